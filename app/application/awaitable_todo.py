@@ -0,0 +1,61 @@
+import asyncio
+import functools
+import itertools
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Executor
+from typing import Any
+
+from .todo import TodoService
+
+ITERATE_CHUNK_SIZE = 100
+"""Items an iterator is advanced by in one call to the executor."""
+
+
+class AwaitableTodoService:
+    """Expose a ``TodoService`` through the interface of ``AsyncTodoService``.
+
+    Every method of the wrapped service becomes a coroutine function, so
+    the routes can ``await`` either service. Without an executor the calls
+    run inline and block the event loop for each DynamoDB round trip, as
+    the synchronous backend always has. With one, they run in its threads
+    and iterators are advanced there too, ``ITERATE_CHUNK_SIZE`` items
+    at a time, which are then yielded from the event loop.
+    """
+
+    def __init__(
+        self,
+        service: TodoService,
+        executor: Executor | None = None,
+    ):
+        self.service = service
+        self.executor = executor
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        method = getattr(self.service, name)
+
+        if self.executor is None:
+
+            async def call_inline(*args: Any, **kwargs: Any) -> Any:
+                return method(*args, **kwargs)
+
+            return call_inline
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            result = await self._run(functools.partial(method, *args, **kwargs))
+            if isinstance(result, Iterator):
+                return self._iterate(result)
+            return result
+
+        return call
+
+    async def _run[T](self, fn: Callable[[], T]) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, fn)
+
+    async def _iterate[T](self, items: Iterator[T]) -> AsyncIterator[T]:
+        def take() -> list[T]:
+            return list(itertools.islice(items, ITERATE_CHUNK_SIZE))
+
+        while chunk := await self._run(take):
+            for item in chunk:
+                yield item
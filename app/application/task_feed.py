@@ -0,0 +1,81 @@
+import heapq
+import itertools
+from collections.abc import Iterable
+
+from ..domain.page import Page
+from ..domain.task import Task
+from ..domain.task_feed import TaskFeedCursor, feed_sort_key
+from ..domain.task_list import TaskSortOrder
+
+FEED_CONCURRENCY = 8
+"""Task lists read at once when merging the tasks of a user.
+
+This bounds the share of a shared executor that one request can take.
+"""
+
+
+def is_after(task: Task, cursor: TaskFeedCursor, order: TaskSortOrder) -> bool:
+    """Whether ``task`` comes after ``cursor`` in the tasks of a user."""
+    if order is TaskSortOrder.DESCENDING:
+        return feed_sort_key(task) < cursor.sort_key
+    return feed_sort_key(task) > cursor.sort_key
+
+
+def feed_window(
+    tasks: Iterable[Task],
+    order: TaskSortOrder,
+    limit: int | None = None,
+    cursor: TaskFeedCursor | None = None,
+) -> list[Task]:
+    """Tasks of one list that the page after ``cursor`` can contain.
+
+    ``tasks`` are sorted by creation time in ``order`` and read lazily:
+    the tasks up to ``cursor`` are dropped, then at most one more task
+    than ``limit`` is read, as any further one would not be on the page.
+    """
+    if cursor is not None:
+        tasks = itertools.dropwhile(
+            lambda task: not is_after(task, cursor, order), tasks
+        )
+
+    if limit is None:
+        return list(tasks)
+    return list(itertools.islice(tasks, limit + 1))
+
+
+def merge_task_feed(
+    tasks_by_list: Iterable[Iterable[Task]],
+    order: TaskSortOrder,
+    limit: int | None = None,
+    cursor: TaskFeedCursor | None = None,
+) -> Page[Task]:
+    """Merge the ordered tasks of several task lists into one page.
+
+    Each list must already be sorted by creation time in ``order``. The
+    page starts after ``cursor`` and its next token is a cursor after its
+    last task, like the pages read from the user task indexes.
+    """
+    tasks: Iterable[Task] = heapq.merge(
+        *tasks_by_list,
+        key=feed_sort_key,
+        reverse=order is TaskSortOrder.DESCENDING,
+    )
+
+    if cursor is not None:
+        tasks = itertools.dropwhile(
+            lambda task: not is_after(task, cursor, order), tasks
+        )
+
+    if limit is None:
+        return Page(items=list(tasks))
+
+    # One more task than the page tells whether there is a next one.
+    items = list(itertools.islice(tasks, limit + 1))
+    if len(items) <= limit:
+        return Page(items=items)
+
+    del items[limit:]
+    return Page(
+        items=items,
+        next_token=TaskFeedCursor.after(items[-1]).encode(),
+    )
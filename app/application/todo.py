@@ -1,12 +1,21 @@
+import itertools
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Executor
+
+from ..domain.page import Page
 from ..domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from ..domain.task_feed import TaskFeedCursor
 from ..domain.task_list import (
     TaskList,
     TaskListId,
     TaskListName,
+    TaskSortBy,
+    TaskSortOrder,
 )
 from ..domain.task_list_repository import TaskListRepository
 from ..domain.task_repository import TaskRepository
 from ..domain.user import UserId
+from .task_feed import FEED_CONCURRENCY, feed_window, merge_task_feed
 
 
 class TodoService:
@@ -14,9 +23,13 @@ class TodoService:
         self,
         task_list_repository: TaskListRepository,
         task_repository: TaskRepository,
+        user_task_index: bool = False,
+        executor: Executor | None = None,
     ):
         self.task_list_repository = task_list_repository
         self.task_repository = task_repository
+        self.user_task_index = user_task_index
+        self.executor = executor
 
     def create_task_list(
         self,
@@ -31,151 +44,387 @@ class TodoService:
     def get_task_list(
         self,
         task_list_id: TaskListId,
+        user_id: UserId | None = None,
     ) -> TaskList:
         """Retrieve a task list by its ID."""
-        task_list = self.task_list_repository.find_by_id(task_list_id)
+        task_list = self._find_task_list(task_list_id, user_id)
 
         if not task_list:
             raise ValueError("Task list not found.")
 
         return task_list
 
+    def get_task_list_with_tasks(
+        self,
+        task_list_id: TaskListId,
+        user_id: UserId | None = None,
+        limit: int | None = None,
+    ) -> tuple[TaskList, Page[Task]]:
+        """Retrieve a task list and its first page of tasks at once."""
+        result = self.task_list_repository.find_with_tasks(
+            task_list_id,
+            limit=limit,
+        )
+
+        if result is None or (
+            user_id is not None and result[0].user_id != user_id
+        ):
+            raise ValueError("Task list not found.")
+
+        return result
+
     def update_task_list_name(
         self,
         task_list_id: TaskListId,
         new_name: TaskListName,
+        user_id: UserId | None = None,
     ) -> TaskList:
         """Update the name of an existing task list."""
-        task_list = self.task_list_repository.find_by_id(task_list_id)
+        if user_id is None:
+            task_list = self.task_list_repository.find_by_id(task_list_id)
+
+            if not task_list:
+                raise ValueError("Task list not found.")
+
+            user_id = task_list.user_id
+
+        task_list = self.task_list_repository.update_name(
+            user_id,
+            task_list_id,
+            new_name,
+        )
 
         if not task_list:
             raise ValueError("Task list not found.")
 
-        task_list.update_name(new_name)
-        self.task_list_repository.store(task_list)
-
         return task_list
 
-    def delete_task_list(self, task_list_id: TaskListId) -> None:
-        """Delete a task list by its ID."""
-        self.task_list_repository.delete(task_list_id)
+    def delete_task_list(
+        self,
+        task_list_id: TaskListId,
+        user_id: UserId | None = None,
+    ) -> None:
+        """Delete a task list and every task in it."""
+        self.task_list_repository.delete(task_list_id, user_id=user_id)
 
-    def list_all_task_lists(self, user_id: UserId) -> list[TaskList]:
-        """List all task lists."""
-        return self.task_list_repository.list_all(user_id)
+    def list_all_task_lists(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+    ) -> Page[TaskList]:
+        """List the task lists of a user, one page at a time."""
+        return self.task_list_repository.list_all(
+            user_id,
+            limit=limit,
+            next_token=next_token,
+        )
+
+    def iter_task_lists(self, user_id: UserId) -> Iterator[TaskList]:
+        """Iterate over every task list of a user, page by page."""
+        return self.task_list_repository.iter_all(user_id)
 
     def create_task(
         self,
         task_list_id: TaskListId,
         title: TaskTitle,
         description: TaskDescription,
+        user_id: UserId | None = None,
     ) -> Task:
         """Add a task to an existing task list."""
-        task_list = self.task_list_repository.find_by_id(task_list_id)
+        if user_id is None:
+            task_list = self.task_list_repository.find_by_id(task_list_id)
 
-        if not task_list:
-            raise ValueError("Task list not found.")
+            if not task_list:
+                raise ValueError("Task list not found.")
 
-        task = Task.create(title, description, task_list_id)
-        task_list.add_task()
+            # Fail fast on the cached count; the repository enforces the
+            # limit again on the server.
+            task_list.add_task()
+            user_id = task_list.user_id
 
-        self.task_list_repository.store(task_list)
-        self.task_repository.store(task)
+        task = Task.create(title, description, task_list_id)
+        self.task_repository.add_task_to_list(user_id, task)
 
         return task
 
+    def create_tasks(
+        self,
+        task_list_id: TaskListId,
+        drafts: Sequence[tuple[TaskTitle, TaskDescription]],
+        user_id: UserId | None = None,
+    ) -> list[Task]:
+        """Add several tasks to an existing task list, all or none."""
+        if not drafts:
+            return []
+
+        if user_id is None:
+            task_list = self.task_list_repository.find_by_id(task_list_id)
+
+            if not task_list:
+                raise ValueError("Task list not found.")
+
+            task_list.add_tasks(len(drafts))
+            user_id = task_list.user_id
+
+        tasks = [
+            Task.create(title, description, task_list_id)
+            for title, description in drafts
+        ]
+        self.task_repository.add_tasks_to_list(user_id, task_list_id, tasks)
+
+        return tasks
+
     def get_task(
         self,
         task_id: TaskId,
+        task_list_id: TaskListId | None = None,
     ) -> Task:
         """Get a task from a task list by its ID."""
-        task = self.task_repository.find_by_id(task_id)
+        task = self._find_task(task_id, task_list_id)
 
         if not task:
             raise ValueError("Task not found.")
 
         return task
 
+    def get_tasks(
+        self,
+        keys: Sequence[tuple[TaskListId, TaskId]],
+    ) -> list[Task | None]:
+        """Get tasks of any task lists by key, ``None`` for missing ones."""
+        if not keys:
+            return []
+
+        return self.task_repository.find_many(keys)
+
     def remove_task(
         self,
         task_list_id: TaskListId,
         task_id: TaskId,
+        user_id: UserId | None = None,
     ) -> None:
         """Remove a task from a task list."""
-        task = self.task_repository.find_by_id(task_id)
+        if user_id is None:
+            task_list = self.task_list_repository.find_by_id(task_list_id)
 
-        if not task:
-            raise ValueError("Task not found.")
+            if not task_list:
+                raise ValueError("Task list not found.")
 
-        task_list = self.task_list_repository.find_by_id(task_list_id)
+            user_id = task_list.user_id
 
-        if not task_list:
-            raise ValueError("Task list not found.")
-
-        task_list.delete_task()
+        self.task_repository.remove_task_from_list(
+            user_id,
+            task_list_id,
+            task_id,
+        )
 
-        self.task_list_repository.store(task_list)
-        self.task_repository.delete(task_id)
-
-    def update_task_status(
+    def update_task(
         self,
         task_id: TaskId,
-        status: TaskStatus,
+        title: TaskTitle | None = None,
+        description: TaskDescription | None = None,
+        status: TaskStatus | None = None,
+        task_list_id: TaskListId | None = None,
+        user_id: UserId | None = None,
     ) -> Task:
-        """Update the status of a task in a task list."""
-        task = self.task_repository.find_by_id(task_id)
+        """Update the given fields of a task in a task list at once."""
+        if title is None and description is None and status is None:
+            raise ValueError("At least one field must be provided for update.")
+
+        if task_list_id is None:
+            task = self.task_repository.find_by_id(task_id)
+
+            if not task:
+                raise ValueError("Task not found.")
+
+            task_list_id = task.task_list_id
+
+        if status is not None and user_id is None:
+            # The status counters live on the task list of its owner.
+            task_list = self.task_list_repository.find_by_id(task_list_id)
+
+            if not task_list:
+                raise ValueError("Task list not found.")
+
+            user_id = task_list.user_id
+
+        task = self.task_repository.update(
+            task_list_id,
+            task_id,
+            title=title,
+            description=description,
+            status=status,
+            user_id=user_id,
+        )
 
         if not task:
             raise ValueError("Task not found.")
-        task.update_status(status)
-
-        self.task_repository.store(task)
 
         return task
 
+    def update_task_status(
+        self,
+        task_id: TaskId,
+        status: TaskStatus,
+        task_list_id: TaskListId | None = None,
+        user_id: UserId | None = None,
+    ) -> Task:
+        """Update the status of a task in a task list."""
+        return self.update_task(
+            task_id,
+            status=status,
+            task_list_id=task_list_id,
+            user_id=user_id,
+        )
+
     def update_task_title(
         self,
         task_id: TaskId,
         title: TaskTitle,
+        task_list_id: TaskListId | None = None,
     ) -> Task:
         """Update the title of a task in a task list."""
-
-        task = self.task_repository.find_by_id(task_id)
-
-        if not task:
-            raise ValueError("Task not found.")
-
-        task.update_title(title)
-        self.task_repository.store(task)
-
-        return task
+        return self.update_task(
+            task_id,
+            title=title,
+            task_list_id=task_list_id,
+        )
 
     def update_task_description(
         self,
         task_id: TaskId,
         description: TaskDescription,
+        task_list_id: TaskListId | None = None,
     ) -> Task:
         """Update the description of a task in a task list."""
-        task = self.task_repository.find_by_id(task_id)
+        return self.update_task(
+            task_id,
+            description=description,
+            task_list_id=task_list_id,
+        )
 
-        if not task:
-            raise ValueError("Task not found.")
+    def list_tasks(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a task list, optionally in one status only."""
+        task_list = self.task_list_repository.find_by_id(task_list_id)
 
-        task.update_description(description)
-        self.task_repository.store(task)
+        if not task_list:
+            raise ValueError("Task list not found.")
 
-        return task
+        return self.task_repository.list_all(
+            task_list_id,
+            limit=limit,
+            next_token=next_token,
+            sort_by=sort_by,
+            order=order,
+            status=status,
+        )
 
-    def list_tasks(
+    def iter_tasks(
         self,
         task_list_id: TaskListId,
-    ) -> list[Task]:
-        """List all tasks in a task list with optional sorting."""
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Iterator[Task]:
+        """Iterate over every task of a task list in order, page by page."""
         task_list = self.task_list_repository.find_by_id(task_list_id)
 
         if not task_list:
             raise ValueError("Task list not found.")
 
-        tasks = self.task_repository.list_all(task_list_id)
+        return self.task_repository.iter_all(
+            task_list_id,
+            sort_by=sort_by,
+            order=order,
+            status=status,
+        )
 
-        return tasks
+    def list_user_tasks(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a user across their task lists by creation time.
+
+        With the user task index this is one query. Otherwise the tasks of
+        every list of the user are read from the cursor on, at most one
+        page per list, and merged, which pages the same way until the
+        index is backfilled. The lists are read ``FEED_CONCURRENCY`` at a
+        time in the executor, or one after another without one.
+        """
+        if self.user_task_index:
+            return self.task_repository.list_user_tasks(
+                user_id,
+                limit=limit,
+                next_token=next_token,
+                order=order,
+                status=status,
+            )
+
+        order = order or TaskSortOrder.default()
+        cursor = (
+            None if next_token is None else TaskFeedCursor.decode(next_token)
+        )
+        task_list_ids = [
+            task_list.id
+            for task_list in self.task_list_repository.iter_all(user_id)
+        ]
+
+        if not task_list_ids:
+            return Page()
+
+        def list_tasks(task_list_id: TaskListId) -> list[Task]:
+            tasks = self.task_repository.iter_all(
+                task_list_id,
+                sort_by=TaskSortBy.CREATED_AT,
+                order=order,
+                status=status,
+                start=cursor,
+                page_size=None if limit is None else limit + 1,
+            )
+            return feed_window(tasks, order, limit, cursor)
+
+        run = map if self.executor is None else self.executor.map
+        tasks_by_list = [
+            tasks
+            for chunk in itertools.batched(
+                task_list_ids, FEED_CONCURRENCY, strict=False
+            )
+            for tasks in run(list_tasks, chunk)
+        ]
+
+        return merge_task_feed(tasks_by_list, order, limit, cursor)
+
+    def _find_task_list(
+        self,
+        task_list_id: TaskListId,
+        user_id: UserId | None,
+    ) -> TaskList | None:
+        """Look up a task list by key, or by ID when its owner is unknown."""
+        if user_id is None:
+            return self.task_list_repository.find_by_id(task_list_id)
+
+        return self.task_list_repository.find(user_id, task_list_id)
+
+    def _find_task(
+        self,
+        task_id: TaskId,
+        task_list_id: TaskListId | None,
+    ) -> Task | None:
+        """Look up a task by key, or by ID when its task list is unknown."""
+        if task_list_id is None:
+            return self.task_repository.find_by_id(task_id)
+
+        return self.task_repository.find(task_list_id, task_id)
@@ -0,0 +1,227 @@
+import functools
+import os
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Self
+
+from .application.async_todo import AsyncTodoService
+from .application.awaitable_todo import AwaitableTodoService
+from .application.todo import TodoService
+from .domain.task import Task, TaskId
+from .domain.task_list import TaskList, TaskListId
+from .domain.task_list_repository import TaskListRepository
+from .domain.task_repository import TaskRepository
+from .infrastructure.cache.cached_task_list_repository import (
+    CachedTaskListRepository,
+)
+from .infrastructure.cache.cached_task_repository import CachedTaskRepository
+from .infrastructure.cache.lru import CacheSettings, CacheStats, LRUCache
+from .infrastructure.cache.shared import SharedCacheSettings
+from .infrastructure.cache.shared_task_list_repository import (
+    SharedCachedTaskListRepository,
+)
+from .infrastructure.cache.shared_task_repository import (
+    SharedCachedTaskRepository,
+)
+from .infrastructure.db.async_dynamodb import AsyncDynamoDBClient, AsyncTable
+from .infrastructure.db.async_dynamodb_task_list_repository import (
+    AsyncDynamoDBTaskListRepository,
+)
+from .infrastructure.db.async_dynamodb_task_repository import (
+    AsyncDynamoDBTaskRepository,
+)
+from .infrastructure.db.dynamodb import DynamoDBResources, DynamoDBSettings
+from .infrastructure.db.dynamodb_task_list_repository import (
+    DynamoDBTaskListRepository,
+)
+from .infrastructure.db.dynamodb_task_repository import (
+    DynamoDBTaskRepository,
+)
+from .infrastructure.executor import InstrumentedThreadPoolExecutor
+
+RENDER_CACHE = CacheSettings(max_size=8192, ttl=300.0)
+"""Default cache of rendered tasks and task lists.
+
+Rendered entities are keyed by version and never go stale, so they live
+longer than the entities themselves and only expire to free memory.
+"""
+
+
+class ExecutionMode(StrEnum):
+    """How the routes reach DynamoDB.
+
+    ``sync`` calls the boto3 repositories on the event loop,
+    ``threadpool`` calls them in a bounded pool of threads and ``async``
+    uses the non-blocking repositories.
+    """
+
+    SYNC = "sync"
+    THREADPOOL = "threadpool"
+    ASYNC = "async"
+
+    @classmethod
+    def from_env(cls) -> Self:
+        return cls(os.getenv("APP_EXECUTION_MODE", cls.SYNC))
+
+
+@dataclass(frozen=True)
+class Container:
+    """Process-wide objects shared by every request."""
+
+    dynamodb: DynamoDBResources
+    task_list_repository: TaskListRepository
+    task_repository: TaskRepository
+    todo_service: TodoService
+    caches: dict[str, LRUCache] = field(default_factory=dict)
+    executor: InstrumentedThreadPoolExecutor | None = None
+    """Threads of the threadpool mode, one per pooled connection.
+
+    More threads than connections would only wait for a connection inside
+    botocore, where the wait cannot be observed. Batched reads and writes
+    and the task feed fan out into the same threads in every mode, so the
+    threads of the process never outnumber the connections.
+    """
+
+    @classmethod
+    def create(
+        cls,
+        settings: DynamoDBSettings,
+        task_list_cache: CacheSettings | None = None,
+        task_cache: CacheSettings | None = None,
+        shared_cache: SharedCacheSettings | None = None,
+        render_cache: CacheSettings | None = None,
+    ) -> Self:
+        dynamodb = DynamoDBResources.create(settings)
+        # Threads are only started by the first call.
+        executor = InstrumentedThreadPoolExecutor(
+            max_workers=settings.max_pool_connections,
+            thread_name_prefix="dynamodb",
+        )
+        legacy_task_lists = not settings.task_lists_migrated
+        task_list_repository: TaskListRepository = DynamoDBTaskListRepository(
+            dynamodb.table,
+            dynamodb.wire_table,
+            legacy_task_lists=legacy_task_lists,
+            executor=executor,
+        )
+        task_repository: TaskRepository = DynamoDBTaskRepository(
+            dynamodb.table,
+            dynamodb.wire_table,
+            legacy_task_lists=legacy_task_lists,
+            executor=executor,
+        )
+
+        shared_cache = shared_cache or SharedCacheSettings()
+        collections = shared_cache.create_collections()
+        if collections is not None:
+            task_list_repository = SharedCachedTaskListRepository(
+                task_list_repository,
+                collections,
+            )
+            task_repository = SharedCachedTaskRepository(
+                task_repository,
+                collections,
+            )
+
+        task_lists = LRUCache[TaskListId, TaskList](
+            task_list_cache or CacheSettings()
+        )
+        tasks = LRUCache[TaskId, Task](task_cache or CacheSettings())
+        task_list_repository = CachedTaskListRepository(
+            task_list_repository,
+            task_lists,
+            task_cache=tasks,
+        )
+        task_repository = CachedTaskRepository(
+            task_repository,
+            tasks,
+            task_list_cache=task_lists,
+        )
+
+        return cls(
+            dynamodb=dynamodb,
+            task_list_repository=task_list_repository,
+            task_repository=task_repository,
+            todo_service=TodoService(
+                task_list_repository=task_list_repository,
+                task_repository=task_repository,
+                user_task_index=settings.user_task_index,
+                executor=executor,
+            ),
+            caches={
+                "task_list": task_lists,
+                "task": tasks,
+                "rendered": LRUCache[tuple[str, str, int], bytes](
+                    render_cache or RENDER_CACHE
+                ),
+            },
+            executor=executor,
+        )
+
+    @functools.cached_property
+    def async_dynamodb(self) -> AsyncDynamoDBClient:
+        """Non-blocking client, created on first use of the async mode."""
+        return AsyncDynamoDBClient.create(
+            self.dynamodb.settings,
+            self.dynamodb.session,
+        )
+
+    @functools.cached_property
+    def async_todo_service(self) -> AsyncTodoService:
+        table = AsyncTable(
+            self.async_dynamodb,
+            self.dynamodb.settings.table_name,
+            self.dynamodb.client.meta.service_model,
+        )
+
+        legacy_task_lists = not self.dynamodb.settings.task_lists_migrated
+
+        return AsyncTodoService(
+            task_list_repository=AsyncDynamoDBTaskListRepository(
+                table,
+                legacy_task_lists=legacy_task_lists,
+            ),
+            task_repository=AsyncDynamoDBTaskRepository(
+                table,
+                legacy_task_lists=legacy_task_lists,
+            ),
+            user_task_index=self.dynamodb.settings.user_task_index,
+        )
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """Counters of the in-process caches, by entity type."""
+        return {name: cache.stats() for name, cache in self.caches.items()}
+
+    def todo_service_for(
+        self,
+        mode: ExecutionMode,
+    ) -> AsyncTodoService | AwaitableTodoService:
+        """The service the routes await in the given execution mode."""
+        if mode is ExecutionMode.ASYNC:
+            return self.async_todo_service
+        if mode is ExecutionMode.THREADPOOL:
+            return AwaitableTodoService(self.todo_service, self.executor)
+
+        return AwaitableTodoService(self.todo_service)
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
+        self.dynamodb.close()
+
+    async def aclose(self) -> None:
+        """Close the non-blocking client if it was ever created."""
+        if "async_dynamodb" in self.__dict__:
+            await self.async_dynamodb.aclose()
+
+
+@functools.cache
+def get_container() -> Container:
+    """Get the container of the current process, creating it on first use."""
+    return Container.create(
+        DynamoDBSettings.from_env(),
+        task_list_cache=CacheSettings.from_env("TASK_LIST"),
+        task_cache=CacheSettings.from_env("TASK"),
+        shared_cache=SharedCacheSettings.from_env(),
+        render_cache=CacheSettings.from_env("RENDER", RENDER_CACHE),
+    )
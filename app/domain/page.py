@@ -0,0 +1,7 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class Page[T]:
+    items: list[T] = field(default_factory=list)
+    next_token: str | None = None
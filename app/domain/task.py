@@ -1,13 +1,13 @@
 import enum
-import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Self
 
+from .ids import uuid7
 from .task_list import TaskListId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskId:
     value: str
 
@@ -16,10 +16,10 @@ class TaskId:
 
     @classmethod
     def generate(cls) -> Self:
-        return cls(value=str(uuid.uuid4()))
+        return cls(value=str(uuid7()))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskTitle:
     value: str
 
@@ -40,7 +40,7 @@ class TaskTitle:
         self.validate()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskDescription:
     value: str
 
@@ -64,7 +64,10 @@ class TaskStatus(enum.StrEnum):
     DONE = enum.auto()
 
 
-@dataclass
+_STATUSES = {status.value: status for status in TaskStatus}
+
+
+@dataclass(slots=True)
 class Task:
     id: TaskId
     task_list_id: TaskListId
@@ -72,6 +75,8 @@ class Task:
     description: TaskDescription
     status: TaskStatus
     created_at: datetime
+    version: int = 0
+    """Incremented by every write, zero for tasks stored before versions."""
 
     @classmethod
     def create(
@@ -87,6 +92,40 @@ class Task:
             description=description,
             status=TaskStatus.TODO,
             created_at=datetime.now(),
+            version=1,
+        )
+
+    @classmethod
+    def from_trusted(
+        cls,
+        id: str,
+        task_list_id: TaskListId,
+        title: str,
+        description: str,
+        status: str,
+        created_at: datetime,
+        version: int = 0,
+    ) -> Self:
+        """Rebuild a task from values validated when it was stored.
+
+        The title and description are not validated again, so this must
+        only be given data read back from storage, never user input. The
+        ``task_list_id`` may be shared by the tasks of one task list.
+        """
+        # Built without __init__, which would run __post_init__ validation.
+        task_title = object.__new__(TaskTitle)
+        object.__setattr__(task_title, "value", title)
+        task_description = object.__new__(TaskDescription)
+        object.__setattr__(task_description, "value", description)
+
+        return cls(
+            id=TaskId(id),
+            task_list_id=task_list_id,
+            title=task_title,
+            description=task_description,
+            status=_STATUSES[status],
+            created_at=created_at,
+            version=version,
         )
 
     def update_title(self, title: TaskTitle) -> None:
@@ -0,0 +1,67 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Self
+
+from .task import Task, TaskId
+from .task_list import TaskListId
+
+
+def feed_sort_key(task: Task) -> tuple[str, str]:
+    """Order of the tasks of a user: by creation time, then by ID."""
+    return task.created_at.isoformat(), str(task.id)
+
+
+@dataclass(frozen=True, slots=True)
+class TaskFeedCursor:
+    """Position in the tasks of a user, right after the last task read.
+
+    It only depends on that task, so a page can be continued whether the
+    tasks are read from an index or merged from every task list.
+    """
+
+    created_at: str
+    task_list_id: TaskListId
+    task_id: TaskId
+
+    @classmethod
+    def after(cls, task: Task) -> Self:
+        return cls(
+            created_at=task.created_at.isoformat(),
+            task_list_id=task.task_list_id,
+            task_id=task.id,
+        )
+
+    @property
+    def sort_key(self) -> tuple[str, str]:
+        return self.created_at, str(self.task_id)
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque pagination token."""
+        data = json.dumps(
+            [self.created_at, str(self.task_list_id), str(self.task_id)],
+            separators=(",", ":"),
+        ).encode()
+        return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        """Decode a pagination token made by ``encode``."""
+        try:
+            data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            created_at, task_list_id, task_id = json.loads(data)
+        except (binascii.Error, ValueError, TypeError) as e:
+            raise ValueError("Invalid pagination token.") from e
+
+        if not all(
+            isinstance(value, str)
+            for value in (created_at, task_list_id, task_id)
+        ):
+            raise ValueError("Invalid pagination token.")
+
+        return cls(
+            created_at=created_at,
+            task_list_id=TaskListId(task_list_id),
+            task_id=TaskId(task_id),
+        )
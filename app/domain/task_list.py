@@ -1,12 +1,12 @@
 import enum
-import uuid
 from dataclasses import dataclass
 from typing import Self
 
+from .ids import uuid7
 from .user import UserId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskListId:
     value: str
 
@@ -15,10 +15,10 @@ class TaskListId:
 
     @classmethod
     def generate(cls) -> Self:
-        return cls(value=str(uuid.uuid4()))
+        return cls(value=str(uuid7()))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskListName:
     value: str
     MAX_LENGTH = 100
@@ -57,7 +57,7 @@ class TaskSortBy(enum.StrEnum):
         return cls.CREATED_AT
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskCount:
     value: int
     MAX_TASK_COUNT = 100
@@ -75,12 +75,16 @@ class TaskCount:
         self.validate()
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskList:
     id: TaskListId
     user_id: UserId
     name: TaskListName
     count: TaskCount
+    todo_count: TaskCount = TaskCount(0)
+    done_count: TaskCount = TaskCount(0)
+    version: int = 0
+    """Incremented by every write, zero for lists stored before versions."""
 
     @classmethod
     def create(
@@ -93,6 +97,42 @@ class TaskList:
             user_id=user_id,
             name=name,
             count=TaskCount(0),
+            version=1,
+        )
+
+    @classmethod
+    def from_trusted(
+        cls,
+        id: str,
+        user_id: str,
+        name: str,
+        count: int,
+        todo_count: int,
+        done_count: int,
+        version: int = 0,
+    ) -> Self:
+        """Rebuild a task list from values validated when it was stored.
+
+        The name and counts are not validated again, so this must only be
+        given data read back from storage, never user input.
+        """
+        # Built without __init__, which would run __post_init__ validation.
+        task_list_name = object.__new__(TaskListName)
+        object.__setattr__(task_list_name, "value", name)
+        counts = []
+        for value in (count, todo_count, done_count):
+            task_count = object.__new__(TaskCount)
+            object.__setattr__(task_count, "value", value)
+            counts.append(task_count)
+
+        return cls(
+            id=TaskListId(id),
+            user_id=UserId(user_id),
+            name=task_list_name,
+            count=counts[0],
+            todo_count=counts[1],
+            done_count=counts[2],
+            version=version,
         )
 
     def update_name(self, name: TaskListName) -> None:
@@ -101,8 +141,17 @@ class TaskList:
 
     def add_task(self) -> None:
         """Add a task to the task list."""
-        self.count = TaskCount(self.count.value + 1)
+        self.add_tasks(1)
+
+    def add_tasks(self, count: int) -> None:
+        """Add ``count`` tasks to the task list at once."""
+        self.count = TaskCount(self.count.value + count)
+        self.todo_count = TaskCount(self.todo_count.value + count)
 
-    def delete_task(self) -> None:
-        """Delete a task from the task list."""
+    def delete_task(self, done: bool = False) -> None:
+        """Delete a task, done or still to do, from the task list."""
         self.count = TaskCount(self.count.value - 1)
+        if done:
+            self.done_count = TaskCount(self.done_count.value - 1)
+        else:
+            self.todo_count = TaskCount(self.todo_count.value - 1)
@@ -1,7 +1,10 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator, Iterator
 from typing import Protocol
 
-from .task_list import TaskList, TaskListId
+from .page import Page
+from .task import Task
+from .task_list import TaskList, TaskListId, TaskListName
 from .user import UserId
 
 
@@ -11,17 +14,125 @@ class TaskListRepository(Protocol):
         """Save a task list to the repository."""
         raise NotImplementedError
 
+    @abstractmethod
+    def update_name(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        name: TaskListName,
+    ) -> TaskList | None:
+        """Rename a task list and return the updated task list."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def find(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+    ) -> TaskList | None:
+        """Find a task list by the ID of its owner and its own ID."""
+        raise NotImplementedError
+
     @abstractmethod
     def find_by_id(self, task_list_id: TaskListId) -> TaskList | None:
         """Find a task list by its ID."""
         raise NotImplementedError
 
     @abstractmethod
-    def delete(self, task_list_id: TaskListId) -> None:
-        """Delete a task list by its ID."""
+    def find_with_tasks(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None = None,
+    ) -> tuple[TaskList, Page[Task]] | None:
+        """Find a task list and its first page of tasks by creation time."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(
+        self,
+        task_list_id: TaskListId,
+        user_id: UserId | None = None,
+    ) -> None:
+        """Delete a task list and its tasks, by key or by ID alone."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_all(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+    ) -> Page[TaskList]:
+        """List the task lists of a user, one page at a time."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_all(self, user_id: UserId) -> Iterator[TaskList]:
+        """Iterate over the task lists of a user, page by page."""
+        raise NotImplementedError
+
+
+class AsyncTaskListRepository(Protocol):
+    """Non-blocking counterpart of ``TaskListRepository``."""
+
+    @abstractmethod
+    async def store(self, task_list: TaskList) -> None:
+        """Save a task list to the repository."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_name(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        name: TaskListName,
+    ) -> TaskList | None:
+        """Rename a task list and return the updated task list."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+    ) -> TaskList | None:
+        """Find a task list by the ID of its owner and its own ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_id(self, task_list_id: TaskListId) -> TaskList | None:
+        """Find a task list by its ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_with_tasks(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None = None,
+    ) -> tuple[TaskList, Page[Task]] | None:
+        """Find a task list and its first page of tasks by creation time."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(
+        self,
+        task_list_id: TaskListId,
+        user_id: UserId | None = None,
+    ) -> None:
+        """Delete a task list and its tasks, by key or by ID alone."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_all(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+    ) -> Page[TaskList]:
+        """List the task lists of a user, one page at a time."""
         raise NotImplementedError
 
     @abstractmethod
-    def list_all(self, user_id: UserId) -> list[TaskList]:
-        """List all task lists in the repository."""
+    def iter_all(self, user_id: UserId) -> AsyncIterator[TaskList]:
+        """Iterate over the task lists of a user, page by page."""
         raise NotImplementedError
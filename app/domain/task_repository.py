@@ -1,8 +1,12 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator, Iterator, Sequence
 from typing import Protocol
 
-from .task import Task, TaskId
-from .task_list import TaskListId
+from .page import Page
+from .task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from .task_feed import TaskFeedCursor
+from .task_list import TaskListId, TaskSortBy, TaskSortOrder
+from .user import UserId
 
 
 class TaskRepository(Protocol):
@@ -14,6 +18,57 @@ class TaskRepository(Protocol):
         """Save a task to the repository."""
         raise NotImplementedError
 
+    @abstractmethod
+    def add_task_to_list(self, user_id: UserId, task: Task) -> None:
+        """Save a new task and count it in its task list atomically."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_tasks_to_list(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        tasks: Sequence[Task],
+    ) -> None:
+        """Save new tasks of one task list and count them all or none."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove_task_from_list(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+    ) -> None:
+        """Delete a task and uncount it from its task list atomically."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(
+        self,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+        title: TaskTitle | None = None,
+        description: TaskDescription | None = None,
+        status: TaskStatus | None = None,
+        user_id: UserId | None = None,
+    ) -> Task | None:
+        """Update the given fields of a task and return the updated task.
+
+        Setting a ``status`` also updates the status counters of the task
+        list, which needs its owner ``user_id``.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def find(
+        self,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+    ) -> Task | None:
+        """Find a task by the ID of its task list and its own ID."""
+        raise NotImplementedError
+
     @abstractmethod
     def find_by_id(
         self,
@@ -22,15 +77,205 @@ class TaskRepository(Protocol):
         """Find a task by its ID."""
         raise NotImplementedError
 
+    @abstractmethod
+    def find_many(
+        self,
+        keys: Sequence[tuple[TaskListId, TaskId]],
+    ) -> list[Task | None]:
+        """Find tasks by their full keys, ``None`` for missing ones."""
+        raise NotImplementedError
+
     @abstractmethod
     def delete(
         self,
         task_id: TaskId,
+        task_list_id: TaskListId | None = None,
+    ) -> None:
+        """Delete a task by its key, or by its ID alone."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_all(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a task list in order, one page at a time.
+
+        With a ``status``, only the tasks in that status are listed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_user_tasks(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a user across their task lists by creation time.
+
+        Needs the user task indexes. With a ``status``, only the tasks in
+        that status are listed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_all(
+        self,
+        task_list_id: TaskListId,
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+        start: TaskFeedCursor | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[Task]:
+        """Iterate over the tasks of a task list in order, page by page.
+
+        By creation time, the tasks created before the ``start`` cursor in
+        ``order`` are skipped without being read. ``page_size`` caps the
+        tasks read by each request.
+        """
+        raise NotImplementedError
+
+
+class AsyncTaskRepository(Protocol):
+    """Non-blocking counterpart of ``TaskRepository``."""
+
+    @abstractmethod
+    async def store(
+        self,
+        task: Task,
     ) -> None:
-        """Delete a task by its ID."""
+        """Save a task to the repository."""
         raise NotImplementedError
 
     @abstractmethod
-    def list_all(self, task_list_id: TaskListId) -> list[Task]:
-        """List all tasks in the repository."""
+    async def add_task_to_list(self, user_id: UserId, task: Task) -> None:
+        """Save a new task and count it in its task list atomically."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_tasks_to_list(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        tasks: Sequence[Task],
+    ) -> None:
+        """Save new tasks of one task list and count them all or none."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_task_from_list(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+    ) -> None:
+        """Delete a task and uncount it from its task list atomically."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update(
+        self,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+        title: TaskTitle | None = None,
+        description: TaskDescription | None = None,
+        status: TaskStatus | None = None,
+        user_id: UserId | None = None,
+    ) -> Task | None:
+        """Update the given fields of a task and return the updated task.
+
+        Setting a ``status`` also updates the status counters of the task
+        list, which needs its owner ``user_id``.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find(
+        self,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+    ) -> Task | None:
+        """Find a task by the ID of its task list and its own ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_id(
+        self,
+        task_id: TaskId,
+    ) -> Task | None:
+        """Find a task by its ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_many(
+        self,
+        keys: Sequence[tuple[TaskListId, TaskId]],
+    ) -> list[Task | None]:
+        """Find tasks by their full keys, ``None`` for missing ones."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(
+        self,
+        task_id: TaskId,
+        task_list_id: TaskListId | None = None,
+    ) -> None:
+        """Delete a task by its key, or by its ID alone."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_all(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a task list in order, one page at a time.
+
+        With a ``status``, only the tasks in that status are listed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_user_tasks(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a user across their task lists by creation time.
+
+        Needs the user task indexes. With a ``status``, only the tasks in
+        that status are listed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_all(
+        self,
+        task_list_id: TaskListId,
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+        start: TaskFeedCursor | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[Task]:
+        """Iterate over the tasks of a task list in order, page by page.
+
+        Takes the same ``start`` and ``page_size`` as ``TaskRepository``.
+        """
         raise NotImplementedError
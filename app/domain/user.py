@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserId:
     value: str
 
@@ -9,6 +9,6 @@ class UserId:
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: UserId
@@ -0,0 +1,124 @@
+from collections.abc import Iterator
+
+from ...domain.page import Page
+from ...domain.task import Task, TaskId
+from ...domain.task_list import TaskList, TaskListId, TaskListName
+from ...domain.task_list_repository import TaskListRepository
+from ...domain.user import UserId
+from .lru import LRUCache
+
+
+class CachedTaskListRepository(TaskListRepository):
+    """Read-through cache of task lists in front of another repository.
+
+    Task lists are cached by ID when read consistently by key or returned
+    by a write, never from index queries, which may return a task list as
+    it was before a recent write. Writes through this repository invalidate
+    or refresh their entry, and ``CachedTaskRepository`` invalidates the
+    entry when it changes the task count. Deleting a task list also drops
+    its tasks from ``task_cache``. Writes made by other processes are seen
+    once the entry expires.
+    """
+
+    def __init__(
+        self,
+        repository: TaskListRepository,
+        cache: LRUCache[TaskListId, TaskList],
+        task_cache: LRUCache[TaskId, Task] | None = None,
+    ):
+        self._repository = repository
+        self.cache = cache
+        self._task_cache = task_cache
+
+    def store(self, task_list: TaskList) -> None:
+        """Save a task list to the repository."""
+        self._repository.store(task_list)
+        self.cache.invalidate(task_list.id)
+
+    def update_name(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        name: TaskListName,
+    ) -> TaskList | None:
+        """Rename a task list and cache the renamed task list."""
+        task_list = self._repository.update_name(user_id, task_list_id, name)
+
+        if task_list is None:
+            self.cache.invalidate(task_list_id)
+        else:
+            self.cache.put(task_list_id, task_list)
+
+        return task_list
+
+    def find(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+    ) -> TaskList | None:
+        """Find a task list by its full key."""
+        task_list = self.cache.get(task_list_id)
+
+        if task_list is not None and task_list.user_id == user_id:
+            return task_list
+
+        task_list = self._repository.find(user_id, task_list_id)
+
+        if task_list is not None:
+            self.cache.put(task_list_id, task_list)
+
+        return task_list
+
+    def find_by_id(self, task_list_id: TaskListId) -> TaskList | None:
+        """Find a task list by its ID."""
+        task_list = self.cache.get(task_list_id)
+
+        if task_list is not None:
+            return task_list
+
+        task_list = self._repository.find_by_id(task_list_id)
+
+        if task_list is not None:
+            self.cache.put(task_list_id, task_list)
+
+        return task_list
+
+    def find_with_tasks(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None = None,
+    ) -> tuple[TaskList, Page[Task]] | None:
+        """Find a task list and its first tasks without caching them."""
+        return self._repository.find_with_tasks(task_list_id, limit=limit)
+
+    def delete(
+        self,
+        task_list_id: TaskListId,
+        user_id: UserId | None = None,
+    ) -> None:
+        """Delete a task list and its tasks, by key or by ID alone."""
+        try:
+            self._repository.delete(task_list_id, user_id=user_id)
+        finally:
+            self.cache.invalidate(task_list_id)
+            if self._task_cache is not None:
+                self._task_cache.invalidate_where(
+                    lambda task: task.task_list_id == task_list_id
+                )
+
+    def list_all(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+    ) -> Page[TaskList]:
+        """List the task lists of a user without caching them."""
+        return self._repository.list_all(
+            user_id,
+            limit=limit,
+            next_token=next_token,
+        )
+
+    def iter_all(self, user_id: UserId) -> Iterator[TaskList]:
+        """Iterate over the task lists of a user without caching them."""
+        return self._repository.iter_all(user_id)
@@ -0,0 +1,224 @@
+from collections.abc import Iterator, Sequence
+
+from ...domain.page import Page
+from ...domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from ...domain.task_feed import TaskFeedCursor
+from ...domain.task_list import (
+    TaskList,
+    TaskListId,
+    TaskSortBy,
+    TaskSortOrder,
+)
+from ...domain.task_repository import TaskRepository
+from ...domain.user import UserId
+from .lru import LRUCache
+
+
+class CachedTaskRepository(TaskRepository):
+    """Read-through cache of tasks in front of another repository.
+
+    Tasks are cached by ID. Only tasks read consistently by key or
+    returned by a write are cached, since index queries may return a task
+    as it was before a recent write. Adding or removing a task, or setting
+    its status, also invalidates its task list in ``task_list_cache``,
+    whose cached counts are then stale.
+    """
+
+    def __init__(
+        self,
+        repository: TaskRepository,
+        cache: LRUCache[TaskId, Task],
+        task_list_cache: LRUCache[TaskListId, TaskList] | None = None,
+    ):
+        self._repository = repository
+        self.cache = cache
+        self._task_list_cache = task_list_cache
+
+    def store(self, task: Task) -> None:
+        """Save a task to the repository."""
+        self._repository.store(task)
+        self.cache.invalidate(task.id)
+
+    def add_task_to_list(self, user_id: UserId, task: Task) -> None:
+        """Save a new task and count it in its task list atomically."""
+        try:
+            self._repository.add_task_to_list(user_id, task)
+        finally:
+            self.cache.invalidate(task.id)
+            self._invalidate_task_list(task.task_list_id)
+
+    def add_tasks_to_list(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        tasks: Sequence[Task],
+    ) -> None:
+        """Save new tasks of one task list and count them all or none."""
+        try:
+            self._repository.add_tasks_to_list(user_id, task_list_id, tasks)
+        finally:
+            self._invalidate_task_list(task_list_id)
+
+    def remove_task_from_list(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+    ) -> None:
+        """Delete a task and uncount it from its task list atomically."""
+        try:
+            self._repository.remove_task_from_list(
+                user_id,
+                task_list_id,
+                task_id,
+            )
+        finally:
+            self.cache.invalidate(task_id)
+            self._invalidate_task_list(task_list_id)
+
+    def update(
+        self,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+        title: TaskTitle | None = None,
+        description: TaskDescription | None = None,
+        status: TaskStatus | None = None,
+        user_id: UserId | None = None,
+    ) -> Task | None:
+        """Update the given fields of a task and cache the updated task."""
+        try:
+            task = self._repository.update(
+                task_list_id,
+                task_id,
+                title=title,
+                description=description,
+                status=status,
+                user_id=user_id,
+            )
+        finally:
+            if status is not None:
+                # The status counters of the task list may have changed.
+                self._invalidate_task_list(task_list_id)
+
+        if task is None:
+            self.cache.invalidate(task_id)
+        else:
+            self.cache.put(task_id, task)
+
+        return task
+
+    def find(
+        self,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+    ) -> Task | None:
+        """Find a task by the ID of its task list and its own ID."""
+        task = self.cache.get(task_id)
+
+        if task is not None and task.task_list_id == task_list_id:
+            return task
+
+        task = self._repository.find(task_list_id, task_id)
+
+        if task is not None:
+            self.cache.put(task_id, task)
+
+        return task
+
+    def find_by_id(self, task_id: TaskId) -> Task | None:
+        """Find a task by its ID, from the index if it is not cached."""
+        task = self.cache.get(task_id)
+
+        if task is not None:
+            return task
+
+        return self._repository.find_by_id(task_id)
+
+    def find_many(
+        self,
+        keys: Sequence[tuple[TaskListId, TaskId]],
+    ) -> list[Task | None]:
+        """Find tasks by their full keys, reading only the cache misses."""
+        tasks = {}
+        misses = []
+        for task_list_id, task_id in keys:
+            task = self.cache.get(task_id)
+            if task is not None and task.task_list_id == task_list_id:
+                tasks[task_list_id, task_id] = task
+            else:
+                misses.append((task_list_id, task_id))
+
+        if misses:
+            for key, task in zip(
+                misses,
+                self._repository.find_many(misses),
+                strict=True,
+            ):
+                if task is not None:
+                    self.cache.put(task.id, task)
+                    tasks[key] = task
+
+        return [tasks.get(key) for key in keys]
+
+    def delete(
+        self,
+        task_id: TaskId,
+        task_list_id: TaskListId | None = None,
+    ) -> None:
+        """Delete a task by its key, or by its ID alone."""
+        self._repository.delete(task_id, task_list_id=task_list_id)
+        self.cache.invalidate(task_id)
+
+    def list_all(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a task list without caching them."""
+        return self._repository.list_all(
+            task_list_id,
+            limit=limit,
+            next_token=next_token,
+            sort_by=sort_by,
+            order=order,
+            status=status,
+        )
+
+    def list_user_tasks(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a user without caching them."""
+        return self._repository.list_user_tasks(
+            user_id,
+            limit=limit,
+            next_token=next_token,
+            order=order,
+            status=status,
+        )
+
+    def iter_all(
+        self,
+        task_list_id: TaskListId,
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+        start: TaskFeedCursor | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[Task]:
+        """Iterate over the tasks of a task list without caching them."""
+        return self._repository.iter_all(
+            task_list_id, sort_by, order, status, start, page_size
+        )
+
+    def _invalidate_task_list(self, task_list_id: TaskListId) -> None:
+        if self._task_list_cache is not None:
+            self._task_list_cache.invalidate(task_list_id)
@@ -0,0 +1,185 @@
+"""Compact binary encoding of pages stored in the shared cache.
+
+A page is a version byte, a varint item count, the items and an optional
+next token. Strings are a varint byte length followed by UTF-8, counts,
+statuses and versions are varints and naive timestamps are microseconds
+since the epoch, so a typical task takes a third of its JSON size.
+"""
+
+from datetime import datetime, timedelta
+
+from ...domain.page import Page
+from ...domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from ...domain.task_list import TaskCount, TaskList, TaskListId, TaskListName
+from ...domain.user import UserId
+
+VERSION = 3
+
+EPOCH = datetime(1970, 1, 1)
+
+STATUSES = list(TaskStatus)
+
+NAIVE_TIMESTAMP = 0
+ISO_TIMESTAMP = 1
+
+
+class _Writer:
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def varint(self, value: int) -> None:
+        while value >= 0x80:
+            self.buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.buffer.append(value)
+
+    def signed(self, value: int) -> None:
+        # Zigzag, so small negative values stay small.
+        self.varint(value << 1 if value >= 0 else (-value << 1) - 1)
+
+    def string(self, value: str) -> None:
+        data = value.encode()
+        self.varint(len(data))
+        self.buffer += data
+
+    def datetime(self, value: datetime) -> None:
+        if value.tzinfo is None:
+            self.varint(NAIVE_TIMESTAMP)
+            self.signed((value - EPOCH) // timedelta(microseconds=1))
+        else:
+            self.varint(ISO_TIMESTAMP)
+            self.string(value.isoformat())
+
+    def optional_string(self, value: str | None) -> None:
+        self.varint(value is not None)
+        if value is not None:
+            self.string(value)
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self._data = memoryview(data)
+        self._offset = 0
+
+    def varint(self) -> int:
+        value = shift = 0
+        while True:
+            byte = self._data[self._offset]
+            self._offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def signed(self) -> int:
+        value = self.varint()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    def string(self) -> str:
+        length = self.varint()
+        start = self._offset
+        self._offset += length
+        return bytes(self._data[start : self._offset]).decode()
+
+    def datetime(self) -> datetime:
+        if self.varint() == NAIVE_TIMESTAMP:
+            return EPOCH + timedelta(microseconds=self.signed())
+        return datetime.fromisoformat(self.string())
+
+    def optional_string(self) -> str | None:
+        return self.string() if self.varint() else None
+
+    def end(self) -> None:
+        if self._offset != len(self._data):
+            raise ValueError("Trailing bytes after encoded page.")
+
+
+def _reader(data: bytes) -> _Reader:
+    reader = _Reader(data)
+    try:
+        version = reader.varint()
+    except IndexError as e:
+        raise ValueError("Empty encoded page.") from e
+    if version != VERSION:
+        raise ValueError(f"Unsupported page encoding version: {version}.")
+    return reader
+
+
+def encode_task_page(page: Page[Task]) -> bytes:
+    writer = _Writer()
+    writer.varint(VERSION)
+    writer.varint(len(page.items))
+    for task in page.items:
+        writer.string(str(task.id))
+        writer.string(str(task.task_list_id))
+        writer.string(str(task.title))
+        writer.string(str(task.description))
+        writer.varint(STATUSES.index(task.status))
+        writer.datetime(task.created_at)
+        writer.varint(task.version)
+    writer.optional_string(page.next_token)
+    return bytes(writer.buffer)
+
+
+def decode_task_page(data: bytes) -> Page[Task]:
+    """Decode a page of tasks, raising ``ValueError`` if it is malformed."""
+    reader = _reader(data)
+    try:
+        items = [
+            Task(
+                id=TaskId(reader.string()),
+                task_list_id=TaskListId(reader.string()),
+                title=TaskTitle(reader.string()),
+                description=TaskDescription(reader.string()),
+                status=STATUSES[reader.varint()],
+                created_at=reader.datetime(),
+                version=reader.varint(),
+            )
+            for _ in range(reader.varint())
+        ]
+        next_token = reader.optional_string()
+        reader.end()
+    except (IndexError, UnicodeDecodeError) as e:
+        raise ValueError("Malformed encoded page.") from e
+
+    return Page(items=items, next_token=next_token)
+
+
+def encode_task_list_page(page: Page[TaskList]) -> bytes:
+    writer = _Writer()
+    writer.varint(VERSION)
+    writer.varint(len(page.items))
+    for task_list in page.items:
+        writer.string(str(task_list.id))
+        writer.string(str(task_list.user_id))
+        writer.string(str(task_list.name))
+        writer.varint(int(task_list.count))
+        writer.varint(int(task_list.todo_count))
+        writer.varint(int(task_list.done_count))
+        writer.varint(task_list.version)
+    writer.optional_string(page.next_token)
+    return bytes(writer.buffer)
+
+
+def decode_task_list_page(data: bytes) -> Page[TaskList]:
+    """Decode a page of task lists, raising ``ValueError`` if malformed."""
+    reader = _reader(data)
+    try:
+        items = [
+            TaskList(
+                id=TaskListId(reader.string()),
+                user_id=UserId(reader.string()),
+                name=TaskListName(reader.string()),
+                count=TaskCount(reader.varint()),
+                todo_count=TaskCount(reader.varint()),
+                done_count=TaskCount(reader.varint()),
+                version=reader.varint(),
+            )
+            for _ in range(reader.varint())
+        ]
+        next_token = reader.optional_string()
+        reader.end()
+    except (IndexError, UnicodeDecodeError) as e:
+        raise ValueError("Malformed encoded page.") from e
+
+    return Page(items=items, next_token=next_token)
@@ -0,0 +1,120 @@
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Self
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    """Size and time to live of the in-process cache of one entity type.
+
+    A ``max_size`` of zero disables the cache.
+    """
+
+    max_size: int = 1024
+    ttl: float = 5.0
+
+    @classmethod
+    def from_env(cls, prefix: str, default: Self | None = None) -> Self:
+        """Read ``{prefix}_CACHE_MAX_SIZE`` and ``{prefix}_CACHE_TTL``.
+
+        Unset variables fall back to ``default``, if given.
+        """
+        default = default or cls()
+        return cls(
+            max_size=int(
+                os.getenv(f"{prefix}_CACHE_MAX_SIZE", default.max_size)
+            ),
+            ttl=float(os.getenv(f"{prefix}_CACHE_TTL", default.ttl)),
+        )
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class LRUCache[K: Hashable, V]:
+    """Thread-safe, size-bounded LRU cache whose entries expire after a TTL.
+
+    Values are copied on the way in and out, so callers may mutate the
+    entities they get without corrupting the cache. Expired entries count
+    as misses and are dropped when they are read.
+    """
+
+    def __init__(
+        self,
+        settings: CacheSettings,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_size = settings.max_size
+        self._ttl = settings.ttl
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return copy.copy(entry[1])
+
+    def put(self, key: K, value: V) -> None:
+        if self._max_size <= 0:
+            return
+
+        expires_at = self._clock() + self._ttl
+        with self._lock:
+            self._entries[key] = (expires_at, copy.copy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[V], bool]) -> None:
+        """Drop every entry whose value matches ``predicate``.
+
+        Scans the whole cache, so it is meant for rare writes touching
+        many entries at once.
+        """
+        with self._lock:
+            for key in [
+                key
+                for key, (_, value) in self._entries.items()
+                if predicate(value)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
@@ -0,0 +1,293 @@
+import os
+import secrets
+import socket
+import threading
+import time
+from abc import abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Protocol, Self
+from urllib.parse import urlparse
+
+from loguru import logger
+
+
+class SharedCacheError(Exception):
+    """The shared cache could not be reached or rejected a command."""
+
+
+class SharedCache(Protocol):
+    """Byte store shared by every process of the fleet."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Get the value of ``key``, or ``None`` if it is missing."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Set ``key`` to ``value`` for ``ttl`` seconds."""
+        raise NotImplementedError
+
+
+class InMemorySharedCache(SharedCache):
+    """Stand-in for the shared cache, local to the process."""
+
+    def __init__(self):
+        self._entries: dict[str, tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+
+class RedisSharedCache(SharedCache):
+    """Minimal client of the Redis protocol (RESP2) over one connection.
+
+    Only the handful of commands the collection cache needs are
+    implemented, so no client library is required. Commands are
+    serialized on the connection, which is reopened after any error.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 6379,
+        db: int = 0,
+        timeout: float = 0.5,
+    ):
+        self._address = (host, port)
+        self._db = db
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._socket: socket.socket | None = None
+        self._reader: Any = None
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 0.5) -> Self:
+        """Create a client for ``redis://host[:port][/db]``."""
+        parsed = urlparse(url)
+        return cls(
+            host=parsed.hostname or "localhost",
+            port=parsed.port or 6379,
+            db=int(parsed.path.lstrip("/") or 0),
+            timeout=timeout,
+        )
+
+    def get(self, key: str) -> bytes | None:
+        return self._command(b"GET", key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._command(b"SET", key, value, b"PX", int(ttl * 1000))
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _command(self, *args: Any) -> Any:
+        with self._lock:
+            try:
+                if self._socket is None:
+                    self._connect()
+                self._send(*args)
+                return self._read_reply()
+            except OSError as e:
+                self._disconnect()
+                raise SharedCacheError(str(e)) from e
+            except SharedCacheError:
+                self._disconnect()
+                raise
+
+    def _connect(self) -> None:
+        self._socket = socket.create_connection(self._address, self._timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._socket.makefile("rb")
+        if self._db:
+            self._send(b"SELECT", self._db)
+            self._read_reply()
+
+    def _disconnect(self) -> None:
+        if self._socket is not None:
+            self._reader.close()
+            self._socket.close()
+        self._socket = None
+        self._reader = None
+
+    def _send(self, *args: Any) -> None:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        assert self._socket is not None
+        self._socket.sendall(b"".join(parts))
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise SharedCacheError("Connection closed by the server.")
+
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            raise SharedCacheError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            length = int(rest)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(rest)
+            if length < 0:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise SharedCacheError(f"Unexpected reply: {line!r}")
+
+
+@dataclass(frozen=True)
+class SharedCacheSettings:
+    """Where the shared cache lives and how long its pages are kept.
+
+    ``url`` is ``redis://host[:port][/db]`` or ``memory://`` for the
+    process-local stand-in. Without a URL the shared tier is disabled.
+    ``settle`` is how long a collection is left uncached after a write,
+    for its indexes to catch up.
+    """
+
+    url: str | None = None
+    ttl: float = 60.0
+    timeout: float = 0.5
+    settle: float = 1.0
+
+    @classmethod
+    def from_env(cls) -> Self:
+        return cls(
+            url=os.getenv("SHARED_CACHE_URL") or None,
+            ttl=float(os.getenv("SHARED_CACHE_TTL", cls.ttl)),
+            timeout=float(os.getenv("SHARED_CACHE_TIMEOUT", cls.timeout)),
+            settle=float(os.getenv("SHARED_CACHE_SETTLE", cls.settle)),
+        )
+
+    def create_cache(self) -> SharedCache | None:
+        if self.url is None:
+            return None
+        if self.url.startswith("memory://"):
+            return InMemorySharedCache()
+        if self.url.startswith("redis://"):
+            return RedisSharedCache.from_url(self.url, timeout=self.timeout)
+        raise ValueError(f"Unsupported shared cache URL: {self.url}")
+
+    def create_collections(self) -> "CollectionCache | None":
+        cache = self.create_cache()
+        if cache is None:
+            return None
+        return CollectionCache(cache, self.ttl, settle=self.settle)
+
+
+class CollectionCache:
+    """Pages of collection queries, invalidated by a generation token.
+
+    Every collection has a generation that writes replace with a new
+    token, and its pages are stored under keys containing the current
+    one, so invalidating a collection is one ``SET`` and stale pages
+    simply expire.
+
+    Listings read indexes that lag behind writes, so a collection is not
+    cached until ``settle`` seconds after its last invalidation: a page
+    read sooner could miss the write and be kept for the whole TTL. Reads
+    fail open and are served by the repository, but a failed invalidation
+    stops this process from using the cache for one page TTL, until every
+    page it could have left stale has expired.
+    """
+
+    def __init__(
+        self,
+        cache: SharedCache,
+        ttl: float,
+        settle: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._cache = cache
+        self._ttl = ttl
+        self._settle = settle
+        self._clock = clock
+        self._suspended_until = 0.0
+
+    def key(self, collection: str, *query: object) -> str | None:
+        """Key of a page of ``collection`` at its current generation.
+
+        Returns ``None`` when the page must not be cached: the cache is
+        unavailable or the collection was invalidated too recently.
+        """
+        now = self._clock()
+        if now < self._suspended_until:
+            return None
+
+        try:
+            generation = self._cache.get(f"gen:{collection}") or b"0"
+        except SharedCacheError as e:
+            logger.warning(f"Shared cache unavailable: {e}")
+            return None
+
+        token = generation.decode()
+        invalidated_at = int(token.partition("-")[0]) / 1000
+        if now < invalidated_at + self._settle:
+            return None
+
+        parts = ":".join("" if part is None else str(part) for part in query)
+        return f"page:{collection}:{token}:{parts}"
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return self._cache.get(key)
+        except SharedCacheError as e:
+            logger.warning(f"Shared cache unavailable: {e}")
+            return None
+
+    def put(self, key: str, value: bytes) -> None:
+        try:
+            self._cache.set(key, value, self._ttl)
+        except SharedCacheError as e:
+            logger.warning(f"Shared cache unavailable: {e}")
+
+    def invalidate(self, collection: str) -> None:
+        # The token starts with the time of the write, in milliseconds,
+        # for readers to wait for the indexes to settle. The generation
+        # outlives the pages cached before it, or expiring would bring
+        # them back.
+        now = self._clock()
+        token = f"{int(now * 1000)}-{secrets.token_hex(4)}"
+        try:
+            self._cache.set(f"gen:{collection}", token.encode(), 2 * self._ttl)
+        except SharedCacheError as e:
+            logger.error(
+                f"Could not invalidate {collection}, bypassing the shared "
+                f"cache for {self._ttl:g}s: {e}"
+            )
+            self._suspended_until = now + self._ttl
+
+
+def user_task_lists(user_id: object) -> str:
+    """Collection of the task lists of a user."""
+    return f"user:{user_id}:task_lists"
+
+
+def task_list_tasks(task_list_id: object) -> str:
+    """Collection of the tasks of a task list."""
+    return f"task_list:{task_list_id}:tasks"
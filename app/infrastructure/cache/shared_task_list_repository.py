@@ -0,0 +1,114 @@
+from collections.abc import Iterator
+
+from ...domain.page import Page
+from ...domain.task import Task
+from ...domain.task_list import TaskList, TaskListId, TaskListName
+from ...domain.task_list_repository import TaskListRepository
+from ...domain.user import UserId
+from .codec import decode_task_list_page, encode_task_list_page
+from .shared import CollectionCache, task_list_tasks, user_task_lists
+
+
+class SharedCachedTaskListRepository(TaskListRepository):
+    """Cache the task list pages of each user in the shared cache.
+
+    Writes bump the generation of the user's collection after they
+    succeed, so no process reads a page cached before the write. Deletes,
+    made of several requests, bump it even when they fail partway.
+    """
+
+    def __init__(
+        self,
+        repository: TaskListRepository,
+        collections: CollectionCache,
+    ):
+        self._repository = repository
+        self._collections = collections
+
+    def store(self, task_list: TaskList) -> None:
+        """Save a task list to the repository."""
+        self._repository.store(task_list)
+        self._collections.invalidate(user_task_lists(task_list.user_id))
+
+    def update_name(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        name: TaskListName,
+    ) -> TaskList | None:
+        """Rename a task list and return the updated task list."""
+        task_list = self._repository.update_name(user_id, task_list_id, name)
+        self._collections.invalidate(user_task_lists(user_id))
+        return task_list
+
+    def find(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+    ) -> TaskList | None:
+        """Find a task list by the ID of its owner and its own ID."""
+        return self._repository.find(user_id, task_list_id)
+
+    def find_by_id(self, task_list_id: TaskListId) -> TaskList | None:
+        """Find a task list by its ID."""
+        return self._repository.find_by_id(task_list_id)
+
+    def find_with_tasks(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None = None,
+    ) -> tuple[TaskList, Page[Task]] | None:
+        """Find a task list and its first page of tasks by creation time."""
+        return self._repository.find_with_tasks(task_list_id, limit=limit)
+
+    def delete(
+        self,
+        task_list_id: TaskListId,
+        user_id: UserId | None = None,
+    ) -> None:
+        """Delete a task list and its tasks, by key or by ID alone."""
+        if user_id is None:
+            # The owner is needed to find the collection to invalidate.
+            task_list = self._repository.find_by_id(task_list_id)
+
+            if not task_list:
+                return
+
+            user_id = task_list.user_id
+
+        try:
+            self._repository.delete(task_list_id, user_id=user_id)
+        finally:
+            self._collections.invalidate(user_task_lists(user_id))
+            self._collections.invalidate(task_list_tasks(task_list_id))
+
+    def list_all(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+    ) -> Page[TaskList]:
+        """List the task lists of a user, one page at a time."""
+        key = self._collections.key(user_task_lists(user_id), limit, next_token)
+        data = self._collections.get(key) if key else None
+
+        if data is not None:
+            try:
+                return decode_task_list_page(data)
+            except ValueError:
+                pass
+
+        page = self._repository.list_all(
+            user_id,
+            limit=limit,
+            next_token=next_token,
+        )
+
+        if key:
+            self._collections.put(key, encode_task_list_page(page))
+
+        return page
+
+    def iter_all(self, user_id: UserId) -> Iterator[TaskList]:
+        """Iterate over the task lists of a user, page by page."""
+        return self._repository.iter_all(user_id)
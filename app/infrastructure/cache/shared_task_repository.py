@@ -0,0 +1,202 @@
+from collections.abc import Iterator, Sequence
+
+from ...domain.page import Page
+from ...domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from ...domain.task_feed import TaskFeedCursor
+from ...domain.task_list import TaskListId, TaskSortBy, TaskSortOrder
+from ...domain.task_repository import TaskRepository
+from ...domain.user import UserId
+from .codec import decode_task_page, encode_task_page
+from .shared import CollectionCache, task_list_tasks, user_task_lists
+
+
+class SharedCachedTaskRepository(TaskRepository):
+    """Cache the task pages of each task list in the shared cache.
+
+    Adding or removing a task, or setting its status, also bumps the task
+    lists of its owner, whose pages carry the task counts. Bulk adds and
+    deletes bump the collections even when they fail, since they may have
+    been written in part.
+    """
+
+    def __init__(
+        self,
+        repository: TaskRepository,
+        collections: CollectionCache,
+    ):
+        self._repository = repository
+        self._collections = collections
+
+    def store(self, task: Task) -> None:
+        """Save a task to the repository."""
+        self._repository.store(task)
+        self._collections.invalidate(task_list_tasks(task.task_list_id))
+
+    def add_task_to_list(self, user_id: UserId, task: Task) -> None:
+        """Save a new task and count it in its task list atomically."""
+        self._repository.add_task_to_list(user_id, task)
+        self._collections.invalidate(task_list_tasks(task.task_list_id))
+        self._collections.invalidate(user_task_lists(user_id))
+
+    def add_tasks_to_list(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        tasks: Sequence[Task],
+    ) -> None:
+        """Save new tasks of one task list and count them all or none."""
+        try:
+            self._repository.add_tasks_to_list(user_id, task_list_id, tasks)
+        finally:
+            self._collections.invalidate(task_list_tasks(task_list_id))
+            self._collections.invalidate(user_task_lists(user_id))
+
+    def remove_task_from_list(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+    ) -> None:
+        """Delete a task and uncount it from its task list atomically."""
+        self._repository.remove_task_from_list(user_id, task_list_id, task_id)
+        self._collections.invalidate(task_list_tasks(task_list_id))
+        self._collections.invalidate(user_task_lists(user_id))
+
+    def update(
+        self,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+        title: TaskTitle | None = None,
+        description: TaskDescription | None = None,
+        status: TaskStatus | None = None,
+        user_id: UserId | None = None,
+    ) -> Task | None:
+        """Update the given fields of a task and return the updated task."""
+        task = self._repository.update(
+            task_list_id,
+            task_id,
+            title=title,
+            description=description,
+            status=status,
+            user_id=user_id,
+        )
+        self._collections.invalidate(task_list_tasks(task_list_id))
+        if status is not None and user_id is not None:
+            self._collections.invalidate(user_task_lists(user_id))
+        return task
+
+    def find(
+        self,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+    ) -> Task | None:
+        """Find a task by the ID of its task list and its own ID."""
+        return self._repository.find(task_list_id, task_id)
+
+    def find_by_id(self, task_id: TaskId) -> Task | None:
+        """Find a task by its ID."""
+        return self._repository.find_by_id(task_id)
+
+    def find_many(
+        self,
+        keys: Sequence[tuple[TaskListId, TaskId]],
+    ) -> list[Task | None]:
+        """Find tasks by their full keys, ``None`` for missing ones."""
+        return self._repository.find_many(keys)
+
+    def delete(
+        self,
+        task_id: TaskId,
+        task_list_id: TaskListId | None = None,
+    ) -> None:
+        """Delete a task by its key, or by its ID alone."""
+        if task_list_id is None:
+            # The task list is needed to find the collection to invalidate.
+            task = self._repository.find_by_id(task_id)
+
+            if not task:
+                return
+
+            task_list_id = task.task_list_id
+
+        try:
+            self._repository.delete(task_id, task_list_id=task_list_id)
+        finally:
+            self._collections.invalidate(task_list_tasks(task_list_id))
+
+    def list_all(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a task list in order, one page at a time."""
+        sort_by = sort_by or TaskSortBy.default()
+        order = order or TaskSortOrder.default()
+        key = self._collections.key(
+            task_list_tasks(task_list_id),
+            sort_by,
+            order,
+            status,
+            limit,
+            next_token,
+        )
+        data = self._collections.get(key) if key else None
+
+        if data is not None:
+            try:
+                return decode_task_page(data)
+            except ValueError:
+                pass
+
+        page = self._repository.list_all(
+            task_list_id,
+            limit=limit,
+            next_token=next_token,
+            sort_by=sort_by,
+            order=order,
+            status=status,
+        )
+
+        if key:
+            self._collections.put(key, encode_task_page(page))
+
+        return page
+
+    def list_user_tasks(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a user without caching the page.
+
+        The page spans task lists, whose writes only invalidate their own
+        collections, so it could not be invalidated reliably.
+        """
+        return self._repository.list_user_tasks(
+            user_id,
+            limit=limit,
+            next_token=next_token,
+            order=order,
+            status=status,
+        )
+
+    def iter_all(
+        self,
+        task_list_id: TaskListId,
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+        start: TaskFeedCursor | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[Task]:
+        """Iterate over the tasks of a task list in order, page by page."""
+        return self._repository.iter_all(
+            task_list_id, sort_by, order, status, start, page_size
+        )
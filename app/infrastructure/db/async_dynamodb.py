@@ -0,0 +1,227 @@
+import asyncio
+import json
+import random
+from typing import Any, Self
+
+import boto3
+import httpx
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.exceptions import ClientError
+
+from .dynamodb import DynamoDBSettings, PlainValues
+from .wire import AsyncWireTable
+
+TARGET_PREFIX = "DynamoDB_20120810"
+
+CONTENT_TYPE = "application/x-amz-json-1.0"
+
+RETRYABLE_ERROR_CODES = frozenset(
+    [
+        "InternalServerError",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "ServiceUnavailable",
+        "ThrottlingException",
+    ]
+)
+
+
+class AsyncDynamoDBClient:
+    """Non-blocking DynamoDB client speaking the JSON protocol over HTTP.
+
+    Requests are signed with botocore's SigV4 signer and sent through one
+    pooled ``httpx.AsyncClient``. Parameters and results use the typed
+    wire format (``{"S": "..."}``) of the low-level boto3 client, and
+    errors are raised as botocore ``ClientError`` so callers can handle
+    them the same way as with the synchronous client.
+    """
+
+    def __init__(
+        self,
+        http: httpx.AsyncClient,
+        credentials,
+        region_name: str,
+        endpoint_url: str,
+        max_attempts: int = 3,
+    ):
+        self._http = http
+        self._credentials = credentials
+        self._region_name = region_name
+        self._endpoint_url = endpoint_url
+        self._max_attempts = max_attempts
+
+    @classmethod
+    def create(
+        cls,
+        settings: DynamoDBSettings,
+        session: boto3.Session,
+    ) -> Self:
+        """Create a client sharing the credentials of ``session``."""
+        http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.max_pool_connections,
+                max_keepalive_connections=settings.max_pool_connections,
+            ),
+            timeout=httpx.Timeout(
+                settings.read_timeout,
+                connect=settings.connect_timeout,
+            ),
+        )
+        endpoint_url = (
+            settings.endpoint_url
+            or f"https://dynamodb.{settings.region_name}.amazonaws.com/"
+        )
+
+        return cls(
+            http=http,
+            credentials=session.get_credentials(),
+            region_name=settings.region_name,
+            endpoint_url=endpoint_url,
+            max_attempts=settings.max_attempts,
+        )
+
+    async def call(
+        self,
+        operation: str,
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Call a DynamoDB operation, retrying throttling and 5xx errors."""
+        body = json.dumps(params, separators=(",", ":")).encode()
+
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                response = await self._http.post(
+                    self._endpoint_url,
+                    content=body,
+                    headers=self._sign(operation, body),
+                )
+            except httpx.TransportError:
+                if attempt == self._max_attempts:
+                    raise
+                await self._backoff(attempt)
+                continue
+
+            if response.status_code < 400:
+                return response.json()
+
+            error = self._client_error(operation, response)
+            code = error.response["Error"]["Code"]
+            retryable = (
+                code in RETRYABLE_ERROR_CODES or response.status_code >= 500
+            )
+            if not retryable or attempt == self._max_attempts:
+                raise error
+            await self._backoff(attempt)
+
+        raise AssertionError("unreachable")
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self._http.aclose()
+
+    def _sign(self, operation: str, body: bytes) -> dict[str, str]:
+        request = AWSRequest(
+            method="POST",
+            url=self._endpoint_url,
+            data=body,
+            headers={
+                "Content-Type": CONTENT_TYPE,
+                "X-Amz-Target": f"{TARGET_PREFIX}.{operation}",
+            },
+        )
+        SigV4Auth(self._credentials, "dynamodb", self._region_name).add_auth(
+            request
+        )
+        return dict(request.headers.items())
+
+    @staticmethod
+    def _client_error(
+        operation: str,
+        response: httpx.Response,
+    ) -> ClientError:
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+
+        error_response: dict[str, Any] = {
+            "Error": {
+                "Code": str(data.get("__type", "")).rsplit("#", 1)[-1]
+                or str(response.status_code),
+                "Message": data.get("message") or data.get("Message", ""),
+            },
+            "ResponseMetadata": {"HTTPStatusCode": response.status_code},
+        }
+        if "CancellationReasons" in data:
+            error_response["CancellationReasons"] = data["CancellationReasons"]
+        if "Item" in data:
+            error_response["Item"] = data["Item"]
+
+        # The error response of the stubs has no "Item", which botocore
+        # also passes through on a failed condition check.
+        return ClientError(
+            error_response,  # ty: ignore[invalid-argument-type]
+            operation,
+        )
+
+    @staticmethod
+    async def _backoff(attempt: int) -> None:
+        # Full jitter, capped at one second.
+        await asyncio.sleep(random.uniform(0, min(1.0, 0.025 * 2**attempt)))
+
+
+class AsyncTable:
+    """Asynchronous counterpart of the boto3 ``Table`` resource.
+
+    Parameters and results use plain Python values and accept
+    ``boto3.dynamodb.conditions`` expressions, converted like those of a
+    ``ClientTable``, so repositories can build the same requests as their
+    synchronous versions.
+    """
+
+    def __init__(
+        self,
+        client: AsyncDynamoDBClient,
+        name: str,
+        service_model,
+    ):
+        self.name = name
+        self._client = client
+        self._values = PlainValues(service_model)
+
+    @property
+    def wire(self) -> AsyncWireTable:
+        """Queries of the table in the typed wire format, untransformed."""
+        return AsyncWireTable(self._client, self.name)
+
+    async def get_item(self, **kwargs: Any) -> dict[str, Any]:
+        return await self.call("GetItem", TableName=self.name, **kwargs)
+
+    async def put_item(self, **kwargs: Any) -> dict[str, Any]:
+        return await self.call("PutItem", TableName=self.name, **kwargs)
+
+    async def update_item(self, **kwargs: Any) -> dict[str, Any]:
+        return await self.call("UpdateItem", TableName=self.name, **kwargs)
+
+    async def delete_item(self, **kwargs: Any) -> dict[str, Any]:
+        return await self.call("DeleteItem", TableName=self.name, **kwargs)
+
+    async def query(self, **kwargs: Any) -> dict[str, Any]:
+        return await self.call("Query", TableName=self.name, **kwargs)
+
+    async def transact_write_items(self, **kwargs: Any) -> dict[str, Any]:
+        return await self.call("TransactWriteItems", **kwargs)
+
+    async def batch_write_item(self, **kwargs: Any) -> dict[str, Any]:
+        return await self.call("BatchWriteItem", **kwargs)
+
+    async def batch_get_item(self, **kwargs: Any) -> dict[str, Any]:
+        return await self.call("BatchGetItem", **kwargs)
+
+    async def call(self, operation: str, **params: Any) -> dict[str, Any]:
+        """Call ``operation`` with plain Python parameters."""
+        parsed = await self._client.call(
+            operation, self._values.params(operation, params)
+        )
+        return self._values.result(operation, parsed)
@@ -0,0 +1,258 @@
+from collections.abc import AsyncIterator
+
+from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
+
+from ...domain.page import Page
+from ...domain.task import Task
+from ...domain.task_list import TaskList, TaskListId, TaskListName
+from ...domain.task_list_repository import AsyncTaskListRepository
+from ...domain.user import UserId
+from .async_dynamodb import AsyncTable
+from .batch import batch_delete_async
+from .expressions import increment_version, set_expression
+from .items import (
+    task_from_wire,
+    task_list_from_item,
+    task_list_from_wire,
+    task_list_to_item,
+)
+from .keys import TASK_LIST_METADATA, task_list_key
+from .migration import (
+    iter_with_moved_task_lists_async,
+    merge_moved_task_lists,
+    move_legacy_task_list_async,
+    move_legacy_task_lists_async,
+)
+from .operations import (
+    list_task_lists_query,
+    owned_task_list_request,
+    task_list_with_tasks_query,
+)
+from .pagination import iter_query_async, query_page_async
+from .transaction import is_conditional_check_failed
+
+
+class AsyncDynamoDBTaskListRepository(AsyncTaskListRepository):
+    """``DynamoDBTaskListRepository`` on top of an ``AsyncTable``."""
+
+    def __init__(self, table: AsyncTable, legacy_task_lists: bool = False):
+        self._table = table
+        self._wire = table.wire
+        self._legacy_task_lists = legacy_task_lists
+
+    async def store(self, task_list: TaskList) -> None:
+        """Save a task list to the repository."""
+        await self._table.put_item(Item=task_list_to_item(task_list))
+
+    async def update_name(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        name: TaskListName,
+    ) -> TaskList | None:
+        """Rename a task list in a single write."""
+        task_list = await self._update_name(user_id, task_list_id, name)
+
+        if task_list is None and await self._move_legacy(task_list_id, user_id):
+            task_list = await self._update_name(user_id, task_list_id, name)
+
+        return task_list
+
+    async def _update_name(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        name: TaskListName,
+    ) -> TaskList | None:
+        try:
+            resp = await self._table.update_item(
+                **owned_task_list_request(
+                    user_id,
+                    Key=task_list_key(task_list_id),
+                    ReturnValues="ALL_NEW",
+                    **increment_version(set_expression({"name": str(name)})),
+                )
+            )
+        except ClientError as e:
+            if is_conditional_check_failed(e):
+                return None
+            raise
+
+        return task_list_from_item(resp["Attributes"])
+
+    async def find(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+    ) -> TaskList | None:
+        """Find a task list by its ID, if it belongs to ``user_id``."""
+        task_list = await self.find_by_id(task_list_id)
+
+        if task_list is None or task_list.user_id != user_id:
+            return None
+
+        return task_list
+
+    async def find_by_id(self, task_list_id: TaskListId) -> TaskList | None:
+        """Find a task list by its ID."""
+        task_list = await self._get(task_list_id)
+
+        if task_list is None and await self._move_legacy(task_list_id):
+            task_list = await self._get(task_list_id)
+
+        return task_list
+
+    async def _get(self, task_list_id: TaskListId) -> TaskList | None:
+        resp = await self._table.get_item(
+            Key=task_list_key(task_list_id),
+            ConsistentRead=True,
+        )
+        item = resp.get("Item")
+
+        if not item:
+            return None
+
+        return task_list_from_item(item)
+
+    async def find_with_tasks(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None = None,
+    ) -> tuple[TaskList, Page[Task]] | None:
+        """Find a task list and its first page of tasks with one query."""
+        result = await self._find_with_tasks(task_list_id, limit)
+
+        if result is None and await self._move_legacy(task_list_id):
+            result = await self._find_with_tasks(task_list_id, limit)
+
+        return result
+
+    async def _find_with_tasks(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None,
+    ) -> tuple[TaskList, Page[Task]] | None:
+        items, next_token = await query_page_async(
+            self._wire,
+            "PK",
+            f"TASK_LIST#{task_list_id}",
+            # One more item for the task list itself.
+            limit=None if limit is None else limit + 1,
+            index_key="created_at",
+            **task_list_with_tasks_query(task_list_id),
+        )
+
+        if not items or items[0]["SK"]["S"] != TASK_LIST_METADATA:
+            return None
+
+        task_list_ids = {str(task_list_id): task_list_id}
+
+        return task_list_from_wire(items[0]), Page(
+            items=[task_from_wire(item, task_list_ids) for item in items[1:]],
+            next_token=next_token,
+        )
+
+    async def delete(
+        self,
+        task_list_id: TaskListId,
+        user_id: UserId | None = None,
+    ) -> None:
+        """Delete a task list and every task in it."""
+        deleted = await self._delete_item(task_list_id, user_id)
+
+        if not deleted and await self._move_legacy(task_list_id, user_id):
+            deleted = await self._delete_item(task_list_id, user_id)
+
+        if not deleted:
+            return
+
+        keys = iter_query_async(
+            self._table,
+            KeyConditionExpression=Key("PK").eq(f"TASK_LIST#{task_list_id}"),
+            ProjectionExpression="PK, SK",
+        )
+        await batch_delete_async(
+            self._table,
+            self._table.name,
+            [key async for key in keys],
+        )
+
+    async def list_all(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+    ) -> Page[TaskList]:
+        """List the task lists of a user, one page at a time."""
+        moved = []
+        if self._legacy_task_lists and next_token is None:
+            moved = await move_legacy_task_lists_async(self._table, user_id)
+
+        items, next_token = await query_page_async(
+            self._wire,
+            "GSI1PK",
+            f"USER#{user_id}",
+            limit=limit,
+            next_token=next_token,
+            index_key="GSI1SK",
+            **list_task_lists_query(user_id),
+        )
+
+        task_lists = [task_list_from_wire(item) for item in items]
+        if moved:
+            task_lists = merge_moved_task_lists(
+                task_lists, moved, last_page=next_token is None
+            )
+
+        return Page(items=task_lists, next_token=next_token)
+
+    async def iter_all(self, user_id: UserId) -> AsyncIterator[TaskList]:
+        """Iterate over the task lists of a user without loading them all."""
+        moved = []
+        if self._legacy_task_lists:
+            moved = await move_legacy_task_lists_async(self._table, user_id)
+
+        items = iter_query_async(self._wire, **list_task_lists_query(user_id))
+        task_lists = (task_list_from_wire(item) async for item in items)
+
+        async for task_list in iter_with_moved_task_lists_async(
+            task_lists, moved
+        ):
+            yield task_list
+
+    async def _delete_item(
+        self,
+        task_list_id: TaskListId,
+        user_id: UserId | None,
+    ) -> bool:
+        request = {
+            "Key": task_list_key(task_list_id),
+            "ConditionExpression": "attribute_exists(PK)",
+        }
+        if user_id is not None:
+            request = owned_task_list_request(
+                user_id,
+                Key=task_list_key(task_list_id),
+            )
+
+        try:
+            await self._table.delete_item(**request)
+        except ClientError as e:
+            if is_conditional_check_failed(e):
+                return False
+            raise
+
+        return True
+
+    async def _move_legacy(
+        self,
+        task_list_id: TaskListId,
+        user_id: UserId | None = None,
+    ) -> bool:
+        """Move a task list still at its legacy key, if it is looked for."""
+        if not self._legacy_task_lists:
+            return False
+        return await move_legacy_task_list_async(
+            self._table, task_list_id, user_id
+        )
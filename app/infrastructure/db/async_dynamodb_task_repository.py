@@ -0,0 +1,483 @@
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from functools import partial
+
+from botocore.exceptions import ClientError
+from loguru import logger
+
+from ...domain.page import Page
+from ...domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from ...domain.task_feed import TaskFeedCursor
+from ...domain.task_list import TaskListId, TaskSortBy, TaskSortOrder
+from ...domain.task_repository import AsyncTaskRepository
+from ...domain.user import UserId
+from .async_dynamodb import AsyncTable
+from .batch import batch_delete_async, batch_get_async, batch_put_async
+from .items import (
+    task_from_item,
+    task_from_wire,
+    task_to_item,
+    user_tasks_key,
+)
+from .keys import task_key
+from .migration import move_legacy_task_list_async
+from .operations import (
+    STATUS_ATTEMPTS,
+    TaskListNotFoundError,
+    TaskStatusChangedError,
+    add_task_to_list_error,
+    add_task_to_list_request,
+    change_task_status_error,
+    change_task_status_request,
+    find_task_query,
+    list_tasks_query,
+    list_user_tasks_query,
+    release_task_count_request,
+    remove_task_from_list_error,
+    remove_task_from_list_request,
+    reserve_task_count_error,
+    reserve_task_count_request,
+    update_task_error,
+    update_task_request,
+)
+from .pagination import iter_query_async, query_page_async
+from .schema import LOCAL_SECONDARY_INDEXES
+
+
+class AsyncDynamoDBTaskRepository(AsyncTaskRepository):
+    """``DynamoDBTaskRepository`` on top of an ``AsyncTable``."""
+
+    def __init__(self, table: AsyncTable, legacy_task_lists: bool = False):
+        self._table = table
+        self._wire = table.wire
+        self._legacy_task_lists = legacy_task_lists
+
+    async def store(self, task: Task) -> None:
+        """Save a task to the repository."""
+        await self._table.put_item(Item=task_to_item(task))
+
+    async def add_task_to_list(self, user_id: UserId, task: Task) -> None:
+        """Save a new task and increment the count of its task list."""
+        await self._on_task_list(
+            user_id,
+            task.task_list_id,
+            partial(self._add_task_to_list, user_id, task),
+        )
+
+    async def _add_task_to_list(self, user_id: UserId, task: Task) -> None:
+        try:
+            await self._table.transact_write_items(
+                **add_task_to_list_request(self._table.name, user_id, task)
+            )
+        except ClientError as e:
+            raise add_task_to_list_error(e, user_id) from e
+
+    async def add_tasks_to_list(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        tasks: Sequence[Task],
+    ) -> None:
+        """Save new tasks of one task list with batched writes."""
+        if not tasks:
+            return
+
+        await self._on_task_list(
+            user_id,
+            task_list_id,
+            partial(self._reserve_task_count, user_id, task_list_id, tasks),
+        )
+
+        try:
+            await batch_put_async(
+                self._table,
+                self._table.name,
+                [task_to_item(task, user_id) for task in tasks],
+            )
+        except Exception:
+            try:
+                await batch_delete_async(
+                    self._table,
+                    self._table.name,
+                    [task_key(task_list_id, task.id) for task in tasks],
+                )
+                await self._table.update_item(
+                    **release_task_count_request(user_id, task_list_id, tasks)
+                )
+            except Exception as e:
+                # The count stays reserved until reconcile_counts repairs it.
+                logger.error(f"Error rolling back tasks of {task_list_id}: {e}")
+            raise
+
+    async def remove_task_from_list(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+    ) -> None:
+        """Delete a task and decrement the counts of its task list."""
+        for _ in range(STATUS_ATTEMPTS):
+            task = await self.find(task_list_id, task_id)
+
+            if task is None:
+                raise ValueError("Task not found.")
+
+            try:
+                await self._on_task_list(
+                    user_id,
+                    task_list_id,
+                    partial(
+                        self._remove_task,
+                        user_id,
+                        task_list_id,
+                        task_id,
+                        task.status,
+                    ),
+                )
+                return
+            except TaskStatusChangedError:
+                continue
+
+        raise RuntimeError("Task status kept changing while removing it.")
+
+    async def update(
+        self,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+        title: TaskTitle | None = None,
+        description: TaskDescription | None = None,
+        status: TaskStatus | None = None,
+        user_id: UserId | None = None,
+    ) -> Task | None:
+        """Update the given fields of a task and its status counters."""
+        if status is None:
+            return await self._update(
+                update_task_request(
+                    task_list_id,
+                    task_id,
+                    title=title,
+                    description=description,
+                )
+            )
+
+        if user_id is None:
+            raise ValueError("The task list owner is needed to set a status.")
+
+        for _ in range(STATUS_ATTEMPTS):
+            task = await self.find(task_list_id, task_id)
+
+            if task is None:
+                return None
+
+            try:
+                if task.status == status:
+                    return await self._update(
+                        update_task_request(
+                            task_list_id,
+                            task_id,
+                            title=title,
+                            description=description,
+                            status=status,
+                            created_at=task.created_at.isoformat(),
+                            previous_status=task.status,
+                        )
+                    )
+
+                return await self._change_status(
+                    user_id,
+                    task,
+                    status,
+                    title=title,
+                    description=description,
+                )
+            except TaskStatusChangedError:
+                continue
+
+        raise RuntimeError("Task status kept changing while updating it.")
+
+    async def find(
+        self,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+    ) -> Task | None:
+        """Find a task by its full key."""
+        resp = await self._table.get_item(
+            Key=task_key(task_list_id, task_id),
+            ConsistentRead=True,
+        )
+        item = resp.get("Item")
+
+        if not item:
+            return None
+
+        return task_from_item(item)
+
+    async def find_by_id(
+        self,
+        task_id: TaskId,
+    ) -> Task | None:
+        """Find a task by its ID."""
+        logger.info(f"Finding task by ID: {task_id}")
+
+        resp = await self._wire.query(**find_task_query(task_id))
+        items = resp["Items"]
+
+        if not items:
+            return None
+
+        return task_from_wire(items[0])
+
+    async def find_many(
+        self,
+        keys: Sequence[tuple[TaskListId, TaskId]],
+    ) -> list[Task | None]:
+        """Find tasks by their full keys, in the order of ``keys``.
+
+        Duplicate keys are read once and missing tasks are ``None``.
+        """
+        items = await batch_get_async(
+            self._table,
+            self._table.name,
+            [task_key(*key) for key in dict.fromkeys(keys)],
+            ConsistentRead=True,
+        )
+        tasks = {
+            (task.task_list_id, task.id): task
+            for task in map(task_from_item, items)
+        }
+
+        return [tasks.get(key) for key in keys]
+
+    async def delete(
+        self,
+        task_id: TaskId,
+        task_list_id: TaskListId | None = None,
+    ) -> None:
+        """Delete a task by its key, or by its ID alone."""
+        if task_list_id is None:
+            task = await self.find_by_id(task_id)
+
+            if not task:
+                return
+
+            task_list_id = task.task_list_id
+
+        await self._table.delete_item(Key=task_key(task_list_id, task_id))
+
+    async def list_all(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a task list in order, one page at a time."""
+        query = list_tasks_query(
+            task_list_id,
+            sort_by or TaskSortBy.default(),
+            order or TaskSortOrder.default(),
+            status=status,
+        )
+        items, next_token = await query_page_async(
+            self._wire,
+            "PK",
+            f"TASK_LIST#{task_list_id}",
+            limit=limit,
+            next_token=next_token,
+            index_key=LOCAL_SECONDARY_INDEXES[query["IndexName"]],
+            **query,
+        )
+
+        task_list_ids = {str(task_list_id): task_list_id}
+
+        return Page(
+            items=[task_from_wire(item, task_list_ids) for item in items],
+            next_token=next_token,
+        )
+
+    async def list_user_tasks(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a user across their task lists by creation time.
+
+        The tasks are read from the user task indexes, and the next token
+        is a ``TaskFeedCursor`` after the last task of the page.
+        """
+        cursor = (
+            None if next_token is None else TaskFeedCursor.decode(next_token)
+        )
+        items, last_token = await query_page_async(
+            self._wire,
+            "GSI2PK",
+            user_tasks_key(user_id),
+            limit=limit,
+            **list_user_tasks_query(
+                user_id,
+                order or TaskSortOrder.default(),
+                status=status,
+                cursor=cursor,
+            ),
+        )
+        task_list_ids: dict[str, TaskListId] = {}
+        tasks = [task_from_wire(item, task_list_ids) for item in items]
+
+        return Page(
+            items=tasks,
+            next_token=None
+            if last_token is None
+            else TaskFeedCursor.after(tasks[-1]).encode(),
+        )
+
+    async def iter_all(
+        self,
+        task_list_id: TaskListId,
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+        start: TaskFeedCursor | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[Task]:
+        """Iterate over the tasks of a task list without loading them all."""
+        query = list_tasks_query(
+            task_list_id,
+            sort_by or TaskSortBy.default(),
+            order or TaskSortOrder.default(),
+            status=status,
+            start=start,
+        )
+        if page_size is not None:
+            query["Limit"] = page_size
+        items = iter_query_async(self._wire, **query)
+        task_list_ids = {str(task_list_id): task_list_id}
+
+        async for item in items:
+            yield task_from_wire(item, task_list_ids)
+
+    async def _update(self, request: dict) -> Task | None:
+        try:
+            resp = await self._table.update_item(**request)
+        except ClientError as e:
+            error = update_task_error(e)
+            if error is None:
+                return None
+            raise error from e
+
+        return task_from_item(resp["Attributes"])
+
+    async def _change_status(
+        self,
+        user_id: UserId,
+        task: Task,
+        status: TaskStatus,
+        title: TaskTitle | None = None,
+        description: TaskDescription | None = None,
+    ) -> Task | None:
+        changed = await self._on_task_list(
+            user_id,
+            task.task_list_id,
+            partial(
+                self._write_status_change,
+                user_id,
+                task,
+                status,
+                title,
+                description,
+            ),
+        )
+        if not changed:
+            return None
+
+        task.update_status(status)
+        task.version += 1
+        if title is not None:
+            task.update_title(title)
+        if description is not None:
+            task.update_description(description)
+
+        return task
+
+    async def _write_status_change(
+        self,
+        user_id: UserId,
+        task: Task,
+        status: TaskStatus,
+        title: TaskTitle | None,
+        description: TaskDescription | None,
+    ) -> bool:
+        try:
+            await self._table.transact_write_items(
+                **change_task_status_request(
+                    self._table.name,
+                    user_id,
+                    task,
+                    status,
+                    title=title,
+                    description=description,
+                )
+            )
+        except ClientError as e:
+            error = change_task_status_error(e)
+            if error is None:
+                return False
+            raise error from e
+
+        return True
+
+    async def _reserve_task_count(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        tasks: Sequence[Task],
+    ) -> None:
+        try:
+            await self._table.update_item(
+                **reserve_task_count_request(user_id, task_list_id, tasks)
+            )
+        except ClientError as e:
+            raise reserve_task_count_error(e, user_id) from e
+
+    async def _remove_task(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+        status: TaskStatus,
+    ) -> None:
+        try:
+            await self._table.transact_write_items(
+                **remove_task_from_list_request(
+                    self._table.name,
+                    user_id,
+                    task_list_id,
+                    task_id,
+                    status,
+                )
+            )
+        except ClientError as e:
+            raise remove_task_from_list_error(e) from e
+
+    async def _on_task_list[T](
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        write: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Run a write, moving its task list from a legacy key if missing."""
+        try:
+            return await write()
+        except TaskListNotFoundError:
+            if (
+                not self._legacy_task_lists
+                or not await move_legacy_task_list_async(
+                    self._table, task_list_id, user_id
+                )
+            ):
+                raise
+
+        return await write()
@@ -0,0 +1,97 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+from loguru import logger
+
+from ...domain.user import UserId
+from .batch import BATCH_CONCURRENCY
+from .items import user_tasks_key
+from .keys import TASK_LIST_METADATA
+from .pagination import iter_query
+from .transaction import is_conditional_check_failed
+
+
+def iter_task_list_owners(table) -> Iterator[dict[str, Any]]:
+    """Scan the key and owner of every task list item of the table."""
+    kwargs: dict[str, Any] = {
+        "FilterExpression": Attr("SK").eq(TASK_LIST_METADATA),
+        "ProjectionExpression": "PK, user_id",
+    }
+    while True:
+        resp = table.scan(**kwargs)
+        yield from resp["Items"]
+
+        last_evaluated_key = resp.get("LastEvaluatedKey")
+        if last_evaluated_key is None:
+            return
+
+        kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+
+def unindexed_tasks_query(partition: str) -> dict[str, Any]:
+    """``Query`` reading the keys of the tasks of a list not yet indexed."""
+    return {
+        "KeyConditionExpression": Key("PK").eq(partition)
+        & Key("SK").begins_with("TASK#"),
+        "FilterExpression": Attr("GSI2PK").not_exists(),
+        "ProjectionExpression": "PK, SK",
+    }
+
+
+def index_task_request(
+    key: dict[str, Any],
+    user_id: UserId,
+) -> dict[str, Any]:
+    """``UpdateItem`` indexing one task in the tasks of ``user_id``.
+
+    The task must still exist, so a task deleted in between is not
+    recreated as a bare key.
+    """
+    return {
+        "Key": {"PK": key["PK"], "SK": key["SK"]},
+        "UpdateExpression": "SET #GSI2PK = :GSI2PK",
+        "ConditionExpression": "attribute_exists(PK)",
+        "ExpressionAttributeNames": {"#GSI2PK": "GSI2PK"},
+        "ExpressionAttributeValues": {":GSI2PK": user_tasks_key(user_id)},
+    }
+
+
+def backfill_task_list(table, item: dict[str, Any]) -> int:
+    """Index the tasks of one task list under its owner.
+
+    Returns the number of tasks indexed.
+    """
+    user_id = UserId(item["user_id"])
+    indexed = 0
+    for key in iter_query(table, **unindexed_tasks_query(item["PK"])):
+        try:
+            table.update_item(**index_task_request(key, user_id))
+        except ClientError as e:
+            if is_conditional_check_failed(e):
+                continue
+            raise
+        indexed += 1
+
+    return indexed
+
+
+def backfill_user_tasks(table) -> int:
+    """Index every task created before the user task indexes.
+
+    Task lists are backfilled concurrently. Tasks already indexed are
+    filtered out, so running it again once done indexes none. Returns
+    the number of tasks indexed.
+    """
+    with ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY) as executor:
+        indexed = sum(
+            executor.map(
+                lambda item: backfill_task_list(table, item),
+                iter_task_list_owners(table),
+            )
+        )
+
+    logger.info(f"Indexed {indexed} tasks under their users")
+    return indexed
@@ -0,0 +1,237 @@
+import asyncio
+import itertools
+import random
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
+from typing import Any
+
+BATCH_WRITE_SIZE = 25
+"""Maximum number of requests of one ``BatchWriteItem`` call."""
+
+BATCH_CONCURRENCY = 8
+"""Batches of one call sent at the same time."""
+
+BATCH_ATTEMPTS = 8
+
+BATCH_GET_SIZE = 100
+"""Maximum number of keys of one ``BatchGetItem`` call."""
+
+
+def write_batches(
+    table_name: str,
+    requests: Iterable[dict[str, Any]],
+) -> list[dict[str, list[dict[str, Any]]]]:
+    """``RequestItems`` of the ``BatchWriteItem`` calls sending ``requests``."""
+    requests = list(requests)
+    return [
+        {table_name: requests[i : i + BATCH_WRITE_SIZE]}
+        for i in range(0, len(requests), BATCH_WRITE_SIZE)
+    ]
+
+
+def delete_batches(
+    table_name: str,
+    keys: Iterable[dict[str, Any]],
+) -> list[dict[str, list[dict[str, Any]]]]:
+    """``RequestItems`` of the ``BatchWriteItem`` calls deleting ``keys``."""
+    return write_batches(
+        table_name,
+        ({"DeleteRequest": {"Key": key}} for key in keys),
+    )
+
+
+def put_batches(
+    table_name: str,
+    items: Iterable[dict[str, Any]],
+) -> list[dict[str, list[dict[str, Any]]]]:
+    """``RequestItems`` of the ``BatchWriteItem`` calls putting ``items``."""
+    return write_batches(
+        table_name,
+        ({"PutRequest": {"Item": item}} for item in items),
+    )
+
+
+def get_batches(
+    table_name: str,
+    keys: Iterable[dict[str, Any]],
+    **kwargs: Any,
+) -> list[dict[str, dict[str, Any]]]:
+    """``RequestItems`` of the ``BatchGetItem`` calls reading ``keys``.
+
+    ``kwargs`` such as ``ConsistentRead`` apply to every call.
+    """
+    keys = list(keys)
+    return [
+        {table_name: {"Keys": keys[i : i + BATCH_GET_SIZE], **kwargs}}
+        for i in range(0, len(keys), BATCH_GET_SIZE)
+    ]
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter delay before retrying unprocessed items."""
+    return random.uniform(0, min(1.0, 0.025 * 2**attempt))
+
+
+def batch_delete(
+    table,
+    table_name: str,
+    keys: Iterable[dict],
+    executor: Executor | None = None,
+) -> None:
+    """Delete items by key with ``BatchWriteItem`` calls.
+
+    Unprocessed items are retried with jittered backoff. ``table`` is a
+    ``ClientTable``, which is thread-safe and accepts plain Python values.
+    The batches are sent ``BATCH_CONCURRENCY`` at a time in ``executor``,
+    or one after another without one.
+    """
+    _write_batches(table, delete_batches(table_name, keys), executor)
+
+
+def batch_put(
+    table,
+    table_name: str,
+    items: Iterable[dict],
+    executor: Executor | None = None,
+) -> None:
+    """Put items with ``BatchWriteItem`` calls, like ``batch_delete``.
+
+    Puts are unconditional, so they overwrite any item with the same key.
+    A failed call may leave the other batches written.
+    """
+    _write_batches(table, put_batches(table_name, items), executor)
+
+
+def batch_get(
+    table,
+    table_name: str,
+    keys: Iterable[dict],
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> list[dict[str, Any]]:
+    """Read items by key with ``BatchGetItem`` calls, like ``batch_delete``.
+
+    Unprocessed keys are retried with jittered backoff. The items come
+    back in no particular order and missing keys are simply absent.
+    """
+    batches = get_batches(table_name, keys, **kwargs)
+    results = _map_batches(
+        lambda batch: _get_batch(table, batch), batches, executor
+    )
+    return [item for items in results for item in items]
+
+
+def _map_batches[T](
+    fn: Callable[[dict], T],
+    batches: list[dict],
+    executor: Executor | None,
+) -> list[T]:
+    if executor is None or len(batches) <= 1:
+        return list(map(fn, batches))
+
+    return [
+        result
+        for chunk in itertools.batched(batches, BATCH_CONCURRENCY, strict=False)
+        for result in executor.map(fn, chunk)
+    ]
+
+
+def _get_batch(table, request_items: dict[str, dict]) -> list[dict]:
+    items = []
+    for attempt in range(1, BATCH_ATTEMPTS + 1):
+        resp = table.batch_get_item(RequestItems=request_items)
+        for table_items in resp.get("Responses", {}).values():
+            items.extend(table_items)
+        request_items = resp.get("UnprocessedKeys") or {}
+        if not request_items:
+            return items
+        time.sleep(backoff_delay(attempt))
+
+    raise RuntimeError("Keys were left unprocessed by BatchGetItem.")
+
+
+def _write_batches(
+    table,
+    batches: list[dict[str, list[dict]]],
+    executor: Executor | None,
+) -> None:
+    _map_batches(lambda batch: _write_batch(table, batch), batches, executor)
+
+
+def _write_batch(table, request_items: dict[str, list[dict]]) -> None:
+    for attempt in range(1, BATCH_ATTEMPTS + 1):
+        resp = table.batch_write_item(RequestItems=request_items)
+        request_items = resp.get("UnprocessedItems") or {}
+        if not request_items:
+            return
+        time.sleep(backoff_delay(attempt))
+
+    raise RuntimeError("Items were left unprocessed by BatchWriteItem.")
+
+
+async def batch_delete_async(
+    table,
+    table_name: str,
+    keys: Iterable[dict],
+) -> None:
+    """``batch_delete`` for an ``AsyncTable``."""
+    await _write_batches_async(table, delete_batches(table_name, keys))
+
+
+async def batch_put_async(
+    table,
+    table_name: str,
+    items: Iterable[dict],
+) -> None:
+    """``batch_put`` for an ``AsyncTable``."""
+    await _write_batches_async(table, put_batches(table_name, items))
+
+
+async def _write_batches_async(
+    table,
+    batches: list[dict[str, list[dict]]],
+) -> None:
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def write_batch(request_items: dict[str, list[dict]]) -> None:
+        async with semaphore:
+            for attempt in range(1, BATCH_ATTEMPTS + 1):
+                resp = await table.batch_write_item(RequestItems=request_items)
+                request_items = resp.get("UnprocessedItems") or {}
+                if not request_items:
+                    return
+                await asyncio.sleep(backoff_delay(attempt))
+
+        raise RuntimeError("Items were left unprocessed by BatchWriteItem.")
+
+    await asyncio.gather(*(write_batch(batch) for batch in batches))
+
+
+async def batch_get_async(
+    table,
+    table_name: str,
+    keys: Iterable[dict],
+    **kwargs: Any,
+) -> list[dict[str, Any]]:
+    """``batch_get`` for an ``AsyncTable``."""
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def get_batch(request_items: dict[str, dict]) -> list[dict]:
+        items = []
+        async with semaphore:
+            for attempt in range(1, BATCH_ATTEMPTS + 1):
+                resp = await table.batch_get_item(RequestItems=request_items)
+                for table_items in resp.get("Responses", {}).values():
+                    items.extend(table_items)
+                request_items = resp.get("UnprocessedKeys") or {}
+                if not request_items:
+                    return items
+                await asyncio.sleep(backoff_delay(attempt))
+
+        raise RuntimeError("Keys were left unprocessed by BatchGetItem.")
+
+    results = await asyncio.gather(
+        *(get_batch(batch) for batch in get_batches(table_name, keys, **kwargs))
+    )
+    return [item for items in results for item in items]
@@ -0,0 +1,229 @@
+import copy
+import os
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Self
+
+import boto3
+from boto3.dynamodb.transform import TransformationInjector
+from botocore import xform_name
+from botocore.config import Config
+from loguru import logger
+
+from .wire import WireTable
+
+if TYPE_CHECKING:
+    from types_boto3_dynamodb import DynamoDBClient
+
+LOCAL_ENDPOINT_URL = "http://localhost:9000/"
+
+
+@dataclass(frozen=True)
+class DynamoDBSettings:
+    table_name: str = "todo-dev-table"
+    region_name: str = "ap-northeast-1"
+    app_env: str = "local"
+    endpoint_url: str | None = None
+    max_pool_connections: int = 10
+    connect_timeout: float = 2.0
+    read_timeout: float = 5.0
+    max_attempts: int = 3
+    user_task_index: bool = False
+    """Whether tasks are read from the user task indexes, once backfilled."""
+    task_lists_migrated: bool = False
+    """Whether every task list was moved, so legacy keys are not looked up.
+
+    Until then every missed task list costs one more read.
+    """
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """Build the settings from environment variables."""
+        app_env = os.getenv("APP_ENV", "local")
+        endpoint_url = os.getenv("DYNAMODB_ENDPOINT_URL") or (
+            LOCAL_ENDPOINT_URL if app_env == "local" else None
+        )
+
+        return cls(
+            table_name=os.getenv("DYNAMODB_TABLE_NAME", cls.table_name),
+            region_name=os.getenv("AWS_REGION", cls.region_name),
+            app_env=app_env,
+            endpoint_url=endpoint_url,
+            max_pool_connections=int(
+                os.getenv(
+                    "DYNAMODB_MAX_POOL_CONNECTIONS",
+                    cls.max_pool_connections,
+                )
+            ),
+            connect_timeout=float(
+                os.getenv("DYNAMODB_CONNECT_TIMEOUT", cls.connect_timeout)
+            ),
+            read_timeout=float(
+                os.getenv("DYNAMODB_READ_TIMEOUT", cls.read_timeout)
+            ),
+            max_attempts=int(
+                os.getenv("DYNAMODB_MAX_ATTEMPTS", cls.max_attempts)
+            ),
+            user_task_index=os.getenv("DYNAMODB_USER_TASK_INDEX", "").lower()
+            in ("1", "true"),
+            task_lists_migrated=os.getenv(
+                "DYNAMODB_TASK_LISTS_MIGRATED", ""
+            ).lower()
+            in ("1", "true"),
+        )
+
+    @property
+    def is_local(self) -> bool:
+        return self.app_env == "local"
+
+    def botocore_config(self) -> Config:
+        """Build the botocore client configuration."""
+        return Config(
+            region_name=self.region_name,
+            max_pool_connections=self.max_pool_connections,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
+            retries={"max_attempts": self.max_attempts, "mode": "standard"},
+        )
+
+
+class PlainValues:
+    """Converts the calls of a low-level client to and from plain values.
+
+    Parameters may hold plain Python values and ``boto3.dynamodb.conditions``
+    expressions, and results come back as plain values, through the same
+    transformations the boto3 resource layer registers on its client. The
+    condition builder numbers the placeholders of the call being built, so
+    one instance must not be shared between threads.
+    """
+
+    def __init__(self, service_model):
+        self._service_model = service_model
+        self._injector = TransformationInjector()
+
+    def params(self, operation: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Typed parameters of ``operation`` given in plain values."""
+        # The transformations rewrite nested values in place.
+        params = copy.deepcopy(params)
+        model = self._service_model.operation_model(operation)
+        self._injector.inject_condition_expressions(params, model)
+        self._injector.inject_attribute_value_input(params, model)
+        return params
+
+    def result(self, operation: str, parsed: dict[str, Any]) -> dict[str, Any]:
+        """Plain values of the typed result of ``operation``."""
+        model = self._service_model.operation_model(operation)
+        self._injector.inject_attribute_value_output(parsed, model)
+        return parsed
+
+
+class ClientTable:
+    """One table of a low-level client, called with plain values.
+
+    Stands in for the boto3 ``Table`` resource, which is never built, with
+    the methods the repositories use. ``wire`` reads the same table in the
+    typed wire format on the same client and connection pool.
+    """
+
+    def __init__(self, client: "DynamoDBClient", name: str):
+        self.name = name
+        self._client = client
+        self._local = threading.local()
+
+    @property
+    def wire(self) -> WireTable:
+        """Queries of the table in the typed wire format, untransformed."""
+        return WireTable(self._client, self.name)
+
+    def get_item(self, **kwargs: Any) -> dict[str, Any]:
+        return self.call("GetItem", TableName=self.name, **kwargs)
+
+    def put_item(self, **kwargs: Any) -> dict[str, Any]:
+        return self.call("PutItem", TableName=self.name, **kwargs)
+
+    def update_item(self, **kwargs: Any) -> dict[str, Any]:
+        return self.call("UpdateItem", TableName=self.name, **kwargs)
+
+    def delete_item(self, **kwargs: Any) -> dict[str, Any]:
+        return self.call("DeleteItem", TableName=self.name, **kwargs)
+
+    def query(self, **kwargs: Any) -> dict[str, Any]:
+        return self.call("Query", TableName=self.name, **kwargs)
+
+    def scan(self, **kwargs: Any) -> dict[str, Any]:
+        return self.call("Scan", TableName=self.name, **kwargs)
+
+    def transact_write_items(self, **kwargs: Any) -> dict[str, Any]:
+        return self.call("TransactWriteItems", **kwargs)
+
+    def batch_write_item(self, **kwargs: Any) -> dict[str, Any]:
+        return self.call("BatchWriteItem", **kwargs)
+
+    def batch_get_item(self, **kwargs: Any) -> dict[str, Any]:
+        return self.call("BatchGetItem", **kwargs)
+
+    def call(self, operation: str, **params: Any) -> dict[str, Any]:
+        """Call ``operation`` with plain Python parameters."""
+        values = self._plain_values()
+        method = getattr(self._client, xform_name(operation))
+        parsed = method(**values.params(operation, params))
+        return values.result(operation, parsed)
+
+    def _plain_values(self) -> PlainValues:
+        # The client is thread-safe, but not the conversions.
+        values = getattr(self._local, "values", None)
+        if values is None:
+            values = PlainValues(self._client.meta.service_model)
+            self._local.values = values
+        return values
+
+
+@dataclass(frozen=True)
+class DynamoDBResources:
+    """boto3 objects shared by every repository of the process.
+
+    Only a low-level client is created: the boto3 resource layer, whose
+    model and classes are built on first use, is never loaded.
+    """
+
+    settings: DynamoDBSettings
+    session: boto3.Session
+    client: "DynamoDBClient"
+    table: ClientTable
+
+    @classmethod
+    def create(cls, settings: DynamoDBSettings) -> Self:
+        """Create the session, client and table handle once."""
+        logger.info(f"Using DynamoDB table: {settings.table_name}")
+        logger.info(f"Using AWS region: {settings.region_name}")
+        logger.info(f"Using AWS endpoint: {settings.app_env}")
+
+        if settings.is_local:
+            session = boto3.Session(
+                region_name=settings.region_name,
+                aws_access_key_id="DUMMY",
+                aws_secret_access_key="DUMMY",
+            )
+        else:
+            session = boto3.Session(region_name=settings.region_name)
+
+        client = session.client(
+            "dynamodb",
+            endpoint_url=settings.endpoint_url,
+            config=settings.botocore_config(),
+        )
+        return cls(
+            settings=settings,
+            session=session,
+            client=client,
+            table=ClientTable(client, settings.table_name),
+        )
+
+    @property
+    def wire_table(self) -> WireTable:
+        """Queries of the table in the typed wire format, on its client."""
+        return self.table.wire
+
+    def close(self) -> None:
+        """Release the pooled connections of the shared client."""
+        self.client.close()
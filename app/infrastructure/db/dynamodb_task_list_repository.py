@@ -1,115 +1,282 @@
-import os
+from collections.abc import Iterator
+from concurrent.futures import Executor
 
-import boto3
 from boto3.dynamodb.conditions import Key
-from loguru import logger
+from botocore.exceptions import ClientError
 
-from ...domain.task_list import TaskCount, TaskList, TaskListId, TaskListName
+from ...domain.page import Page
+from ...domain.task import Task
+from ...domain.task_list import TaskList, TaskListId, TaskListName
 from ...domain.task_list_repository import TaskListRepository
 from ...domain.user import UserId
+from .batch import batch_delete
+from .expressions import increment_version, set_expression
+from .items import (
+    task_from_wire,
+    task_list_from_item,
+    task_list_from_wire,
+    task_list_to_item,
+)
+from .keys import TASK_LIST_METADATA, task_list_key
+from .migration import (
+    iter_with_moved_task_lists,
+    merge_moved_task_lists,
+    move_legacy_task_list,
+    move_legacy_task_lists,
+)
+from .operations import (
+    list_task_lists_query,
+    owned_task_list_request,
+    task_list_with_tasks_query,
+)
+from .pagination import iter_query, query_page
+from .transaction import is_conditional_check_failed
+from .wire import WireTable
 
 
-def get_dynamodb_task_list_repository() -> TaskListRepository:
-    """Get the task list repository instance."""
-
-    table_name = os.getenv("DYNAMODB_TABLE_NAME", "todo-dev-table")
-
-    logger.info(f"Using DynamoDB table: {table_name}")
-    logger.info(
-        f"Using AWS region: {os.getenv('AWS_REGION', 'ap-northeast-1')}"
-    )
-    logger.info(f"Using AWS endpoint: {os.getenv('APP_ENV', 'local')}")
+class DynamoDBTaskListRepository(TaskListRepository):
+    """Task lists stored at the head of the item collection of their tasks.
 
-    if os.getenv("APP_ENV", "local") == "local":
-        dynamodb = boto3.resource(
-            "dynamodb",
-            region_name=os.getenv("AWS_REGION", "ap-northeast-1"),
-            endpoint_url="http://localhost:9000/",
-            aws_access_key_id="DUMMY",
-            aws_secret_access_key="DUMMY",
-        )
-    else:
-        dynamodb = boto3.resource(
-            "dynamodb",
-            region_name=os.getenv("AWS_REGION", "ap-northeast-1"),
-        )
-    table = dynamodb.Table(table_name)
-    return DynamoDBTaskListRepository(table)
+    A task list item is keyed by its ID alone, next to its tasks, and
+    indexed by owner in GSI1 to list the task lists of a user.
 
+    Until ``migrate_task_lists`` has moved every task list item from its
+    legacy key in the partition of its owner, ``legacy_task_lists`` moves
+    a task list the first time it is missed, and the task lists of a user
+    before they are listed. Meanwhile every miss, such as a request for a
+    task list that does not exist, costs one more query of GSI1 or read of
+    the legacy key, and every first page of task lists one more query of
+    the legacy partition of the user, until ``DYNAMODB_TASK_LISTS_MIGRATED``
+    is set.
+    """
 
-class DynamoDBTaskListRepository(TaskListRepository):
-    def __init__(self, table):
+    def __init__(
+        self,
+        table,
+        wire: WireTable,
+        legacy_task_lists: bool = False,
+        executor: Executor | None = None,
+    ):
         self._table = table
+        self._wire = wire
+        self._legacy_task_lists = legacy_task_lists
+        self._executor = executor
 
     def store(self, task_list: TaskList) -> None:
         """Save a task list to the repository."""
+        self._table.put_item(Item=task_list_to_item(task_list))
 
-        self._table.put_item(
-            Item={
-                "PK": f"USER#{task_list.user_id}",
-                "SK": f"TASK_LIST#{task_list.id}",
-                "GSI1PK": f"TASK_LIST#{task_list.id}",
-                "GSI1SK": f"TASK_LIST#{task_list.id}",
-                "user_id": str(task_list.user_id),
-                "task_list_id": str(task_list.id),
-                "name": str(task_list.name),
-                "count": int(task_list.count),
-            }
-        )
+    def update_name(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        name: TaskListName,
+    ) -> TaskList | None:
+        """Rename a task list in a single write."""
+        task_list = self._update_name(user_id, task_list_id, name)
+
+        if task_list is None and self._move_legacy(task_list_id, user_id):
+            task_list = self._update_name(user_id, task_list_id, name)
+
+        return task_list
+
+    def _update_name(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        name: TaskListName,
+    ) -> TaskList | None:
+        try:
+            resp = self._table.update_item(
+                **owned_task_list_request(
+                    user_id,
+                    Key=task_list_key(task_list_id),
+                    ReturnValues="ALL_NEW",
+                    **increment_version(set_expression({"name": str(name)})),
+                )
+            )
+        except ClientError as e:
+            if is_conditional_check_failed(e):
+                return None
+            raise
+
+        return task_list_from_item(resp["Attributes"])
+
+    def find(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+    ) -> TaskList | None:
+        """Find a task list by its ID, if it belongs to ``user_id``."""
+        task_list = self.find_by_id(task_list_id)
+
+        if task_list is None or task_list.user_id != user_id:
+            return None
+
+        return task_list
 
     def find_by_id(self, task_list_id: TaskListId) -> TaskList | None:
         """Find a task list by its ID."""
-        resp = self._table.query(
-            IndexName="GSI1",
-            KeyConditionExpression=Key("GSI1PK").eq(f"TASK_LIST#{task_list_id}")
-            & Key("GSI1SK").eq(f"TASK_LIST#{task_list_id}"),
+        task_list = self._get(task_list_id)
+
+        if task_list is None and self._move_legacy(task_list_id):
+            task_list = self._get(task_list_id)
+
+        return task_list
+
+    def _get(self, task_list_id: TaskListId) -> TaskList | None:
+        resp = self._table.get_item(
+            Key=task_list_key(task_list_id),
+            ConsistentRead=True,
         )
-        items = resp["Items"]
+        item = resp.get("Item")
 
-        if not items:
+        if not item:
             return None
 
-        return TaskList(
-            id=TaskListId(str(items[0]["task_list_id"])),
-            user_id=UserId(str(items[0]["user_id"])),
-            name=TaskListName(str(items[0]["name"])),
-            count=TaskCount(int(items[0]["count"])),
+        return task_list_from_item(item)
+
+    def find_with_tasks(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None = None,
+    ) -> tuple[TaskList, Page[Task]] | None:
+        """Find a task list and its first page of tasks with one query."""
+        result = self._find_with_tasks(task_list_id, limit)
+
+        if result is None and self._move_legacy(task_list_id):
+            result = self._find_with_tasks(task_list_id, limit)
+
+        return result
+
+    def _find_with_tasks(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None,
+    ) -> tuple[TaskList, Page[Task]] | None:
+        items, next_token = query_page(
+            self._wire,
+            "PK",
+            f"TASK_LIST#{task_list_id}",
+            # One more item for the task list itself.
+            limit=None if limit is None else limit + 1,
+            index_key="created_at",
+            **task_list_with_tasks_query(task_list_id),
         )
 
-    def delete(self, task_list_id: TaskListId) -> None:
-        """Delete a task list by its ID."""
-        resp = self._table.query(
-            IndexName="GSI1",
-            KeyConditionExpression=Key("GSI1PK").eq(
-                f"TASK_LIST#{task_list_id}"
-            ),
+        if not items or items[0]["SK"]["S"] != TASK_LIST_METADATA:
+            return None
+
+        task_list_ids = {str(task_list_id): task_list_id}
+
+        return task_list_from_wire(items[0]), Page(
+            items=[task_from_wire(item, task_list_ids) for item in items[1:]],
+            next_token=next_token,
         )
-        items = resp.get("Items", [])
 
-        if not items:
+    def delete(
+        self,
+        task_list_id: TaskListId,
+        user_id: UserId | None = None,
+    ) -> None:
+        """Delete a task list and every task in it.
+
+        The task list item goes first, so no task can be added to the list
+        while its item collection is being emptied. Its tasks are only
+        deleted when the task list existed under the given owner.
+        """
+        deleted = self._delete_item(task_list_id, user_id)
+
+        if not deleted and self._move_legacy(task_list_id, user_id):
+            deleted = self._delete_item(task_list_id, user_id)
+
+        if not deleted:
             return
 
-        self._table.delete_item(
-            Key={
-                "PK": items[0]["PK"],
-                "SK": items[0]["SK"],
-            }
+        batch_delete(
+            self._table,
+            self._table.name,
+            iter_query(
+                self._table,
+                KeyConditionExpression=Key("PK").eq(
+                    f"TASK_LIST#{task_list_id}"
+                ),
+                ProjectionExpression="PK, SK",
+            ),
+            self._executor,
         )
 
-    def list_all(self, user_id: UserId) -> list[TaskList]:
-        """List all task lists in the repository."""
-        resp = self._table.query(
-            KeyConditionExpression=Key("PK").eq(f"USER#{user_id}")
-            & Key("SK").begins_with("TASK_LIST#"),
+    def list_all(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+    ) -> Page[TaskList]:
+        """List the task lists of a user, one page at a time."""
+        moved = []
+        if self._legacy_task_lists and next_token is None:
+            moved = move_legacy_task_lists(self._table, user_id)
+
+        items, next_token = query_page(
+            self._wire,
+            "GSI1PK",
+            f"USER#{user_id}",
+            limit=limit,
+            next_token=next_token,
+            index_key="GSI1SK",
+            **list_task_lists_query(user_id),
         )
-        items = resp["Items"]
-
-        return [
-            TaskList(
-                id=TaskListId(str(item["task_list_id"])),
-                user_id=UserId(str(item["user_id"])),
-                name=TaskListName(str(item["name"])),
-                count=TaskCount(int(item["count"])),
+
+        task_lists = [task_list_from_wire(item) for item in items]
+        if moved:
+            task_lists = merge_moved_task_lists(
+                task_lists, moved, last_page=next_token is None
             )
-            for item in items
-        ]
+
+        return Page(items=task_lists, next_token=next_token)
+
+    def iter_all(self, user_id: UserId) -> Iterator[TaskList]:
+        """Iterate over the task lists of a user without loading them all."""
+        moved = []
+        if self._legacy_task_lists:
+            moved = move_legacy_task_lists(self._table, user_id)
+
+        items = iter_query(self._wire, **list_task_lists_query(user_id))
+
+        return iter_with_moved_task_lists(
+            map(task_list_from_wire, items), moved
+        )
+
+    def _delete_item(
+        self,
+        task_list_id: TaskListId,
+        user_id: UserId | None,
+    ) -> bool:
+        request = {
+            "Key": task_list_key(task_list_id),
+            "ConditionExpression": "attribute_exists(PK)",
+        }
+        if user_id is not None:
+            request = owned_task_list_request(
+                user_id,
+                Key=task_list_key(task_list_id),
+            )
+
+        try:
+            self._table.delete_item(**request)
+        except ClientError as e:
+            if is_conditional_check_failed(e):
+                return False
+            raise
+
+        return True
+
+    def _move_legacy(
+        self,
+        task_list_id: TaskListId,
+        user_id: UserId | None = None,
+    ) -> bool:
+        """Move a task list still at its legacy key, if it is looked for."""
+        if not self._legacy_task_lists:
+            return False
+        return move_legacy_task_list(self._table, task_list_id, user_id)
@@ -1,63 +1,248 @@
-import os
-from datetime import datetime
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor
+from functools import partial
 
-import boto3
-from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
 from loguru import logger
 
+from ...domain.page import Page
 from ...domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
-from ...domain.task_list import TaskListId
+from ...domain.task_feed import TaskFeedCursor
+from ...domain.task_list import TaskListId, TaskSortBy, TaskSortOrder
 from ...domain.task_repository import TaskRepository
+from ...domain.user import UserId
+from .batch import batch_delete, batch_get, batch_put
+from .items import (
+    task_from_item,
+    task_from_wire,
+    task_to_item,
+    user_tasks_key,
+)
+from .keys import task_key
+from .migration import move_legacy_task_list
+from .operations import (
+    STATUS_ATTEMPTS,
+    TaskListNotFoundError,
+    TaskStatusChangedError,
+    add_task_to_list_error,
+    add_task_to_list_request,
+    change_task_status_error,
+    change_task_status_request,
+    find_task_query,
+    list_tasks_query,
+    list_user_tasks_query,
+    release_task_count_request,
+    remove_task_from_list_error,
+    remove_task_from_list_request,
+    reserve_task_count_error,
+    reserve_task_count_request,
+    update_task_error,
+    update_task_request,
+)
+from .pagination import iter_query, query_page
+from .schema import LOCAL_SECONDARY_INDEXES
+from .wire import WireTable
 
 
-def get_dynamodb_task_repository() -> TaskRepository:
-    """Get the task repository instance."""
+class DynamoDBTaskRepository(TaskRepository):
+    def __init__(
+        self,
+        table,
+        wire: WireTable,
+        legacy_task_lists: bool = False,
+        executor: Executor | None = None,
+    ):
+        self._table = table
+        self._wire = wire
+        self._legacy_task_lists = legacy_task_lists
+        self._executor = executor
+
+    def store(self, task: Task) -> None:
+        """Save a task to the repository."""
+        self._table.put_item(Item=task_to_item(task))
 
-    table_name = os.getenv("DYNAMODB_TABLE_NAME", "todo-dev-table")
-    logger.info(f"Using DynamoDB table: {table_name}")
-    logger.info(
-        f"Using AWS region: {os.getenv('AWS_REGION', 'ap-northeast-1')}"
-    )
-    logger.info(f"Using AWS endpoint: {os.getenv('APP_ENV', 'local')}")
+    def add_task_to_list(self, user_id: UserId, task: Task) -> None:
+        """Save a new task and increment the count of its task list.
 
-    if os.getenv("APP_ENV", "local") == "local":
-        dynamodb = boto3.resource(
-            "dynamodb",
-            region_name=os.getenv("AWS_REGION", "ap-northeast-1"),
-            endpoint_url="http://localhost:9000/",
-            aws_access_key_id="DUMMY",
-            aws_secret_access_key="DUMMY",
+        Both writes run in one transaction. The task list must exist and
+        have room for one more task, which is checked on the server so
+        concurrent writers cannot exceed ``TaskCount.MAX_TASK_COUNT``.
+        """
+        self._on_task_list(
+            user_id,
+            task.task_list_id,
+            partial(self._add_task_to_list, user_id, task),
         )
-    else:
-        dynamodb = boto3.resource(
-            "dynamodb",
-            region_name=os.getenv("AWS_REGION", "ap-northeast-1"),
+
+    def _add_task_to_list(self, user_id: UserId, task: Task) -> None:
+        try:
+            self._table.transact_write_items(
+                **add_task_to_list_request(self._table.name, user_id, task)
+            )
+        except ClientError as e:
+            raise add_task_to_list_error(e, user_id) from e
+
+    def add_tasks_to_list(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        tasks: Sequence[Task],
+    ) -> None:
+        """Save new tasks of one task list with batched writes.
+
+        Room for all the tasks is reserved first with one conditional
+        update of the count, so concurrent writers cannot exceed
+        ``TaskCount.MAX_TASK_COUNT``. The tasks are then put with
+        ``BatchWriteItem``, and written tasks are deleted and the count
+        released again when any batch fails. The error of the batch is
+        raised even when this rollback fails too, which is only logged.
+        """
+        if not tasks:
+            return
+
+        self._on_task_list(
+            user_id,
+            task_list_id,
+            partial(self._reserve_task_count, user_id, task_list_id, tasks),
         )
-    table = dynamodb.Table(table_name)
 
-    return DynamoDBTaskRepository(table)
+        try:
+            batch_put(
+                self._table,
+                self._table.name,
+                [task_to_item(task, user_id) for task in tasks],
+                self._executor,
+            )
+        except Exception:
+            try:
+                batch_delete(
+                    self._table,
+                    self._table.name,
+                    [task_key(task_list_id, task.id) for task in tasks],
+                    self._executor,
+                )
+                self._table.update_item(
+                    **release_task_count_request(user_id, task_list_id, tasks)
+                )
+            except Exception as e:
+                # The count stays reserved until reconcile_counts repairs it.
+                logger.error(f"Error rolling back tasks of {task_list_id}: {e}")
+            raise
 
+    def remove_task_from_list(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+    ) -> None:
+        """Delete a task and decrement the counts of its task list.
 
-class DynamoDBTaskRepository(TaskRepository):
-    def __init__(self, table):
-        self._table = table
+        Both writes run in one transaction, which is cancelled when either
+        the task or the task list does not exist. The task is read first to
+        uncount its status, and the transaction is retried if the status
+        changes in between.
+        """
+        for _ in range(STATUS_ATTEMPTS):
+            task = self.find(task_list_id, task_id)
 
-    def store(self, task: Task) -> None:
-        """Save a task to the repository."""
-        self._table.put_item(
-            Item={
-                "PK": f"TASK_LIST#{task.task_list_id}",
-                "SK": f"TASK#{task.id}",
-                "GSI1PK": f"TASK#{task.id}",
-                "GSI1SK": f"TASK#{task.id}",
-                "task_list_id": str(task.task_list_id),
-                "task_id": str(task.id),
-                "title": str(task.title),
-                "description": str(task.description),
-                "status": str(task.status),
-                "created_at": task.created_at.isoformat(),
-            }
+            if task is None:
+                raise ValueError("Task not found.")
+
+            try:
+                self._on_task_list(
+                    user_id,
+                    task_list_id,
+                    partial(
+                        self._remove_task,
+                        user_id,
+                        task_list_id,
+                        task_id,
+                        task.status,
+                    ),
+                )
+                return
+            except TaskStatusChangedError:
+                continue
+
+        raise RuntimeError("Task status kept changing while removing it.")
+
+    def update(
+        self,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+        title: TaskTitle | None = None,
+        description: TaskDescription | None = None,
+        status: TaskStatus | None = None,
+        user_id: UserId | None = None,
+    ) -> Task | None:
+        """Update the given fields of a task.
+
+        Without a ``status`` this is a single write. A status is set after
+        reading the task, and a new one moves the task between the status
+        counters of its task list, owned by ``user_id``, in the same
+        transaction. Both are retried if the status changes in between.
+        """
+        if status is None:
+            return self._update(
+                update_task_request(
+                    task_list_id,
+                    task_id,
+                    title=title,
+                    description=description,
+                )
+            )
+
+        if user_id is None:
+            raise ValueError("The task list owner is needed to set a status.")
+
+        for _ in range(STATUS_ATTEMPTS):
+            task = self.find(task_list_id, task_id)
+
+            if task is None:
+                return None
+
+            try:
+                if task.status == status:
+                    return self._update(
+                        update_task_request(
+                            task_list_id,
+                            task_id,
+                            title=title,
+                            description=description,
+                            status=status,
+                            created_at=task.created_at.isoformat(),
+                            previous_status=task.status,
+                        )
+                    )
+
+                return self._change_status(
+                    user_id,
+                    task,
+                    status,
+                    title=title,
+                    description=description,
+                )
+            except TaskStatusChangedError:
+                continue
+
+        raise RuntimeError("Task status kept changing while updating it.")
+
+    def find(
+        self,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+    ) -> Task | None:
+        """Find a task by its full key."""
+        resp = self._table.get_item(
+            Key=task_key(task_list_id, task_id),
+            ConsistentRead=True,
         )
+        item = resp.get("Item")
+
+        if not item:
+            return None
+
+        return task_from_item(item)
 
     def find_by_id(
         self,
@@ -66,60 +251,264 @@ class DynamoDBTaskRepository(TaskRepository):
         """Find a task by its ID."""
         logger.info(f"Finding task by ID: {task_id}")
 
-        resp = self._table.query(
-            IndexName="GSI1",
-            KeyConditionExpression=Key("GSI1PK").eq(f"TASK#{task_id}")
-            & Key("GSI1SK").eq(f"TASK#{task_id}"),
-        )
+        resp = self._wire.query(**find_task_query(task_id))
         items = resp["Items"]
 
         if not items:
             return None
 
-        return Task(
-            id=TaskId(str(items[0]["task_id"])),
-            task_list_id=TaskListId(str(items[0]["task_list_id"])),
-            title=TaskTitle(str(items[0]["title"])),
-            description=TaskDescription(str(items[0]["description"])),
-            status=TaskStatus(str(items[0]["status"])),
-            created_at=datetime.fromisoformat(str(items[0]["created_at"])),
+        return task_from_wire(items[0])
+
+    def find_many(
+        self,
+        keys: Sequence[tuple[TaskListId, TaskId]],
+    ) -> list[Task | None]:
+        """Find tasks by their full keys, in the order of ``keys``.
+
+        Duplicate keys are read once and missing tasks are ``None``.
+        """
+        items = batch_get(
+            self._table,
+            self._table.name,
+            [task_key(*key) for key in dict.fromkeys(keys)],
+            self._executor,
+            ConsistentRead=True,
         )
+        tasks = {
+            (task.task_list_id, task.id): task
+            for task in map(task_from_item, items)
+        }
+
+        return [tasks.get(key) for key in keys]
+
+    def delete(
+        self,
+        task_id: TaskId,
+        task_list_id: TaskListId | None = None,
+    ) -> None:
+        """Delete a task by its key, or by its ID alone."""
+        if task_list_id is None:
+            task = self.find_by_id(task_id)
+
+            if not task:
+                return
 
-    def delete(self, task_id: TaskId) -> None:
-        """Delete a task by its ID."""
-        resp = self._table.query(
-            IndexName="GSI1",
-            KeyConditionExpression=Key("GSI1PK").eq(f"TASK#{task_id}"),
+            task_list_id = task.task_list_id
+
+        self._table.delete_item(Key=task_key(task_list_id, task_id))
+
+    def list_all(
+        self,
+        task_list_id: TaskListId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a task list in order, one page at a time."""
+        query = list_tasks_query(
+            task_list_id,
+            sort_by or TaskSortBy.default(),
+            order or TaskSortOrder.default(),
+            status=status,
+        )
+        items, next_token = query_page(
+            self._wire,
+            "PK",
+            f"TASK_LIST#{task_list_id}",
+            limit=limit,
+            next_token=next_token,
+            index_key=LOCAL_SECONDARY_INDEXES[query["IndexName"]],
+            **query,
         )
-        items = resp.get("Items", [])
 
-        if not items:
-            return
+        task_list_ids = {str(task_list_id): task_list_id}
 
-        self._table.delete_item(
-            Key={
-                "PK": items[0]["PK"],
-                "SK": items[0]["SK"],
-            }
+        return Page(
+            items=[task_from_wire(item, task_list_ids) for item in items],
+            next_token=next_token,
         )
 
-    def list_all(self, task_list_id: TaskListId) -> list[Task]:
-        """List all tasks in the repository."""
-        resp = self._table.query(
-            KeyConditionExpression=Key("PK").eq(f"TASK_LIST#{task_list_id}")
-            & Key("SK").begins_with("TASK#"),
+    def list_user_tasks(
+        self,
+        user_id: UserId,
+        limit: int | None = None,
+        next_token: str | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+    ) -> Page[Task]:
+        """List the tasks of a user across their task lists by creation time.
+
+        The tasks are read from the user task indexes, and the next token
+        is a ``TaskFeedCursor`` after the last task of the page.
+        """
+        cursor = (
+            None if next_token is None else TaskFeedCursor.decode(next_token)
         )
+        items, last_token = query_page(
+            self._wire,
+            "GSI2PK",
+            user_tasks_key(user_id),
+            limit=limit,
+            **list_user_tasks_query(
+                user_id,
+                order or TaskSortOrder.default(),
+                status=status,
+                cursor=cursor,
+            ),
+        )
+        task_list_ids: dict[str, TaskListId] = {}
+        tasks = [task_from_wire(item, task_list_ids) for item in items]
 
-        items = resp["Items"]
+        return Page(
+            items=tasks,
+            next_token=None
+            if last_token is None
+            else TaskFeedCursor.after(tasks[-1]).encode(),
+        )
+
+    def iter_all(
+        self,
+        task_list_id: TaskListId,
+        sort_by: TaskSortBy | None = None,
+        order: TaskSortOrder | None = None,
+        status: TaskStatus | None = None,
+        start: TaskFeedCursor | None = None,
+        page_size: int | None = None,
+    ) -> Iterator[Task]:
+        """Iterate over the tasks of a task list without loading them all."""
+        query = list_tasks_query(
+            task_list_id,
+            sort_by or TaskSortBy.default(),
+            order or TaskSortOrder.default(),
+            status=status,
+            start=start,
+        )
+        if page_size is not None:
+            query["Limit"] = page_size
+        items = iter_query(self._wire, **query)
+
+        task_list_ids = {str(task_list_id): task_list_id}
+
+        return (task_from_wire(item, task_list_ids) for item in items)
 
-        return [
-            Task(
-                id=TaskId(str(item["task_id"])),
-                task_list_id=TaskListId(str(item["task_list_id"])),
-                title=TaskTitle(str(item["title"])),
-                description=TaskDescription(str(item["description"])),
-                status=TaskStatus(str(item["status"])),
-                created_at=datetime.fromisoformat(str(item["created_at"])),
+    def _update(self, request: dict) -> Task | None:
+        try:
+            resp = self._table.update_item(**request)
+        except ClientError as e:
+            error = update_task_error(e)
+            if error is None:
+                return None
+            raise error from e
+
+        return task_from_item(resp["Attributes"])
+
+    def _change_status(
+        self,
+        user_id: UserId,
+        task: Task,
+        status: TaskStatus,
+        title: TaskTitle | None = None,
+        description: TaskDescription | None = None,
+    ) -> Task | None:
+        changed = self._on_task_list(
+            user_id,
+            task.task_list_id,
+            partial(
+                self._write_status_change,
+                user_id,
+                task,
+                status,
+                title,
+                description,
+            ),
+        )
+        if not changed:
+            return None
+
+        task.update_status(status)
+        task.version += 1
+        if title is not None:
+            task.update_title(title)
+        if description is not None:
+            task.update_description(description)
+
+        return task
+
+    def _write_status_change(
+        self,
+        user_id: UserId,
+        task: Task,
+        status: TaskStatus,
+        title: TaskTitle | None,
+        description: TaskDescription | None,
+    ) -> bool:
+        try:
+            self._table.transact_write_items(
+                **change_task_status_request(
+                    self._table.name,
+                    user_id,
+                    task,
+                    status,
+                    title=title,
+                    description=description,
+                )
             )
-            for item in items
-        ]
+        except ClientError as e:
+            error = change_task_status_error(e)
+            if error is None:
+                return False
+            raise error from e
+
+        return True
+
+    def _reserve_task_count(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        tasks: Sequence[Task],
+    ) -> None:
+        try:
+            self._table.update_item(
+                **reserve_task_count_request(user_id, task_list_id, tasks)
+            )
+        except ClientError as e:
+            raise reserve_task_count_error(e, user_id) from e
+
+    def _remove_task(
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        task_id: TaskId,
+        status: TaskStatus,
+    ) -> None:
+        try:
+            self._table.transact_write_items(
+                **remove_task_from_list_request(
+                    self._table.name,
+                    user_id,
+                    task_list_id,
+                    task_id,
+                    status,
+                )
+            )
+        except ClientError as e:
+            raise remove_task_from_list_error(e) from e
+
+    def _on_task_list[T](
+        self,
+        user_id: UserId,
+        task_list_id: TaskListId,
+        write: Callable[[], T],
+    ) -> T:
+        """Run a write, moving its task list from a legacy key if missing."""
+        try:
+            return write()
+        except TaskListNotFoundError:
+            if not self._legacy_task_lists or not move_legacy_task_list(
+                self._table, task_list_id, user_id
+            ):
+                raise
+
+        return write()
@@ -0,0 +1,43 @@
+from typing import Any
+
+
+def set_expression(values: dict[str, Any]) -> dict[str, Any]:
+    """``UpdateItem`` arguments that ``SET`` each attribute in ``values``.
+
+    Attribute names are always aliased, so reserved words such as
+    ``name`` or ``status`` can be updated.
+    """
+    if not values:
+        raise ValueError("At least one attribute must be updated.")
+
+    return {
+        "UpdateExpression": "SET "
+        + ", ".join(f"#{name} = :{name}" for name in values),
+        "ExpressionAttributeNames": {f"#{name}": name for name in values},
+        "ExpressionAttributeValues": {
+            f":{name}": value for name, value in values.items()
+        },
+    }
+
+
+def increment_version(request: dict[str, Any]) -> dict[str, Any]:
+    """``UpdateItem`` arguments of ``request`` also incrementing ``version``.
+
+    The ``UpdateExpression`` of ``request`` must either only ``SET`` or
+    only ``ADD`` attributes. A missing version is incremented from zero.
+    """
+    expression = request["UpdateExpression"]
+    separator = ", " if expression.startswith("ADD ") else " ADD "
+
+    return {
+        **request,
+        "UpdateExpression": f"{expression}{separator}#version :version_step",
+        "ExpressionAttributeNames": {
+            **request.get("ExpressionAttributeNames", {}),
+            "#version": "version",
+        },
+        "ExpressionAttributeValues": {
+            **request.get("ExpressionAttributeValues", {}),
+            ":version_step": 1,
+        },
+    }
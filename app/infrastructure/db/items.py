@@ -0,0 +1,213 @@
+from datetime import datetime
+from typing import Any
+
+from ...domain.task import Task, TaskStatus
+from ...domain.task_list import TaskList, TaskListId
+from ...domain.user import UserId
+from .keys import (
+    TASK_BY_ID_SORT_KEY,
+    TASK_LIST_METADATA,
+    task_key,
+    task_list_key,
+)
+
+ITEM_FORMAT = 2
+"""Format of the items written by ``task_to_item`` and ``task_list_to_item``.
+
+Format 1 items carry no format attribute and store their IDs next to
+their keys. Format 2 items derive the IDs from their keys, index tasks
+by ID under a constant sort key and leave out empty descriptions. Both
+are read. Attribute names, ISO creation times and status names are kept
+as they are, since the local secondary indexes are keyed on them.
+"""
+
+ITEM_FORMAT_ATTRIBUTE = "fmt"
+"""Attribute holding the ``ITEM_FORMAT`` of an item, kept short per item."""
+
+VERSION_ATTRIBUTE = "version"
+"""Attribute holding the version of the entity of an item.
+
+Unlike the item format, it is incremented by every write of the entity.
+Items written before it existed read as version zero.
+"""
+
+
+def status_sort_key(status: TaskStatus, created_at: str) -> str:
+    """Sort key of a task in the index of tasks by status, then age."""
+    return f"{status}#{created_at}"
+
+
+def status_count_attribute(status: TaskStatus) -> str:
+    """Attribute of a task list item counting its tasks in ``status``."""
+    return f"{status}_count"
+
+
+def user_tasks_key(user_id: UserId) -> str:
+    """Partition of the tasks of a user in the user task indexes."""
+    return f"USER#{user_id}"
+
+
+def task_to_item(task: Task, user_id: UserId | None = None) -> dict[str, Any]:
+    """Map a task to its DynamoDB item.
+
+    With the ``user_id`` owning its task list, the task is also indexed in
+    the tasks of that user.
+    """
+    created_at = task.created_at.isoformat()
+    item: dict[str, Any] = {
+        **task_key(task.task_list_id, task.id),
+        "GSI1PK": f"TASK#{task.id}",
+        "GSI1SK": TASK_BY_ID_SORT_KEY,
+        ITEM_FORMAT_ATTRIBUTE: ITEM_FORMAT,
+        "title": str(task.title),
+        "status": str(task.status),
+        "created_at": created_at,
+        "status_created_at": status_sort_key(task.status, created_at),
+        VERSION_ATTRIBUTE: task.version,
+    }
+    if task.description.value:
+        item["description"] = str(task.description)
+    if user_id is not None:
+        item["GSI2PK"] = user_tasks_key(user_id)
+
+    return item
+
+
+def task_from_item(item: dict[str, Any]) -> Task:
+    """Map a DynamoDB item of any version back to a task."""
+    if _has_keyed_ids(item):
+        task_list_id = str(item["PK"]).removeprefix("TASK_LIST#")
+        task_id = str(item["SK"]).removeprefix("TASK#")
+    else:
+        task_list_id = str(item["task_list_id"])
+        task_id = str(item["task_id"])
+
+    return Task.from_trusted(
+        id=task_id,
+        task_list_id=TaskListId(task_list_id),
+        title=str(item["title"]),
+        description=str(item.get("description", "")),
+        status=str(item["status"]),
+        created_at=datetime.fromisoformat(str(item["created_at"])),
+        version=int(item.get(VERSION_ATTRIBUTE, 0)),
+    )
+
+
+def task_list_to_item(task_list: TaskList) -> dict[str, Any]:
+    """Map a task list to its DynamoDB item."""
+    return {
+        **task_list_key(task_list.id),
+        "GSI1PK": f"USER#{task_list.user_id}",
+        "GSI1SK": f"TASK_LIST#{task_list.id}",
+        # Puts the task list at the head of the creation time index.
+        "created_at": TASK_LIST_METADATA,
+        ITEM_FORMAT_ATTRIBUTE: ITEM_FORMAT,
+        "user_id": str(task_list.user_id),
+        "name": str(task_list.name),
+        "count": int(task_list.count),
+        "todo_count": int(task_list.todo_count),
+        "done_count": int(task_list.done_count),
+        VERSION_ATTRIBUTE: task_list.version,
+    }
+
+
+def task_list_from_item(item: dict[str, Any]) -> TaskList:
+    """Map a DynamoDB item of any version back to a task list."""
+    if _has_keyed_ids(item):
+        task_list_id = str(item["PK"]).removeprefix("TASK_LIST#")
+    else:
+        task_list_id = str(item["task_list_id"])
+
+    return TaskList.from_trusted(
+        id=task_list_id,
+        user_id=str(item["user_id"]),
+        name=str(item["name"]),
+        count=int(item["count"]),
+        todo_count=_status_count(item, TaskStatus.TODO),
+        done_count=_status_count(item, TaskStatus.DONE),
+        version=int(item.get(VERSION_ATTRIBUTE, 0)),
+    )
+
+
+def _status_count(item: dict[str, Any], status: TaskStatus) -> int:
+    # Lists written before the counters existed read as zero and may go
+    # negative until the reconciliation job repairs them.
+    return max(0, int(item.get(status_count_attribute(status), 0)))
+
+
+def _has_keyed_ids(item: dict[str, Any]) -> bool:
+    # Format 2 items derive their IDs from their keys.
+    return ITEM_FORMAT_ATTRIBUTE in item
+
+
+def task_from_wire(
+    item: dict[str, dict[str, str]],
+    task_list_ids: dict[str, TaskListId] | None = None,
+) -> Task:
+    """Map a DynamoDB item of any version in the typed wire format to a task.
+
+    Reads the attributes directly, without deserializing the whole item
+    first like ``task_from_item``. The tasks mapped with the same
+    ``task_list_ids`` share one ``TaskListId`` per task list.
+    """
+    if _has_keyed_ids(item):
+        task_list_id = item["PK"]["S"].removeprefix("TASK_LIST#")
+        task_id = item["SK"]["S"].removeprefix("TASK#")
+    else:
+        task_list_id = item["task_list_id"]["S"]
+        task_id = item["task_id"]["S"]
+    description = item.get("description")
+
+    return Task.from_trusted(
+        id=task_id,
+        task_list_id=_interned_task_list_id(task_list_id, task_list_ids),
+        title=item["title"]["S"],
+        description=description["S"] if description else "",
+        status=item["status"]["S"],
+        created_at=datetime.fromisoformat(item["created_at"]["S"]),
+        version=_version_from_wire(item),
+    )
+
+
+def _interned_task_list_id(
+    value: str,
+    task_list_ids: dict[str, TaskListId] | None,
+) -> TaskListId:
+    if task_list_ids is None:
+        return TaskListId(value)
+
+    task_list_id = task_list_ids.get(value)
+    if task_list_id is None:
+        task_list_id = task_list_ids[value] = TaskListId(value)
+    return task_list_id
+
+
+def task_list_from_wire(item: dict[str, dict[str, str]]) -> TaskList:
+    """Map a DynamoDB item of any version in the typed wire format to a list."""
+    if _has_keyed_ids(item):
+        task_list_id = item["PK"]["S"].removeprefix("TASK_LIST#")
+    else:
+        task_list_id = item["task_list_id"]["S"]
+
+    return TaskList.from_trusted(
+        id=task_list_id,
+        user_id=item["user_id"]["S"],
+        name=item["name"]["S"],
+        count=int(item["count"]["N"]),
+        todo_count=_status_count_from_wire(item, TaskStatus.TODO),
+        done_count=_status_count_from_wire(item, TaskStatus.DONE),
+        version=_version_from_wire(item),
+    )
+
+
+def _status_count_from_wire(
+    item: dict[str, dict[str, str]],
+    status: TaskStatus,
+) -> int:
+    count = item.get(status_count_attribute(status))
+    return max(0, int(count["N"])) if count else 0
+
+
+def _version_from_wire(item: dict[str, dict[str, str]]) -> int:
+    version = item.get(VERSION_ATTRIBUTE)
+    return int(version["N"]) if version else 0
@@ -0,0 +1,36 @@
+from ...domain.task import TaskId
+from ...domain.task_list import TaskListId
+from ...domain.user import UserId
+
+TASK_LIST_METADATA = "#METADATA"
+"""Sort key of the item holding a task list in its own item collection.
+
+``#`` sorts before the ``TASK#`` keys of the tasks and before the ISO
+creation times of the creation time index, so the task list comes first
+when its collection is read in ascending order.
+"""
+
+TASK_BY_ID_SORT_KEY = "#"
+"""Sort key of a task in the index of tasks by ID.
+
+Each task is alone in its ``GSI1PK`` partition, so the sort key only
+needs to exist and is kept to one byte.
+"""
+
+
+def task_list_key(task_list_id: TaskListId) -> dict[str, str]:
+    """Primary key of a task list item."""
+    return {"PK": f"TASK_LIST#{task_list_id}", "SK": TASK_LIST_METADATA}
+
+
+def task_key(task_list_id: TaskListId, task_id: TaskId) -> dict[str, str]:
+    """Primary key of a task item."""
+    return {"PK": f"TASK_LIST#{task_list_id}", "SK": f"TASK#{task_id}"}
+
+
+def legacy_task_list_key(
+    user_id: UserId,
+    task_list_id: TaskListId,
+) -> dict[str, str]:
+    """Key of a task list item not yet moved next to its tasks."""
+    return {"PK": f"USER#{user_id}", "SK": f"TASK_LIST#{task_list_id}"}
@@ -0,0 +1,304 @@
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+from loguru import logger
+
+from ...domain.task_list import TaskList, TaskListId
+from ...domain.user import UserId
+from .async_dynamodb import AsyncTable
+from .batch import BATCH_CONCURRENCY
+from .items import task_list_from_item, task_list_to_item
+from .keys import legacy_task_list_key
+from .pagination import iter_query, iter_query_async
+from .transaction import cancellation_reasons, failed_condition
+
+MIGRATION_PAGE_SIZE = 500
+"""Items scanned per page, between which the migration can stop."""
+
+
+@dataclass(frozen=True)
+class MigrationResult:
+    moved: int = 0
+    start_key: dict[str, Any] | None = None
+    """Where to resume the scan, or ``None`` once the whole table is done."""
+
+
+def move_task_list_request(
+    table_name: str,
+    item: dict[str, Any],
+) -> dict[str, Any]:
+    """``TransactWriteItems`` moving a legacy task list item to its new key.
+
+    The task list is put at the head of the item collection of its tasks
+    and the legacy item is deleted in the same transaction.
+    """
+    return {
+        "TransactItems": [
+            {
+                "Put": {
+                    "TableName": table_name,
+                    "Item": task_list_to_item(task_list_from_item(item)),
+                    "ConditionExpression": "attribute_not_exists(PK)",
+                }
+            },
+            {
+                "Delete": {
+                    "TableName": table_name,
+                    "Key": {"PK": item["PK"], "SK": item["SK"]},
+                    "ConditionExpression": "attribute_exists(PK)",
+                }
+            },
+        ]
+    }
+
+
+def move_task_list(table, item: dict[str, Any]) -> bool:
+    """Move one legacy task list item, ``False`` if it was already moved."""
+    try:
+        table.transact_write_items(**move_task_list_request(table.name, item))
+    except ClientError as e:
+        reasons = cancellation_reasons(e)
+        if reasons is None or not any(map(failed_condition, reasons)):
+            raise
+        return False
+
+    return True
+
+
+def migrate_task_lists(
+    table,
+    start_key: dict[str, Any] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> MigrationResult:
+    """Move the legacy task list items next to their tasks, page by page.
+
+    The scan resumes from ``start_key`` and the task lists of each page
+    are moved concurrently. After each page it stops if ``should_stop``
+    returns true, returning the key to resume from. Running it again once
+    done moves none.
+    """
+    kwargs: dict[str, Any] = {
+        "FilterExpression": Attr("PK").begins_with("USER#")
+        & Attr("SK").begins_with("TASK_LIST#"),
+        "Limit": MIGRATION_PAGE_SIZE,
+    }
+    moved = 0
+    with ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY) as executor:
+        while True:
+            if start_key is not None:
+                kwargs["ExclusiveStartKey"] = start_key
+
+            resp = table.scan(**kwargs)
+            moved += sum(
+                executor.map(
+                    lambda item: move_task_list(table, item),
+                    resp["Items"],
+                )
+            )
+
+            start_key = resp.get("LastEvaluatedKey")
+            if start_key is None or (should_stop is not None and should_stop()):
+                break
+
+    logger.info(f"Moved {moved} task lists next to their tasks")
+    return MigrationResult(moved=moved, start_key=start_key)
+
+
+def find_legacy_task_list_item(
+    table,
+    task_list_id: TaskListId,
+    user_id: UserId | None = None,
+) -> dict[str, Any] | None:
+    """Find a task list item still at its legacy key.
+
+    With its owner the item is read by key. Otherwise it is found in
+    GSI1, where legacy task lists are indexed by their own ID.
+    """
+    if user_id is not None:
+        resp = table.get_item(
+            Key=legacy_task_list_key(user_id, task_list_id),
+            ConsistentRead=True,
+        )
+        return resp.get("Item")
+
+    items = table.query(**legacy_task_list_query(task_list_id))["Items"]
+    return items[0] if items else None
+
+
+def move_legacy_task_list(
+    table,
+    task_list_id: TaskListId,
+    user_id: UserId | None = None,
+) -> bool:
+    """Move a task list still at its legacy key next to its tasks.
+
+    Returns whether one was found, even if another writer moved it first.
+    """
+    item = find_legacy_task_list_item(table, task_list_id, user_id)
+
+    if item is None:
+        return False
+
+    move_task_list(table, item)
+    return True
+
+
+def move_legacy_task_lists(table, user_id: UserId) -> list[TaskList]:
+    """Move every task list of a user still at its legacy key.
+
+    Returns the task lists found there, in the order of GSI1, which may
+    not index them yet at their new key.
+    """
+    items = list(iter_query(table, **legacy_task_lists_query(user_id)))
+    for item in items:
+        move_task_list(table, item)
+    return [task_list_from_item(item) for item in items]
+
+
+async def move_task_list_async(table: AsyncTable, item: dict[str, Any]) -> bool:
+    """``move_task_list`` for an ``AsyncTable``."""
+    try:
+        await table.transact_write_items(
+            **move_task_list_request(table.name, item)
+        )
+    except ClientError as e:
+        reasons = cancellation_reasons(e)
+        if reasons is None or not any(map(failed_condition, reasons)):
+            raise
+        return False
+
+    return True
+
+
+async def find_legacy_task_list_item_async(
+    table: AsyncTable,
+    task_list_id: TaskListId,
+    user_id: UserId | None = None,
+) -> dict[str, Any] | None:
+    """``find_legacy_task_list_item`` for an ``AsyncTable``."""
+    if user_id is not None:
+        resp = await table.get_item(
+            Key=legacy_task_list_key(user_id, task_list_id),
+            ConsistentRead=True,
+        )
+        return resp.get("Item")
+
+    items = (await table.query(**legacy_task_list_query(task_list_id)))["Items"]
+    return items[0] if items else None
+
+
+async def move_legacy_task_list_async(
+    table: AsyncTable,
+    task_list_id: TaskListId,
+    user_id: UserId | None = None,
+) -> bool:
+    """``move_legacy_task_list`` for an ``AsyncTable``."""
+    item = await find_legacy_task_list_item_async(table, task_list_id, user_id)
+
+    if item is None:
+        return False
+
+    await move_task_list_async(table, item)
+    return True
+
+
+async def move_legacy_task_lists_async(
+    table: AsyncTable,
+    user_id: UserId,
+) -> list[TaskList]:
+    """``move_legacy_task_lists`` for an ``AsyncTable``."""
+    items = [
+        item
+        async for item in iter_query_async(
+            table, **legacy_task_lists_query(user_id)
+        )
+    ]
+    for item in items:
+        await move_task_list_async(table, item)
+    return [task_list_from_item(item) for item in items]
+
+
+def index_order(task_list: TaskList) -> str:
+    """Sort key of a task list among those of its owner in GSI1."""
+    return f"TASK_LIST#{task_list.id}"
+
+
+def merge_moved_task_lists(
+    task_lists: list[TaskList],
+    moved: list[TaskList],
+    last_page: bool,
+) -> list[TaskList]:
+    """A page of task lists read from GSI1 with those just moved.
+
+    GSI1 is eventually consistent, so a task list moved a moment ago may
+    be missing from the page. Moved task lists are merged in index order,
+    but only up to the last task list of the page unless it is the last
+    page, so that a later page cannot return them again.
+    """
+    ids = {task_list.id for task_list in task_lists}
+    end = None if last_page or not task_lists else index_order(task_lists[-1])
+    missing = [
+        task_list
+        for task_list in moved
+        if task_list.id not in ids
+        and (end is None or index_order(task_list) < end)
+    ]
+    return sorted([*task_lists, *missing], key=index_order)
+
+
+def iter_with_moved_task_lists(
+    task_lists: Iterable[TaskList],
+    moved: list[TaskList],
+) -> Iterator[TaskList]:
+    """Task lists read from GSI1 in order, with those just moved merged."""
+    pending = sorted(moved, key=index_order)
+    for task_list in task_lists:
+        while pending and index_order(pending[0]) < index_order(task_list):
+            yield pending.pop(0)
+        if pending and pending[0].id == task_list.id:
+            pending.pop(0)
+        yield task_list
+    yield from pending
+
+
+async def iter_with_moved_task_lists_async(
+    task_lists: AsyncIterable[TaskList],
+    moved: list[TaskList],
+) -> AsyncIterator[TaskList]:
+    """``iter_with_moved_task_lists`` for task lists read asynchronously."""
+    pending = sorted(moved, key=index_order)
+    async for task_list in task_lists:
+        while pending and index_order(pending[0]) < index_order(task_list):
+            yield pending.pop(0)
+        if pending and pending[0].id == task_list.id:
+            pending.pop(0)
+        yield task_list
+    for task_list in pending:
+        yield task_list
+
+
+def legacy_task_list_query(task_list_id: TaskListId) -> dict[str, Any]:
+    """``Query`` of a legacy task list by its ID alone."""
+    return {
+        "IndexName": "GSI1",
+        "KeyConditionExpression": Key("GSI1PK").eq(f"TASK_LIST#{task_list_id}"),
+    }
+
+
+def legacy_task_lists_query(user_id: UserId) -> dict[str, Any]:
+    """Consistent ``Query`` of the legacy task lists of a user."""
+    return {
+        "KeyConditionExpression": Key("PK").eq(f"USER#{user_id}")
+        & Key("SK").begins_with("TASK_LIST#"),
+        "ConsistentRead": True,
+    }
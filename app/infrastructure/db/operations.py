@@ -0,0 +1,602 @@
+"""Request builders shared by the synchronous and asynchronous repositories.
+
+Each builder returns the keyword arguments of one DynamoDB call using
+plain Python values, and each ``*_error`` function translates the
+``ClientError`` of that call into the domain error it stands for.
+"""
+
+from collections import Counter
+from collections.abc import Sequence
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from ...domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from ...domain.task_feed import TaskFeedCursor
+from ...domain.task_list import (
+    TaskCount,
+    TaskListId,
+    TaskSortBy,
+    TaskSortOrder,
+)
+from ...domain.user import UserId
+from .expressions import increment_version, set_expression
+from .items import (
+    status_count_attribute,
+    status_sort_key,
+    task_to_item,
+    user_tasks_key,
+)
+from .keys import TASK_LIST_METADATA, task_key, task_list_key
+from .schema import LOCAL_SECONDARY_INDEXES, USER_TASK_INDEXES
+from .transaction import (
+    cancellation_reasons,
+    failed_condition,
+    is_conditional_check_failed,
+)
+from .wire import KeyCondition
+
+STATUS_ATTEMPTS = 3
+"""Attempts of a write depending on a status that changes concurrently."""
+
+TASK_SORT_INDEXES = {
+    TaskSortBy.CREATED_AT: "LSI1",
+    TaskSortBy.TITLE: "LSI2",
+    TaskSortBy.STATUS: "LSI3",
+}
+"""Local secondary index serving each order of the tasks of a list."""
+
+
+class TaskStatusChangedError(Exception):
+    """The status of a task, or its version, changed since it was read."""
+
+
+class TaskListNotFoundError(ValueError):
+    """The task list of a write does not exist, or not for its user."""
+
+    def __init__(self):
+        super().__init__("Task list not found.")
+
+
+def owned_task_list_request(user_id: UserId, **request: Any) -> dict[str, Any]:
+    """Condition a write of a task list item on it existing for ``user_id``.
+
+    The task list item is keyed by its ID alone, so writes made on behalf
+    of a user check the owner stored in the item. A condition already in
+    ``request`` must hold as well.
+    """
+    condition = "attribute_exists(PK) AND #user_id = :user_id"
+    if "ConditionExpression" in request:
+        condition += f" AND {request['ConditionExpression']}"
+
+    return {
+        **request,
+        "ConditionExpression": condition,
+        "ExpressionAttributeNames": {
+            **request.get("ExpressionAttributeNames", {}),
+            "#user_id": "user_id",
+        },
+        "ExpressionAttributeValues": {
+            **request.get("ExpressionAttributeValues", {}),
+            ":user_id": str(user_id),
+        },
+    }
+
+
+def is_owned_by(item: dict[str, Any], user_id: UserId) -> bool:
+    """Whether an item returned by a failed condition belongs to ``user_id``.
+
+    Such items are not deserialized, so their values are typed.
+    """
+    return item.get("user_id") == {"S": str(user_id)}
+
+
+def add_task_to_list_request(
+    table_name: str,
+    user_id: UserId,
+    task: Task,
+) -> dict[str, Any]:
+    """``TransactWriteItems`` putting a task and counting it in its list.
+
+    The task list must exist and have room for one more task, which is
+    checked on the server so concurrent writers cannot exceed
+    ``TaskCount.MAX_TASK_COUNT``. The counter of the status of the task
+    is incremented with the total.
+    """
+    return {
+        "TransactItems": [
+            {
+                "Put": {
+                    "TableName": table_name,
+                    "Item": task_to_item(task, user_id),
+                    "ConditionExpression": "attribute_not_exists(PK)",
+                }
+            },
+            {
+                "Update": increment_version(
+                    owned_task_list_request(
+                        user_id,
+                        TableName=table_name,
+                        Key=task_list_key(task.task_list_id),
+                        UpdateExpression="ADD #count :one, #status_count :one",
+                        ConditionExpression="#count < :max",
+                        ExpressionAttributeNames={
+                            "#count": "count",
+                            "#status_count": status_count_attribute(
+                                task.status
+                            ),
+                        },
+                        ExpressionAttributeValues={
+                            ":one": 1,
+                            ":max": TaskCount.MAX_TASK_COUNT,
+                        },
+                        ReturnValuesOnConditionCheckFailure="ALL_OLD",
+                    )
+                )
+            },
+        ]
+    }
+
+
+def add_task_to_list_error(error: ClientError, user_id: UserId) -> Exception:
+    reasons = cancellation_reasons(error)
+    if reasons is None:
+        return error
+    if failed_condition(reasons[0]):
+        return ValueError("Task already exists.")
+    if failed_condition(reasons[1]):
+        if not is_owned_by(reasons[1].get("Item", {}), user_id):
+            return TaskListNotFoundError()
+        return ValueError(
+            f"Task count cannot exceed {TaskCount.MAX_TASK_COUNT}."
+        )
+    return error
+
+
+def reserve_task_count_request(
+    user_id: UserId,
+    task_list_id: TaskListId,
+    tasks: Sequence[Task],
+) -> dict[str, Any]:
+    """``UpdateItem`` counting new ``tasks`` in their task list.
+
+    The task list must exist and have room for all of them, so the tasks
+    can then be put without a transaction.
+    """
+    expression = _count_tasks_expression(tasks, 1)
+    expression["ExpressionAttributeValues"][":limit"] = (
+        TaskCount.MAX_TASK_COUNT - len(tasks)
+    )
+
+    return owned_task_list_request(
+        user_id,
+        **expression,
+        Key=task_list_key(task_list_id),
+        ConditionExpression="#count <= :limit",
+        ReturnValuesOnConditionCheckFailure="ALL_OLD",
+    )
+
+
+def reserve_task_count_error(
+    error: ClientError,
+    user_id: UserId,
+) -> Exception:
+    if not is_conditional_check_failed(error):
+        return error
+    if not is_owned_by(error.response.get("Item", {}), user_id):
+        return TaskListNotFoundError()
+    return ValueError(f"Task count cannot exceed {TaskCount.MAX_TASK_COUNT}.")
+
+
+def release_task_count_request(
+    user_id: UserId,
+    task_list_id: TaskListId,
+    tasks: Sequence[Task],
+) -> dict[str, Any]:
+    """``UpdateItem`` undoing ``reserve_task_count_request``."""
+    return owned_task_list_request(
+        user_id,
+        **_count_tasks_expression(tasks, -1),
+        Key=task_list_key(task_list_id),
+    )
+
+
+def _count_tasks_expression(tasks: Sequence[Task], sign: int) -> dict:
+    """``ADD`` of ``tasks`` to the total and per-status counters."""
+    counts = Counter(task.status for task in tasks)
+    return increment_version(
+        {
+            "UpdateExpression": "ADD #count :count, "
+            + ", ".join(
+                f"#{status}_count :{status}_count" for status in counts
+            ),
+            "ExpressionAttributeNames": {
+                "#count": "count",
+                **{
+                    f"#{status}_count": status_count_attribute(status)
+                    for status in counts
+                },
+            },
+            "ExpressionAttributeValues": {
+                ":count": sign * len(tasks),
+                **{
+                    f":{status}_count": sign * count
+                    for status, count in counts.items()
+                },
+            },
+        }
+    )
+
+
+def remove_task_from_list_request(
+    table_name: str,
+    user_id: UserId,
+    task_list_id: TaskListId,
+    task_id: TaskId,
+    status: TaskStatus,
+) -> dict[str, Any]:
+    """``TransactWriteItems`` deleting a task and uncounting it.
+
+    ``status`` is the last read status of the task, whose counter is
+    decremented with the total. The transaction is cancelled when either
+    the task or the task list does not exist, or the status has changed.
+    """
+    return {
+        "TransactItems": [
+            {
+                "Delete": {
+                    "TableName": table_name,
+                    "Key": task_key(task_list_id, task_id),
+                    "ConditionExpression": "attribute_exists(PK) "
+                    "AND #status = :status",
+                    "ExpressionAttributeNames": {"#status": "status"},
+                    "ExpressionAttributeValues": {":status": str(status)},
+                    "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+                }
+            },
+            {
+                "Update": increment_version(
+                    owned_task_list_request(
+                        user_id,
+                        TableName=table_name,
+                        Key=task_list_key(task_list_id),
+                        UpdateExpression="ADD #count :minus_one, "
+                        "#status_count :minus_one",
+                        ConditionExpression="#count > :zero",
+                        ExpressionAttributeNames={
+                            "#count": "count",
+                            "#status_count": status_count_attribute(status),
+                        },
+                        ExpressionAttributeValues={
+                            ":minus_one": -1,
+                            ":zero": 0,
+                        },
+                    )
+                )
+            },
+        ]
+    }
+
+
+def remove_task_from_list_error(error: ClientError) -> Exception:
+    reasons = cancellation_reasons(error)
+    if reasons is None:
+        return error
+    if failed_condition(reasons[0]):
+        if "Item" in reasons[0]:
+            return TaskStatusChangedError()
+        return ValueError("Task not found.")
+    if failed_condition(reasons[1]):
+        return TaskListNotFoundError()
+    return error
+
+
+def update_task_request(
+    task_list_id: TaskListId,
+    task_id: TaskId,
+    title: TaskTitle | None = None,
+    description: TaskDescription | None = None,
+    status: TaskStatus | None = None,
+    created_at: str | None = None,
+    previous_status: TaskStatus | None = None,
+) -> dict[str, Any]:
+    """``UpdateItem`` setting only the given fields of an existing task.
+
+    A new ``status`` also moves the task in the status index, whose sort
+    key embeds the stored ``created_at`` of the task. With a
+    ``previous_status``, the update is rejected if the status changed
+    since it was read.
+    """
+    values = {
+        name: str(value)
+        for name, value in [
+            ("title", title),
+            ("description", description),
+            ("status", status),
+        ]
+        if value is not None
+    }
+    if status is not None:
+        if created_at is None:
+            raise ValueError("The creation time is needed to set a status.")
+        values["status_created_at"] = status_sort_key(status, created_at)
+
+    request = {
+        "Key": task_key(task_list_id, task_id),
+        "ConditionExpression": "attribute_exists(PK)",
+        "ReturnValues": "ALL_NEW",
+        **increment_version(set_expression(values)),
+    }
+    if previous_status is not None:
+        request["ConditionExpression"] += " AND #status = :previous_status"
+        request["ExpressionAttributeNames"]["#status"] = "status"
+        request["ExpressionAttributeValues"][":previous_status"] = str(
+            previous_status
+        )
+        request["ReturnValuesOnConditionCheckFailure"] = "ALL_OLD"
+
+    return request
+
+
+def update_task_error(error: ClientError) -> Exception | None:
+    """Translate a failed ``update_task_request``, ``None`` when missing."""
+    if not is_conditional_check_failed(error):
+        return error
+    if "Item" in error.response:
+        return TaskStatusChangedError()
+    return None
+
+
+def change_task_status_request(
+    table_name: str,
+    user_id: UserId,
+    task: Task,
+    status: TaskStatus,
+    title: TaskTitle | None = None,
+    description: TaskDescription | None = None,
+) -> dict[str, Any]:
+    """``TransactWriteItems`` updating a task and moving it to ``status``.
+
+    ``task`` is the task as last read. Its update is rejected if its
+    status or any other field has changed since, so the task can be
+    updated in place afterwards, and the task is moved from the counter
+    of its previous status to that of the new one.
+    """
+    update = update_task_request(
+        task.task_list_id,
+        task.id,
+        title=title,
+        description=description,
+        status=status,
+        created_at=task.created_at.isoformat(),
+        previous_status=task.status,
+    )
+    del update["ReturnValues"]
+    if task.version:
+        update["ConditionExpression"] += " AND #version = :previous_version"
+        update["ExpressionAttributeValues"][":previous_version"] = task.version
+    else:
+        update["ConditionExpression"] += " AND attribute_not_exists(#version)"
+
+    return {
+        "TransactItems": [
+            {"Update": {"TableName": table_name, **update}},
+            {
+                "Update": increment_version(
+                    owned_task_list_request(
+                        user_id,
+                        TableName=table_name,
+                        Key=task_list_key(task.task_list_id),
+                        UpdateExpression="ADD #previous :minus_one, "
+                        "#status :one",
+                        ExpressionAttributeNames={
+                            "#previous": status_count_attribute(task.status),
+                            "#status": status_count_attribute(status),
+                        },
+                        ExpressionAttributeValues={
+                            ":minus_one": -1,
+                            ":one": 1,
+                        },
+                    )
+                )
+            },
+        ]
+    }
+
+
+def change_task_status_error(error: ClientError) -> Exception | None:
+    """Translate a cancelled ``change_task_status_request``.
+
+    Returns ``None`` when the task does not exist.
+    """
+    reasons = cancellation_reasons(error)
+    if reasons is None:
+        return error
+    if failed_condition(reasons[0]):
+        if "Item" in reasons[0]:
+            return TaskStatusChangedError()
+        return None
+    if failed_condition(reasons[1]):
+        return TaskListNotFoundError()
+    return error
+
+
+TASK_COLLECTION = KeyCondition("PK")
+"""Every item of the collection of a task list."""
+
+TASKS_AFTER_TASK_LIST = KeyCondition("PK", LOCAL_SECONDARY_INDEXES["LSI1"], ">")
+"""Tasks of a list in the creation time index, after the task list item."""
+
+TASKS_IN_STATUS = KeyCondition(
+    "PK", LOCAL_SECONDARY_INDEXES["LSI3"], "begins_with"
+)
+"""Tasks of a list in one status, in the status index."""
+
+TASKS_CREATED_BETWEEN = KeyCondition(
+    "PK", LOCAL_SECONDARY_INDEXES["LSI1"], "between"
+)
+"""Tasks of a list created in a time range, in the creation time index."""
+
+TASKS_IN_STATUS_CREATED_BETWEEN = KeyCondition(
+    "PK", LOCAL_SECONDARY_INDEXES["LSI3"], "between"
+)
+"""Tasks of a list in one status created in a time range."""
+
+EARLIEST_CREATED_AT = "0"
+"""Sorts before every ISO creation time, and after the task list item."""
+
+LATEST_CREATED_AT = "~"
+"""Sorts after every ISO creation time."""
+
+TASK_BY_ID = KeyCondition("GSI1PK")
+"""A task in the index of tasks by ID."""
+
+TASK_LISTS_OF_USER = KeyCondition("GSI1PK", "GSI1SK", "begins_with")
+"""Task lists of a user in the index of task lists by owner."""
+
+USER_TASKS = KeyCondition("GSI2PK")
+"""Tasks of a user, in either user task index."""
+
+USER_TASKS_IN_STATUS = KeyCondition(
+    "GSI2PK", USER_TASK_INDEXES["GSI3"], "begins_with"
+)
+"""Tasks of a user in one status, in the user status index."""
+
+
+def list_tasks_query(
+    task_list_id: TaskListId,
+    sort_by: TaskSortBy,
+    order: TaskSortOrder,
+    status: TaskStatus | None = None,
+    start: TaskFeedCursor | None = None,
+) -> dict[str, Any]:
+    """Low-level ``Query`` reading the tasks of a list in ``sort_by`` order.
+
+    Each order has its own local secondary index, so it is served by
+    DynamoDB and paginates like the table itself. Tasks in one ``status``
+    are a key range of the status index, ordered by creation time, so
+    only the matching tasks are read. By creation time, the tasks before
+    the ``start`` cursor in ``order`` are left out of the key range, but
+    those created at the same time as its task are read.
+    """
+    partition = f"TASK_LIST#{task_list_id}"
+
+    if start is not None:
+        if sort_by is not TaskSortBy.CREATED_AT:
+            raise ValueError("Only tasks by creation time start at a cursor.")
+        return {
+            "IndexName": TASK_SORT_INDEXES[
+                TaskSortBy.CREATED_AT if status is None else TaskSortBy.STATUS
+            ],
+            "ScanIndexForward": order is TaskSortOrder.ASCENDING,
+            **_created_between(partition, order, status, start),
+        }
+
+    if status is None:
+        index_name = TASK_SORT_INDEXES[sort_by]
+        if sort_by is TaskSortBy.CREATED_AT:
+            # Skip the task list, which heads the creation time index.
+            key_condition = TASKS_AFTER_TASK_LIST.bind(
+                partition, TASK_LIST_METADATA
+            )
+        else:
+            key_condition = TASK_COLLECTION.bind(partition)
+    elif sort_by in (TaskSortBy.CREATED_AT, TaskSortBy.STATUS):
+        index_name = TASK_SORT_INDEXES[TaskSortBy.STATUS]
+        key_condition = TASKS_IN_STATUS.bind(partition, f"{status}#")
+    else:
+        raise ValueError(
+            "Tasks filtered by status can only be sorted by creation time."
+        )
+
+    return {
+        "IndexName": index_name,
+        "ScanIndexForward": order is TaskSortOrder.ASCENDING,
+        **key_condition,
+    }
+
+
+def _created_between(
+    partition: str,
+    order: TaskSortOrder,
+    status: TaskStatus | None,
+    start: TaskFeedCursor,
+) -> dict[str, Any]:
+    """Key condition of the tasks of a list from ``start`` on in ``order``."""
+    if order is TaskSortOrder.ASCENDING:
+        bounds = start.created_at, LATEST_CREATED_AT
+    else:
+        bounds = EARLIEST_CREATED_AT, start.created_at
+
+    if status is None:
+        return TASKS_CREATED_BETWEEN.bind(partition, *bounds)
+
+    low, high = (status_sort_key(status, bound) for bound in bounds)
+    return TASKS_IN_STATUS_CREATED_BETWEEN.bind(partition, low, high)
+
+
+def task_list_with_tasks_query(task_list_id: TaskListId) -> dict[str, Any]:
+    """Low-level ``Query`` reading a task list and its tasks by creation time.
+
+    The task list item heads the creation time index of its own item
+    collection, so it comes first, followed by the tasks in the default
+    order of ``list_tasks_query``.
+    """
+    return {
+        "IndexName": TASK_SORT_INDEXES[TaskSortBy.CREATED_AT],
+        "ScanIndexForward": True,
+        **TASK_COLLECTION.bind(f"TASK_LIST#{task_list_id}"),
+    }
+
+
+def find_task_query(task_id: TaskId) -> dict[str, Any]:
+    """Low-level ``Query`` finding a task by its ID alone."""
+    return {"IndexName": "GSI1", **TASK_BY_ID.bind(f"TASK#{task_id}")}
+
+
+def list_task_lists_query(user_id: UserId) -> dict[str, Any]:
+    """Low-level ``Query`` reading the task lists of a user."""
+    return {
+        "IndexName": "GSI1",
+        **TASK_LISTS_OF_USER.bind(f"USER#{user_id}", "TASK_LIST#"),
+    }
+
+
+def list_user_tasks_query(
+    user_id: UserId,
+    order: TaskSortOrder,
+    status: TaskStatus | None = None,
+    cursor: TaskFeedCursor | None = None,
+) -> dict[str, Any]:
+    """Low-level ``Query`` reading the tasks of a user by creation time.
+
+    The tasks of all the lists of a user share one partition of the user
+    task indexes, so they are read in order without merging the lists.
+    Tasks in one ``status`` are a key range of the second index. The
+    ``cursor`` is turned back into the key of the index it points into.
+    """
+    partition = user_tasks_key(user_id)
+
+    if status is None:
+        index_name = "GSI2"
+        key_condition = USER_TASKS.bind(partition)
+    else:
+        index_name = "GSI3"
+        key_condition = USER_TASKS_IN_STATUS.bind(partition, f"{status}#")
+
+    query: dict[str, Any] = {
+        "IndexName": index_name,
+        "ScanIndexForward": order is TaskSortOrder.ASCENDING,
+        **key_condition,
+    }
+    if cursor is not None:
+        sort_key = cursor.created_at
+        if status is not None:
+            sort_key = status_sort_key(status, sort_key)
+        query["ExclusiveStartKey"] = {
+            "GSI2PK": partition,
+            USER_TASK_INDEXES[index_name]: sort_key,
+            **task_key(cursor.task_list_id, cursor.task_id),
+        }
+
+    return query
@@ -0,0 +1,135 @@
+import base64
+import binascii
+import json
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+
+def encode_token(last_evaluated_key: dict[str, Any]) -> str:
+    """Encode a ``LastEvaluatedKey`` as an opaque pagination token."""
+    data = json.dumps(last_evaluated_key, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_token(
+    token: str,
+    key_name: str,
+    key_value: str,
+    index_key: str | None = None,
+) -> dict[str, Any]:
+    """Decode a pagination token into an ``ExclusiveStartKey``.
+
+    The key must belong to the partition being queried, so a token issued
+    for one collection cannot be replayed against another. With an
+    ``index_key``, the key must also come from a query of that index.
+    """
+    try:
+        data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        key = json.loads(data)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError("Invalid pagination token.") from e
+
+    if not isinstance(key, dict) or key.get(key_name) != key_value:
+        raise ValueError("Invalid pagination token.")
+    if index_key is not None and index_key not in key:
+        raise ValueError("Invalid pagination token.")
+
+    return key
+
+
+def query_page(
+    table,
+    key_name: str,
+    key_value: str,
+    limit: int | None = None,
+    next_token: str | None = None,
+    index_key: str | None = None,
+    **kwargs: Any,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Query up to ``limit`` items, following ``LastEvaluatedKey``.
+
+    Without a limit every page of the partition is read. ``index_key`` is
+    the sort key of the queried index, if any, checked in ``next_token``.
+    """
+    if next_token is not None:
+        kwargs["ExclusiveStartKey"] = decode_token(
+            next_token, key_name, key_value, index_key
+        )
+
+    items: list[dict[str, Any]] = []
+    while True:
+        if limit is not None:
+            kwargs["Limit"] = limit - len(items)
+
+        resp = table.query(**kwargs)
+        items.extend(resp["Items"])
+        last_evaluated_key = resp.get("LastEvaluatedKey")
+
+        if last_evaluated_key is None:
+            return items, None
+        if limit is not None and len(items) >= limit:
+            return items, encode_token(last_evaluated_key)
+
+        kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+
+def iter_query(table, **kwargs: Any) -> Iterator[dict[str, Any]]:
+    """Yield the items of a query page by page, fetching pages lazily."""
+    while True:
+        resp = table.query(**kwargs)
+        yield from resp["Items"]
+
+        last_evaluated_key = resp.get("LastEvaluatedKey")
+        if last_evaluated_key is None:
+            return
+
+        kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+
+async def query_page_async(
+    table,
+    key_name: str,
+    key_value: str,
+    limit: int | None = None,
+    next_token: str | None = None,
+    index_key: str | None = None,
+    **kwargs: Any,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """``query_page`` for an ``AsyncTable``."""
+    if next_token is not None:
+        kwargs["ExclusiveStartKey"] = decode_token(
+            next_token, key_name, key_value, index_key
+        )
+
+    items: list[dict[str, Any]] = []
+    while True:
+        if limit is not None:
+            kwargs["Limit"] = limit - len(items)
+
+        resp = await table.query(**kwargs)
+        items.extend(resp["Items"])
+        last_evaluated_key = resp.get("LastEvaluatedKey")
+
+        if last_evaluated_key is None:
+            return items, None
+        if limit is not None and len(items) >= limit:
+            return items, encode_token(last_evaluated_key)
+
+        kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+
+async def iter_query_async(
+    table,
+    **kwargs: Any,
+) -> AsyncIterator[dict[str, Any]]:
+    """``iter_query`` for an ``AsyncTable``."""
+    while True:
+        resp = await table.query(**kwargs)
+        for item in resp["Items"]:
+            yield item
+
+        last_evaluated_key = resp.get("LastEvaluatedKey")
+        if last_evaluated_key is None:
+            return
+
+        kwargs["ExclusiveStartKey"] = last_evaluated_key
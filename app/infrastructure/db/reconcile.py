@@ -0,0 +1,212 @@
+import itertools
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+from loguru import logger
+
+from ...domain.task import TaskStatus
+from ..cache.shared import CollectionCache, user_task_lists
+from .batch import BATCH_CONCURRENCY
+from .expressions import increment_version
+from .items import status_count_attribute
+from .keys import TASK_LIST_METADATA
+from .schema import LOCAL_SECONDARY_INDEXES
+from .transaction import is_conditional_check_failed
+
+STATUS_INDEX = "LSI3"
+"""Local secondary index whose sort key starts with the task status."""
+
+RECONCILE_CHUNK_SIZE = BATCH_CONCURRENCY * 4
+"""Task lists submitted at once, so the scan is read as they are counted."""
+
+
+@dataclass(frozen=True)
+class ReconcileResult:
+    checked: int = 0
+    repaired: int = 0
+    skipped: int = 0
+    legacy: int = 0
+    """Task lists still at their legacy key, left to ``migrate_task_lists``."""
+
+
+def count_tasks(table, task_list_id: str, status: TaskStatus) -> int:
+    """Count the tasks of a list in ``status`` without reading them.
+
+    The count is read consistently, so it includes every task written
+    before the counters it is compared with were scanned.
+    """
+    kwargs: dict[str, Any] = {
+        "IndexName": STATUS_INDEX,
+        "KeyConditionExpression": Key("PK").eq(f"TASK_LIST#{task_list_id}")
+        & Key(LOCAL_SECONDARY_INDEXES[STATUS_INDEX]).begins_with(f"{status}#"),
+        "Select": "COUNT",
+        "ConsistentRead": True,
+    }
+    count = 0
+    while True:
+        resp = table.query(**kwargs)
+        count += resp["Count"]
+
+        last_evaluated_key = resp.get("LastEvaluatedKey")
+        if last_evaluated_key is None:
+            return count
+
+        kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+
+def iter_task_list_items(table) -> Iterator[dict[str, Any]]:
+    """Scan the counters of every task list item of the table.
+
+    Task list items still at their legacy key are included, so that they
+    can be reported.
+    """
+    kwargs: dict[str, Any] = {
+        "FilterExpression": Attr("SK").eq(TASK_LIST_METADATA)
+        | (
+            Attr("PK").begins_with("USER#")
+            & Attr("SK").begins_with("TASK_LIST#")
+        ),
+        "ProjectionExpression": "PK, SK, user_id, #count, "
+        + ", ".join(f"#{status}" for status in TaskStatus),
+        "ExpressionAttributeNames": {
+            "#count": "count",
+            **{
+                f"#{status}": status_count_attribute(status)
+                for status in TaskStatus
+            },
+        },
+        "ConsistentRead": True,
+    }
+    while True:
+        resp = table.scan(**kwargs)
+        yield from resp["Items"]
+
+        last_evaluated_key = resp.get("LastEvaluatedKey")
+        if last_evaluated_key is None:
+            return
+
+        kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+
+def repair_request(
+    item: dict[str, Any],
+    counts: dict[TaskStatus, int],
+) -> dict[str, Any] | None:
+    """``UpdateItem`` setting the counters of ``item`` to ``counts``.
+
+    Returns ``None`` when they already match. The update is conditioned on
+    the counters read by the scan, so a task written in between makes it
+    fail instead of being overwritten.
+    """
+    values: dict[str, int] = {"count": sum(counts.values())}
+    for status, count in counts.items():
+        values[status_count_attribute(status)] = count
+
+    if all(item.get(name) == value for name, value in values.items()):
+        return None
+
+    condition = Attr("PK").exists()
+    for name in values:
+        if name in item:
+            condition &= Attr(name).eq(item[name])
+        else:
+            condition &= Attr(name).not_exists()
+
+    return increment_version(
+        {
+            "Key": {"PK": item["PK"], "SK": item["SK"]},
+            "UpdateExpression": "SET "
+            + ", ".join(f"#{name} = :{name}" for name in values),
+            "ConditionExpression": condition,
+            "ExpressionAttributeNames": {f"#{name}": name for name in values},
+            "ExpressionAttributeValues": {
+                f":{name}": value for name, value in values.items()
+            },
+        }
+    )
+
+
+def reconcile_task_list(
+    table,
+    item: dict[str, Any],
+    collections: CollectionCache | None = None,
+) -> bool | None:
+    """Recount the tasks of one task list and repair its counters.
+
+    Returns whether the counters were repaired, or ``None`` when the task
+    list changed while it was being counted. The cached pages of the task
+    lists of its owner are invalidated after a repair.
+    """
+    task_list_id = item["PK"].removeprefix("TASK_LIST#")
+    counts = {
+        status: count_tasks(table, task_list_id, status)
+        for status in TaskStatus
+    }
+    request = repair_request(item, counts)
+
+    if request is None:
+        return False
+
+    try:
+        table.update_item(**request)
+    except ClientError as e:
+        if is_conditional_check_failed(e):
+            return None
+        raise
+
+    if collections is not None:
+        collections.invalidate(user_task_lists(item["user_id"]))
+
+    logger.info(
+        f"Repaired task counts of task list {task_list_id}: "
+        + ", ".join(f"{status}={count}" for status, count in counts.items())
+    )
+    return True
+
+
+def reconcile_task_lists(
+    table,
+    collections: CollectionCache | None = None,
+) -> ReconcileResult:
+    """Recount the tasks of every task list and repair drifted counters.
+
+    Task lists are counted concurrently, each with one ``Select=COUNT``
+    query per status on the status index, a chunk of the scan at a time.
+    Lists written while they are counted are skipped and left to the next
+    run. Lists still at their legacy key are only counted in ``legacy``:
+    run ``migrate_task_lists`` first to reconcile them.
+    """
+    checked = repaired = skipped = legacy = 0
+    with ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY) as executor:
+        for chunk in itertools.batched(
+            iter_task_list_items(table), RECONCILE_CHUNK_SIZE, strict=False
+        ):
+            items = [item for item in chunk if item["SK"] == TASK_LIST_METADATA]
+            legacy += len(chunk) - len(items)
+            results = executor.map(
+                lambda item: reconcile_task_list(table, item, collections),
+                items,
+            )
+            for result in results:
+                checked += 1
+                if result is None:
+                    skipped += 1
+                elif result:
+                    repaired += 1
+
+    if legacy:
+        logger.warning(
+            f"Skipped {legacy} task lists still at their legacy key, "
+            "run migrate_task_lists first"
+        )
+
+    return ReconcileResult(
+        checked=checked,
+        repaired=repaired,
+        skipped=skipped,
+        legacy=legacy,
+    )
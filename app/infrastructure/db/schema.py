@@ -0,0 +1,87 @@
+from loguru import logger
+
+LOCAL_SECONDARY_INDEXES = {
+    "LSI1": "created_at",
+    "LSI2": "title",
+    "LSI3": "status_created_at",
+}
+"""Sort key attribute of each local secondary index over task lists.
+
+Only task items carry these attributes, except for the task list item
+heading the creation time index of its own collection.
+"""
+
+USER_TASK_INDEXES = {
+    "GSI2": "created_at",
+    "GSI3": "status_created_at",
+}
+"""Sort key attribute of each global secondary index over user tasks.
+
+Both are partitioned by ``GSI2PK``, the owner of the task list of a task,
+so the tasks of a user across all their lists are read with one query.
+"""
+
+
+def table_definition(table_name: str) -> dict:
+    """Keyword arguments of ``CreateTable`` for the application table."""
+    return {
+        "TableName": table_name,
+        "BillingMode": "PAY_PER_REQUEST",
+        "AttributeDefinitions": [
+            {"AttributeName": "PK", "AttributeType": "S"},
+            {"AttributeName": "SK", "AttributeType": "S"},
+            {"AttributeName": "GSI1PK", "AttributeType": "S"},
+            {"AttributeName": "GSI1SK", "AttributeType": "S"},
+            {"AttributeName": "GSI2PK", "AttributeType": "S"},
+            *(
+                {"AttributeName": attribute, "AttributeType": "S"}
+                for attribute in LOCAL_SECONDARY_INDEXES.values()
+            ),
+        ],
+        "KeySchema": [
+            {"AttributeName": "PK", "KeyType": "HASH"},
+            {"AttributeName": "SK", "KeyType": "RANGE"},
+        ],
+        "GlobalSecondaryIndexes": [
+            {
+                "IndexName": "GSI1",
+                "KeySchema": [
+                    {"AttributeName": "GSI1PK", "KeyType": "HASH"},
+                    {"AttributeName": "GSI1SK", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            *(
+                {
+                    "IndexName": index_name,
+                    "KeySchema": [
+                        {"AttributeName": "GSI2PK", "KeyType": "HASH"},
+                        {"AttributeName": attribute, "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+                for index_name, attribute in USER_TASK_INDEXES.items()
+            ),
+        ],
+        "LocalSecondaryIndexes": [
+            {
+                "IndexName": index_name,
+                "KeySchema": [
+                    {"AttributeName": "PK", "KeyType": "HASH"},
+                    {"AttributeName": attribute, "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            }
+            for index_name, attribute in LOCAL_SECONDARY_INDEXES.items()
+        ],
+    }
+
+
+def create_table(client, table_name: str) -> None:
+    """Create the application table unless it already exists."""
+    if table_name in client.list_tables()["TableNames"]:
+        return
+
+    logger.info(f"Creating DynamoDB table: {table_name}")
+    client.create_table(**table_definition(table_name))
+    client.get_waiter("table_exists").wait(TableName=table_name)
@@ -0,0 +1,27 @@
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+
+def is_conditional_check_failed(error: ClientError) -> bool:
+    """Whether a single-item write was rejected by its condition."""
+    code = error.response.get("Error", {}).get("Code")
+    return code == "ConditionalCheckFailedException"
+
+
+def cancellation_reasons(error: ClientError) -> list[dict[str, Any]] | None:
+    """Per-item reasons of a cancelled ``TransactWriteItems`` call.
+
+    Returns ``None`` when the error is not a transaction cancellation, so
+    callers can re-raise anything they do not know how to translate.
+    """
+    code = error.response.get("Error", {}).get("Code")
+    if code != "TransactionCanceledException":
+        return None
+
+    return error.response.get("CancellationReasons", [])
+
+
+def failed_condition(reason: dict[str, Any]) -> bool:
+    """Whether one transaction item failed its ``ConditionExpression``."""
+    return reason.get("Code") == "ConditionalCheckFailed"
@@ -0,0 +1,121 @@
+"""Queries on the low-level client, in its typed wire format.
+
+Plain value calls rebuild key condition expressions on every call and
+deserializes every attribute of every item into Python values, numbers
+becoming ``Decimal``, before the repositories convert them once more.
+Queries reading many items instead go through a ``WireTable``: their key
+conditions are compiled once into ``KeyCondition`` templates, and their
+items are decoded from the typed wire format (``{"S": "..."}``) straight
+into domain objects by ``items.task_from_wire`` and
+``items.task_list_from_wire``.
+
+A ``WireTable`` shares the client of the ``ClientTable`` reading the
+same table in plain values, and so its connection pool.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+KEY_CONDITION_OPERATORS = {
+    "=": "#sk = :sk",
+    ">": "#sk > :sk",
+    "begins_with": "begins_with(#sk, :sk)",
+    "between": "#sk BETWEEN :sk AND :sk_end",
+}
+
+
+@dataclass(frozen=True)
+class KeyCondition:
+    """Key condition compiled once, with its values bound per query."""
+
+    partition_key: str
+    sort_key: str | None = None
+    operator: str | None = None
+    expression: str = field(init=False)
+    names: dict[str, str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        expression = "#pk = :pk"
+        names = {"#pk": self.partition_key}
+        if self.sort_key is not None and self.operator is not None:
+            expression += " AND " + KEY_CONDITION_OPERATORS[self.operator]
+            names["#sk"] = self.sort_key
+
+        object.__setattr__(self, "expression", expression)
+        object.__setattr__(self, "names", names)
+
+    def bind(
+        self,
+        partition_value: str,
+        sort_value: str | None = None,
+        sort_end: str | None = None,
+    ) -> dict[str, Any]:
+        """Low-level ``Query`` parameters of the condition for the values.
+
+        ``sort_end`` is the upper bound of a ``between`` condition.
+        """
+        values = {":pk": {"S": partition_value}}
+        if sort_value is not None:
+            values[":sk"] = {"S": sort_value}
+        if sort_end is not None:
+            values[":sk_end"] = {"S": sort_end}
+
+        return {
+            "KeyConditionExpression": self.expression,
+            "ExpressionAttributeNames": self.names,
+            "ExpressionAttributeValues": values,
+        }
+
+
+def key_to_wire(key: dict[str, str]) -> dict[str, dict[str, str]]:
+    """Typed form of a key, whose attributes are all strings."""
+    return {name: {"S": value} for name, value in key.items()}
+
+
+def key_from_wire(key: dict[str, dict[str, str]]) -> dict[str, str]:
+    """Plain form of a typed key, whose attributes are all strings."""
+    return {name: value["S"] for name, value in key.items()}
+
+
+def _query_params(table_name: str, params: dict[str, Any]) -> dict[str, Any]:
+    params = {"TableName": table_name, **params}
+    if "ExclusiveStartKey" in params:
+        params["ExclusiveStartKey"] = key_to_wire(params["ExclusiveStartKey"])
+    return params
+
+
+def _query_result(resp: dict[str, Any]) -> dict[str, Any]:
+    if "LastEvaluatedKey" in resp:
+        resp["LastEvaluatedKey"] = key_from_wire(resp["LastEvaluatedKey"])
+    return resp
+
+
+class WireTable:
+    """``Query`` of one table through a low-level boto3 client.
+
+    Items are returned in the typed wire format. Start and last evaluated
+    keys stay plain, so ``pagination`` encodes the same tokens as for a
+    ``ClientTable``.
+    """
+
+    def __init__(self, client, name: str):
+        self.name = name
+        self._client = client
+
+    def query(self, **params: Any) -> dict[str, Any]:
+        return _query_result(
+            self._client.query(**_query_params(self.name, params))
+        )
+
+
+class AsyncWireTable:
+    """``WireTable`` for an ``AsyncDynamoDBClient``."""
+
+    def __init__(self, client, name: str):
+        self.name = name
+        self._client = client
+
+    async def query(self, **params: Any) -> dict[str, Any]:
+        return _query_result(
+            await self._client.call("Query", _query_params(self.name, params))
+        )
@@ -0,0 +1,107 @@
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ExecutorMetrics:
+    """Snapshot of the load of an ``InstrumentedThreadPoolExecutor``."""
+
+    max_workers: int
+    queue_depth: int
+    running: int
+    completed: int
+    wait_time_mean_ms: float
+    wait_time_max_ms: float
+
+
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+    """Fixed-size thread pool that records how long calls wait for a thread.
+
+    The queue depth is the number of calls submitted but not yet started,
+    and the wait time is measured from submission to start, so a pool that
+    is too small for the load shows up in both.
+
+    ``map`` runs a call in the calling thread when it has not started by
+    the time its result is needed. The pool's own threads can then fan
+    out into the pool without waiting for threads that are all waiting
+    themselves, and a call never uses more threads than the pool has.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = ""):
+        super().__init__(max_workers, thread_name_prefix)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        submitted_at = time.perf_counter()
+
+        def run():
+            wait_time = time.perf_counter() - submitted_at
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._wait_time_total += wait_time
+                self._wait_time_max = max(self._wait_time_max, wait_time)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        with self._lock:
+            self._queued += 1
+        future = super().submit(run)
+        future.add_done_callback(self._forget_if_cancelled)
+        return future
+
+    def map(
+        self,
+        fn: Callable[..., Any],
+        *iterables: Iterable[Any],
+        timeout: float | None = None,
+        chunksize: int = 1,
+    ) -> Iterator[Any]:
+        calls = list(zip(*iterables, strict=False))
+        futures = [self.submit(fn, *args) for args in calls]
+
+        def results() -> Iterator[Any]:
+            try:
+                for future, args in zip(futures, calls, strict=True):
+                    if future.cancel():
+                        yield fn(*args)
+                    else:
+                        yield future.result(timeout)
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        return results()
+
+    def metrics(self) -> ExecutorMetrics:
+        with self._lock:
+            started = self._completed + self._running
+            return ExecutorMetrics(
+                max_workers=self._max_workers,
+                queue_depth=self._queued,
+                running=self._running,
+                completed=self._completed,
+                wait_time_mean_ms=(
+                    self._wait_time_total / started * 1000 if started else 0.0
+                ),
+                wait_time_max_ms=self._wait_time_max * 1000,
+            )
+
+    def _forget_if_cancelled(self, future: Future) -> None:
+        # A call cancelled while queued never runs.
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
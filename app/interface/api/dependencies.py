@@ -1,35 +1,18 @@
-from typing import Annotated
+from ...application.async_todo import AsyncTodoService
+from ...domain.user import UserId
+from .rendering import FragmentRenderer
 
-from fastapi import Depends
 
-from ...application.todo import TodoService
-from ...domain.task_list_repository import TaskListRepository
-from ...domain.task_repository import TaskRepository
-
-
-def get_task_list_repository() -> TaskListRepository:
+def get_todo_service() -> AsyncTodoService:
     raise NotImplementedError(
-        "Dependency 'get_task_list_repository' has not been overridden."
+        "Dependency 'get_todo_service' has not been overridden."
     )
 
 
-def get_task_repository() -> TaskRepository:
-    raise NotImplementedError(
-        "Dependency 'get_task_repository' has not been overridden."
-    )
+def get_renderer() -> FragmentRenderer:
+    """Renderer of the response bodies, without a cache unless overridden."""
+    return FragmentRenderer()
 
 
-def get_todo_service(
-    task_list_repository: Annotated[
-        TaskListRepository,
-        Depends(get_task_list_repository),
-    ],
-    task_repository: Annotated[
-        TaskRepository,
-        Depends(get_task_repository),
-    ],
-) -> TodoService:
-    return TodoService(
-        task_list_repository=task_list_repository,
-        task_repository=task_repository,
-    )
+def get_current_user_id() -> UserId:
+    return UserId("000001")
@@ -0,0 +1,137 @@
+"""JSON responses assembled from the rendered bytes of each entity.
+
+A task or task list renders to the same JSON until its next write, which
+increments its version, so its bytes are cached by kind, ID and version
+and reused by every response containing it. Pages are joined from these
+fragments without encoding their entities again.
+"""
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from pydantic_core import to_json
+
+from ...domain.page import Page
+from ...domain.task import Task, TaskId
+from ...domain.task_list import TaskList
+from ...infrastructure.cache.lru import LRUCache
+from .schema.task import (
+    batch_get_tasks_to_dict,
+    task_page_to_dict,
+    task_to_dict,
+)
+from .schema.task_list import (
+    task_list_page_to_dict,
+    task_list_to_dict,
+    task_list_with_tasks_to_dict,
+)
+
+type FragmentKey = tuple[str, str, int]
+"""Kind, ID and version of a rendered entity."""
+
+
+class FragmentRenderer:
+    """Renders response bodies, reusing the fragments of unchanged entities.
+
+    Without a cache whole responses are rendered at once, which beats
+    joining fragments rendered one by one. Entities stored before versions
+    existed have version zero and are never cached, since a writer unaware
+    of versions could change them without a new version.
+    """
+
+    def __init__(self, cache: LRUCache[FragmentKey, bytes] | None = None):
+        self._cache = cache
+
+    def task(self, task: Task) -> bytes:
+        """``TaskResponse`` of a task."""
+        return self._fragment(
+            ("task", task.id.value, task.version), task, task_to_dict
+        )
+
+    def task_list(self, task_list: TaskList) -> bytes:
+        """``TaskListResponse`` of a task list."""
+        return self._fragment(
+            ("task_list", task_list.id.value, task_list.version),
+            task_list,
+            task_list_to_dict,
+        )
+
+    def task_page(self, page: Page[Task]) -> bytes:
+        """``TaskPageResponse`` of a page of tasks."""
+        if self._cache is None:
+            return to_json(task_page_to_dict(page))
+        return _page(map(self.task, page.items), page.next_token)
+
+    def task_list_page(self, page: Page[TaskList]) -> bytes:
+        """``TaskListPageResponse`` of a page of task lists."""
+        if self._cache is None:
+            return to_json(task_list_page_to_dict(page))
+        return _page(map(self.task_list, page.items), page.next_token)
+
+    def task_list_with_tasks(
+        self,
+        task_list: TaskList,
+        tasks: Page[Task],
+    ) -> bytes:
+        """``TaskListWithTasksResponse`` of a task list and its tasks."""
+        if self._cache is None:
+            return to_json(task_list_with_tasks_to_dict(task_list, tasks))
+        # Reopen the object of the task list to add its tasks.
+        return b"".join(
+            [
+                self.task_list(task_list)[:-1],
+                b',"tasks":',
+                self.task_page(tasks),
+                b"}",
+            ]
+        )
+
+    def batch_get_tasks(
+        self,
+        task_ids: list[TaskId],
+        tasks: list[Task | None],
+    ) -> bytes:
+        """``BatchGetTasksResponse`` of the tasks found by ID."""
+        if self._cache is None:
+            return to_json(batch_get_tasks_to_dict(task_ids, tasks))
+        missing_ids = [
+            str(task_id)
+            for task_id, task in zip(task_ids, tasks, strict=True)
+            if task is None
+        ]
+        return b"".join(
+            [
+                b'{"items":[',
+                b",".join(self.task(task) for task in tasks if task),
+                b'],"missing_ids":',
+                to_json(missing_ids),
+                b"}",
+            ]
+        )
+
+    def _fragment[T](
+        self,
+        key: FragmentKey,
+        entity: T,
+        to_dict: Callable[[T], dict[str, Any]],
+    ) -> bytes:
+        if self._cache is None or not key[2]:
+            return to_json(to_dict(entity))
+
+        fragment = self._cache.get(key)
+        if fragment is None:
+            fragment = to_json(to_dict(entity))
+            self._cache.put(key, fragment)
+        return fragment
+
+
+def _page(fragments: Iterable[bytes], next_token: str | None) -> bytes:
+    return b"".join(
+        [
+            b'{"items":[',
+            b",".join(fragments),
+            b'],"next_token":',
+            to_json(next_token),
+            b"}",
+        ]
+    )
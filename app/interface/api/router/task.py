@@ -1,15 +1,24 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import Response
 from loguru import logger
 
-from ....application.todo import TodoService
+from ....application.async_todo import AsyncTodoService
 from ....domain.task import TaskDescription, TaskId, TaskStatus, TaskTitle
 from ....domain.task_list import (
     TaskListId,
 )
-from ..dependencies import get_todo_service
+from ....domain.user import UserId
+from ..dependencies import (
+    get_current_user_id,
+    get_renderer,
+    get_todo_service,
+)
+from ..rendering import FragmentRenderer
+from ..responses import RenderedJSONResponse
 from ..schema import task as schema
+from ..streaming import NDJSON_RESPONSE, accepts_ndjson, ndjson_response
 
 router = APIRouter(tags=["task"])
 
@@ -21,19 +30,24 @@ async def create_task(
         Depends(schema.CreateTaskParameters),
     ],
     task_usecase: Annotated[
-        TodoService,
+        AsyncTodoService,
         Depends(get_todo_service),
     ],
+    user_id: Annotated[
+        UserId,
+        Depends(get_current_user_id),
+    ],
 ) -> schema.TaskResponse:
     try:
         task_list_id = TaskListId(value=params.task_list_id)
         title = TaskTitle(value=params.title)
         description = TaskDescription(value=params.description or "")
 
-        task = task_usecase.create_task(
+        task = await task_usecase.create_task(
             task_list_id=task_list_id,
             title=title,
             description=description,
+            user_id=user_id,
         )
 
         return schema.TaskResponse.from_domain(task)
@@ -43,48 +57,158 @@ async def create_task(
         raise HTTPException(status_code=404, detail=str(e)) from e
 
 
-@router.get("/task_list/{task_list_id}/task")
+@router.post("/task_list/{task_list_id}/task:bulk")
+async def bulk_create_tasks(
+    task_list_id: str,
+    params: schema.BulkCreateTasksParameters,
+    task_usecase: Annotated[
+        AsyncTodoService,
+        Depends(get_todo_service),
+    ],
+    user_id: Annotated[
+        UserId,
+        Depends(get_current_user_id),
+    ],
+) -> schema.BulkCreateTasksResponse:
+    drafts: dict[int, tuple[TaskTitle, TaskDescription]] = {}
+    errors: dict[int, str] = {}
+    for index, draft in enumerate(params.tasks):
+        try:
+            drafts[index] = (
+                TaskTitle(value=draft.title),
+                TaskDescription(value=draft.description or ""),
+            )
+        except ValueError as e:
+            errors[index] = str(e)
+
+    try:
+        tasks = await task_usecase.create_tasks(
+            task_list_id=TaskListId(value=task_list_id),
+            drafts=list(drafts.values()),
+            user_id=user_id,
+        )
+
+        return schema.BulkCreateTasksResponse.from_domain(
+            dict(zip(drafts, tasks, strict=True)),
+            errors,
+        )
+
+    except Exception as e:
+        logger.error(f"Error creating tasks: {e}")
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@router.get(
+    "/task_list/{task_list_id}/task",
+    response_model=schema.TaskPageResponse,
+    responses=NDJSON_RESPONSE,
+)
 async def list_tasks(
     params: Annotated[
         schema.ListTasksParameters,
         Depends(schema.ListTasksParameters),
     ],
     task_usecase: Annotated[
-        TodoService,
+        AsyncTodoService,
         Depends(get_todo_service),
     ],
-) -> list[schema.TaskResponse]:
+    renderer: Annotated[
+        FragmentRenderer,
+        Depends(get_renderer),
+    ],
+    accept: Annotated[str | None, Header()] = None,
+) -> Response:
     try:
         task_list_id = TaskListId(value=params.task_list_id)
 
-        tasks = task_usecase.list_tasks(task_list_id=task_list_id)
+        if accepts_ndjson(accept):
+            tasks = await task_usecase.iter_tasks(
+                task_list_id=task_list_id,
+                sort_by=params.sort_by,
+                order=params.order,
+                status=params.status,
+            )
+            return ndjson_response(tasks, schema.task_to_dict)
+
+        page = await task_usecase.list_tasks(
+            task_list_id=task_list_id,
+            limit=params.limit,
+            next_token=params.next_token,
+            sort_by=params.sort_by,
+            order=params.order,
+            status=params.status,
+        )
 
-        return [schema.TaskResponse.from_domain(task) for task in tasks]
+        return RenderedJSONResponse(renderer.task_page(page))
 
     except Exception as e:
         logger.error(f"Error listing tasks: {e}")
         raise HTTPException(status_code=404, detail=str(e)) from e
 
 
-@router.get("/task_list/{task_list_id}/task/{task_id}")
+@router.get("/task", response_model=schema.TaskPageResponse)
+async def list_user_tasks(
+    params: Annotated[
+        schema.ListUserTasksParameters,
+        Depends(schema.ListUserTasksParameters),
+    ],
+    task_usecase: Annotated[
+        AsyncTodoService,
+        Depends(get_todo_service),
+    ],
+    user_id: Annotated[
+        UserId,
+        Depends(get_current_user_id),
+    ],
+    renderer: Annotated[
+        FragmentRenderer,
+        Depends(get_renderer),
+    ],
+) -> Response:
+    try:
+        page = await task_usecase.list_user_tasks(
+            user_id=user_id,
+            limit=params.limit,
+            next_token=params.next_token,
+            order=params.order,
+            status=params.status,
+        )
+
+        return RenderedJSONResponse(renderer.task_page(page))
+
+    except Exception as e:
+        logger.error(f"Error listing user tasks: {e}")
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@router.get(
+    "/task_list/{task_list_id}/task/{task_id}",
+    response_model=schema.TaskResponse,
+)
 async def get_task(
     params: Annotated[
         schema.GetTaskParameters,
         Depends(schema.GetTaskParameters),
     ],
     task_usecase: Annotated[
-        TodoService,
+        AsyncTodoService,
         Depends(get_todo_service),
     ],
-) -> schema.TaskResponse:
+    renderer: Annotated[
+        FragmentRenderer,
+        Depends(get_renderer),
+    ],
+) -> Response:
     try:
+        task_list_id = TaskListId(value=params.task_list_id)
         task_id = TaskId(value=params.task_id)
 
-        task = task_usecase.get_task(
+        task = await task_usecase.get_task(
             task_id=task_id,
+            task_list_id=task_list_id,
         )
 
-        return schema.TaskResponse.from_domain(task)
+        return RenderedJSONResponse(renderer.task(task))
 
     except Exception as e:
         logger.error(f"Error getting task: {e}")
@@ -98,11 +222,16 @@ async def update_task(
         Depends(schema.UpdateTaskParameters),
     ],
     task_usecase: Annotated[
-        TodoService,
+        AsyncTodoService,
         Depends(get_todo_service),
     ],
+    user_id: Annotated[
+        UserId,
+        Depends(get_current_user_id),
+    ],
 ) -> schema.TaskResponse:
     try:
+        task_list_id = TaskListId(value=params.task_list_id)
         task_id = TaskId(value=params.task_id)
 
         if (
@@ -116,26 +245,26 @@ async def update_task(
                 detail=detail,
             )
 
+        title = None
         if params.title is not None:
             title = TaskTitle(value=params.title)
-            task = task_usecase.update_task_title(
-                task_id=task_id,
-                title=title,
-            )
 
+        description = None
         if params.description is not None:
             description = TaskDescription(value=params.description)
-            task = task_usecase.update_task_description(
-                task_id=task_id,
-                description=description,
-            )
 
+        status = None
         if params.status is not None:
             status = TaskStatus(params.status)
-            task = task_usecase.update_task_status(
-                task_id=task_id,
-                status=status,
-            )
+
+        task = await task_usecase.update_task(
+            task_id=task_id,
+            title=title,
+            description=description,
+            status=status,
+            task_list_id=task_list_id,
+            user_id=user_id,
+        )
 
         logger.debug(f"Task updated successfully: {task=}")
         return schema.TaskResponse.from_domain(task)
@@ -145,6 +274,38 @@ async def update_task(
         raise HTTPException(status_code=404, detail=str(e)) from e
 
 
+@router.post("/task:batchGet", response_model=schema.BatchGetTasksResponse)
+async def batch_get_tasks(
+    params: schema.BatchGetTasksParameters,
+    task_usecase: Annotated[
+        AsyncTodoService,
+        Depends(get_todo_service),
+    ],
+    renderer: Annotated[
+        FragmentRenderer,
+        Depends(get_renderer),
+    ],
+) -> Response:
+    try:
+        keys = [
+            (TaskListId(value=key.task_list_id), TaskId(value=key.task_id))
+            for key in params.keys
+        ]
+
+        tasks = await task_usecase.get_tasks(keys=keys)
+
+        return RenderedJSONResponse(
+            renderer.batch_get_tasks(
+                [task_id for _, task_id in keys],
+                tasks,
+            )
+        )
+
+    except Exception as e:
+        logger.error(f"Error getting tasks: {e}")
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
 @router.delete("/task_list/{task_list_id}/task/{task_id}")
 async def delete_task(
     params: Annotated[
@@ -152,17 +313,22 @@ async def delete_task(
         Depends(schema.DeleteTaskParameters),
     ],
     task_usecase: Annotated[
-        TodoService,
+        AsyncTodoService,
         Depends(get_todo_service),
     ],
+    user_id: Annotated[
+        UserId,
+        Depends(get_current_user_id),
+    ],
 ):
     try:
         task_list_id = TaskListId(value=params.task_list_id)
         task_id = TaskId(value=params.task_id)
 
-        task_usecase.remove_task(
+        await task_usecase.remove_task(
             task_list_id=task_list_id,
             task_id=task_id,
+            user_id=user_id,
         )
 
     except Exception as e:
@@ -1,16 +1,24 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import Response
 from loguru import logger
 
-from ....application.todo import TodoService
+from ....application.async_todo import AsyncTodoService
 from ....domain.task_list import (
     TaskListId,
     TaskListName,
 )
 from ....domain.user import UserId
-from ..dependencies import get_todo_service
+from ..dependencies import (
+    get_current_user_id,
+    get_renderer,
+    get_todo_service,
+)
+from ..rendering import FragmentRenderer
+from ..responses import RenderedJSONResponse
 from ..schema import task_list as schema
+from ..streaming import NDJSON_RESPONSE, accepts_ndjson, ndjson_response
 
 router = APIRouter(tags=["task_list"])
 
@@ -22,57 +30,104 @@ async def create_task_list(
         Depends(schema.CreateTaskListParameters),
     ],
     task_usecase: Annotated[
-        TodoService,
+        AsyncTodoService,
         Depends(get_todo_service),
     ],
+    user_id: Annotated[
+        UserId,
+        Depends(get_current_user_id),
+    ],
 ) -> schema.TaskListResponse:
     try:
         name = TaskListName(value=params.name)
-        user_id = UserId("000001")
-        task_list = task_usecase.create_task_list(user_id, name)
+        task_list = await task_usecase.create_task_list(user_id, name)
         return schema.TaskListResponse.from_domain(task_list)
     except Exception as e:
         logger.error(f"Error creating task list: {e}")
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
-@router.get("/task_list")
+@router.get(
+    "/task_list",
+    response_model=schema.TaskListPageResponse,
+    responses=NDJSON_RESPONSE,
+)
 async def list_all_task_lists(
+    params: Annotated[
+        schema.ListTaskListsParameters,
+        Depends(schema.ListTaskListsParameters),
+    ],
     task_usecase: Annotated[
-        TodoService,
+        AsyncTodoService,
         Depends(get_todo_service),
     ],
-) -> list[schema.TaskListResponse]:
+    user_id: Annotated[
+        UserId,
+        Depends(get_current_user_id),
+    ],
+    renderer: Annotated[
+        FragmentRenderer,
+        Depends(get_renderer),
+    ],
+    accept: Annotated[str | None, Header()] = None,
+) -> Response:
     try:
-        task_lists = task_usecase.list_all_task_lists(user_id=UserId("000001"))
-        return [
-            schema.TaskListResponse.from_domain(task_list)
-            for task_list in task_lists
-        ]
+        if accepts_ndjson(accept):
+            task_lists = await task_usecase.iter_task_lists(user_id=user_id)
+            return ndjson_response(task_lists, schema.task_list_to_dict)
+
+        page = await task_usecase.list_all_task_lists(
+            user_id=user_id,
+            limit=params.limit,
+            next_token=params.next_token,
+        )
+        return RenderedJSONResponse(renderer.task_list_page(page))
 
     except Exception as e:
         logger.error(f"Error listing task lists: {e}")
         raise HTTPException(status_code=404, detail=str(e)) from e
 
 
-@router.get("/task_list/{task_list_id}")
+@router.get(
+    "/task_list/{task_list_id}",
+    response_model=schema.TaskListWithTasksResponse | schema.TaskListResponse,
+)
 async def get_task_list(
     params: Annotated[
         schema.GetTaskListParameters,
         Depends(schema.GetTaskListParameters),
     ],
     task_usecase: Annotated[
-        TodoService,
+        AsyncTodoService,
         Depends(get_todo_service),
     ],
-) -> schema.TaskListResponse:
+    user_id: Annotated[
+        UserId,
+        Depends(get_current_user_id),
+    ],
+    renderer: Annotated[
+        FragmentRenderer,
+        Depends(get_renderer),
+    ],
+) -> Response:
     try:
         task_list_id = TaskListId(value=params.task_list_id)
 
-        task_list = task_usecase.get_task_list(
+        if params.include == "tasks":
+            task_list, tasks = await task_usecase.get_task_list_with_tasks(
+                task_list_id=task_list_id,
+                user_id=user_id,
+                limit=params.limit,
+            )
+            return RenderedJSONResponse(
+                renderer.task_list_with_tasks(task_list, tasks)
+            )
+
+        task_list = await task_usecase.get_task_list(
             task_list_id=task_list_id,
+            user_id=user_id,
         )
-        return schema.TaskListResponse.from_domain(task_list)
+        return RenderedJSONResponse(renderer.task_list(task_list))
 
     except Exception as e:
         logger.error(f"Error getting task list: {e}")
@@ -86,17 +141,22 @@ async def update_task_list(
         Depends(schema.UpdateTaskListParameters),
     ],
     task_usecase: Annotated[
-        TodoService,
+        AsyncTodoService,
         Depends(get_todo_service),
     ],
+    user_id: Annotated[
+        UserId,
+        Depends(get_current_user_id),
+    ],
 ) -> schema.TaskListResponse:
     try:
         name = TaskListName(value=params.name)
         task_list_id = TaskListId(params.task_list_id)
 
-        task_list = task_usecase.update_task_list_name(
+        task_list = await task_usecase.update_task_list_name(
             task_list_id=task_list_id,
             new_name=name,
+            user_id=user_id,
         )
 
         return schema.TaskListResponse.from_domain(task_list)
@@ -113,13 +173,20 @@ async def delete_task_list(
         Depends(schema.DeleteTaskListParameters),
     ],
     task_usecase: Annotated[
-        TodoService,
+        AsyncTodoService,
         Depends(get_todo_service),
     ],
+    user_id: Annotated[
+        UserId,
+        Depends(get_current_user_id),
+    ],
 ):
     try:
         task_list_id = TaskListId(params.task_list_id)
-        task_usecase.delete_task_list(task_list_id=task_list_id)
+        await task_usecase.delete_task_list(
+            task_list_id=task_list_id,
+            user_id=user_id,
+        )
 
     except Exception as e:
         logger.error(f"Error deleting task list: {e}")
@@ -1,12 +1,50 @@
-from typing import Literal, Self
+from typing import Any, Literal, Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from ....domain.task import Task
+from ....domain.page import Page
+from ....domain.task import Task, TaskId, TaskStatus
+from ....domain.task_list import TaskCount, TaskSortBy, TaskSortOrder
+
+
+def task_to_dict(task: Task) -> dict[str, str]:
+    """``TaskResponse`` of a task as plain data."""
+    return {
+        "id": task.id.value,
+        "task_list_id": task.task_list_id.value,
+        "title": task.title.value,
+        "description": task.description.value,
+        "status": task.status.value,
+        "created_at": task.created_at.isoformat(),
+    }
+
+
+def task_page_to_dict(page: Page[Task]) -> dict[str, Any]:
+    """``TaskPageResponse`` of a page of tasks as plain data."""
+    return {
+        "items": [task_to_dict(task) for task in page.items],
+        "next_token": page.next_token,
+    }
+
+
+def batch_get_tasks_to_dict(
+    task_ids: list[TaskId],
+    tasks: list[Task | None],
+) -> dict[str, Any]:
+    """``BatchGetTasksResponse`` of the tasks found by ID as plain data."""
+    return {
+        "items": [task_to_dict(task) for task in tasks if task],
+        "missing_ids": [
+            str(task_id)
+            for task_id, task in zip(task_ids, tasks, strict=True)
+            if task is None
+        ],
+    }
 
 
 class TaskResponse(BaseModel):
     id: str
+    task_list_id: str
     title: str
     description: str
     status: str
@@ -14,12 +52,61 @@ class TaskResponse(BaseModel):
 
     @classmethod
     def from_domain(cls, task: Task) -> Self:
+        return cls(**task_to_dict(task))
+
+
+class TaskPageResponse(BaseModel):
+    items: list[TaskResponse]
+    next_token: str | None = None
+
+    @classmethod
+    def from_domain(cls, page: Page[Task]) -> Self:
+        return cls.model_validate(task_page_to_dict(page))
+
+
+class BatchGetTasksResponse(BaseModel):
+    items: list[TaskResponse]
+    missing_ids: list[str]
+
+    @classmethod
+    def from_domain(
+        cls,
+        task_ids: list[TaskId],
+        tasks: list[Task | None],
+    ) -> Self:
+        return cls.model_validate(batch_get_tasks_to_dict(task_ids, tasks))
+
+
+class BulkCreateTaskResult(BaseModel):
+    index: int
+    task: TaskResponse | None = None
+    error: str | None = None
+
+
+class BulkCreateTasksResponse(BaseModel):
+    results: list[BulkCreateTaskResult]
+
+    @classmethod
+    def from_domain(
+        cls,
+        tasks: dict[int, Task],
+        errors: dict[int, str],
+    ) -> Self:
         return cls(
-            id=str(task.id),
-            title=str(task.title),
-            description=str(task.description),
-            status=task.status.value,
-            created_at=task.created_at.isoformat(),
+            results=sorted(
+                [
+                    BulkCreateTaskResult(
+                        index=index,
+                        task=TaskResponse.from_domain(task),
+                    )
+                    for index, task in tasks.items()
+                ]
+                + [
+                    BulkCreateTaskResult(index=index, error=error)
+                    for index, error in errors.items()
+                ],
+                key=lambda result: result.index,
+            )
         )
 
 
@@ -28,12 +115,33 @@ class GetTaskParameters(BaseModel):
     task_id: str
 
 
+class TaskKeyParameters(BaseModel):
+    task_list_id: str
+    task_id: str
+
+
+class BatchGetTasksParameters(BaseModel):
+    keys: list[TaskKeyParameters] = Field(min_length=1, max_length=500)
+
+
 class CreateTaskParameters(BaseModel):
     task_list_id: str
     title: str
     description: str | None = None
 
 
+class TaskDraftParameters(BaseModel):
+    title: str
+    description: str | None = None
+
+
+class BulkCreateTasksParameters(BaseModel):
+    tasks: list[TaskDraftParameters] = Field(
+        min_length=1,
+        max_length=TaskCount.MAX_TASK_COUNT,
+    )
+
+
 class DeleteTaskParameters(BaseModel):
     task_list_id: str
     task_id: str
@@ -49,3 +157,15 @@ class UpdateTaskParameters(BaseModel):
 
 class ListTasksParameters(BaseModel):
     task_list_id: str
+    limit: int = Field(default=50, ge=1, le=100)
+    next_token: str | None = None
+    sort_by: TaskSortBy = TaskSortBy.default()
+    order: TaskSortOrder = TaskSortOrder.default()
+    status: TaskStatus | None = None
+
+
+class ListUserTasksParameters(BaseModel):
+    limit: int = Field(default=50, ge=1, le=100)
+    next_token: str | None = None
+    order: TaskSortOrder = TaskSortOrder.default()
+    status: TaskStatus | None = None
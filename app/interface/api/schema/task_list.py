@@ -1,8 +1,39 @@
-from typing import Self
+from typing import Any, Literal, Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from ....domain.page import Page
+from ....domain.task import Task
 from ....domain.task_list import TaskList
+from .task import TaskPageResponse, task_page_to_dict
+
+
+def task_list_to_dict(task_list: TaskList) -> dict[str, Any]:
+    """``TaskListResponse`` of a task list as plain data."""
+    return {
+        "id": task_list.id.value,
+        "user_id": task_list.user_id.value,
+        "name": task_list.name.value,
+        "count": task_list.count.value,
+        "todo_count": task_list.todo_count.value,
+        "done_count": task_list.done_count.value,
+    }
+
+
+def task_list_with_tasks_to_dict(
+    task_list: TaskList,
+    tasks: Page[Task],
+) -> dict[str, Any]:
+    """``TaskListWithTasksResponse`` of a task list as plain data."""
+    return task_list_to_dict(task_list) | {"tasks": task_page_to_dict(tasks)}
+
+
+def task_list_page_to_dict(page: Page[TaskList]) -> dict[str, Any]:
+    """``TaskListPageResponse`` of a page of task lists as plain data."""
+    return {
+        "items": [task_list_to_dict(task_list) for task_list in page.items],
+        "next_token": page.next_token,
+    }
 
 
 class TaskListResponse(BaseModel):
@@ -10,19 +41,46 @@ class TaskListResponse(BaseModel):
     user_id: str
     name: str
     count: int
+    todo_count: int
+    done_count: int
 
     @classmethod
     def from_domain(cls, task_list: TaskList) -> Self:
-        return cls(
-            id=str(task_list.id),
-            user_id=str(task_list.user_id),
-            name=str(task_list.name),
-            count=int(task_list.count),
+        return cls(**task_list_to_dict(task_list))
+
+
+class TaskListWithTasksResponse(TaskListResponse):
+    tasks: TaskPageResponse
+
+    @classmethod
+    def from_domain_with_tasks(
+        cls,
+        task_list: TaskList,
+        tasks: Page[Task],
+    ) -> Self:
+        return cls.model_validate(
+            task_list_with_tasks_to_dict(task_list, tasks)
         )
 
 
+class TaskListPageResponse(BaseModel):
+    items: list[TaskListResponse]
+    next_token: str | None = None
+
+    @classmethod
+    def from_domain(cls, page: Page[TaskList]) -> Self:
+        return cls.model_validate(task_list_page_to_dict(page))
+
+
+class ListTaskListsParameters(BaseModel):
+    limit: int = Field(default=50, ge=1, le=100)
+    next_token: str | None = None
+
+
 class GetTaskListParameters(BaseModel):
     task_list_id: str
+    include: Literal["tasks"] | None = None
+    limit: int = Field(default=50, ge=1, le=100)
 
 
 class CreateTaskListParameters(BaseModel):
@@ -0,0 +1,65 @@
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+NDJSON_RESPONSE = {
+    200: {
+        "content": {NDJSON_MEDIA_TYPE: {}},
+        "description": "Successful Response. One JSON object per line "
+        f"when `Accept: {NDJSON_MEDIA_TYPE}` is requested.",
+    }
+}
+
+
+def accepts_ndjson(accept: str | None) -> bool:
+    """Whether the ``Accept`` header asks for newline-delimited JSON."""
+    if not accept:
+        return False
+
+    return any(
+        media_range.split(";", 1)[0].strip() == NDJSON_MEDIA_TYPE
+        for media_range in accept.split(",")
+    )
+
+
+def ndjson_response[T](
+    items: Iterable[T] | AsyncIterable[T],
+    to_response: Callable[[T], Any],
+) -> StreamingResponse:
+    """Stream ``items`` as NDJSON, rendering one line per item as it comes.
+
+    ``to_response`` maps an item to the data of its line, like the plain
+    ``*_to_dict`` renderers of the schemas.
+
+    The iterable is consumed lazily by the server, so only the page being
+    read from the repository is held in memory. Asynchronous iterables
+    are read on the event loop, synchronous ones in a worker thread.
+
+    This holds under an ASGI server such as uvicorn. Behind
+    ``app.main.handler`` Mangum collects the whole body before returning
+    it to Lambda, so the response is not streamed there and is subject
+    to the payload limit of buffered Lambda responses.
+    """
+    if isinstance(items, AsyncIterable):
+
+        async def async_lines() -> AsyncIterator[bytes]:
+            async for item in items:
+                yield to_json(to_response(item)) + b"\n"
+
+        return StreamingResponse(async_lines(), media_type=NDJSON_MEDIA_TYPE)
+
+    def lines() -> Iterator[bytes]:
+        for item in items:
+            yield to_json(to_response(item)) + b"\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,29 @@
+"""Index the tasks created before the user task indexes under their users.
+
+Run once after adding the ``GSI2`` and ``GSI3`` indexes to an existing
+table, then enable ``DYNAMODB_USER_TASK_INDEX``. Until then the tasks of a
+user are merged from each of their task lists.
+
+Usage: python -m app.interface.job.backfill_user_tasks
+Lambda handler: app.interface.job.backfill_user_tasks.handler
+"""
+
+from ...infrastructure.db.backfill import backfill_user_tasks
+from ...infrastructure.db.dynamodb import DynamoDBResources, DynamoDBSettings
+
+
+def run() -> dict[str, int]:
+    resources = DynamoDBResources.create(DynamoDBSettings.from_env())
+    return {"indexed": backfill_user_tasks(resources.table)}
+
+
+def handler(event, context) -> dict[str, int]:
+    return run()
+
+
+def main() -> None:
+    run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Move task list items from their owner's partition next to their tasks.
+
+Run after deploying the layout that keys task lists by their ID, then
+enable ``DYNAMODB_TASK_LISTS_MIGRATED``. Until then a task list still at
+its legacy key is moved the first time it is looked for.
+
+The Lambda handler stops before its timeout and returns the ``start_key``
+to resume from; invoke it again with that key until it is null.
+
+Usage: python -m app.interface.job.migrate_task_lists
+Lambda handler: app.interface.job.migrate_task_lists.handler
+"""
+
+from collections.abc import Callable
+from dataclasses import asdict
+from typing import Any
+
+from loguru import logger
+
+from ...infrastructure.db.dynamodb import DynamoDBResources, DynamoDBSettings
+from ...infrastructure.db.migration import migrate_task_lists
+
+STOP_BEFORE_TIMEOUT_MS = 30_000
+"""Time left to the Lambda invocation below which no page is started."""
+
+
+def run(
+    start_key: dict[str, Any] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> dict[str, Any]:
+    resources = DynamoDBResources.create(DynamoDBSettings.from_env())
+    result = migrate_task_lists(resources.table, start_key, should_stop)
+
+    if result.start_key is None:
+        logger.info(
+            "All task lists moved; DYNAMODB_TASK_LISTS_MIGRATED can be set"
+        )
+
+    return asdict(result)
+
+
+def handler(event, context) -> dict[str, Any]:
+    return run(
+        (event or {}).get("start_key"),
+        lambda: context.get_remaining_time_in_millis() < STOP_BEFORE_TIMEOUT_MS,
+    )
+
+
+def main() -> None:
+    run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Recount the tasks of every task list and repair drifted counters.
+
+Run once after deploying the per-status counters, and on a schedule to
+repair any later drift. Task lists still at their legacy key are only
+reported, so run ``migrate_task_lists`` first.
+
+Usage: python -m app.interface.job.reconcile_counts
+Lambda handler: app.interface.job.reconcile_counts.handler
+"""
+
+from dataclasses import asdict
+
+from loguru import logger
+
+from ...infrastructure.cache.shared import SharedCacheSettings
+from ...infrastructure.db.dynamodb import DynamoDBResources, DynamoDBSettings
+from ...infrastructure.db.reconcile import reconcile_task_lists
+
+
+def run() -> dict[str, int]:
+    resources = DynamoDBResources.create(DynamoDBSettings.from_env())
+    collections = SharedCacheSettings.from_env().create_collections()
+    result = asdict(reconcile_task_lists(resources.table, collections))
+    logger.info(f"Reconciled task counts: {result}")
+    return result
+
+
+def handler(event, context) -> dict[str, int]:
+    return run()
+
+
+def main() -> None:
+    run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,64 @@
-from fastapi import FastAPI
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from loguru import logger
 from mangum import Mangum
 
-from .infrastructure.db.dynamodb_task_list_repository import (
-    get_dynamodb_task_list_repository,
-)
-from .infrastructure.db.dynamodb_task_repository import (
-    get_dynamodb_task_repository,
-)
-from .interface.api.dependencies import (
-    get_task_list_repository,
-    get_task_repository,
-)
+from .application.async_todo import AsyncTodoService
+from .container import Container, ExecutionMode, get_container
+from .interface.api.dependencies import get_renderer, get_todo_service
+from .interface.api.rendering import FragmentRenderer
 from .interface.api.router import router
 
 
-def create_app() -> FastAPI:
-    app = FastAPI()
-    app.dependency_overrides[get_task_list_repository] = (
-        get_dynamodb_task_list_repository
-    )
-    app.dependency_overrides[get_task_repository] = get_dynamodb_task_repository
+def create_app(
+    container: Container | None = None,
+    mode: ExecutionMode | None = None,
+) -> FastAPI:
+    """Create the application.
+
+    ``mode`` selects the backend the routes await and defaults to the
+    ``APP_EXECUTION_MODE`` environment variable.
+    """
+    mode = mode or ExecutionMode.from_env()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # The container is shared by the whole process. Mangum runs the
+        # lifespan on every invocation, so it is not closed on shutdown.
+        app.state.container = container or get_container()
+        app.state.todo_service = app.state.container.todo_service_for(mode)
+        app.state.renderer = FragmentRenderer(
+            app.state.container.caches.get("rendered")
+        )
+        yield
+
+        logger.info(f"Cache stats: {app.state.container.cache_stats()}")
+        if mode is ExecutionMode.THREADPOOL:
+            metrics = app.state.container.executor.metrics()
+            logger.info(f"Executor metrics: {metrics}")
+
+    def get_shared_todo_service(request: Request) -> AsyncTodoService:
+        return request.app.state.todo_service
+
+    def get_shared_renderer(request: Request) -> FragmentRenderer:
+        return request.app.state.renderer
+
+    app = FastAPI(lifespan=lifespan)
+    app.dependency_overrides[get_todo_service] = get_shared_todo_service
+    app.dependency_overrides[get_renderer] = get_shared_renderer
 
     app.include_router(router)
     return app
 
 
+if "AWS_LAMBDA_FUNCTION_NAME" in os.environ:
+    # Build the shared clients during the Lambda init phase.
+    get_container()
+
 app = create_app()
+# Mangum buffers every response body, NDJSON streams included. Streaming
+# them from Lambda would need a response streaming adapter in front of an
+# ASGI server instead of this handler.
 handler = Mangum(app)
@@ -0,0 +1,61 @@
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from loguru import logger
+
+from app.infrastructure.db.dynamodb import (
+    LOCAL_ENDPOINT_URL,
+    DynamoDBResources,
+    DynamoDBSettings,
+)
+from app.infrastructure.db.schema import create_table
+
+BENCH_TABLE_NAME = "todo-bench-table"
+
+logger.disable("app")
+
+
+@dataclass(frozen=True)
+class Timing:
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+
+    def __str__(self) -> str:
+        return (
+            f"mean={self.mean_ms:8.3f}ms "
+            f"p50={self.p50_ms:8.3f}ms "
+            f"p99={self.p99_ms:8.3f}ms"
+        )
+
+
+def measure(fn: Callable[[], object], repeat: int) -> Timing:
+    """Call ``fn`` ``repeat`` times and summarize the wall-clock latency."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return Timing(
+        mean_ms=statistics.fmean(samples),
+        p50_ms=samples[len(samples) // 2],
+        p99_ms=samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+    )
+
+
+def local_resources() -> DynamoDBResources:
+    """Shared resources for the benchmark table on DynamoDB Local.
+
+    Start DynamoDB Local with ``docker compose up dynamodb-local`` first.
+    """
+    settings = DynamoDBSettings(
+        table_name=BENCH_TABLE_NAME,
+        endpoint_url=LOCAL_ENDPOINT_URL,
+    )
+    resources = DynamoDBResources.create(settings)
+    create_table(resources.client, settings.table_name)
+    return resources
@@ -0,0 +1,118 @@
+"""Requests per second of one uvicorn worker for each execution mode.
+
+Each mode serves ``GET /task_list/{id}/task/{id}`` (one GetItem) from an
+in-process uvicorn server while 1 and then N clients request it in a loop.
+The synchronous mode serializes concurrent requests on the event loop, so
+its throughput should stay flat as clients are added. The pool metrics of
+the threadpool mode are printed after its runs.
+
+Usage: python -m benchmarks.bench_async [--clients 1 16] [--requests 400]
+"""
+
+import argparse
+import asyncio
+import socket
+import threading
+import time
+
+import httpx
+import uvicorn
+
+from app.container import Container, ExecutionMode
+from app.domain.task import Task, TaskDescription, TaskTitle
+from app.domain.task_list import TaskList, TaskListName
+from app.domain.user import UserId
+from app.main import create_app
+
+from ._common import local_resources
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Server:
+    """uvicorn running the application in a background thread."""
+
+    def __init__(self, container: Container, mode: ExecutionMode):
+        self.port = free_port()
+        self._server = uvicorn.Server(
+            uvicorn.Config(
+                create_app(container, mode),
+                port=self.port,
+                log_level="warning",
+            )
+        )
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    def __enter__(self) -> str:
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return f"http://127.0.0.1:{self.port}"
+
+    def __exit__(self, *exc) -> None:
+        self._server.should_exit = True
+        self._thread.join()
+
+
+async def requests_per_second(
+    url: str,
+    clients: int,
+    requests: int,
+) -> float:
+    """Send ``requests`` GETs from ``clients`` concurrent loops."""
+    remaining = requests
+
+    async def client(http: httpx.AsyncClient) -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            response = await http.get(url)
+            response.raise_for_status()
+
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(limits=limits) as http:
+        await http.get(url)  # warm up
+        start = time.perf_counter()
+        await asyncio.gather(*(client(http) for _ in range(clients)))
+        return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 16])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        type=ExecutionMode,
+        default=list(ExecutionMode),
+    )
+    args = parser.parse_args()
+
+    resources = local_resources()
+    container = Container.create(resources.settings)
+
+    task_list = TaskList.create(TaskListName("benchmark"), UserId("000001"))
+    container.task_list_repository.store(task_list)
+    task = Task.create(TaskTitle("Task"), TaskDescription(""), task_list.id)
+    container.task_repository.add_task_to_list(task_list.user_id, task)
+    path = f"/api/v1/task_list/{task_list.id}/task/{task.id}"
+
+    for mode in args.modes:
+        with Server(container, mode) as base_url:
+            for clients in args.clients:
+                rps = asyncio.run(
+                    requests_per_second(base_url + path, clients, args.requests)
+                )
+                print(f"{mode:>10} clients={clients:<3} {rps:8.1f} req/s")
+
+        if mode is ExecutionMode.THREADPOOL and container.executor:
+            print(f"{'':>10} {container.executor.metrics()}")
+
+
+if __name__ == "__main__":
+    main()
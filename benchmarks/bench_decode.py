@@ -0,0 +1,95 @@
+"""Compare plain values and the typed wire format on query reads.
+
+Runs offline. The plain path deserializes every attribute of a typed
+item into Python values, as a ``ClientTable`` or the boto3 resource layer
+does for each item of a ``Query``, before ``task_from_item`` maps it to a
+task. The wire
+path maps the typed item with ``task_from_wire`` directly. Building the
+key condition is compared too: a boto3 condition compiled per query
+against a ``KeyCondition`` template bound per query.
+
+Usage: python -m benchmarks.bench_decode [--tasks 1000] [--repeat 200]
+"""
+
+import argparse
+
+from boto3.dynamodb.conditions import ConditionExpressionBuilder, Key
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from app.domain.task import Task, TaskDescription, TaskTitle
+from app.domain.task_list import TaskListId
+from app.domain.user import UserId
+from app.infrastructure.db.items import (
+    task_from_item,
+    task_from_wire,
+    task_to_item,
+)
+from app.infrastructure.db.operations import TASKS_AFTER_TASK_LIST
+
+from ._common import measure
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    serializer = TypeSerializer()
+    deserializer = TypeDeserializer()
+    task_list_id = TaskListId.generate()
+    items = [
+        {
+            name: serializer.serialize(value)
+            for name, value in task_to_item(
+                Task.create(
+                    TaskTitle(f"Task {i}"),
+                    TaskDescription("benchmark" if i % 4 == 0 else ""),
+                    task_list_id,
+                ),
+                UserId("000001"),
+            ).items()
+        }
+        for i in range(args.tasks)
+    ]
+
+    def plain_decode() -> None:
+        for item in items:
+            task_from_item(
+                {
+                    name: deserializer.deserialize(value)
+                    for name, value in item.items()
+                }
+            )
+
+    def wire_decode() -> None:
+        for item in items:
+            task_from_wire(item)
+
+    def plain_condition() -> None:
+        ConditionExpressionBuilder().build_expression(
+            Key("PK").eq(f"TASK_LIST#{task_list_id}")
+            & Key("created_at").gt("#METADATA"),
+            is_key_condition=True,
+        )
+
+    def wire_condition() -> None:
+        TASKS_AFTER_TASK_LIST.bind(f"TASK_LIST#{task_list_id}", "#METADATA")
+
+    print(f"decode {args.tasks} items")
+    print(f"  plain:    {measure(plain_decode, args.repeat)}")
+    print(f"  wire:     {measure(wire_decode, args.repeat)}")
+    print(f"key condition x{args.tasks}")
+    for name, build in [
+        ("plain", plain_condition),
+        ("wire", wire_condition),
+    ]:
+        timing = measure(
+            lambda build=build: [build() for _ in range(args.tasks)],
+            args.repeat,
+        )
+        print(f"  {name + ':':<9} {timing}")
+
+
+if __name__ == "__main__":
+    main()
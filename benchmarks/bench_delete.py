@@ -0,0 +1,86 @@
+"""Time the cascade delete of a full task list.
+
+Compares deleting the task items one ``DeleteItem`` at a time with the
+concurrent ``BatchWriteItem`` cascade of ``DynamoDBTaskListRepository``.
+
+Usage: python -m benchmarks.bench_delete [--tasks 100] [--repeat 5]
+"""
+
+import argparse
+import statistics
+import time
+
+from boto3.dynamodb.conditions import Key
+
+from app.domain.task import Task, TaskDescription, TaskTitle
+from app.domain.task_list import TaskCount, TaskList, TaskListName
+from app.domain.user import UserId
+from app.infrastructure.db.batch import batch_put
+from app.infrastructure.db.dynamodb_task_list_repository import (
+    DynamoDBTaskListRepository,
+)
+from app.infrastructure.db.items import task_list_to_item, task_to_item
+from app.infrastructure.db.keys import task_list_key
+from app.infrastructure.db.pagination import iter_query
+
+from ._common import local_resources
+
+
+def fill_task_list(table, count: int) -> TaskList:
+    task_list = TaskList.create(TaskListName("benchmark"), UserId("000001"))
+    task_list.count = TaskCount(count)
+    tasks = [
+        Task.create(
+            TaskTitle(f"Task {i}"),
+            TaskDescription("benchmark"),
+            task_list.id,
+        )
+        for i in range(count)
+    ]
+    batch_put(
+        table,
+        table.name,
+        [task_list_to_item(task_list), *map(task_to_item, tasks)],
+    )
+    return task_list
+
+
+def delete_sequentially(table, task_list: TaskList) -> None:
+    table.delete_item(Key=task_list_key(task_list.id))
+    for key in iter_query(
+        table,
+        KeyConditionExpression=Key("PK").eq(f"TASK_LIST#{task_list.id}"),
+        ProjectionExpression="PK, SK",
+    ):
+        table.delete_item(Key=key)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=TaskCount.MAX_TASK_COUNT)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    resources = local_resources()
+    task_lists = DynamoDBTaskListRepository(
+        resources.table, resources.wire_table
+    )
+
+    def timed(delete) -> float:
+        samples = []
+        for _ in range(args.repeat):
+            task_list = fill_task_list(resources.table, args.tasks)
+            start = time.perf_counter()
+            delete(task_list)
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples)
+
+    sequential = timed(lambda tl: delete_sequentially(resources.table, tl))
+    cascade = timed(lambda tl: task_lists.delete(tl.id, user_id=tl.user_id))
+
+    print(f"DeleteItem one by one ({args.tasks} tasks): {sequential:8.1f}ms")
+    print(f"BatchWriteItem cascade ({args.tasks} tasks): {cascade:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
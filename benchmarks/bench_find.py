@@ -0,0 +1,75 @@
+"""Compare GetItem point lookups with GSI1 queries for a single task.
+
+Usage: python -m benchmarks.bench_find [--tasks 100] [--repeat 500]
+"""
+
+import argparse
+import random
+
+from boto3.dynamodb.conditions import Key
+
+from app.domain.task import Task, TaskDescription, TaskTitle
+from app.domain.task_list import TaskListId
+from app.infrastructure.db.dynamodb_task_repository import (
+    DynamoDBTaskRepository,
+)
+
+from ._common import local_resources, measure
+
+
+def consumed_read_units(table, task: Task) -> tuple[float, float]:
+    """Read capacity of one GetItem and one GSI1 query for ``task``."""
+    get_item = table.get_item(
+        Key={"PK": f"TASK_LIST#{task.task_list_id}", "SK": f"TASK#{task.id}"},
+        ConsistentRead=True,
+        ReturnConsumedCapacity="TOTAL",
+    )
+    query = table.query(
+        IndexName="GSI1",
+        KeyConditionExpression=Key("GSI1PK").eq(f"TASK#{task.id}"),
+        ReturnConsumedCapacity="TOTAL",
+    )
+    return (
+        float(get_item["ConsumedCapacity"]["CapacityUnits"]),
+        float(query["ConsumedCapacity"]["CapacityUnits"]),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    resources = local_resources()
+    repository = DynamoDBTaskRepository(resources.table, resources.wire_table)
+
+    task_list_id = TaskListId.generate()
+    tasks = [
+        Task.create(
+            TaskTitle(f"Task {i}"),
+            TaskDescription("benchmark"),
+            task_list_id,
+        )
+        for i in range(args.tasks)
+    ]
+    for task in tasks:
+        repository.store(task)
+
+    get_item_rcu, query_rcu = consumed_read_units(resources.table, tasks[0])
+
+    def find() -> None:
+        task = random.choice(tasks)
+        repository.find(task.task_list_id, task.id)
+
+    def find_by_id() -> None:
+        repository.find_by_id(random.choice(tasks).id)
+
+    print(f"GetItem (consistent): {measure(find, args.repeat)}", end="")
+    print(f" RCU={get_item_rcu}")
+    print(f"Query GSI1 (eventual): {measure(find_by_id, args.repeat)}", end="")
+    print(f" RCU={query_rcu}")
+
+
+if __name__ == "__main__":
+    main()
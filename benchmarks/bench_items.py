@@ -0,0 +1,90 @@
+"""Compare the size and decode time of legacy and compact task items.
+
+Runs offline. Sizes follow the DynamoDB item size rules: the UTF-8
+length of each attribute name and string value, and about one byte per
+two significant digits of a number, plus one.
+
+Usage: python -m benchmarks.bench_items [--tasks 1000] [--repeat 200]
+"""
+
+import argparse
+from decimal import Decimal
+from typing import Any
+
+from app.domain.task import Task, TaskDescription, TaskTitle
+from app.domain.task_list import TaskListId
+from app.domain.user import UserId
+from app.infrastructure.db.items import task_from_item, task_to_item
+
+from ._common import measure
+
+
+def legacy_task_item(task: Task, user_id: UserId) -> dict[str, Any]:
+    """Version 1 item of ``task``, as written before the compact format."""
+    created_at = task.created_at.isoformat()
+    return {
+        "PK": f"TASK_LIST#{task.task_list_id}",
+        "SK": f"TASK#{task.id}",
+        "GSI1PK": f"TASK#{task.id}",
+        "GSI1SK": f"TASK#{task.id}",
+        "GSI2PK": f"USER#{user_id}",
+        "task_list_id": str(task.task_list_id),
+        "task_id": str(task.id),
+        "title": str(task.title),
+        "description": str(task.description),
+        "status": str(task.status),
+        "created_at": created_at,
+        "status_created_at": f"{task.status}#{created_at}",
+    }
+
+
+def item_size(item: dict[str, Any]) -> int:
+    """Approximate billed size of ``item`` in bytes."""
+    size = 0
+    for name, value in item.items():
+        size += len(name.encode())
+        if isinstance(value, str):
+            size += len(value.encode())
+        else:
+            digits = len(str(abs(Decimal(value))).replace(".", "").strip("0"))
+            size += (max(digits, 1) + 1) // 2 + 1
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    user_id = UserId("000001")
+    task_list_id = TaskListId.generate()
+    tasks = [
+        Task.create(
+            TaskTitle(f"Task {i}"),
+            # Most tasks are created without a description.
+            TaskDescription("benchmark" if i % 4 == 0 else ""),
+            task_list_id,
+        )
+        for i in range(args.tasks)
+    ]
+    formats = {
+        "legacy (v1)": [legacy_task_item(task, user_id) for task in tasks],
+        "compact (v2)": [task_to_item(task, user_id) for task in tasks],
+    }
+
+    for name, items in formats.items():
+        size = sum(map(item_size, items)) / len(items)
+        timing = measure(
+            lambda items=items: list(map(task_from_item, items)), args.repeat
+        )
+        print(
+            f"{name:>13}: {size:6.1f} bytes/item "
+            # Eventually consistent queries read 8 KB per read unit.
+            f"{8192 / size:5.1f} items/RCU "
+            f"decode {args.tasks} items {timing}"
+        )
+
+
+if __name__ == "__main__":
+    main()
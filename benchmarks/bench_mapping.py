@@ -0,0 +1,78 @@
+"""Compare validated and trusted construction of tasks read from storage.
+
+Runs offline. Both paths map the same typed items of the wire format: the
+validated path builds every value object through its constructor, as the
+routers do for user input, and the trusted path uses ``Task.from_trusted``
+through ``task_from_wire``, as the repositories do.
+
+Usage: python -m benchmarks.bench_mapping [--tasks 1000] [--repeat 200]
+"""
+
+import argparse
+from datetime import datetime
+
+from boto3.dynamodb.types import TypeSerializer
+
+from app.domain.task import (
+    Task,
+    TaskDescription,
+    TaskId,
+    TaskStatus,
+    TaskTitle,
+)
+from app.domain.task_list import TaskListId
+from app.domain.user import UserId
+from app.infrastructure.db.items import task_from_wire, task_to_item
+
+from ._common import measure
+
+
+def validated_task_from_wire(item: dict[str, dict[str, str]]) -> Task:
+    """``task_from_wire`` building the task through validating constructors."""
+    description = item.get("description")
+    return Task(
+        id=TaskId(item["SK"]["S"].removeprefix("TASK#")),
+        task_list_id=TaskListId(item["PK"]["S"].removeprefix("TASK_LIST#")),
+        title=TaskTitle(item["title"]["S"]),
+        description=TaskDescription(description["S"] if description else ""),
+        status=TaskStatus(item["status"]["S"]),
+        created_at=datetime.fromisoformat(item["created_at"]["S"]),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    serializer = TypeSerializer()
+    task_list_id = TaskListId.generate()
+    items = [
+        {
+            name: serializer.serialize(value)
+            for name, value in task_to_item(
+                Task.create(
+                    TaskTitle(f"Task {i}"),
+                    TaskDescription("benchmark" if i % 4 == 0 else ""),
+                    task_list_id,
+                ),
+                UserId("000001"),
+            ).items()
+        }
+        for i in range(args.tasks)
+    ]
+
+    print(f"map {args.tasks} items")
+    for name, mapper in [
+        ("validated", validated_task_from_wire),
+        ("trusted", task_from_wire),
+    ]:
+        timing = measure(
+            lambda mapper=mapper: list(map(mapper, items)), args.repeat
+        )
+        print(f"  {name + ':':<10} {timing}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Compare the memory held per task by the domain model.
+
+Runs offline. Tasks are mapped from typed items of the wire format and
+the memory they hold is traced with ``tracemalloc``. The legacy model
+replicates the domain dataclasses as they were before they had slots,
+with one ``TaskListId`` per task. The slotted model is measured with and
+without sharing the ``TaskListId`` of the task list between its tasks.
+
+Usage: python -m benchmarks.bench_memory [--tasks 10000 100000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from boto3.dynamodb.types import TypeSerializer
+
+from app.domain.task import Task, TaskDescription, TaskStatus, TaskTitle
+from app.domain.task_list import TaskListId
+from app.domain.user import UserId
+from app.infrastructure.db.items import task_from_wire, task_to_item
+
+
+@dataclass(frozen=True)
+class LegacyValue:
+    """Value object of the domain model before it had slots."""
+
+    value: str
+
+
+@dataclass
+class LegacyTask:
+    """``Task`` before it had slots."""
+
+    id: LegacyValue
+    task_list_id: LegacyValue
+    title: LegacyValue
+    description: LegacyValue
+    status: TaskStatus
+    created_at: datetime
+
+
+def legacy_task_from_wire(item: dict[str, dict[str, str]]) -> LegacyTask:
+    description = item.get("description")
+    return LegacyTask(
+        id=LegacyValue(item["SK"]["S"].removeprefix("TASK#")),
+        task_list_id=LegacyValue(item["PK"]["S"].removeprefix("TASK_LIST#")),
+        title=LegacyValue(item["title"]["S"]),
+        description=LegacyValue(description["S"] if description else ""),
+        status=TaskStatus(item["status"]["S"]),
+        created_at=datetime.fromisoformat(item["created_at"]["S"]),
+    )
+
+
+def interned_tasks(items: list[dict[str, dict[str, str]]]) -> list[Task]:
+    task_list_ids: dict[str, TaskListId] = {}
+    return [task_from_wire(item, task_list_ids) for item in items]
+
+
+def traced_bytes(build: Callable[[], list]) -> int:
+    """Bytes still allocated by the list that ``build`` returns."""
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    result = build()
+    end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in end.compare_to(start, "filename"))
+    del result
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--tasks", type=int, nargs="+", default=[10_000, 100_000]
+    )
+    args = parser.parse_args()
+
+    serializer = TypeSerializer()
+    task_list_id = TaskListId.generate()
+    user_id = UserId("000001")
+
+    for count in args.tasks:
+        items = [
+            {
+                name: serializer.serialize(value)
+                for name, value in task_to_item(
+                    Task.create(
+                        TaskTitle(f"Task {i}"),
+                        TaskDescription("benchmark" if i % 4 == 0 else ""),
+                        task_list_id,
+                    ),
+                    user_id,
+                ).items()
+            }
+            for i in range(count)
+        ]
+        models = {
+            "legacy": lambda items=items: [
+                legacy_task_from_wire(item) for item in items
+            ],
+            "slotted": lambda items=items: [
+                task_from_wire(item) for item in items
+            ],
+            "slotted+interned": lambda items=items: interned_tasks(items),
+        }
+
+        print(f"{count} tasks")
+        for name, build in models.items():
+            size = traced_bytes(build)
+            print(f"  {name + ':':<17} {size / count:6.1f} bytes/task")
+
+
+if __name__ == "__main__":
+    main()
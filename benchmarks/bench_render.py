@@ -0,0 +1,86 @@
+"""Compare rendering a page of tasks through the response model or directly.
+
+Runs offline against an in-process app with three routes declaring the
+same ``response_model``. The model route returns ``TaskPageResponse``,
+which FastAPI validates again and encodes with ``jsonable_encoder``. The
+fast route renders the page with a ``FragmentRenderer`` without a cache,
+and the cached route with a cache of task fragments like the list routes
+of the API, so repeated requests reuse the bytes of every task.
+
+Usage: python -m benchmarks.bench_render [--tasks 10 100 1000] [--repeat 200]
+"""
+
+import argparse
+
+from fastapi import FastAPI
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from app.domain.page import Page
+from app.domain.task import Task, TaskDescription, TaskTitle
+from app.domain.task_list import TaskListId
+from app.infrastructure.cache.lru import CacheSettings, LRUCache
+from app.interface.api.rendering import FragmentRenderer
+from app.interface.api.responses import RenderedJSONResponse
+from app.interface.api.schema.task import TaskPageResponse
+
+from ._common import measure
+
+
+def create_bench_app(page: Page[Task]) -> FastAPI:
+    app = FastAPI()
+    renderer = FragmentRenderer()
+    cached_renderer = FragmentRenderer(
+        LRUCache(CacheSettings(max_size=len(page.items), ttl=3600.0))
+    )
+
+    @app.get("/model", response_model=TaskPageResponse)
+    async def model() -> TaskPageResponse:
+        return TaskPageResponse.from_domain(page)
+
+    @app.get("/fast", response_model=TaskPageResponse)
+    async def fast() -> Response:
+        return RenderedJSONResponse(renderer.task_page(page))
+
+    @app.get("/cached", response_model=TaskPageResponse)
+    async def cached() -> Response:
+        return RenderedJSONResponse(cached_renderer.task_page(page))
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    task_list_id = TaskListId.generate()
+    for count in args.tasks:
+        page = Page(
+            items=[
+                Task.create(
+                    TaskTitle(f"Task {i}"),
+                    TaskDescription("benchmark" if i % 4 == 0 else ""),
+                    task_list_id,
+                )
+                for i in range(count)
+            ],
+            next_token="token",
+        )
+
+        with TestClient(create_bench_app(page)) as client:
+            expected = client.get("/model").json()
+            assert client.get("/fast").json() == expected
+            assert client.get("/cached").json() == expected
+
+            print(f"{count} tasks")
+            for path in ["/model", "/fast", "/cached"]:
+                timing = measure(
+                    lambda path=path: client.get(path), args.repeat
+                )
+                print(f"  {path + ':':<9} {timing}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.async_todo import AsyncTodoService
+from app.domain.page import Page
+from app.domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from app.domain.task_feed import TaskFeedCursor, feed_sort_key
+from app.domain.task_list import TaskCount, TaskList, TaskListId, TaskListName
+from app.domain.task_list_repository import AsyncTaskListRepository
+from app.domain.task_repository import AsyncTaskRepository
+from app.domain.user import UserId
+
+
+@pytest.fixture
+def mock_task_list_repository():
+    return AsyncMock(spec=AsyncTaskListRepository)
+
+
+@pytest.fixture
+def mock_task_repository():
+    repository = AsyncMock(spec=AsyncTaskRepository)
+    repository.iter_all = MagicMock()
+    return repository
+
+
+@pytest.fixture
+def todo_service(mock_task_list_repository, mock_task_repository):
+    return AsyncTodoService(mock_task_list_repository, mock_task_repository)
+
+
+@pytest.fixture
+def task_list_factory():
+    def create_task_list(task_list_id: TaskListId, count: int = 0):
+        return TaskList(
+            id=task_list_id,
+            name=TaskListName("Test"),
+            user_id=UserId("user1"),
+            count=TaskCount(count),
+        )
+
+    return create_task_list
+
+
+@pytest.mark.asyncio
+async def test_create_task_list_should_create_and_store_task_list(
+    todo_service: AsyncTodoService,
+    mock_task_list_repository: AsyncMock,
+):
+    # Arrange
+    user_id = UserId(str(uuid.uuid4()))
+    name = TaskListName("Test Task List")
+
+    # Act
+    task_list = await todo_service.create_task_list(user_id, name)
+
+    # Assert
+    assert task_list.name == name
+    assert task_list.user_id == user_id
+    mock_task_list_repository.store.assert_awaited_once_with(task_list)
+
+
+@pytest.mark.asyncio
+async def test_get_task_list_should_find_by_key_when_user_is_known(
+    todo_service: AsyncTodoService,
+    mock_task_list_repository: AsyncMock,
+    task_list_factory,
+):
+    # Arrange
+    task_list_id = TaskListId("list1")
+    expected = task_list_factory(task_list_id)
+    mock_task_list_repository.find.return_value = expected
+
+    # Act
+    task_list = await todo_service.get_task_list(
+        task_list_id,
+        user_id=UserId("user1"),
+    )
+
+    # Assert
+    assert task_list == expected
+    mock_task_list_repository.find.assert_awaited_once_with(
+        UserId("user1"),
+        task_list_id,
+    )
+    mock_task_list_repository.find_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_task_should_add_task_to_list_of_user(
+    todo_service: AsyncTodoService,
+    mock_task_repository: AsyncMock,
+):
+    # Arrange
+    task_list_id = TaskListId("list1")
+
+    # Act
+    task = await todo_service.create_task(
+        task_list_id,
+        TaskTitle("Task"),
+        TaskDescription(""),
+        user_id=UserId("user1"),
+    )
+
+    # Assert
+    assert task.task_list_id == task_list_id
+    mock_task_repository.add_task_to_list.assert_awaited_once_with(
+        UserId("user1"),
+        task,
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_task_should_raise_error_when_task_list_is_full(
+    todo_service: AsyncTodoService,
+    mock_task_list_repository: AsyncMock,
+    mock_task_repository: AsyncMock,
+    task_list_factory,
+):
+    # Arrange
+    task_list_id = TaskListId("list1")
+    mock_task_list_repository.find_by_id.return_value = task_list_factory(
+        task_list_id,
+        count=TaskCount.MAX_TASK_COUNT,
+    )
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task count cannot exceed"):
+        await todo_service.create_task(
+            task_list_id,
+            TaskTitle("Task"),
+            TaskDescription(""),
+        )
+    mock_task_repository.add_task_to_list.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_task_should_raise_error_when_not_found(
+    todo_service: AsyncTodoService,
+    mock_task_repository: AsyncMock,
+):
+    # Arrange
+    mock_task_repository.update.return_value = None
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task not found."):
+        await todo_service.update_task(
+            TaskId("task1"),
+            status=TaskStatus.DONE,
+            task_list_id=TaskListId("list1"),
+        )
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_should_return_page_of_existing_task_list(
+    todo_service: AsyncTodoService,
+    mock_task_list_repository: AsyncMock,
+    mock_task_repository: AsyncMock,
+    task_list_factory,
+):
+    # Arrange
+    task_list_id = TaskListId("list1")
+    mock_task_list_repository.find_by_id.return_value = task_list_factory(
+        task_list_id
+    )
+    expected = Page[Task](items=[], next_token="token")
+    mock_task_repository.list_all.return_value = expected
+
+    # Act
+    page = await todo_service.list_tasks(task_list_id, limit=10)
+
+    # Assert
+    assert page == expected
+    mock_task_repository.list_all.assert_awaited_once_with(
+        task_list_id,
+        limit=10,
+        next_token=None,
+        sort_by=None,
+        order=None,
+        status=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_iter_tasks_should_raise_error_when_task_list_not_found(
+    todo_service: AsyncTodoService,
+    mock_task_list_repository: AsyncMock,
+    mock_task_repository: AsyncMock,
+):
+    # Arrange
+    mock_task_list_repository.find_by_id.return_value = None
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task list not found."):
+        await todo_service.iter_tasks(TaskListId("list1"))
+    mock_task_repository.iter_all.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_should_find_many_by_key(
+    todo_service: AsyncTodoService,
+    mock_task_repository: AsyncMock,
+):
+    # Arrange
+    keys = [(TaskListId("list1"), TaskId("task1"))]
+    mock_task_repository.find_many.return_value = [None]
+
+    # Act
+    tasks = await todo_service.get_tasks(keys)
+
+    # Assert
+    assert tasks == [None]
+    mock_task_repository.find_many.assert_awaited_once_with(keys)
+
+
+@pytest.mark.asyncio
+async def test_create_tasks_should_add_all_tasks_to_list_of_user(
+    todo_service: AsyncTodoService,
+    mock_task_repository: AsyncMock,
+):
+    # Arrange
+    task_list_id = TaskListId("list1")
+    drafts = [(TaskTitle(f"Task {i}"), TaskDescription("")) for i in range(3)]
+
+    # Act
+    tasks = await todo_service.create_tasks(
+        task_list_id,
+        drafts,
+        user_id=UserId("user1"),
+    )
+
+    # Assert
+    assert len(tasks) == 3
+    mock_task_repository.add_tasks_to_list.assert_awaited_once_with(
+        UserId("user1"), task_list_id, tasks
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_user_tasks_should_query_user_task_index_when_enabled(
+    mock_task_list_repository: AsyncMock,
+    mock_task_repository: AsyncMock,
+):
+    # Arrange
+    todo_service = AsyncTodoService(
+        mock_task_list_repository,
+        mock_task_repository,
+        user_task_index=True,
+    )
+    user_id = UserId("user1")
+    expected_page = Page(items=[], next_token="token")
+    mock_task_repository.list_user_tasks.return_value = expected_page
+
+    # Act
+    page = await todo_service.list_user_tasks(user_id, limit=10)
+
+    # Assert
+    assert page == expected_page
+    mock_task_repository.list_user_tasks.assert_awaited_once_with(
+        user_id,
+        limit=10,
+        next_token=None,
+        order=None,
+        status=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_user_tasks_should_merge_task_lists_without_index(
+    todo_service: AsyncTodoService,
+    mock_task_list_repository: AsyncMock,
+    mock_task_repository: AsyncMock,
+    task_list_factory,
+):
+    # Arrange
+    task_lists = [task_list_factory(TaskListId(f"list{i}")) for i in range(2)]
+    tasks = [
+        Task.create(TaskTitle(f"Task {i}"), TaskDescription(""), task_list.id)
+        for i, task_list in enumerate(task_lists)
+    ]
+
+    async def iter_task_lists():
+        for task_list in task_lists:
+            yield task_list
+
+    async def iter_tasks(task_list_id, **_):
+        for task in tasks:
+            if task.task_list_id == task_list_id:
+                yield task
+
+    mock_task_list_repository.iter_all = MagicMock(
+        return_value=iter_task_lists()
+    )
+    mock_task_repository.iter_all = MagicMock(side_effect=iter_tasks)
+
+    # Act
+    page = await todo_service.list_user_tasks(UserId("user1"))
+
+    # Assert
+    assert page.items == sorted(tasks, key=feed_sort_key)
+    assert page.next_token is None
+    assert mock_task_repository.iter_all.call_count == 2
+    mock_task_repository.list_user_tasks.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_user_tasks_should_read_one_page_per_task_list_from_cursor(
+    todo_service: AsyncTodoService,
+    mock_task_list_repository: AsyncMock,
+    mock_task_repository: AsyncMock,
+    task_list_factory,
+):
+    # Arrange
+    task_list = task_list_factory(TaskListId("list1"))
+    tasks = [
+        Task.create(TaskTitle(f"Task {i}"), TaskDescription(""), task_list.id)
+        for i in range(4)
+    ]
+    tasks.sort(key=feed_sort_key)
+    cursor = TaskFeedCursor.after(tasks[0])
+    reads = []
+
+    async def iter_task_lists():
+        yield task_list
+
+    async def iter_tasks(task_list_id, **_):
+        for task in tasks:
+            reads.append(task)
+            yield task
+
+    mock_task_list_repository.iter_all = MagicMock(
+        return_value=iter_task_lists()
+    )
+    mock_task_repository.iter_all = MagicMock(side_effect=iter_tasks)
+
+    # Act
+    page = await todo_service.list_user_tasks(
+        UserId("user1"), limit=1, next_token=cursor.encode()
+    )
+
+    # Assert
+    assert page.items == [tasks[1]]
+    assert page.next_token is not None
+    assert reads == tasks[:3]
+    assert mock_task_repository.iter_all.call_args.kwargs["start"] == cursor
+    assert mock_task_repository.iter_all.call_args.kwargs["page_size"] == 2
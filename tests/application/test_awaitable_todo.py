@@ -0,0 +1,94 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.application.awaitable_todo import (
+    ITERATE_CHUNK_SIZE,
+    AwaitableTodoService,
+)
+from app.domain.task_list import TaskListId
+
+
+@pytest.mark.asyncio
+async def test_awaitable_todo_service_should_call_wrapped_service():
+    # Arrange
+    service = MagicMock()
+    service.get_task_list.return_value = "task list"
+    awaitable = AwaitableTodoService(service)
+
+    # Act
+    result = await awaitable.get_task_list(task_list_id=TaskListId("list1"))
+
+    # Assert
+    assert result == "task list"
+    service.get_task_list.assert_called_once_with(
+        task_list_id=TaskListId("list1")
+    )
+
+
+@pytest.mark.asyncio
+async def test_awaitable_todo_service_should_propagate_errors():
+    # Arrange
+    service = MagicMock()
+    service.get_task.side_effect = ValueError("Task not found.")
+    awaitable = AwaitableTodoService(service)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task not found."):
+        await awaitable.get_task("task1")
+
+
+@pytest.mark.asyncio
+async def test_awaitable_todo_service_should_run_calls_in_executor():
+    # Arrange
+    service = MagicMock()
+    service.get_task_list.side_effect = lambda **kwargs: (
+        threading.current_thread().name
+    )
+
+    # Act
+    with ThreadPoolExecutor(thread_name_prefix="test") as executor:
+        awaitable = AwaitableTodoService(service, executor)
+        thread_name = await awaitable.get_task_list(
+            task_list_id=TaskListId("list1")
+        )
+
+    # Assert
+    assert thread_name.startswith("test")
+
+
+@pytest.mark.asyncio
+async def test_awaitable_todo_service_should_iterate_in_executor():
+    # Arrange
+    service = MagicMock()
+    service.iter_tasks.return_value = iter(["task1", "task2"])
+
+    # Act
+    with ThreadPoolExecutor() as executor:
+        awaitable = AwaitableTodoService(service, executor)
+        tasks = await awaitable.iter_tasks(TaskListId("list1"))
+        items = [task async for task in tasks]
+
+    # Assert
+    assert items == ["task1", "task2"]
+
+
+@pytest.mark.asyncio
+async def test_awaitable_todo_service_should_iterate_in_chunks():
+    # Arrange
+    service = MagicMock()
+    service.iter_tasks.return_value = iter(range(ITERATE_CHUNK_SIZE + 1))
+    executor = MagicMock(wraps=ThreadPoolExecutor())
+
+    # Act
+    awaitable = AwaitableTodoService(service, executor)
+    tasks = await awaitable.iter_tasks(TaskListId("list1"))
+    items = [task async for task in tasks]
+    executor.shutdown()
+
+    # Assert
+    assert items == list(range(ITERATE_CHUNK_SIZE + 1))
+    # One call for the iterator, then two chunks and the empty end.
+    assert executor.submit.call_count == 4
@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta
+
+from app.application.task_feed import feed_window, merge_task_feed
+from app.domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from app.domain.task_feed import TaskFeedCursor
+from app.domain.task_list import TaskListId, TaskSortOrder
+
+START = datetime(2025, 1, 1)
+
+
+def create_task(task_list_id: str, task_id: str, minutes: int) -> Task:
+    return Task(
+        id=TaskId(task_id),
+        task_list_id=TaskListId(task_list_id),
+        title=TaskTitle("Test"),
+        description=TaskDescription(""),
+        status=TaskStatus.TODO,
+        created_at=START + timedelta(minutes=minutes),
+    )
+
+
+def task_lists(descending: bool = False) -> list[list[Task]]:
+    lists = [
+        [create_task("list1", "t1", 1), create_task("list1", "t4", 4)],
+        [create_task("list2", "t2", 2), create_task("list2", "t3", 3)],
+        [create_task("list3", "t5", 5)],
+    ]
+    return [
+        sorted(tasks, key=lambda task: task.created_at, reverse=descending)
+        for tasks in lists
+    ]
+
+
+def test_merge_task_feed_should_merge_lists_by_creation_time():
+    # Act
+    page = merge_task_feed(task_lists(), TaskSortOrder.ASCENDING)
+
+    # Assert
+    assert [str(task.id) for task in page.items] == [
+        "t1",
+        "t2",
+        "t3",
+        "t4",
+        "t5",
+    ]
+    assert page.next_token is None
+
+
+def test_merge_task_feed_should_merge_lists_in_descending_order():
+    # Act
+    page = merge_task_feed(
+        task_lists(descending=True), TaskSortOrder.DESCENDING
+    )
+
+    # Assert
+    assert [str(task.id) for task in page.items] == [
+        "t5",
+        "t4",
+        "t3",
+        "t2",
+        "t1",
+    ]
+
+
+def test_merge_task_feed_should_return_cursor_after_last_task_of_page():
+    # Act
+    page = merge_task_feed(task_lists(), TaskSortOrder.ASCENDING, limit=2)
+
+    # Assert
+    assert [str(task.id) for task in page.items] == ["t1", "t2"]
+    assert page.next_token is not None
+    cursor = TaskFeedCursor.decode(page.next_token)
+    assert cursor.task_id == TaskId("t2")
+    assert cursor.task_list_id == TaskListId("list2")
+
+
+def test_merge_task_feed_should_start_after_cursor():
+    # Arrange
+    first = merge_task_feed(task_lists(), TaskSortOrder.ASCENDING, limit=2)
+    cursor = TaskFeedCursor.decode(first.next_token or "")
+
+    # Act
+    page = merge_task_feed(
+        task_lists(), TaskSortOrder.ASCENDING, limit=3, cursor=cursor
+    )
+
+    # Assert
+    assert [str(task.id) for task in page.items] == ["t3", "t4", "t5"]
+    assert page.next_token is None
+
+
+def test_merge_task_feed_should_start_after_cursor_in_descending_order():
+    # Arrange
+    cursor = TaskFeedCursor.after(create_task("list1", "t4", 4))
+
+    # Act
+    page = merge_task_feed(
+        task_lists(descending=True), TaskSortOrder.DESCENDING, cursor=cursor
+    )
+
+    # Assert
+    assert [str(task.id) for task in page.items] == ["t3", "t2", "t1"]
+
+
+def test_merge_task_feed_should_return_empty_page_without_lists():
+    # Act
+    page = merge_task_feed([], TaskSortOrder.ASCENDING, limit=10)
+
+    # Assert
+    assert page.items == []
+    assert page.next_token is None
+
+
+def test_feed_window_should_read_one_more_task_than_limit_after_cursor():
+    # Arrange
+    tasks = [create_task("list1", f"t{i}", i) for i in range(10)]
+    cursor = TaskFeedCursor.after(tasks[2])
+    reads = []
+
+    def read_tasks():
+        for task in tasks:
+            reads.append(task)
+            yield task
+
+    # Act
+    window = feed_window(
+        read_tasks(), TaskSortOrder.ASCENDING, limit=2, cursor=cursor
+    )
+
+    # Assert
+    assert [str(task.id) for task in window] == ["t3", "t4", "t5"]
+    assert reads == tasks[:6]
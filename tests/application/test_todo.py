@@ -1,12 +1,23 @@
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
 
 from app.application.todo import TodoService
+from app.domain.page import Page
 from app.domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
-from app.domain.task_list import TaskCount, TaskList, TaskListId, TaskListName
+from app.domain.task_feed import TaskFeedCursor
+from app.domain.task_list import (
+    TaskCount,
+    TaskList,
+    TaskListId,
+    TaskListName,
+    TaskSortBy,
+    TaskSortOrder,
+)
 from app.domain.task_list_repository import TaskListRepository
 from app.domain.task_repository import TaskRepository
 from app.domain.user import UserId
@@ -81,6 +92,51 @@ def test_get_task_list_should_raise_error_when_not_found(
     mock_task_list_repository.find_by_id.assert_called_once_with(task_list_id)
 
 
+def test_get_task_list_with_tasks_should_find_both_at_once(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+):
+    # Arrange
+    user_id = UserId(str(uuid.uuid4()))
+    task_list = TaskList.create(TaskListName("Test"), user_id)
+    page = Page[Task](items=[], next_token=None)
+    mock_task_list_repository.find_with_tasks.return_value = (task_list, page)
+
+    # Act
+    result = todo_service.get_task_list_with_tasks(
+        task_list.id,
+        user_id=user_id,
+        limit=10,
+    )
+
+    # Assert
+    assert result == (task_list, page)
+    mock_task_list_repository.find_with_tasks.assert_called_once_with(
+        task_list.id,
+        limit=10,
+    )
+    mock_task_list_repository.find_by_id.assert_not_called()
+
+
+def test_get_task_list_with_tasks_should_raise_error_when_not_owned(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+):
+    # Arrange
+    task_list = TaskList.create(TaskListName("Test"), UserId("owner"))
+    mock_task_list_repository.find_with_tasks.return_value = (
+        task_list,
+        Page[Task](items=[], next_token=None),
+    )
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task list not found."):
+        todo_service.get_task_list_with_tasks(
+            task_list.id,
+            user_id=UserId("someone-else"),
+        )
+
+
 def test_update_task_list_name_should_update_and_store_task_list(
     todo_service: TodoService,
     mock_task_list_repository: MagicMock,
@@ -96,6 +152,12 @@ def test_update_task_list_name_should_update_and_store_task_list(
         count=TaskCount(0),
     )
     mock_task_list_repository.find_by_id.return_value = task_list
+    mock_task_list_repository.update_name.return_value = TaskList(
+        id=task_list_id,
+        name=new_name,
+        user_id=task_list.user_id,
+        count=TaskCount(0),
+    )
 
     # Act
     updated_task_list = todo_service.update_task_list_name(
@@ -106,7 +168,12 @@ def test_update_task_list_name_should_update_and_store_task_list(
     # Assert
     assert updated_task_list.name == new_name
     mock_task_list_repository.find_by_id.assert_called_once_with(task_list_id)
-    mock_task_list_repository.store.assert_called_once_with(updated_task_list)
+    mock_task_list_repository.update_name.assert_called_once_with(
+        task_list.user_id,
+        task_list_id,
+        new_name,
+    )
+    mock_task_list_repository.store.assert_not_called()
 
 
 def test_update_task_list_name_should_raise_error_when_not_found(
@@ -132,10 +199,13 @@ def test_delete_task_list_should_call_delete_on_repository(
     task_list_id = TaskListId(str(uuid.uuid4()))
 
     # Act
-    todo_service.delete_task_list(task_list_id)
+    todo_service.delete_task_list(task_list_id, user_id=UserId("user1"))
 
     # Assert
-    mock_task_list_repository.delete.assert_called_once_with(task_list_id)
+    mock_task_list_repository.delete.assert_called_once_with(
+        task_list_id,
+        user_id=UserId("user1"),
+    )
 
 
 def test_list_all_task_lists_should_return_list_from_repository(
@@ -152,14 +222,26 @@ def test_list_all_task_lists_should_return_list_from_repository(
             count=TaskCount(0),
         )
     ]
-    mock_task_list_repository.list_all.return_value = expected_lists
+    mock_task_list_repository.list_all.return_value = Page(
+        items=expected_lists,
+        next_token="token2",
+    )
 
     # Act
-    task_lists = todo_service.list_all_task_lists(user_id)
+    page = todo_service.list_all_task_lists(
+        user_id,
+        limit=10,
+        next_token="token1",
+    )
 
     # Assert
-    assert task_lists == expected_lists
-    mock_task_list_repository.list_all.assert_called_once_with(user_id)
+    assert page.items == expected_lists
+    assert page.next_token == "token2"
+    mock_task_list_repository.list_all.assert_called_once_with(
+        user_id,
+        limit=10,
+        next_token="token1",
+    )
 
 
 def test_create_task_should_create_and_store_task(
@@ -187,10 +269,11 @@ def test_create_task_should_create_and_store_task(
     assert task.title == title
     assert task.description == description
     assert task.task_list_id == task_list_id
-    assert task_list.count.value == 1
     mock_task_list_repository.find_by_id.assert_called_once_with(task_list_id)
-    mock_task_list_repository.store.assert_called_once_with(task_list)
-    mock_task_repository.store.assert_called_once_with(task)
+    mock_task_list_repository.store.assert_not_called()
+    mock_task_repository.add_task_to_list.assert_called_once_with(
+        task_list.user_id, task
+    )
 
 
 def test_create_task_should_raise_error_when_task_list_not_found(
@@ -209,6 +292,52 @@ def test_create_task_should_raise_error_when_task_list_not_found(
     mock_task_list_repository.find_by_id.assert_called_once_with(task_list_id)
 
 
+def test_create_tasks_should_add_all_tasks_to_list_of_user(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    task_list_id = TaskListId(str(uuid.uuid4()))
+    user_id = UserId(str(uuid.uuid4()))
+    drafts = [
+        (TaskTitle("First"), TaskDescription("")),
+        (TaskTitle("Second"), TaskDescription("Details")),
+    ]
+
+    # Act
+    tasks = todo_service.create_tasks(task_list_id, drafts, user_id=user_id)
+
+    # Assert
+    assert [(task.title, task.description) for task in tasks] == drafts
+    assert {task.task_list_id for task in tasks} == {task_list_id}
+    mock_task_list_repository.find_by_id.assert_not_called()
+    mock_task_repository.add_tasks_to_list.assert_called_once_with(
+        user_id, task_list_id, tasks
+    )
+
+
+def test_create_tasks_should_raise_error_when_tasks_do_not_fit(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    task_list_id = TaskListId(str(uuid.uuid4()))
+    mock_task_list_repository.find_by_id.return_value = TaskList(
+        id=task_list_id,
+        name=TaskListName("Test List"),
+        user_id=UserId(str(uuid.uuid4())),
+        count=TaskCount(TaskCount.MAX_TASK_COUNT - 1),
+    )
+    drafts = [(TaskTitle("Task"), TaskDescription(""))] * 2
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task count cannot exceed"):
+        todo_service.create_tasks(task_list_id, drafts)
+    mock_task_repository.add_tasks_to_list.assert_not_called()
+
+
 def test_get_task_should_return_task_when_found(
     todo_service: TodoService,
     mock_task_repository: MagicMock,
@@ -245,3 +374,524 @@ def test_get_task_should_raise_error_when_not_found(
     with pytest.raises(ValueError, match="Task not found."):
         todo_service.get_task(task_id)
     mock_task_repository.find_by_id.assert_called_once_with(task_id)
+
+
+def test_get_task_list_should_use_key_lookup_when_user_is_known(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+):
+    # Arrange
+    task_list_id = TaskListId(str(uuid.uuid4()))
+    user_id = UserId(str(uuid.uuid4()))
+    expected_task_list = TaskList(
+        id=task_list_id,
+        name=TaskListName("Test"),
+        user_id=user_id,
+        count=TaskCount(0),
+    )
+    mock_task_list_repository.find.return_value = expected_task_list
+
+    # Act
+    task_list = todo_service.get_task_list(task_list_id, user_id)
+
+    # Assert
+    assert task_list == expected_task_list
+    mock_task_list_repository.find.assert_called_once_with(
+        user_id, task_list_id
+    )
+    mock_task_list_repository.find_by_id.assert_not_called()
+
+
+def test_get_task_should_use_key_lookup_when_task_list_is_known(
+    todo_service: TodoService,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    task_id = TaskId(str(uuid.uuid4()))
+    task_list_id = TaskListId(str(uuid.uuid4()))
+    expected_task = Task(
+        id=task_id,
+        title=TaskTitle("Test"),
+        description=TaskDescription("Test"),
+        status=TaskStatus.TODO,
+        task_list_id=task_list_id,
+        created_at=datetime.now(),
+    )
+    mock_task_repository.find.return_value = expected_task
+
+    # Act
+    task = todo_service.get_task(task_id, task_list_id)
+
+    # Assert
+    assert task == expected_task
+    mock_task_repository.find.assert_called_once_with(task_list_id, task_id)
+    mock_task_repository.find_by_id.assert_not_called()
+
+
+def test_list_tasks_should_return_page_from_repository(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    task_list_id = TaskListId(str(uuid.uuid4()))
+    mock_task_list_repository.find_by_id.return_value = TaskList(
+        id=task_list_id,
+        name=TaskListName("Test List"),
+        user_id=UserId(str(uuid.uuid4())),
+        count=TaskCount(0),
+    )
+    expected_page = Page(items=[], next_token="token2")
+    mock_task_repository.list_all.return_value = expected_page
+
+    # Act
+    page = todo_service.list_tasks(
+        task_list_id,
+        limit=10,
+        next_token="token1",
+        sort_by=TaskSortBy.TITLE,
+        order=TaskSortOrder.DESCENDING,
+        status=TaskStatus.TODO,
+    )
+
+    # Assert
+    assert page == expected_page
+    mock_task_repository.list_all.assert_called_once_with(
+        task_list_id,
+        limit=10,
+        next_token="token1",
+        sort_by=TaskSortBy.TITLE,
+        order=TaskSortOrder.DESCENDING,
+        status=TaskStatus.TODO,
+    )
+
+
+def test_iter_tasks_should_raise_error_when_task_list_not_found(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    task_list_id = TaskListId(str(uuid.uuid4()))
+    mock_task_list_repository.find_by_id.return_value = None
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task list not found."):
+        todo_service.iter_tasks(task_list_id)
+    mock_task_repository.iter_all.assert_not_called()
+
+
+def test_create_task_should_skip_lookup_when_user_is_known(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    task_list_id = TaskListId(str(uuid.uuid4()))
+    user_id = UserId(str(uuid.uuid4()))
+
+    # Act
+    task = todo_service.create_task(
+        task_list_id,
+        TaskTitle("Test Task"),
+        TaskDescription(""),
+        user_id,
+    )
+
+    # Assert
+    mock_task_list_repository.find_by_id.assert_not_called()
+    mock_task_repository.add_task_to_list.assert_called_once_with(user_id, task)
+
+
+def test_create_task_should_raise_error_when_task_list_is_full(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    task_list_id = TaskListId(str(uuid.uuid4()))
+    mock_task_list_repository.find_by_id.return_value = TaskList(
+        id=task_list_id,
+        name=TaskListName("Test List"),
+        user_id=UserId(str(uuid.uuid4())),
+        count=TaskCount(TaskCount.MAX_TASK_COUNT),
+    )
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task count cannot exceed"):
+        todo_service.create_task(
+            task_list_id,
+            TaskTitle("Test Task"),
+            TaskDescription(""),
+        )
+    mock_task_repository.add_task_to_list.assert_not_called()
+
+
+def test_remove_task_should_remove_task_from_list(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    task_list_id = TaskListId(str(uuid.uuid4()))
+    task_id = TaskId(str(uuid.uuid4()))
+    user_id = UserId(str(uuid.uuid4()))
+
+    # Act
+    todo_service.remove_task(task_list_id, task_id, user_id)
+
+    # Assert
+    mock_task_list_repository.find_by_id.assert_not_called()
+    mock_task_repository.remove_task_from_list.assert_called_once_with(
+        user_id, task_list_id, task_id
+    )
+
+
+def test_update_task_should_update_all_fields_with_one_write(
+    todo_service: TodoService,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    task_id = TaskId(str(uuid.uuid4()))
+    task_list_id = TaskListId(str(uuid.uuid4()))
+    user_id = UserId(str(uuid.uuid4()))
+    title = TaskTitle("New Title")
+    description = TaskDescription("New Description")
+    expected_task = Task(
+        id=task_id,
+        title=title,
+        description=description,
+        status=TaskStatus.DONE,
+        task_list_id=task_list_id,
+        created_at=datetime.now(),
+    )
+    mock_task_repository.update.return_value = expected_task
+
+    # Act
+    task = todo_service.update_task(
+        task_id,
+        title=title,
+        description=description,
+        status=TaskStatus.DONE,
+        task_list_id=task_list_id,
+        user_id=user_id,
+    )
+
+    # Assert
+    assert task == expected_task
+    mock_task_repository.find_by_id.assert_not_called()
+    mock_task_repository.store.assert_not_called()
+    mock_task_repository.update.assert_called_once_with(
+        task_list_id,
+        task_id,
+        title=title,
+        description=description,
+        status=TaskStatus.DONE,
+        user_id=user_id,
+    )
+
+
+def test_update_task_should_raise_error_when_not_found(
+    todo_service: TodoService,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    mock_task_repository.update.return_value = None
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task not found."):
+        todo_service.update_task(
+            TaskId(str(uuid.uuid4())),
+            status=TaskStatus.DONE,
+            task_list_id=TaskListId(str(uuid.uuid4())),
+        )
+
+
+def test_update_task_status_should_find_owner_of_task_list(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    task_id = TaskId(str(uuid.uuid4()))
+    task_list = TaskList.create(
+        TaskListName("List"),
+        UserId(str(uuid.uuid4())),
+    )
+    mock_task_list_repository.find_by_id.return_value = task_list
+
+    # Act
+    todo_service.update_task_status(
+        task_id,
+        TaskStatus.DONE,
+        task_list_id=task_list.id,
+    )
+
+    # Assert
+    mock_task_list_repository.find_by_id.assert_called_once_with(task_list.id)
+    mock_task_repository.update.assert_called_once_with(
+        task_list.id,
+        task_id,
+        title=None,
+        description=None,
+        status=TaskStatus.DONE,
+        user_id=task_list.user_id,
+    )
+
+
+def test_update_task_status_should_raise_error_when_list_is_not_found(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    mock_task_list_repository.find_by_id.return_value = None
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task list not found."):
+        todo_service.update_task_status(
+            TaskId(str(uuid.uuid4())),
+            TaskStatus.DONE,
+            task_list_id=TaskListId(str(uuid.uuid4())),
+        )
+    mock_task_repository.update.assert_not_called()
+
+
+def test_get_tasks_should_find_many_by_key(
+    todo_service: TodoService,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    keys = [(TaskListId("list1"), TaskId("task1"))]
+    mock_task_repository.find_many.return_value = [None]
+
+    # Act
+    tasks = todo_service.get_tasks(keys)
+
+    # Assert
+    assert tasks == [None]
+    mock_task_repository.find_many.assert_called_once_with(keys)
+
+
+def test_get_tasks_should_not_call_repository_without_keys(
+    todo_service: TodoService,
+    mock_task_repository: MagicMock,
+):
+    # Act
+    tasks = todo_service.get_tasks([])
+
+    # Assert
+    assert tasks == []
+    mock_task_repository.find_many.assert_not_called()
+
+
+def test_list_user_tasks_should_query_user_task_index_when_enabled(
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    todo_service = TodoService(
+        mock_task_list_repository,
+        mock_task_repository,
+        user_task_index=True,
+    )
+    user_id = UserId("user1")
+    expected_page = Page(items=[], next_token="token")
+    mock_task_repository.list_user_tasks.return_value = expected_page
+
+    # Act
+    page = todo_service.list_user_tasks(
+        user_id,
+        limit=10,
+        order=TaskSortOrder.DESCENDING,
+        status=TaskStatus.TODO,
+    )
+
+    # Assert
+    assert page == expected_page
+    mock_task_repository.list_user_tasks.assert_called_once_with(
+        user_id,
+        limit=10,
+        next_token=None,
+        order=TaskSortOrder.DESCENDING,
+        status=TaskStatus.TODO,
+    )
+    mock_task_list_repository.iter_all.assert_not_called()
+
+
+def test_list_user_tasks_should_merge_task_lists_without_index(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    user_id = UserId("user1")
+    task_lists = [
+        TaskList(
+            id=TaskListId(f"list{i}"),
+            name=TaskListName("Test"),
+            user_id=user_id,
+            count=TaskCount(1),
+        )
+        for i in range(2)
+    ]
+    tasks = [
+        Task(
+            id=TaskId(f"task{i}"),
+            title=TaskTitle("Test"),
+            description=TaskDescription("Test"),
+            status=TaskStatus.TODO,
+            task_list_id=task_lists[i].id,
+            created_at=datetime(2025, 1, 2 - i),
+        )
+        for i in range(2)
+    ]
+    mock_task_list_repository.iter_all.return_value = iter(task_lists)
+    mock_task_repository.iter_all.side_effect = lambda task_list_id, **_: iter(
+        [task for task in tasks if task.task_list_id == task_list_id]
+    )
+
+    # Act
+    page = todo_service.list_user_tasks(user_id, limit=1)
+
+    # Assert
+    assert page.items == [tasks[1]]
+    assert page.next_token is not None
+    mock_task_repository.list_user_tasks.assert_not_called()
+    mock_task_repository.iter_all.assert_any_call(
+        TaskListId("list0"),
+        sort_by=TaskSortBy.CREATED_AT,
+        order=TaskSortOrder.ASCENDING,
+        status=None,
+        start=None,
+        page_size=2,
+    )
+
+
+def test_list_user_tasks_should_read_task_lists_in_given_executor(
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    user_id = UserId("user1")
+    mock_task_list_repository.iter_all.return_value = iter(
+        [
+            TaskList(
+                id=TaskListId(f"list{i}"),
+                name=TaskListName("Test"),
+                user_id=user_id,
+                count=TaskCount(0),
+            )
+            for i in range(3)
+        ]
+    )
+    threads = []
+    mock_task_repository.iter_all.side_effect = lambda *_, **__: (
+        threads.append(threading.current_thread().name) or iter([])
+    )
+
+    # Act
+    with ThreadPoolExecutor(thread_name_prefix="feed") as executor:
+        service = TodoService(
+            mock_task_list_repository,
+            mock_task_repository,
+            executor=executor,
+        )
+        page = service.list_user_tasks(user_id)
+
+    # Assert
+    assert page == Page()
+    assert len(threads) == 3
+    assert all(name.startswith("feed") for name in threads)
+
+
+def test_list_user_tasks_should_read_task_lists_in_caller_without_executor(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    user_id = UserId("user1")
+    mock_task_list_repository.iter_all.return_value = iter(
+        [
+            TaskList(
+                id=TaskListId(f"list{i}"),
+                name=TaskListName("Test"),
+                user_id=user_id,
+                count=TaskCount(0),
+            )
+            for i in range(2)
+        ]
+    )
+    threads = []
+    mock_task_repository.iter_all.side_effect = lambda *_, **__: (
+        threads.append(threading.current_thread()) or iter([])
+    )
+
+    # Act
+    todo_service.list_user_tasks(user_id)
+
+    # Assert
+    assert threads == [threading.current_thread()] * 2
+
+
+def test_list_user_tasks_should_start_each_task_list_at_cursor(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    user_id = UserId("user1")
+    task_list = TaskList(
+        id=TaskListId("list1"),
+        name=TaskListName("Test"),
+        user_id=user_id,
+        count=TaskCount(2),
+    )
+    tasks = [
+        Task(
+            id=TaskId(f"task{i}"),
+            title=TaskTitle("Test"),
+            description=TaskDescription("Test"),
+            status=TaskStatus.TODO,
+            task_list_id=task_list.id,
+            created_at=datetime(2025, 1, 1 + i),
+        )
+        for i in range(2)
+    ]
+    cursor = TaskFeedCursor.after(tasks[0])
+    mock_task_list_repository.iter_all.return_value = iter([task_list])
+    mock_task_repository.iter_all.return_value = iter(tasks)
+
+    # Act
+    page = todo_service.list_user_tasks(
+        user_id, limit=1, next_token=cursor.encode()
+    )
+
+    # Assert
+    assert page.items == [tasks[1]]
+    assert page.next_token is None
+    mock_task_repository.iter_all.assert_called_once_with(
+        task_list.id,
+        sort_by=TaskSortBy.CREATED_AT,
+        order=TaskSortOrder.ASCENDING,
+        status=None,
+        start=cursor,
+        page_size=2,
+    )
+
+
+def test_list_user_tasks_should_return_empty_page_without_task_lists(
+    todo_service: TodoService,
+    mock_task_list_repository: MagicMock,
+    mock_task_repository: MagicMock,
+):
+    # Arrange
+    mock_task_list_repository.iter_all.return_value = iter([])
+
+    # Act
+    page = todo_service.list_user_tasks(UserId("user1"))
+
+    # Assert
+    assert page == Page()
+    mock_task_repository.list_all.assert_not_called()
@@ -0,0 +1,58 @@
+import uuid
+
+from app.domain.ids import UUIDv7Generator
+
+
+def fixed_clock(*ms: int):
+    times = iter(ms)
+    return lambda: next(times) * 1_000_000
+
+
+def test_uuid7_should_set_version_variant_and_timestamp():
+    # Arrange
+    generate = UUIDv7Generator(fixed_clock(1_700_000_000_000))
+
+    # Act
+    value = generate()
+
+    # Assert
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+    assert value.int >> 80 == 1_700_000_000_000
+
+
+def test_uuid7_should_increase_within_same_millisecond():
+    # Arrange
+    generate = UUIDv7Generator(fixed_clock(*[5] * 100))
+
+    # Act
+    values = [str(generate()) for _ in range(100)]
+
+    # Assert
+    assert values == sorted(values)
+    assert len(set(values)) == 100
+    assert {uuid.UUID(value).int >> 80 for value in values} == {5}
+
+
+def test_uuid7_should_borrow_next_millisecond_when_counter_is_exhausted():
+    # Arrange
+    generate = UUIDv7Generator(fixed_clock(*[5] * 4097))
+
+    # Act
+    values = [generate() for _ in range(4097)]
+
+    # Assert
+    assert values == sorted(values)
+    assert values[-1].int >> 80 == 6
+
+
+def test_uuid7_should_stay_ordered_when_clock_goes_backwards():
+    # Arrange
+    generate = UUIDv7Generator(fixed_clock(10, 9, 11))
+
+    # Act
+    values = [str(generate()) for _ in range(3)]
+
+    # Assert
+    assert values == sorted(values)
+    assert uuid.UUID(values[1]).int >> 80 == 10
@@ -23,6 +23,14 @@ def test_task_id_generate_should_create_unique_id():
     assert task_id1.value != task_id2.value
 
 
+def test_task_id_generate_should_sort_in_creation_order():
+    # Act
+    task_ids = [TaskId.generate().value for _ in range(50)]
+
+    # Assert
+    assert task_ids == sorted(task_ids)
+
+
 def test_task_title_should_create_with_valid_value():
     # Arrange
     valid_title = "Valid Title"
@@ -102,6 +110,7 @@ def test_task_create_should_initialize_task_correctly():
     assert task.task_list_id == task_list_id
     assert task.status == TaskStatus.TODO
     assert isinstance(task.created_at, datetime)
+    assert task.version == 1
 
 
 def test_task_update_title_should_change_title():
@@ -151,3 +160,59 @@ def test_task_update_status_should_change_status():
 
     # Assert
     assert task.status == new_status
+
+
+def test_task_from_trusted_should_equal_validated_task():
+    # Arrange
+    created_at = datetime(2025, 1, 1, 12, 0)
+
+    # Act
+    task = Task.from_trusted(
+        id="task1",
+        task_list_id=TaskListId("list1"),
+        title="Task",
+        description="",
+        status="done",
+        created_at=created_at,
+    )
+
+    # Assert
+    assert task == Task(
+        id=TaskId("task1"),
+        task_list_id=TaskListId("list1"),
+        title=TaskTitle("Task"),
+        description=TaskDescription(""),
+        status=TaskStatus.DONE,
+        created_at=created_at,
+    )
+    assert task.status is TaskStatus.DONE
+
+
+def test_task_from_trusted_should_skip_validation():
+    # Act
+    task = Task.from_trusted(
+        id="task1",
+        task_list_id=TaskListId("list1"),
+        title="",
+        description="",
+        status="todo",
+        created_at=datetime(2025, 1, 1),
+    )
+
+    # Assert
+    assert task.title.value == ""
+    with pytest.raises(ValueError, match="cannot be empty"):
+        task.title.validate()
+
+
+def test_task_should_not_carry_instance_dict():
+    # Act
+    task = Task.create(
+        TaskTitle("Task"),
+        TaskDescription(""),
+        TaskListId("list1"),
+    )
+
+    # Assert
+    assert not hasattr(task, "__dict__")
+    assert not hasattr(task.title, "__dict__")
@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import pytest
+
+from app.domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from app.domain.task_feed import TaskFeedCursor, feed_sort_key
+from app.domain.task_list import TaskListId
+
+
+def create_task(task_id: str, created_at: datetime) -> Task:
+    return Task(
+        id=TaskId(task_id),
+        task_list_id=TaskListId("list1"),
+        title=TaskTitle("Test"),
+        description=TaskDescription(""),
+        status=TaskStatus.TODO,
+        created_at=created_at,
+    )
+
+
+def test_cursor_should_round_trip_through_token():
+    # Arrange
+    task = create_task("task1", datetime(2025, 1, 1, 12, 30))
+    cursor = TaskFeedCursor.after(task)
+
+    # Act
+    decoded = TaskFeedCursor.decode(cursor.encode())
+
+    # Assert
+    assert decoded == cursor
+    assert decoded.task_list_id == TaskListId("list1")
+    assert decoded.sort_key == feed_sort_key(task)
+
+
+@pytest.mark.parametrize(
+    "token",
+    ["not base64!", "bm90IGpzb24", "WzEsMiwzXQ", "WyJhIiwiYiJd"],
+)
+def test_decode_should_reject_invalid_token(token: str):
+    # Act / Assert
+    with pytest.raises(ValueError, match="Invalid pagination token."):
+        TaskFeedCursor.decode(token)
+
+
+def test_feed_sort_key_should_order_by_creation_time_then_id():
+    # Arrange
+    tasks = [
+        create_task("b", datetime(2025, 1, 1)),
+        create_task("c", datetime(2024, 12, 31)),
+        create_task("a", datetime(2025, 1, 1)),
+    ]
+
+    # Act
+    ordered = sorted(tasks, key=feed_sort_key)
+
+    # Assert
+    assert [str(task.id) for task in ordered] == ["c", "a", "b"]
@@ -127,6 +127,20 @@ def test_task_list_add_task_should_increment_count():
     assert task_list.count.value == initial_count + 1
 
 
+def test_task_list_add_tasks_should_raise_error_when_tasks_do_not_fit():
+    # Arrange
+    task_list = TaskList.create(
+        TaskListName("List"),
+        UserId(str(uuid.uuid4())),
+    )
+    task_list.add_tasks(TaskCount.MAX_TASK_COUNT - 1)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task count cannot exceed"):
+        task_list.add_tasks(2)
+    assert task_list.count.value == TaskCount.MAX_TASK_COUNT - 1
+
+
 def test_task_list_delete_task_should_decrement_count():
     # Arrange
     task_list = TaskList.create(
@@ -141,3 +155,60 @@ def test_task_list_delete_task_should_decrement_count():
 
     # Assert
     assert task_list.count.value == initial_count - 1
+
+
+def test_task_list_add_tasks_should_count_them_as_todo():
+    # Arrange
+    task_list = TaskList.create(
+        TaskListName("List"),
+        UserId(str(uuid.uuid4())),
+    )
+
+    # Act
+    task_list.add_tasks(3)
+
+    # Assert
+    assert task_list.todo_count.value == 3
+    assert task_list.done_count.value == 0
+
+
+def test_task_list_delete_task_should_decrement_count_of_its_status():
+    # Arrange
+    task_list = TaskList(
+        id=TaskListId.generate(),
+        user_id=UserId(str(uuid.uuid4())),
+        name=TaskListName("List"),
+        count=TaskCount(2),
+        todo_count=TaskCount(1),
+        done_count=TaskCount(1),
+    )
+
+    # Act
+    task_list.delete_task(done=True)
+
+    # Assert
+    assert task_list.count.value == 1
+    assert task_list.todo_count.value == 1
+    assert task_list.done_count.value == 0
+
+
+def test_task_list_from_trusted_should_equal_validated_task_list():
+    # Act
+    task_list = TaskList.from_trusted(
+        id="list1",
+        user_id="user1",
+        name="List",
+        count=2,
+        todo_count=1,
+        done_count=1,
+    )
+
+    # Assert
+    assert task_list == TaskList(
+        id=TaskListId("list1"),
+        user_id=UserId("user1"),
+        name=TaskListName("List"),
+        count=TaskCount(2),
+        todo_count=TaskCount(1),
+        done_count=TaskCount(1),
+    )
@@ -0,0 +1,178 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.page import Page
+from app.domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from app.domain.task_list import TaskCount, TaskList, TaskListId, TaskListName
+from app.domain.task_list_repository import TaskListRepository
+from app.domain.task_repository import TaskRepository
+from app.domain.user import UserId
+from app.infrastructure.cache.cached_task_list_repository import (
+    CachedTaskListRepository,
+)
+from app.infrastructure.cache.cached_task_repository import (
+    CachedTaskRepository,
+)
+from app.infrastructure.cache.lru import CacheSettings, LRUCache
+
+
+@pytest.fixture
+def mock_repository():
+    return MagicMock(spec=TaskListRepository)
+
+
+@pytest.fixture
+def repository(mock_repository):
+    return CachedTaskListRepository(
+        mock_repository,
+        LRUCache[TaskListId, TaskList](CacheSettings()),
+    )
+
+
+@pytest.fixture
+def task_list():
+    return TaskList(
+        id=TaskListId("list1"),
+        user_id=UserId("user1"),
+        name=TaskListName("List"),
+        count=TaskCount(0),
+    )
+
+
+def test_find_by_id_should_read_through_once(
+    repository, mock_repository, task_list
+):
+    # Arrange
+    mock_repository.find_by_id.return_value = task_list
+
+    # Act
+    first = repository.find_by_id(task_list.id)
+    second = repository.find_by_id(task_list.id)
+
+    # Assert
+    assert first == task_list
+    assert second == task_list
+    mock_repository.find_by_id.assert_called_once_with(task_list.id)
+    assert repository.cache.stats().hits == 1
+
+
+def test_find_should_not_return_task_list_of_other_user(
+    repository, mock_repository, task_list
+):
+    # Arrange
+    repository.cache.put(task_list.id, task_list)
+    mock_repository.find.return_value = None
+
+    # Act
+    found = repository.find(UserId("user2"), task_list.id)
+
+    # Assert
+    assert found is None
+    mock_repository.find.assert_called_once_with(UserId("user2"), task_list.id)
+
+
+def test_find_should_not_cache_missing_task_list(repository, mock_repository):
+    # Arrange
+    mock_repository.find.return_value = None
+
+    # Act
+    repository.find(UserId("user1"), TaskListId("list1"))
+    repository.find(UserId("user1"), TaskListId("list1"))
+
+    # Assert
+    assert mock_repository.find.call_count == 2
+
+
+def test_delete_should_invalidate_cached_task_list(
+    repository, mock_repository, task_list
+):
+    # Arrange
+    repository.cache.put(task_list.id, task_list)
+
+    # Act
+    repository.delete(task_list.id)
+
+    # Assert
+    mock_repository.delete.assert_called_once_with(task_list.id, user_id=None)
+    assert repository.cache.get(task_list.id) is None
+
+
+def test_delete_should_drop_cached_tasks_of_task_list(
+    mock_repository, task_list
+):
+    # Arrange
+    tasks = LRUCache[TaskId, Task](CacheSettings())
+    task_lists = LRUCache[TaskListId, TaskList](CacheSettings())
+    mock_task_repository = MagicMock(spec=TaskRepository)
+    mock_task_repository.find.return_value = None
+    task_repository = CachedTaskRepository(
+        mock_task_repository, tasks, task_list_cache=task_lists
+    )
+    repository = CachedTaskListRepository(
+        mock_repository, task_lists, task_cache=tasks
+    )
+    for task_id, task_list_id in [("task1", "list1"), ("task2", "list2")]:
+        tasks.put(
+            TaskId(task_id),
+            Task(
+                id=TaskId(task_id),
+                task_list_id=TaskListId(task_list_id),
+                title=TaskTitle("Task"),
+                description=TaskDescription(""),
+                status=TaskStatus.TODO,
+                created_at=datetime(2025, 1, 1),
+            ),
+        )
+
+    # Act
+    repository.delete(task_list.id)
+    deleted = task_repository.find(task_list.id, TaskId("task1"))
+
+    # Assert
+    assert deleted is None
+    mock_task_repository.find.assert_called_once_with(
+        task_list.id, TaskId("task1")
+    )
+    assert tasks.get(TaskId("task2")) is not None
+
+
+def test_update_name_should_cache_renamed_task_list(
+    repository, mock_repository, task_list
+):
+    # Arrange
+    renamed = TaskList(
+        id=task_list.id,
+        user_id=task_list.user_id,
+        name=TaskListName("Renamed"),
+        count=task_list.count,
+    )
+    repository.cache.put(task_list.id, task_list)
+    mock_repository.update_name.return_value = renamed
+
+    # Act
+    repository.update_name(
+        task_list.user_id,
+        task_list.id,
+        TaskListName("Renamed"),
+    )
+
+    # Assert
+    assert repository.find_by_id(task_list.id) == renamed
+    mock_repository.find_by_id.assert_not_called()
+
+
+def test_list_all_should_not_cache_task_lists_read_from_index(
+    repository, mock_repository, task_list
+):
+    # Arrange
+    mock_repository.list_all.return_value = Page(items=[task_list])
+    mock_repository.find_by_id.return_value = task_list
+
+    # Act
+    repository.list_all(task_list.user_id, limit=10)
+    repository.find_by_id(task_list.id)
+
+    # Assert
+    mock_repository.find_by_id.assert_called_once_with(task_list.id)
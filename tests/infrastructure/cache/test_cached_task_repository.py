@@ -0,0 +1,205 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.page import Page
+from app.domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from app.domain.task_list import TaskCount, TaskList, TaskListId, TaskListName
+from app.domain.task_repository import TaskRepository
+from app.domain.user import UserId
+from app.infrastructure.cache.cached_task_repository import (
+    CachedTaskRepository,
+)
+from app.infrastructure.cache.lru import CacheSettings, LRUCache
+
+
+@pytest.fixture
+def mock_repository():
+    return MagicMock(spec=TaskRepository)
+
+
+@pytest.fixture
+def task_list_cache():
+    return LRUCache[TaskListId, TaskList](CacheSettings())
+
+
+@pytest.fixture
+def repository(mock_repository, task_list_cache):
+    return CachedTaskRepository(
+        mock_repository,
+        LRUCache[TaskId, Task](CacheSettings()),
+        task_list_cache=task_list_cache,
+    )
+
+
+@pytest.fixture
+def task():
+    return Task(
+        id=TaskId("task1"),
+        task_list_id=TaskListId("list1"),
+        title=TaskTitle("Task"),
+        description=TaskDescription(""),
+        status=TaskStatus.TODO,
+        created_at=datetime(2025, 1, 1),
+    )
+
+
+def test_find_should_read_through_once(repository, mock_repository, task):
+    # Arrange
+    mock_repository.find.return_value = task
+
+    # Act
+    repository.find(task.task_list_id, task.id)
+    found = repository.find(task.task_list_id, task.id)
+
+    # Assert
+    assert found == task
+    mock_repository.find.assert_called_once_with(task.task_list_id, task.id)
+
+
+def test_find_should_miss_for_other_task_list(
+    repository, mock_repository, task
+):
+    # Arrange
+    repository.cache.put(task.id, task)
+    mock_repository.find.return_value = None
+
+    # Act
+    found = repository.find(TaskListId("list2"), task.id)
+
+    # Assert
+    assert found is None
+
+
+def test_list_all_should_not_cache_tasks_read_from_index(
+    repository, mock_repository, task
+):
+    # Arrange
+    mock_repository.list_all.return_value = Page(items=[task])
+    mock_repository.find.return_value = task
+
+    # Act
+    repository.list_all(task.task_list_id)
+    repository.find(task.task_list_id, task.id)
+
+    # Assert
+    mock_repository.find.assert_called_once_with(task.task_list_id, task.id)
+    assert repository.cache.stats().size == 1
+
+
+def test_find_by_id_should_serve_cached_task_without_caching_index_reads(
+    repository, mock_repository, task
+):
+    # Arrange
+    mock_repository.find_by_id.return_value = task
+
+    # Act
+    repository.find_by_id(task.id)
+    repository.find_by_id(task.id)
+    repository.cache.put(task.id, task)
+    cached = repository.find_by_id(task.id)
+
+    # Assert
+    assert cached == task
+    assert mock_repository.find_by_id.call_count == 2
+
+
+def test_remove_task_from_list_should_invalidate_task_and_task_list(
+    repository, mock_repository, task_list_cache, task
+):
+    # Arrange
+    repository.cache.put(task.id, task)
+    task_list_cache.put(
+        task.task_list_id,
+        TaskList(
+            id=task.task_list_id,
+            user_id=UserId("user1"),
+            name=TaskListName("List"),
+            count=TaskCount(1),
+        ),
+    )
+
+    # Act
+    repository.remove_task_from_list(
+        UserId("user1"),
+        task.task_list_id,
+        task.id,
+    )
+
+    # Assert
+    assert repository.cache.get(task.id) is None
+    assert task_list_cache.get(task.task_list_id) is None
+
+
+def test_add_task_to_list_should_invalidate_task_list_on_error(
+    repository, mock_repository, task_list_cache, task
+):
+    # Arrange
+    task_list_cache.put(
+        task.task_list_id,
+        TaskList(
+            id=task.task_list_id,
+            user_id=UserId("user1"),
+            name=TaskListName("List"),
+            count=TaskCount(TaskCount.MAX_TASK_COUNT),
+        ),
+    )
+    mock_repository.add_task_to_list.side_effect = ValueError("full")
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="full"):
+        repository.add_task_to_list(UserId("user1"), task)
+    assert task_list_cache.get(task.task_list_id) is None
+
+
+def test_add_tasks_to_list_should_invalidate_task_list(
+    repository, mock_repository, task_list_cache, task
+):
+    # Arrange
+    task_list_cache.put(
+        task.task_list_id,
+        TaskList(
+            id=task.task_list_id,
+            user_id=UserId("user1"),
+            name=TaskListName("List"),
+            count=TaskCount(0),
+        ),
+    )
+
+    # Act
+    repository.add_tasks_to_list(UserId("user1"), task.task_list_id, [task])
+
+    # Assert
+    assert task_list_cache.get(task.task_list_id) is None
+    mock_repository.add_tasks_to_list.assert_called_once_with(
+        UserId("user1"), task.task_list_id, [task]
+    )
+
+
+def test_update_should_cache_updated_task(repository, mock_repository, task):
+    # Arrange
+    mock_repository.update.return_value = task
+
+    # Act
+    repository.update(task.task_list_id, task.id, status=TaskStatus.DONE)
+
+    # Assert
+    assert repository.find_by_id(task.id) == task
+    mock_repository.find_by_id.assert_not_called()
+
+
+def test_find_many_should_read_only_cache_misses(
+    repository, mock_repository, task
+):
+    # Arrange
+    repository.cache.put(task.id, task)
+    missing = (TaskListId("list1"), TaskId("task2"))
+    mock_repository.find_many.return_value = [None]
+
+    # Act
+    tasks = repository.find_many([(task.task_list_id, task.id), missing])
+
+    # Assert
+    assert tasks == [task, None]
+    mock_repository.find_many.assert_called_once_with([missing])
@@ -0,0 +1,101 @@
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from app.domain.page import Page
+from app.domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from app.domain.task_list import TaskCount, TaskList, TaskListId, TaskListName
+from app.domain.user import UserId
+from app.infrastructure.cache.codec import (
+    decode_task_list_page,
+    decode_task_page,
+    encode_task_list_page,
+    encode_task_page,
+)
+
+
+@pytest.fixture
+def task_factory():
+    def create_task(created_at: datetime):
+        return Task(
+            id=TaskId("4e256d59-d0d7-49f1-9520-dff1026a43af"),
+            task_list_id=TaskListId("cb8404e9-3ae1-441b-a1ce-f1fb94215046"),
+            title=TaskTitle("Write the report ✍"),
+            description=TaskDescription("Due on Friday"),
+            status=TaskStatus.DONE,
+            created_at=created_at,
+        )
+
+    return create_task
+
+
+@pytest.mark.parametrize(
+    "created_at",
+    [
+        datetime(2025, 1, 1, 12, 30, 15, 123456),
+        datetime(1960, 1, 1),
+        datetime(2025, 1, 1, tzinfo=UTC),
+    ],
+)
+def test_task_page_should_round_trip(task_factory, created_at):
+    # Arrange
+    page = Page(items=[task_factory(created_at)], next_token="token")
+
+    # Act
+    decoded = decode_task_page(encode_task_page(page))
+
+    # Assert
+    assert decoded == page
+
+
+def test_task_page_should_be_smaller_than_json(task_factory):
+    # Arrange
+    task = task_factory(datetime(2025, 1, 1, 12, 30, 15, 123456))
+    page = Page(items=[task] * 10)
+    as_json = json.dumps(
+        [
+            {
+                "id": str(task.id),
+                "task_list_id": str(task.task_list_id),
+                "title": str(task.title),
+                "description": str(task.description),
+                "status": str(task.status),
+                "created_at": task.created_at.isoformat(),
+            }
+            for task in page.items
+        ]
+    ).encode()
+
+    # Act
+    encoded = encode_task_page(page)
+
+    # Assert
+    assert len(encoded) < len(as_json) * 0.8
+
+
+def test_task_list_page_should_round_trip():
+    # Arrange
+    page = Page(
+        items=[
+            TaskList(
+                id=TaskListId("list1"),
+                user_id=UserId("user1"),
+                name=TaskListName("List"),
+                count=TaskCount(100),
+            )
+        ]
+    )
+
+    # Act
+    decoded = decode_task_list_page(encode_task_list_page(page))
+
+    # Assert
+    assert decoded == page
+
+
+@pytest.mark.parametrize("data", [b"", b"\x04\x00\x00", b"\x03\x05"])
+def test_decode_task_page_should_reject_malformed_data(data):
+    # Act & Assert
+    with pytest.raises(ValueError, match="encoded page|encoding version"):
+        decode_task_page(data)
@@ -0,0 +1,126 @@
+from app.domain.task_list import TaskCount, TaskList, TaskListId, TaskListName
+from app.domain.user import UserId
+from app.infrastructure.cache.lru import CacheSettings, LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_should_count_hits_and_misses():
+    # Arrange
+    cache = LRUCache[str, int](CacheSettings(max_size=2, ttl=10))
+    cache.put("a", 1)
+
+    # Act
+    hit = cache.get("a")
+    miss = cache.get("b")
+
+    # Assert
+    assert hit == 1
+    assert miss is None
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+
+
+def test_put_should_evict_least_recently_used_entry():
+    # Arrange
+    cache = LRUCache[str, int](CacheSettings(max_size=2, ttl=10))
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+
+    # Act
+    cache.put("c", 3)
+
+    # Assert
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+    assert cache.stats().size == 2
+
+
+def test_get_should_expire_entries_after_ttl():
+    # Arrange
+    clock = FakeClock()
+    cache = LRUCache[str, int](CacheSettings(max_size=2, ttl=5), clock=clock)
+    cache.put("a", 1)
+
+    # Act
+    clock.now = 5.0
+    value = cache.get("a")
+
+    # Assert
+    assert value is None
+    assert cache.stats().size == 0
+
+
+def test_put_should_not_store_when_disabled():
+    # Arrange
+    cache = LRUCache[str, int](CacheSettings(max_size=0))
+
+    # Act
+    cache.put("a", 1)
+
+    # Assert
+    assert cache.get("a") is None
+
+
+def test_invalidate_where_should_drop_matching_entries():
+    # Arrange
+    cache = LRUCache[str, int](CacheSettings())
+    for key, value in [("a", 1), ("b", 2), ("c", 3)]:
+        cache.put(key, value)
+
+    # Act
+    cache.invalidate_where(lambda value: value % 2 == 1)
+
+    # Assert
+    assert [cache.get(key) for key in "abc"] == [None, 2, None]
+
+
+def test_get_should_return_copy_of_cached_entity():
+    # Arrange
+    cache = LRUCache[TaskListId, TaskList](CacheSettings())
+    task_list = TaskList(
+        id=TaskListId("list1"),
+        user_id=UserId("user1"),
+        name=TaskListName("List"),
+        count=TaskCount(0),
+    )
+    cache.put(task_list.id, task_list)
+
+    # Act
+    cache.get(task_list.id).add_task()
+
+    # Assert
+    assert cache.get(task_list.id).count == TaskCount(0)
+
+
+def test_cache_settings_from_env_should_read_prefixed_variables(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("TASK_CACHE_MAX_SIZE", "7")
+    monkeypatch.setenv("TASK_CACHE_TTL", "1.5")
+
+    # Act
+    settings = CacheSettings.from_env("TASK")
+
+    # Assert
+    assert settings == CacheSettings(max_size=7, ttl=1.5)
+
+
+def test_cache_settings_from_env_should_fall_back_to_default(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("RENDER_CACHE_MAX_SIZE", "7")
+    monkeypatch.delenv("RENDER_CACHE_TTL", raising=False)
+
+    # Act
+    settings = CacheSettings.from_env("RENDER", CacheSettings(10, 300.0))
+
+    # Assert
+    assert settings == CacheSettings(max_size=7, ttl=300.0)
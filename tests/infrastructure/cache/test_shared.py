@@ -0,0 +1,179 @@
+import socketserver
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.infrastructure.cache.shared import (
+    CollectionCache,
+    InMemorySharedCache,
+    RedisSharedCache,
+    SharedCache,
+    SharedCacheError,
+    SharedCacheSettings,
+)
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    """Serve GET and SET from a dict, as a Redis server would."""
+
+    def handle(self):
+        data = self.server.data
+        while line := self.rfile.readline():
+            args = []
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(length + 2)[:-2])
+
+            command = args[0].upper()
+            if command == b"GET":
+                value = data.get(args[1])
+                reply = (
+                    b"$-1\r\n"
+                    if value is None
+                    else b"$%d\r\n%s\r\n" % (len(value), value)
+                )
+            elif command == b"SET":
+                data[args[1]] = args[2]
+                reply = b"+OK\r\n"
+            else:
+                reply = b"-ERR unknown command\r\n"
+            self.wfile.write(reply)
+
+
+@pytest.fixture
+def redis_url():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeRedisHandler)
+    server.data = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"redis://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_redis_shared_cache_should_speak_resp(redis_url):
+    # Arrange
+    cache = RedisSharedCache.from_url(redis_url)
+
+    # Act
+    missing = cache.get("key")
+    cache.set("key", b"\x00\x01binary", ttl=60)
+    value = cache.get("key")
+    cache.close()
+
+    # Assert
+    assert missing is None
+    assert value == b"\x00\x01binary"
+
+
+def test_redis_shared_cache_should_raise_on_error_reply(redis_url):
+    # Arrange
+    cache = RedisSharedCache.from_url(redis_url)
+
+    # Act & Assert
+    with pytest.raises(SharedCacheError, match="unknown command"):
+        cache._command(b"PING")
+    assert cache.get("key") is None
+
+
+def test_redis_shared_cache_should_raise_when_unreachable():
+    # Arrange
+    cache = RedisSharedCache("127.0.0.1", port=1, timeout=0.1)
+
+    # Act & Assert
+    with pytest.raises(SharedCacheError):
+        cache.get("key")
+
+
+def test_collection_cache_should_change_key_on_invalidate():
+    # Arrange
+    clock = MagicMock(return_value=1000.0)
+    collections = CollectionCache(InMemorySharedCache(), ttl=60, clock=clock)
+    key = collections.key("user:1:task_lists", 50, None)
+    collections.put(key, b"page")
+
+    # Act
+    collections.invalidate("user:1:task_lists")
+    clock.return_value += 1
+    new_key = collections.key("user:1:task_lists", 50, None)
+
+    # Assert
+    assert collections.get(key) == b"page"
+    assert new_key is not None
+    assert new_key != key
+    assert collections.get(new_key) is None
+
+
+def test_collection_cache_should_not_cache_until_indexes_settle():
+    # Arrange
+    clock = MagicMock(return_value=1000.0)
+    collections = CollectionCache(
+        InMemorySharedCache(),
+        ttl=60,
+        settle=1.0,
+        clock=clock,
+    )
+    collections.invalidate("user:1:task_lists")
+
+    # Act
+    clock.return_value += 0.5
+    settling = collections.key("user:1:task_lists")
+    clock.return_value += 0.5
+    settled = collections.key("user:1:task_lists")
+
+    # Assert
+    assert settling is None
+    assert settled is not None
+
+
+def test_collection_cache_should_fail_open():
+    # Arrange
+    collections = CollectionCache(
+        RedisSharedCache("127.0.0.1", port=1, timeout=0.1),
+        ttl=60,
+    )
+
+    # Act
+    key = collections.key("user:1:task_lists")
+
+    # Assert
+    assert key is None
+
+
+def test_collection_cache_should_bypass_cache_after_failed_invalidation():
+    # Arrange
+    cache = MagicMock(spec=SharedCache)
+    cache.get.return_value = None
+    cache.set.side_effect = SharedCacheError("timeout")
+    clock = MagicMock(return_value=1000.0)
+    collections = CollectionCache(cache, ttl=60, clock=clock)
+    collections.invalidate("user:1:task_lists")
+    cache.set.side_effect = None
+
+    # Act
+    clock.return_value += 59
+    bypassed = collections.key("user:2:task_lists")
+    clock.return_value += 1
+    resumed = collections.key("user:2:task_lists")
+
+    # Assert
+    assert bypassed is None
+    assert resumed is not None
+    cache.get.assert_called_once_with("gen:user:2:task_lists")
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        (None, type(None)),
+        ("memory://", InMemorySharedCache),
+        ("redis://localhost:6379/1", RedisSharedCache),
+    ],
+)
+def test_shared_cache_settings_should_create_cache_for_url(url, expected):
+    # Act
+    cache = SharedCacheSettings(url=url).create_cache()
+
+    # Assert
+    assert isinstance(cache, expected)
@@ -0,0 +1,112 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.page import Page
+from app.domain.task_list import TaskCount, TaskList, TaskListId, TaskListName
+from app.domain.task_list_repository import TaskListRepository
+from app.domain.user import UserId
+from app.infrastructure.cache.shared import (
+    CollectionCache,
+    InMemorySharedCache,
+)
+from app.infrastructure.cache.shared_task_list_repository import (
+    SharedCachedTaskListRepository,
+)
+
+
+@pytest.fixture
+def mock_repository():
+    return MagicMock(spec=TaskListRepository)
+
+
+@pytest.fixture
+def repository(mock_repository):
+    return SharedCachedTaskListRepository(
+        mock_repository,
+        CollectionCache(InMemorySharedCache(), ttl=60),
+    )
+
+
+@pytest.fixture
+def task_list():
+    return TaskList(
+        id=TaskListId("list1"),
+        user_id=UserId("user1"),
+        name=TaskListName("List"),
+        count=TaskCount(0),
+    )
+
+
+def test_list_all_should_cache_each_page_separately(
+    repository, mock_repository, task_list
+):
+    # Arrange
+    mock_repository.list_all.return_value = Page(
+        items=[task_list],
+        next_token="token",
+    )
+
+    # Act
+    repository.list_all(task_list.user_id, limit=1)
+    repository.list_all(task_list.user_id, limit=1)
+    repository.list_all(task_list.user_id, limit=1, next_token="token")
+
+    # Assert
+    assert mock_repository.list_all.call_count == 2
+
+
+def test_delete_should_invalidate_pages_of_owner(
+    repository, mock_repository, task_list
+):
+    # Arrange
+    mock_repository.list_all.return_value = Page(items=[task_list])
+    mock_repository.find_by_id.return_value = task_list
+    repository.list_all(task_list.user_id)
+
+    # Act
+    repository.delete(task_list.id)
+    repository.list_all(task_list.user_id)
+
+    # Assert
+    mock_repository.delete.assert_called_once_with(
+        task_list.id,
+        user_id=task_list.user_id,
+    )
+    assert mock_repository.list_all.call_count == 2
+
+
+def test_delete_should_invalidate_pages_of_owner_when_cascade_fails(
+    repository, mock_repository, task_list
+):
+    # Arrange
+    mock_repository.list_all.return_value = Page(items=[task_list])
+    mock_repository.delete.side_effect = RuntimeError("partial")
+    repository.list_all(task_list.user_id)
+
+    # Act
+    with pytest.raises(RuntimeError, match="partial"):
+        repository.delete(task_list.id, user_id=task_list.user_id)
+    repository.list_all(task_list.user_id)
+
+    # Assert
+    assert mock_repository.list_all.call_count == 2
+
+
+def test_update_name_should_invalidate_pages_of_user(
+    repository, mock_repository, task_list
+):
+    # Arrange
+    mock_repository.list_all.return_value = Page(items=[task_list])
+    repository.list_all(task_list.user_id)
+
+    # Act
+    repository.update_name(
+        task_list.user_id,
+        task_list.id,
+        TaskListName("Renamed"),
+    )
+    repository.list_all(task_list.user_id)
+
+    # Assert
+    assert mock_repository.list_all.call_count == 2
@@ -0,0 +1,124 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.page import Page
+from app.domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from app.domain.task_list import TaskListId
+from app.domain.task_repository import TaskRepository
+from app.domain.user import UserId
+from app.infrastructure.cache.shared import (
+    CollectionCache,
+    InMemorySharedCache,
+)
+from app.infrastructure.cache.shared_task_repository import (
+    SharedCachedTaskRepository,
+)
+
+
+@pytest.fixture
+def mock_repository():
+    return MagicMock(spec=TaskRepository)
+
+
+@pytest.fixture
+def collections():
+    return CollectionCache(InMemorySharedCache(), ttl=60)
+
+
+@pytest.fixture
+def task():
+    return Task(
+        id=TaskId("task1"),
+        task_list_id=TaskListId("list1"),
+        title=TaskTitle("Task"),
+        description=TaskDescription(""),
+        status=TaskStatus.TODO,
+        created_at=datetime(2025, 1, 1),
+    )
+
+
+def test_list_all_should_be_shared_between_repositories(
+    mock_repository, collections, task
+):
+    # Arrange
+    mock_repository.list_all.return_value = Page(items=[task])
+    first = SharedCachedTaskRepository(mock_repository, collections)
+    second = SharedCachedTaskRepository(MagicMock(), collections)
+
+    # Act
+    first.list_all(task.task_list_id, limit=10)
+    page = second.list_all(task.task_list_id, limit=10)
+
+    # Assert
+    assert page == Page(items=[task])
+    mock_repository.list_all.assert_called_once()
+
+
+def test_add_task_to_list_should_invalidate_task_pages(
+    mock_repository, collections, task
+):
+    # Arrange
+    mock_repository.list_all.return_value = Page(items=[])
+    repository = SharedCachedTaskRepository(mock_repository, collections)
+    repository.list_all(task.task_list_id)
+
+    # Act
+    repository.add_task_to_list(UserId("user1"), task)
+    repository.list_all(task.task_list_id)
+
+    # Assert
+    assert mock_repository.list_all.call_count == 2
+
+
+def test_add_tasks_to_list_should_invalidate_task_pages(
+    mock_repository, collections, task
+):
+    # Arrange
+    mock_repository.list_all.return_value = Page(items=[])
+    repository = SharedCachedTaskRepository(mock_repository, collections)
+    repository.list_all(task.task_list_id)
+
+    # Act
+    repository.add_tasks_to_list(UserId("user1"), task.task_list_id, [task])
+    repository.list_all(task.task_list_id)
+
+    # Assert
+    assert mock_repository.list_all.call_count == 2
+
+
+def test_add_tasks_to_list_should_invalidate_task_pages_when_write_fails(
+    mock_repository, collections, task
+):
+    # Arrange
+    mock_repository.list_all.return_value = Page(items=[])
+    mock_repository.add_tasks_to_list.side_effect = RuntimeError("partial")
+    repository = SharedCachedTaskRepository(mock_repository, collections)
+    repository.list_all(task.task_list_id)
+
+    # Act
+    with pytest.raises(RuntimeError, match="partial"):
+        repository.add_tasks_to_list(UserId("user1"), task.task_list_id, [task])
+    repository.list_all(task.task_list_id)
+
+    # Assert
+    assert mock_repository.list_all.call_count == 2
+
+
+def test_add_task_to_list_should_not_invalidate_when_write_fails(
+    mock_repository, collections, task
+):
+    # Arrange
+    mock_repository.list_all.return_value = Page(items=[])
+    mock_repository.add_task_to_list.side_effect = ValueError("full")
+    repository = SharedCachedTaskRepository(mock_repository, collections)
+    repository.list_all(task.task_list_id)
+
+    # Act
+    with pytest.raises(ValueError, match="full"):
+        repository.add_task_to_list(UserId("user1"), task)
+    repository.list_all(task.task_list_id)
+
+    # Assert
+    mock_repository.list_all.assert_called_once()
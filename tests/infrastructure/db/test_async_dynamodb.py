@@ -0,0 +1,138 @@
+import json
+
+import boto3
+import httpx
+import pytest
+from botocore.credentials import Credentials
+from botocore.exceptions import ClientError
+
+from app.infrastructure.db.async_dynamodb import AsyncDynamoDBClient, AsyncTable
+
+ENDPOINT_URL = "http://dynamodb.test/"
+
+
+@pytest.fixture
+def client_factory():
+    def create_client(handler, max_attempts: int = 3):
+        return AsyncDynamoDBClient(
+            http=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            credentials=Credentials("DUMMY", "DUMMY"),
+            region_name="ap-northeast-1",
+            endpoint_url=ENDPOINT_URL,
+            max_attempts=max_attempts,
+        )
+
+    return create_client
+
+
+@pytest.fixture
+def service_model():
+    client = boto3.client(
+        "dynamodb",
+        region_name="ap-northeast-1",
+        aws_access_key_id="DUMMY",
+        aws_secret_access_key="DUMMY",
+    )
+    return client.meta.service_model
+
+
+@pytest.mark.asyncio
+async def test_call_should_send_signed_json_request(client_factory):
+    # Arrange
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"Item": {"PK": {"S": "a"}}})
+
+    client = client_factory(handler)
+
+    # Act
+    result = await client.call("GetItem", {"TableName": "table"})
+
+    # Assert
+    assert result == {"Item": {"PK": {"S": "a"}}}
+    assert requests[0].headers["X-Amz-Target"] == "DynamoDB_20120810.GetItem"
+    assert requests[0].headers["Authorization"].startswith("AWS4-HMAC-SHA256")
+    assert json.loads(requests[0].content) == {"TableName": "table"}
+
+
+@pytest.mark.asyncio
+async def test_call_should_retry_throttled_requests(client_factory):
+    # Arrange
+    responses = [
+        httpx.Response(
+            400,
+            json={
+                "__type": "com.amazonaws.dynamodb.v20120810#"
+                "ThrottlingException",
+                "message": "Rate exceeded",
+            },
+        ),
+        httpx.Response(200, json={}),
+    ]
+    client = client_factory(lambda request: responses.pop(0))
+
+    # Act
+    result = await client.call("GetItem", {"TableName": "table"})
+
+    # Assert
+    assert result == {}
+    assert responses == []
+
+
+@pytest.mark.asyncio
+async def test_call_should_raise_client_error_with_cancellation_reasons(
+    client_factory,
+):
+    # Arrange
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            400,
+            json={
+                "__type": "com.amazonaws.dynamodb.v20120810#"
+                "TransactionCanceledException",
+                "message": "Transaction cancelled",
+                "CancellationReasons": [
+                    {"Code": "ConditionalCheckFailed"},
+                    {"Code": "None"},
+                ],
+            },
+        )
+
+    client = client_factory(handler)
+
+    # Act & Assert
+    with pytest.raises(ClientError) as exc_info:
+        await client.call("TransactWriteItems", {"TransactItems": []})
+    error = exc_info.value.response
+    assert error["Error"]["Code"] == "TransactionCanceledException"
+    assert error["CancellationReasons"][0]["Code"] == "ConditionalCheckFailed"
+
+
+@pytest.mark.asyncio
+async def test_table_should_convert_plain_values(
+    client_factory,
+    service_model,
+):
+    # Arrange
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            json={"Item": {"PK": {"S": "a"}, "count": {"N": "3"}}},
+        )
+
+    table = AsyncTable(client_factory(handler), "table", service_model)
+
+    # Act
+    result = await table.get_item(Key={"PK": "a", "SK": "b"})
+
+    # Assert
+    assert bodies[0] == {
+        "TableName": "table",
+        "Key": {"PK": {"S": "a"}, "SK": {"S": "b"}},
+    }
+    assert result["Item"] == {"PK": "a", "count": 3}
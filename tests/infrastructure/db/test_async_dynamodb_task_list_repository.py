@@ -0,0 +1,181 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.domain.task_list import TaskListId, TaskListName
+from app.domain.user import UserId
+from app.infrastructure.db.async_dynamodb_task_list_repository import (
+    AsyncDynamoDBTaskListRepository,
+)
+
+
+@pytest.fixture
+def mock_table():
+    return AsyncMock()
+
+
+@pytest.fixture
+def task_list_item_factory():
+    def create_task_list_item(user_id: str, task_list_id: str):
+        return {
+            "PK": f"TASK_LIST#{task_list_id}",
+            "SK": "#METADATA",
+            "task_list_id": task_list_id,
+            "user_id": user_id,
+            "name": "List",
+            "count": 0,
+        }
+
+    return create_task_list_item
+
+
+@pytest.mark.asyncio
+async def test_find_should_get_item_by_key_with_consistent_read(
+    mock_table, task_list_item_factory
+):
+    # Arrange
+    mock_table.get_item.return_value = {
+        "Item": task_list_item_factory("user1", "list1")
+    }
+    repository = AsyncDynamoDBTaskListRepository(mock_table)
+
+    # Act
+    task_list = await repository.find(UserId("user1"), TaskListId("list1"))
+
+    # Assert
+    assert task_list is not None
+    assert task_list.id == TaskListId("list1")
+    mock_table.get_item.assert_awaited_once_with(
+        Key={"PK": "TASK_LIST#list1", "SK": "#METADATA"},
+        ConsistentRead=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_name_should_return_updated_task_list(
+    mock_table, task_list_item_factory
+):
+    # Arrange
+    item = task_list_item_factory("user1", "list1") | {"name": "Renamed"}
+    mock_table.update_item.return_value = {"Attributes": item}
+    repository = AsyncDynamoDBTaskListRepository(mock_table)
+
+    # Act
+    task_list = await repository.update_name(
+        UserId("user1"),
+        TaskListId("list1"),
+        TaskListName("Renamed"),
+    )
+
+    # Assert
+    assert task_list is not None
+    assert task_list.name == TaskListName("Renamed")
+
+
+@pytest.mark.asyncio
+async def test_update_name_should_move_legacy_task_list_when_missing(
+    mock_table, task_list_item_factory
+):
+    # Arrange
+    item = task_list_item_factory("user1", "list1")
+    mock_table.update_item.side_effect = [
+        ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException"}},
+            "UpdateItem",
+        ),
+        {"Attributes": item | {"name": "Renamed"}},
+    ]
+    mock_table.get_item.return_value = {
+        "Item": item | {"PK": "USER#user1", "SK": "TASK_LIST#list1"}
+    }
+    repository = AsyncDynamoDBTaskListRepository(
+        mock_table, legacy_task_lists=True
+    )
+
+    # Act
+    task_list = await repository.update_name(
+        UserId("user1"),
+        TaskListId("list1"),
+        TaskListName("Renamed"),
+    )
+
+    # Assert
+    assert task_list is not None
+    assert task_list.name == TaskListName("Renamed")
+    mock_table.transact_write_items.assert_awaited_once()
+    assert mock_table.update_item.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_list_all_should_return_page_with_next_token(
+    mock_table, task_list_item_factory
+):
+    # Arrange
+    mock_table.wire.query.return_value = {
+        "Items": [
+            {
+                "PK": {"S": "TASK_LIST#list1"},
+                "SK": {"S": "#METADATA"},
+                "user_id": {"S": "user1"},
+                "name": {"S": "List"},
+                "count": {"N": "0"},
+                "fmt": {"N": "2"},
+            }
+        ],
+        "LastEvaluatedKey": {
+            "PK": "TASK_LIST#list1",
+            "SK": "#METADATA",
+            "GSI1PK": "USER#user1",
+            "GSI1SK": "TASK_LIST#list1",
+        },
+    }
+    repository = AsyncDynamoDBTaskListRepository(mock_table)
+
+    # Act
+    page = await repository.list_all(UserId("user1"), limit=1)
+
+    # Assert
+    assert [task_list.id for task_list in page.items] == [TaskListId("list1")]
+    assert page.next_token is not None
+    mock_table.query.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_should_delete_task_list_and_its_tasks(mock_table):
+    # Arrange
+    mock_table.name = "test-table"
+    mock_table.query.return_value = {
+        "Items": [{"PK": "TASK_LIST#list1", "SK": "TASK#task1"}]
+    }
+    mock_table.batch_write_item.return_value = {}
+    repository = AsyncDynamoDBTaskListRepository(mock_table)
+
+    # Act
+    await repository.delete(TaskListId("list1"), user_id=UserId("user1"))
+
+    # Assert
+    mock_table.delete_item.assert_awaited_once_with(
+        Key={"PK": "TASK_LIST#list1", "SK": "#METADATA"},
+        ConditionExpression="attribute_exists(PK) AND #user_id = :user_id",
+        ExpressionAttributeNames={"#user_id": "user_id"},
+        ExpressionAttributeValues={":user_id": "user1"},
+    )
+    mock_table.batch_write_item.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_find_with_tasks_should_return_none_when_first_item_is_a_task(
+    mock_table,
+):
+    # Arrange
+    mock_table.wire.query.return_value = {
+        "Items": [{"PK": {"S": "TASK_LIST#list1"}, "SK": {"S": "TASK#task1"}}]
+    }
+    repository = AsyncDynamoDBTaskListRepository(mock_table)
+
+    # Act
+    result = await repository.find_with_tasks(TaskListId("list1"))
+
+    # Assert
+    assert result is None
@@ -0,0 +1,313 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from boto3.dynamodb.types import TypeSerializer
+from botocore.exceptions import ClientError
+
+from app.domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from app.domain.task_feed import TaskFeedCursor
+from app.domain.task_list import TaskListId, TaskSortOrder
+from app.domain.user import UserId
+from app.infrastructure.db.async_dynamodb_task_repository import (
+    AsyncDynamoDBTaskRepository,
+)
+
+
+@pytest.fixture
+def mock_table():
+    table = AsyncMock()
+    table.name = "test-table"
+    return table
+
+
+@pytest.fixture
+def task_item_factory():
+    def create_task_item(task_list_id: str, task_id: str):
+        return {
+            "PK": f"TASK_LIST#{task_list_id}",
+            "SK": f"TASK#{task_id}",
+            "task_list_id": task_list_id,
+            "task_id": task_id,
+            "title": "Task",
+            "description": "",
+            "status": "todo",
+            "created_at": "2025-01-01T00:00:00",
+        }
+
+    return create_task_item
+
+
+@pytest.fixture
+def task_wire_item_factory(task_item_factory):
+    serializer = TypeSerializer()
+
+    def create_task_wire_item(task_list_id: str, task_id: str):
+        item = task_item_factory(task_list_id, task_id)
+        return {name: serializer.serialize(v) for name, v in item.items()}
+
+    return create_task_wire_item
+
+
+@pytest.mark.asyncio
+async def test_find_should_get_item_by_key_with_consistent_read(
+    mock_table, task_item_factory
+):
+    # Arrange
+    mock_table.get_item.return_value = {
+        "Item": task_item_factory("list1", "task1")
+    }
+    repository = AsyncDynamoDBTaskRepository(mock_table)
+
+    # Act
+    task = await repository.find(TaskListId("list1"), TaskId("task1"))
+
+    # Assert
+    assert task is not None
+    assert task.id == TaskId("task1")
+    mock_table.get_item.assert_awaited_once_with(
+        Key={"PK": "TASK_LIST#list1", "SK": "TASK#task1"},
+        ConsistentRead=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_task_to_list_should_raise_error_when_list_is_missing(
+    mock_table,
+):
+    # Arrange
+    mock_table.transact_write_items.side_effect = ClientError(
+        {
+            "Error": {"Code": "TransactionCanceledException"},
+            "CancellationReasons": [
+                {"Code": "None"},
+                {"Code": "ConditionalCheckFailed"},
+            ],
+        },
+        "TransactWriteItems",
+    )
+    repository = AsyncDynamoDBTaskRepository(mock_table)
+    task = Task.create(
+        TaskTitle("Task"),
+        TaskDescription(""),
+        TaskListId("list1"),
+    )
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task list not found."):
+        await repository.add_task_to_list(UserId("user1"), task)
+
+
+@pytest.mark.asyncio
+async def test_add_tasks_to_list_should_reserve_count_and_batch_put_tasks(
+    mock_table,
+):
+    # Arrange
+    mock_table.batch_write_item.return_value = {}
+    repository = AsyncDynamoDBTaskRepository(mock_table)
+    tasks = [
+        Task.create(
+            TaskTitle(f"Task {i}"), TaskDescription(""), TaskListId("l")
+        )
+        for i in range(2)
+    ]
+
+    # Act
+    await repository.add_tasks_to_list(UserId("user1"), TaskListId("l"), tasks)
+
+    # Assert
+    update = mock_table.update_item.call_args.kwargs
+    assert update["ExpressionAttributeValues"] == {
+        ":count": 2,
+        ":todo_count": 2,
+        ":limit": 98,
+        ":user_id": "user1",
+        ":version_step": 1,
+    }
+    requests = mock_table.batch_write_item.call_args.kwargs["RequestItems"][
+        "test-table"
+    ]
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_add_tasks_to_list_should_raise_put_error_when_roll_back_fails(
+    mock_table,
+):
+    # Arrange
+    error = ClientError({"Error": {"Code": "ValidationException"}}, "Put")
+    mock_table.batch_write_item.side_effect = [
+        error,
+        ClientError({"Error": {"Code": "InternalServerError"}}, "Delete"),
+    ]
+    repository = AsyncDynamoDBTaskRepository(mock_table)
+    task = Task.create(TaskTitle("Task"), TaskDescription(""), TaskListId("l"))
+
+    # Act
+    with pytest.raises(ClientError) as exc_info:
+        await repository.add_tasks_to_list(
+            UserId("user1"), TaskListId("l"), [task]
+        )
+
+    # Assert
+    assert exc_info.value is error
+    assert mock_table.update_item.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_update_should_return_none_when_task_is_missing(mock_table):
+    # Arrange
+    mock_table.update_item.side_effect = ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException"}},
+        "UpdateItem",
+    )
+    repository = AsyncDynamoDBTaskRepository(mock_table)
+
+    # Act
+    task = await repository.update(
+        TaskListId("list1"),
+        TaskId("task1"),
+        title=TaskTitle("Title"),
+    )
+
+    # Assert
+    assert task is None
+
+
+@pytest.mark.asyncio
+async def test_update_should_move_task_between_status_counters_in_transaction(
+    mock_table, task_item_factory
+):
+    # Arrange
+    mock_table.get_item.return_value = {
+        "Item": task_item_factory("list1", "task1")
+    }
+    repository = AsyncDynamoDBTaskRepository(mock_table)
+
+    # Act
+    task = await repository.update(
+        TaskListId("list1"),
+        TaskId("task1"),
+        status=TaskStatus.DONE,
+        user_id=UserId("user1"),
+    )
+
+    # Assert
+    assert task is not None
+    assert task.status == TaskStatus.DONE
+    items = mock_table.transact_write_items.call_args.kwargs["TransactItems"]
+    assert items[1]["Update"]["ExpressionAttributeNames"] == {
+        "#previous": "todo_count",
+        "#status": "done_count",
+        "#user_id": "user_id",
+        "#version": "version",
+    }
+    mock_table.update_item.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_remove_task_from_list_should_retry_when_status_changes(
+    mock_table, task_item_factory
+):
+    # Arrange
+    mock_table.get_item.side_effect = [
+        {"Item": task_item_factory("list1", "task1")},
+        {"Item": {**task_item_factory("list1", "task1"), "status": "done"}},
+    ]
+    mock_table.transact_write_items.side_effect = [
+        ClientError(
+            {
+                "Error": {"Code": "TransactionCanceledException"},
+                "CancellationReasons": [
+                    {"Code": "ConditionalCheckFailed", "Item": {}},
+                    {"Code": "None"},
+                ],
+            },
+            "TransactWriteItems",
+        ),
+        {},
+    ]
+    repository = AsyncDynamoDBTaskRepository(mock_table)
+
+    # Act
+    await repository.remove_task_from_list(
+        UserId("user1"), TaskListId("list1"), TaskId("task1")
+    )
+
+    # Assert
+    items = mock_table.transact_write_items.call_args.kwargs["TransactItems"]
+    assert items[1]["Update"]["ExpressionAttributeNames"]["#status_count"] == (
+        "done_count"
+    )
+
+
+@pytest.mark.asyncio
+async def test_iter_all_should_follow_last_evaluated_key(
+    mock_table, task_wire_item_factory
+):
+    # Arrange
+    mock_table.wire.query.side_effect = [
+        {
+            "Items": [task_wire_item_factory("list1", "task1")],
+            "LastEvaluatedKey": {"PK": "TASK_LIST#list1", "SK": "TASK#task1"},
+        },
+        {"Items": [task_wire_item_factory("list1", "task2")]},
+    ]
+    repository = AsyncDynamoDBTaskRepository(mock_table)
+
+    # Act
+    tasks = [task async for task in repository.iter_all(TaskListId("list1"))]
+
+    # Assert
+    assert [task.id for task in tasks] == [TaskId("task1"), TaskId("task2")]
+    assert mock_table.wire.query.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_find_many_should_return_tasks_in_key_order(
+    mock_table, task_item_factory
+):
+    # Arrange
+    mock_table.batch_get_item.return_value = {
+        "Responses": {"test-table": [task_item_factory("list1", "task1")]}
+    }
+    repository = AsyncDynamoDBTaskRepository(mock_table)
+
+    # Act
+    tasks = await repository.find_many(
+        [
+            (TaskListId("list1"), TaskId("missing")),
+            (TaskListId("list1"), TaskId("task1")),
+        ]
+    )
+
+    # Assert
+    assert tasks[0] is None
+    assert tasks[1].id == TaskId("task1")
+
+
+@pytest.mark.asyncio
+async def test_list_user_tasks_should_query_user_task_index(
+    mock_table, task_wire_item_factory
+):
+    # Arrange
+    mock_table.wire.query.return_value = {
+        "Items": [task_wire_item_factory("list1", "task1")],
+        "LastEvaluatedKey": {"GSI2PK": "USER#user1"},
+    }
+    repository = AsyncDynamoDBTaskRepository(mock_table)
+
+    # Act
+    page = await repository.list_user_tasks(
+        UserId("user1"),
+        limit=1,
+        order=TaskSortOrder.DESCENDING,
+    )
+
+    # Assert
+    assert [task.id for task in page.items] == [TaskId("task1")]
+    assert page.next_token is not None
+    assert TaskFeedCursor.decode(page.next_token).task_id == TaskId("task1")
+    query = mock_table.wire.query.call_args.kwargs
+    assert query["IndexName"] == "GSI2"
+    assert query["ScanIndexForward"] is False
+    assert query["Limit"] == 1
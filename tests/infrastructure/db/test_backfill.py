@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from app.infrastructure.db.backfill import backfill_user_tasks
+
+
+def test_backfill_user_tasks_should_index_tasks_under_owner():
+    # Arrange
+    table = MagicMock()
+    table.scan.return_value = {
+        "Items": [{"PK": "TASK_LIST#list1", "user_id": "user1"}]
+    }
+    table.query.return_value = {
+        "Items": [{"PK": "TASK_LIST#list1", "SK": "TASK#task1"}]
+    }
+
+    # Act
+    indexed = backfill_user_tasks(table)
+
+    # Assert
+    assert indexed == 1
+    update = table.update_item.call_args.kwargs
+    assert update["Key"] == {"PK": "TASK_LIST#list1", "SK": "TASK#task1"}
+    assert update["ConditionExpression"] == "attribute_exists(PK)"
+    assert update["ExpressionAttributeValues"] == {":GSI2PK": "USER#user1"}
+    query = table.query.call_args.kwargs
+    assert query["ProjectionExpression"] == "PK, SK"
+
+
+def test_backfill_user_tasks_should_skip_tasks_deleted_in_between():
+    # Arrange
+    table = MagicMock()
+    table.scan.return_value = {
+        "Items": [{"PK": "TASK_LIST#list1", "user_id": "user1"}]
+    }
+    table.query.return_value = {
+        "Items": [{"PK": "TASK_LIST#list1", "SK": "TASK#task1"}]
+    }
+    table.update_item.side_effect = ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException"}},
+        "UpdateItem",
+    )
+
+    # Act
+    indexed = backfill_user_tasks(table)
+
+    # Assert
+    assert indexed == 0
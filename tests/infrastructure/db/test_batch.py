@@ -0,0 +1,200 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.infrastructure.db.batch import (
+    batch_delete,
+    batch_delete_async,
+    batch_get,
+    batch_get_async,
+    delete_batches,
+    put_batches,
+)
+
+
+@pytest.fixture
+def keys():
+    return [{"PK": "TASK_LIST#list1", "SK": f"TASK#{i}"} for i in range(60)]
+
+
+def test_delete_batches_should_chunk_by_25(keys):
+    # Act
+    batches = delete_batches("table", keys)
+
+    # Assert
+    assert [len(batch["table"]) for batch in batches] == [25, 25, 10]
+    assert batches[0]["table"][0] == {"DeleteRequest": {"Key": keys[0]}}
+
+
+def test_batch_delete_should_write_every_batch(keys):
+    # Arrange
+    client = MagicMock()
+    client.batch_write_item.return_value = {"UnprocessedItems": {}}
+
+    # Act
+    batch_delete(client, "table", keys)
+
+    # Assert
+    assert client.batch_write_item.call_count == 3
+
+
+def test_batch_delete_should_write_in_caller_without_executor(keys):
+    # Arrange
+    client = MagicMock()
+    threads = []
+    client.batch_write_item.side_effect = lambda **_: (
+        threads.append(threading.current_thread()) or {}
+    )
+
+    # Act
+    batch_delete(client, "table", keys)
+
+    # Assert
+    assert threads == [threading.current_thread()] * 3
+
+
+def test_batch_delete_should_write_in_given_executor(keys):
+    # Arrange
+    client = MagicMock()
+    threads = []
+    client.batch_write_item.side_effect = lambda **_: (
+        threads.append(threading.current_thread().name) or {}
+    )
+
+    # Act
+    with ThreadPoolExecutor(thread_name_prefix="batch") as executor:
+        batch_delete(client, "table", keys, executor)
+
+    # Assert
+    assert len(threads) == 3
+    assert all(name.startswith("batch") for name in threads)
+
+
+def test_batch_delete_should_not_call_dynamodb_without_keys():
+    # Arrange
+    client = MagicMock()
+
+    # Act
+    batch_delete(client, "table", [])
+
+    # Assert
+    client.batch_write_item.assert_not_called()
+
+
+@patch("app.infrastructure.db.batch.time.sleep")
+def test_batch_delete_should_retry_unprocessed_items(sleep, keys):
+    # Arrange
+    client = MagicMock()
+    unprocessed = {"table": [{"DeleteRequest": {"Key": keys[0]}}]}
+    client.batch_write_item.side_effect = [
+        {"UnprocessedItems": unprocessed},
+        {"UnprocessedItems": {}},
+    ]
+
+    # Act
+    batch_delete(client, "table", keys[:1])
+
+    # Assert
+    assert client.batch_write_item.call_count == 2
+    client.batch_write_item.assert_called_with(RequestItems=unprocessed)
+    sleep.assert_called_once()
+
+
+@patch("app.infrastructure.db.batch.time.sleep")
+def test_batch_delete_should_raise_when_items_stay_unprocessed(sleep, keys):
+    # Arrange
+    client = MagicMock()
+    client.batch_write_item.return_value = {
+        "UnprocessedItems": {"table": [{"DeleteRequest": {"Key": keys[0]}}]}
+    }
+
+    # Act & Assert
+    with pytest.raises(RuntimeError, match="left unprocessed"):
+        batch_delete(client, "table", keys[:1])
+
+
+@pytest.mark.asyncio
+async def test_batch_delete_async_should_write_every_batch(keys):
+    # Arrange
+    table = AsyncMock()
+    table.batch_write_item.return_value = {}
+
+    # Act
+    await batch_delete_async(table, "table", keys)
+
+    # Assert
+    assert table.batch_write_item.await_count == 3
+
+
+def test_batch_get_should_chunk_by_100_and_collect_responses():
+    # Arrange
+    keys = [{"PK": "TASK_LIST#list1", "SK": f"TASK#{i}"} for i in range(150)]
+    client = MagicMock()
+    client.batch_get_item.side_effect = lambda **kwargs: {
+        "Responses": {"table": kwargs["RequestItems"]["table"]["Keys"]}
+    }
+
+    # Act
+    items = batch_get(client, "table", keys, ConsistentRead=True)
+
+    # Assert
+    assert sorted(item["SK"] for item in items) == sorted(
+        key["SK"] for key in keys
+    )
+    assert client.batch_get_item.call_count == 2
+    request = client.batch_get_item.call_args.kwargs["RequestItems"]["table"]
+    assert request["ConsistentRead"] is True
+
+
+@patch("app.infrastructure.db.batch.time.sleep")
+def test_batch_get_should_retry_unprocessed_keys(sleep):
+    # Arrange
+    keys = [{"PK": "a", "SK": "1"}, {"PK": "a", "SK": "2"}]
+    client = MagicMock()
+    client.batch_get_item.side_effect = [
+        {
+            "Responses": {"table": [keys[0]]},
+            "UnprocessedKeys": {"table": {"Keys": [keys[1]]}},
+        },
+        {"Responses": {"table": [keys[1]]}},
+    ]
+
+    # Act
+    items = batch_get(client, "table", keys)
+
+    # Assert
+    assert items == keys
+    client.batch_get_item.assert_called_with(
+        RequestItems={"table": {"Keys": [keys[1]]}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_get_async_should_collect_responses():
+    # Arrange
+    keys = [{"PK": "a", "SK": str(i)} for i in range(120)]
+    table = AsyncMock()
+    table.batch_get_item.side_effect = lambda **kwargs: {
+        "Responses": {"table": kwargs["RequestItems"]["table"]["Keys"]}
+    }
+
+    # Act
+    items = await batch_get_async(table, "table", keys)
+
+    # Assert
+    assert len(items) == 120
+    assert table.batch_get_item.await_count == 2
+
+
+def test_put_batches_should_chunk_put_requests_by_25():
+    # Arrange
+    items = [{"PK": "a", "SK": str(i)} for i in range(30)]
+
+    # Act
+    batches = put_batches("table", items)
+
+    # Assert
+    assert [len(batch["table"]) for batch in batches] == [25, 5]
+    assert batches[1]["table"][0] == {"PutRequest": {"Item": items[25]}}
@@ -0,0 +1,157 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.stub import Stubber
+
+from app.infrastructure.db.dynamodb import (
+    LOCAL_ENDPOINT_URL,
+    DynamoDBResources,
+    DynamoDBSettings,
+)
+from app.infrastructure.db.wire import KeyCondition
+
+
+def test_dynamodb_settings_from_env_should_use_defaults(monkeypatch):
+    # Arrange
+    for name in [
+        "APP_ENV",
+        "AWS_REGION",
+        "DYNAMODB_TABLE_NAME",
+        "DYNAMODB_ENDPOINT_URL",
+        "DYNAMODB_MAX_POOL_CONNECTIONS",
+    ]:
+        monkeypatch.delenv(name, raising=False)
+
+    # Act
+    settings = DynamoDBSettings.from_env()
+
+    # Assert
+    assert settings.table_name == "todo-dev-table"
+    assert settings.region_name == "ap-northeast-1"
+    assert settings.endpoint_url == LOCAL_ENDPOINT_URL
+    assert settings.max_pool_connections == 10
+
+
+def test_dynamodb_settings_from_env_should_read_pool_and_timeouts(
+    monkeypatch,
+):
+    # Arrange
+    monkeypatch.setenv("APP_ENV", "prod")
+    monkeypatch.delenv("DYNAMODB_ENDPOINT_URL", raising=False)
+    monkeypatch.setenv("DYNAMODB_MAX_POOL_CONNECTIONS", "64")
+    monkeypatch.setenv("DYNAMODB_CONNECT_TIMEOUT", "0.5")
+    monkeypatch.setenv("DYNAMODB_READ_TIMEOUT", "1.5")
+
+    # Act
+    settings = DynamoDBSettings.from_env()
+    config = settings.botocore_config()
+
+    # Assert
+    assert settings.endpoint_url is None
+    assert config.max_pool_connections == 64
+    assert config.connect_timeout == pytest.approx(0.5)
+    assert config.read_timeout == pytest.approx(1.5)
+
+
+def test_dynamodb_resources_create_should_share_one_client():
+    # Arrange
+    settings = DynamoDBSettings(table_name="test-table")
+
+    # Act
+    resources = DynamoDBResources.create(settings)
+
+    # Assert
+    assert resources.table.name == "test-table"
+    assert resources.table._client is resources.client
+    assert resources.client.meta.config.max_pool_connections == 10
+    assert resources.wire_table.name == "test-table"
+    assert resources.wire_table._client is resources.client
+
+
+def test_dynamodb_resources_should_transform_only_plain_table_calls():
+    # Arrange
+    resources = DynamoDBResources.create(
+        DynamoDBSettings(table_name="test-table")
+    )
+    requests = []
+    resources.client.meta.events.register_last(
+        "before-parameter-build.dynamodb.Query",
+        lambda params, **kwargs: requests.append(params),
+    )
+    item = {"PK": {"S": "TASK_LIST#list1"}, "count": {"N": "1"}}
+
+    # Act
+    with Stubber(resources.client) as stubber:
+        stubber.add_response("query", {"Items": [item]})
+        stubber.add_response("query", {"Items": [item]})
+        plain = resources.table.query(
+            KeyConditionExpression=Key("PK").eq("TASK_LIST#list1")
+        )
+        wire = resources.wire_table.query(
+            **KeyCondition("PK").bind("TASK_LIST#list1")
+        )
+
+    # Assert
+    assert plain["Items"] == [{"PK": "TASK_LIST#list1", "count": 1}]
+    assert wire["Items"] == [item]
+    assert [request["ExpressionAttributeValues"] for request in requests] == [
+        {":v0": {"S": "TASK_LIST#list1"}},
+        {":pk": {"S": "TASK_LIST#list1"}},
+    ]
+
+
+def test_client_table_should_serialize_plain_values_of_writes():
+    # Arrange
+    resources = DynamoDBResources.create(
+        DynamoDBSettings(table_name="test-table")
+    )
+
+    # Act
+    with Stubber(resources.client) as stubber:
+        stubber.add_response(
+            "update_item",
+            {"Attributes": {"count": {"N": "2"}}},
+            {
+                "TableName": "test-table",
+                "Key": {"PK": {"S": "TASK_LIST#list1"}, "SK": {"S": "#M"}},
+                "UpdateExpression": "ADD #count :one",
+                "ConditionExpression": "attribute_exists(#n0)",
+                "ExpressionAttributeNames": {"#count": "count", "#n0": "PK"},
+                "ExpressionAttributeValues": {":one": {"N": "1"}},
+                "ReturnValues": "UPDATED_NEW",
+            },
+        )
+        resp = resources.table.update_item(
+            Key={"PK": "TASK_LIST#list1", "SK": "#M"},
+            UpdateExpression="ADD #count :one",
+            ConditionExpression=Attr("PK").exists(),
+            ExpressionAttributeNames={"#count": "count"},
+            ExpressionAttributeValues={":one": 1},
+            ReturnValues="UPDATED_NEW",
+        )
+
+    # Assert
+    assert resp["Attributes"] == {"count": 2}
+
+
+def test_client_table_should_convert_values_apart_in_each_thread():
+    # Arrange
+    table = DynamoDBResources.create(
+        DynamoDBSettings(table_name="test-table")
+    ).table
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        barrier = threading.Barrier(2)
+        values = list(
+            executor.map(
+                lambda _: (barrier.wait(), table._plain_values())[1],
+                range(2),
+            )
+        )
+
+    # Assert
+    assert values[0] is not values[1]
+    assert table._plain_values() not in values
@@ -0,0 +1,280 @@
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.domain.task_list import TaskListId
+from app.domain.user import UserId
+from app.infrastructure.db.dynamodb_task_list_repository import (
+    DynamoDBTaskListRepository,
+)
+
+
+@pytest.fixture
+def mock_table():
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_wire():
+    return MagicMock()
+
+
+@pytest.fixture
+def task_list_item_factory():
+    def create_task_list_item(user_id: str, task_list_id: str):
+        return {
+            "PK": f"TASK_LIST#{task_list_id}",
+            "SK": "#METADATA",
+            "user_id": user_id,
+            "task_list_id": task_list_id,
+            "name": "List",
+            "count": 0,
+        }
+
+    return create_task_list_item
+
+
+@pytest.fixture
+def task_list_wire_item_factory():
+    def create_task_list_wire_item(user_id: str, task_list_id: str):
+        return {
+            "PK": {"S": f"TASK_LIST#{task_list_id}"},
+            "SK": {"S": "#METADATA"},
+            "user_id": {"S": user_id},
+            "name": {"S": "List"},
+            "count": {"N": "0"},
+            "fmt": {"N": "2"},
+        }
+
+    return create_task_list_wire_item
+
+
+def test_find_should_get_item_by_key_with_consistent_read(
+    mock_table, mock_wire, task_list_item_factory
+):
+    # Arrange
+    mock_table.get_item.return_value = {
+        "Item": task_list_item_factory("user1", "list1")
+    }
+    repository = DynamoDBTaskListRepository(mock_table, mock_wire)
+
+    # Act
+    task_list = repository.find(UserId("user1"), TaskListId("list1"))
+
+    # Assert
+    assert task_list is not None
+    assert task_list.id == TaskListId("list1")
+    mock_table.get_item.assert_called_once_with(
+        Key={"PK": "TASK_LIST#list1", "SK": "#METADATA"},
+        ConsistentRead=True,
+    )
+    mock_table.query.assert_not_called()
+
+
+def test_delete_should_delete_task_list_and_its_tasks(mock_table, mock_wire):
+    # Arrange
+    mock_table.name = "test-table"
+    mock_table.query.return_value = {
+        "Items": [
+            {"PK": "TASK_LIST#list1", "SK": "TASK#task1"},
+            {"PK": "TASK_LIST#list1", "SK": "TASK#task2"},
+        ]
+    }
+    mock_table.batch_write_item.return_value = {}
+    repository = DynamoDBTaskListRepository(mock_table, mock_wire)
+
+    # Act
+    repository.delete(TaskListId("list1"), user_id=UserId("user1"))
+
+    # Assert
+    mock_table.delete_item.assert_called_once_with(
+        Key={"PK": "TASK_LIST#list1", "SK": "#METADATA"},
+        ConditionExpression="attribute_exists(PK) AND #user_id = :user_id",
+        ExpressionAttributeNames={"#user_id": "user_id"},
+        ExpressionAttributeValues={":user_id": "user1"},
+    )
+    assert mock_table.query.call_args.kwargs["ProjectionExpression"] == (
+        "PK, SK"
+    )
+    mock_table.batch_write_item.assert_called_once_with(
+        RequestItems={
+            "test-table": [
+                {"DeleteRequest": {"Key": {"PK": "TASK_LIST#list1", "SK": sk}}}
+                for sk in ["TASK#task1", "TASK#task2"]
+            ]
+        }
+    )
+
+
+def test_delete_should_keep_tasks_when_task_list_is_not_owned(
+    mock_table, mock_wire
+):
+    # Arrange
+    mock_table.delete_item.side_effect = ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException"}},
+        "DeleteItem",
+    )
+    repository = DynamoDBTaskListRepository(mock_table, mock_wire)
+
+    # Act
+    repository.delete(TaskListId("list1"), user_id=UserId("user2"))
+
+    # Assert
+    mock_table.query.assert_not_called()
+    mock_table.batch_write_item.assert_not_called()
+
+
+def test_find_should_return_none_when_task_list_is_not_owned(
+    mock_table, mock_wire, task_list_item_factory
+):
+    # Arrange
+    mock_table.get_item.return_value = {
+        "Item": task_list_item_factory("user1", "list1")
+    }
+    repository = DynamoDBTaskListRepository(mock_table, mock_wire)
+
+    # Act
+    task_list = repository.find(UserId("user2"), TaskListId("list1"))
+
+    # Assert
+    assert task_list is None
+
+
+def test_find_by_id_should_move_legacy_task_list_when_missing(
+    mock_table, mock_wire, task_list_item_factory
+):
+    # Arrange
+    item = task_list_item_factory("user1", "list1")
+    legacy_item = item | {"PK": "USER#user1", "SK": "TASK_LIST#list1"}
+    mock_table.get_item.side_effect = [{}, {"Item": item}]
+    mock_table.query.return_value = {"Items": [legacy_item]}
+    repository = DynamoDBTaskListRepository(
+        mock_table, mock_wire, legacy_task_lists=True
+    )
+
+    # Act
+    task_list = repository.find_by_id(TaskListId("list1"))
+
+    # Assert
+    assert task_list is not None
+    assert task_list.id == TaskListId("list1")
+    delete = mock_table.transact_write_items.call_args.kwargs["TransactItems"][
+        1
+    ]["Delete"]
+    assert delete["Key"] == {"PK": "USER#user1", "SK": "TASK_LIST#list1"}
+
+
+def test_find_by_id_should_not_look_up_legacy_key_once_migrated(
+    mock_table, mock_wire
+):
+    # Arrange
+    mock_table.get_item.return_value = {}
+    repository = DynamoDBTaskListRepository(mock_table, mock_wire)
+
+    # Act
+    task_list = repository.find_by_id(TaskListId("list1"))
+
+    # Assert
+    assert task_list is None
+    mock_table.query.assert_not_called()
+
+
+def test_find_with_tasks_should_read_task_list_and_tasks_in_one_query(
+    mock_table, mock_wire, task_list_wire_item_factory
+):
+    # Arrange
+    task_item = {
+        "PK": {"S": "TASK_LIST#list1"},
+        "SK": {"S": "TASK#task1"},
+        "title": {"S": "Task"},
+        "status": {"S": "todo"},
+        "created_at": {"S": "2025-01-01T00:00:00"},
+        "fmt": {"N": "2"},
+    }
+    mock_wire.query.return_value = {
+        "Items": [task_list_wire_item_factory("user1", "list1"), task_item],
+        "LastEvaluatedKey": {
+            "PK": "TASK_LIST#list1",
+            "SK": "TASK#task1",
+            "created_at": "2025-01-01T00:00:00",
+        },
+    }
+    repository = DynamoDBTaskListRepository(mock_table, mock_wire)
+
+    # Act
+    result = repository.find_with_tasks(TaskListId("list1"), limit=1)
+
+    # Assert
+    assert result is not None
+    task_list, page = result
+    assert task_list.id == TaskListId("list1")
+    assert [task.id.value for task in page.items] == ["task1"]
+    assert page.next_token is not None
+    query = mock_wire.query.call_args.kwargs
+    assert query["IndexName"] == "LSI1"
+    assert query["Limit"] == 2
+    assert query["ExpressionAttributeValues"] == {
+        ":pk": {"S": "TASK_LIST#list1"}
+    }
+    mock_table.get_item.assert_not_called()
+
+
+def test_find_with_tasks_should_return_none_when_task_list_is_missing(
+    mock_table,
+    mock_wire,
+):
+    # Arrange
+    mock_wire.query.return_value = {"Items": []}
+    repository = DynamoDBTaskListRepository(mock_table, mock_wire)
+
+    # Act
+    result = repository.find_with_tasks(TaskListId("list1"))
+
+    # Assert
+    assert result is None
+
+
+def test_list_all_should_query_task_lists_of_owner_in_gsi1(
+    mock_table, mock_wire, task_list_wire_item_factory
+):
+    # Arrange
+    mock_wire.query.return_value = {
+        "Items": [task_list_wire_item_factory("user1", "list1")]
+    }
+    repository = DynamoDBTaskListRepository(mock_table, mock_wire)
+
+    # Act
+    page = repository.list_all(UserId("user1"), limit=10)
+
+    # Assert
+    assert [task_list.id for task_list in page.items] == [TaskListId("list1")]
+    query = mock_wire.query.call_args.kwargs
+    assert query["IndexName"] == "GSI1"
+    assert query["ExpressionAttributeValues"] == {
+        ":pk": {"S": "USER#user1"},
+        ":sk": {"S": "TASK_LIST#"},
+    }
+
+
+def test_list_all_should_return_legacy_task_lists_moved_before_indexed(
+    mock_table, mock_wire, task_list_item_factory
+):
+    # Arrange
+    legacy_item = task_list_item_factory("user1", "list1") | {
+        "PK": "USER#user1",
+        "SK": "TASK_LIST#list1",
+    }
+    mock_table.query.return_value = {"Items": [legacy_item]}
+    mock_wire.query.return_value = {"Items": []}
+    repository = DynamoDBTaskListRepository(
+        mock_table, mock_wire, legacy_task_lists=True
+    )
+
+    # Act
+    page = repository.list_all(UserId("user1"), limit=10)
+
+    # Assert
+    assert [task_list.id for task_list in page.items] == [TaskListId("list1")]
+    assert mock_table.query.call_args.kwargs["ConsistentRead"] is True
+    mock_table.transact_write_items.assert_called_once()
@@ -0,0 +1,881 @@
+from unittest.mock import MagicMock
+
+import pytest
+from boto3.dynamodb.types import TypeSerializer
+from botocore.exceptions import ClientError
+
+from app.domain.task import (
+    Task,
+    TaskDescription,
+    TaskId,
+    TaskStatus,
+    TaskTitle,
+)
+from app.domain.task_feed import TaskFeedCursor
+from app.domain.task_list import TaskListId, TaskSortBy, TaskSortOrder
+from app.domain.user import UserId
+from app.infrastructure.db.dynamodb_task_repository import (
+    DynamoDBTaskRepository,
+)
+
+
+@pytest.fixture
+def mock_table():
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_wire():
+    return MagicMock()
+
+
+@pytest.fixture
+def task_item_factory():
+    def create_task_item(task_list_id: str, task_id: str):
+        return {
+            "PK": f"TASK_LIST#{task_list_id}",
+            "SK": f"TASK#{task_id}",
+            "task_list_id": task_list_id,
+            "task_id": task_id,
+            "title": "Task",
+            "description": "",
+            "status": "todo",
+            "created_at": "2025-01-01T00:00:00",
+        }
+
+    return create_task_item
+
+
+@pytest.fixture
+def task_wire_item_factory(task_item_factory):
+    serializer = TypeSerializer()
+
+    def create_task_wire_item(task_list_id: str, task_id: str):
+        item = task_item_factory(task_list_id, task_id)
+        return {name: serializer.serialize(v) for name, v in item.items()}
+
+    return create_task_wire_item
+
+
+def test_find_should_get_item_by_key_with_consistent_read(
+    mock_table, mock_wire, task_item_factory
+):
+    # Arrange
+    mock_table.get_item.return_value = {
+        "Item": task_item_factory("list1", "task1")
+    }
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    task = repository.find(TaskListId("list1"), TaskId("task1"))
+
+    # Assert
+    assert task is not None
+    assert task.id == TaskId("task1")
+    assert task.status == TaskStatus.TODO
+    mock_table.get_item.assert_called_once_with(
+        Key={"PK": "TASK_LIST#list1", "SK": "TASK#task1"},
+        ConsistentRead=True,
+    )
+    mock_wire.query.assert_not_called()
+
+
+def test_find_should_return_none_when_item_is_missing(mock_table, mock_wire):
+    # Arrange
+    mock_table.get_item.return_value = {}
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    task = repository.find(TaskListId("list1"), TaskId("task1"))
+
+    # Assert
+    assert task is None
+
+
+def transaction_canceled(*reasons):
+    return ClientError(
+        {
+            "Error": {"Code": "TransactionCanceledException"},
+            "CancellationReasons": list(reasons),
+        },
+        "TransactWriteItems",
+    )
+
+
+def test_add_task_to_list_should_put_task_and_increment_count(
+    mock_table, mock_wire
+):
+    # Arrange
+    mock_table.name = "table"
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+    task = Task.create(
+        TaskTitle("Task"),
+        TaskDescription(""),
+        TaskListId("list1"),
+    )
+
+    # Act
+    repository.add_task_to_list(UserId("user1"), task)
+
+    # Assert
+    items = mock_table.transact_write_items.call_args.kwargs["TransactItems"]
+    assert items[0]["Put"]["Item"]["SK"] == f"TASK#{task.id}"
+    assert items[1]["Update"]["Key"] == {
+        "PK": "TASK_LIST#list1",
+        "SK": "#METADATA",
+    }
+    assert (
+        items[1]["Update"]["UpdateExpression"]
+        == "ADD #count :one, #status_count :one, #version :version_step"
+    )
+    assert items[1]["Update"]["ExpressionAttributeNames"]["#status_count"] == (
+        "todo_count"
+    )
+    mock_table.put_item.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("list_reason", "message"),
+    [
+        ({"Code": "ConditionalCheckFailed"}, "Task list not found."),
+        (
+            {
+                "Code": "ConditionalCheckFailed",
+                "Item": {"user_id": {"S": "user1"}, "count": {"N": "100"}},
+            },
+            "Task count cannot exceed 100.",
+        ),
+    ],
+)
+def test_add_task_to_list_should_raise_error_when_condition_fails(
+    mock_table, mock_wire, list_reason, message
+):
+    # Arrange
+    mock_table.transact_write_items.side_effect = transaction_canceled(
+        {"Code": "None"}, list_reason
+    )
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+    task = Task.create(
+        TaskTitle("Task"),
+        TaskDescription(""),
+        TaskListId("list1"),
+    )
+
+    # Act & Assert
+    with pytest.raises(ValueError, match=message):
+        repository.add_task_to_list(UserId("user1"), task)
+
+
+def test_add_task_to_list_should_retry_after_moving_legacy_task_list(
+    mock_table, mock_wire
+):
+    # Arrange
+    mock_table.transact_write_items.side_effect = [
+        transaction_canceled(
+            {"Code": "None"}, {"Code": "ConditionalCheckFailed"}
+        ),
+        None,
+        None,
+    ]
+    mock_table.get_item.return_value = {
+        "Item": {
+            "PK": "USER#user1",
+            "SK": "TASK_LIST#list1",
+            "user_id": "user1",
+            "task_list_id": "list1",
+            "name": "List",
+            "count": 0,
+        }
+    }
+    repository = DynamoDBTaskRepository(
+        mock_table, mock_wire, legacy_task_lists=True
+    )
+    task = Task.create(
+        TaskTitle("Task"),
+        TaskDescription(""),
+        TaskListId("list1"),
+    )
+
+    # Act
+    repository.add_task_to_list(UserId("user1"), task)
+
+    # Assert
+    assert mock_table.get_item.call_args.kwargs["Key"] == {
+        "PK": "USER#user1",
+        "SK": "TASK_LIST#list1",
+    }
+    calls = mock_table.transact_write_items.call_args_list
+    assert calls[0] == calls[2]
+    assert len(calls) == 3
+
+
+def test_add_tasks_to_list_should_reserve_count_and_batch_put_tasks(
+    mock_table,
+    mock_wire,
+):
+    # Arrange
+    mock_table.name = "table"
+    mock_table.batch_write_item.return_value = {}
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+    tasks = [
+        Task.create(
+            TaskTitle(f"Task {i}"), TaskDescription(""), TaskListId("l")
+        )
+        for i in range(3)
+    ]
+
+    # Act
+    repository.add_tasks_to_list(UserId("user1"), TaskListId("l"), tasks)
+
+    # Assert
+    update = mock_table.update_item.call_args.kwargs
+    assert update["Key"] == {"PK": "TASK_LIST#l", "SK": "#METADATA"}
+    assert update["UpdateExpression"] == (
+        "ADD #count :count, #todo_count :todo_count, #version :version_step"
+    )
+    assert update["ExpressionAttributeValues"] == {
+        ":count": 3,
+        ":todo_count": 3,
+        ":limit": 97,
+        ":user_id": "user1",
+        ":version_step": 1,
+    }
+    requests = mock_table.batch_write_item.call_args.kwargs["RequestItems"][
+        "table"
+    ]
+    assert [r["PutRequest"]["Item"]["SK"] for r in requests] == [
+        f"TASK#{task.id}" for task in tasks
+    ]
+    assert {r["PutRequest"]["Item"]["GSI2PK"] for r in requests} == {
+        "USER#user1"
+    }
+    mock_table.transact_write_items.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("response", "message"),
+    [
+        ({}, "Task list not found."),
+        (
+            {"Item": {"user_id": {"S": "user1"}, "count": {"N": "99"}}},
+            "Task count cannot exceed 100.",
+        ),
+        ({"Item": {"user_id": {"S": "user2"}}}, "Task list not found."),
+    ],
+)
+def test_add_tasks_to_list_should_raise_error_when_count_is_not_reserved(
+    mock_table, mock_wire, response, message
+):
+    # Arrange
+    mock_table.update_item.side_effect = ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException"}, **response},
+        "UpdateItem",
+    )
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+    tasks = [
+        Task.create(
+            TaskTitle(f"Task {i}"), TaskDescription(""), TaskListId("l")
+        )
+        for i in range(2)
+    ]
+
+    # Act & Assert
+    with pytest.raises(ValueError, match=message):
+        repository.add_tasks_to_list(UserId("user1"), TaskListId("l"), tasks)
+    mock_table.batch_write_item.assert_not_called()
+
+
+def test_add_tasks_to_list_should_roll_back_when_put_fails(
+    mock_table, mock_wire
+):
+    # Arrange
+    mock_table.name = "table"
+    error = ClientError({"Error": {"Code": "ValidationException"}}, "Put")
+    mock_table.batch_write_item.side_effect = [error, {}]
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+    task = Task.create(TaskTitle("Task"), TaskDescription(""), TaskListId("l"))
+
+    # Act
+    with pytest.raises(ClientError):
+        repository.add_tasks_to_list(UserId("user1"), TaskListId("l"), [task])
+
+    # Assert
+    requests = mock_table.batch_write_item.call_args.kwargs["RequestItems"][
+        "table"
+    ]
+    assert requests == [
+        {
+            "DeleteRequest": {
+                "Key": {"PK": "TASK_LIST#l", "SK": f"TASK#{task.id}"}
+            }
+        }
+    ]
+    release = mock_table.update_item.call_args.kwargs
+    assert release["ExpressionAttributeValues"] == {
+        ":count": -1,
+        ":todo_count": -1,
+        ":user_id": "user1",
+        ":version_step": 1,
+    }
+
+
+def test_add_tasks_to_list_should_raise_put_error_when_roll_back_fails(
+    mock_table, mock_wire
+):
+    # Arrange
+    mock_table.name = "table"
+    error = ClientError({"Error": {"Code": "ValidationException"}}, "Put")
+    mock_table.batch_write_item.side_effect = [
+        error,
+        ClientError({"Error": {"Code": "InternalServerError"}}, "Delete"),
+    ]
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+    task = Task.create(TaskTitle("Task"), TaskDescription(""), TaskListId("l"))
+
+    # Act
+    with pytest.raises(ClientError) as exc_info:
+        repository.add_tasks_to_list(UserId("user1"), TaskListId("l"), [task])
+
+    # Assert
+    assert exc_info.value is error
+    # Only the reservation: the count is not released over written tasks.
+    assert mock_table.update_item.call_count == 1
+
+
+def test_remove_task_from_list_should_uncount_task_by_its_status(
+    mock_table, mock_wire, task_item_factory
+):
+    # Arrange
+    mock_table.name = "table"
+    mock_table.get_item.return_value = {
+        "Item": {**task_item_factory("list1", "task1"), "status": "done"}
+    }
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    repository.remove_task_from_list(
+        UserId("user1"), TaskListId("list1"), TaskId("task1")
+    )
+
+    # Assert
+    items = mock_table.transact_write_items.call_args.kwargs["TransactItems"]
+    assert items[0]["Delete"]["ExpressionAttributeValues"] == {
+        ":status": "done"
+    }
+    assert items[1]["Update"]["ExpressionAttributeNames"]["#status_count"] == (
+        "done_count"
+    )
+
+
+def test_remove_task_from_list_should_raise_error_when_task_is_missing(
+    mock_table,
+    mock_wire,
+):
+    # Arrange
+    mock_table.get_item.return_value = {}
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Task not found."):
+        repository.remove_task_from_list(
+            UserId("user1"), TaskListId("list1"), TaskId("task1")
+        )
+    mock_table.transact_write_items.assert_not_called()
+
+
+def test_remove_task_from_list_should_retry_when_status_changes(
+    mock_table, mock_wire, task_item_factory
+):
+    # Arrange
+    mock_table.get_item.side_effect = [
+        {"Item": task_item_factory("list1", "task1")},
+        {"Item": {**task_item_factory("list1", "task1"), "status": "done"}},
+    ]
+    mock_table.transact_write_items.side_effect = [
+        transaction_canceled(
+            {"Code": "ConditionalCheckFailed", "Item": {}}, {"Code": "None"}
+        ),
+        {},
+    ]
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    repository.remove_task_from_list(
+        UserId("user1"), TaskListId("list1"), TaskId("task1")
+    )
+
+    # Assert
+    items = mock_table.transact_write_items.call_args.kwargs["TransactItems"]
+    assert items[1]["Update"]["ExpressionAttributeNames"]["#status_count"] == (
+        "done_count"
+    )
+
+
+def test_update_should_set_only_given_fields(
+    mock_table, mock_wire, task_item_factory
+):
+    # Arrange
+    mock_table.update_item.return_value = {
+        "Attributes": {**task_item_factory("list1", "task1"), "title": "New"}
+    }
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    task = repository.update(
+        TaskListId("list1"),
+        TaskId("task1"),
+        title=TaskTitle("New"),
+    )
+
+    # Assert
+    assert task is not None
+    assert task.title == TaskTitle("New")
+    mock_table.get_item.assert_not_called()
+    mock_table.update_item.assert_called_once_with(
+        Key={"PK": "TASK_LIST#list1", "SK": "TASK#task1"},
+        ConditionExpression="attribute_exists(PK)",
+        ReturnValues="ALL_NEW",
+        UpdateExpression="SET #title = :title ADD #version :version_step",
+        ExpressionAttributeNames={"#title": "title", "#version": "version"},
+        ExpressionAttributeValues={":title": "New", ":version_step": 1},
+    )
+
+
+def test_update_should_move_task_between_status_counters_in_transaction(
+    mock_table, mock_wire, task_item_factory
+):
+    # Arrange
+    mock_table.name = "table"
+    mock_table.get_item.return_value = {
+        "Item": {**task_item_factory("list1", "task1"), "version": 3}
+    }
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    task = repository.update(
+        TaskListId("list1"),
+        TaskId("task1"),
+        status=TaskStatus.DONE,
+        user_id=UserId("user1"),
+    )
+
+    # Assert
+    assert task is not None
+    assert task.status == TaskStatus.DONE
+    assert task.version == 4
+    items = mock_table.transact_write_items.call_args.kwargs["TransactItems"]
+    assert items[0]["Update"]["ConditionExpression"] == (
+        "attribute_exists(PK) AND #status = :previous_status "
+        "AND #version = :previous_version"
+    )
+    assert items[0]["Update"]["ExpressionAttributeValues"] == {
+        ":status": "done",
+        ":status_created_at": "done#2025-01-01T00:00:00",
+        ":version_step": 1,
+        ":previous_status": "todo",
+        ":previous_version": 3,
+    }
+    assert items[1]["Update"]["Key"] == {
+        "PK": "TASK_LIST#list1",
+        "SK": "#METADATA",
+    }
+    assert items[1]["Update"]["ExpressionAttributeNames"] == {
+        "#previous": "todo_count",
+        "#status": "done_count",
+        "#user_id": "user_id",
+        "#version": "version",
+    }
+    mock_table.update_item.assert_not_called()
+
+
+def test_update_should_not_count_task_again_when_status_is_unchanged(
+    mock_table, mock_wire, task_item_factory
+):
+    # Arrange
+    mock_table.get_item.return_value = {
+        "Item": task_item_factory("list1", "task1")
+    }
+    mock_table.update_item.return_value = {
+        "Attributes": task_item_factory("list1", "task1")
+    }
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    task = repository.update(
+        TaskListId("list1"),
+        TaskId("task1"),
+        status=TaskStatus.TODO,
+        user_id=UserId("user1"),
+    )
+
+    # Assert
+    assert task is not None
+    mock_table.transact_write_items.assert_not_called()
+    update = mock_table.update_item.call_args.kwargs
+    assert update["ExpressionAttributeValues"][":previous_status"] == "todo"
+
+
+def test_update_should_retry_when_status_changes_in_between(
+    mock_table, mock_wire, task_item_factory
+):
+    # Arrange
+    mock_table.get_item.side_effect = [
+        {"Item": task_item_factory("list1", "task1")},
+        {"Item": {**task_item_factory("list1", "task1"), "status": "done"}},
+    ]
+    mock_table.transact_write_items.side_effect = transaction_canceled(
+        {"Code": "ConditionalCheckFailed", "Item": {}}, {"Code": "None"}
+    )
+    mock_table.update_item.return_value = {
+        "Attributes": {**task_item_factory("list1", "task1"), "status": "done"}
+    }
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    task = repository.update(
+        TaskListId("list1"),
+        TaskId("task1"),
+        status=TaskStatus.DONE,
+        user_id=UserId("user1"),
+    )
+
+    # Assert
+    assert task is not None
+    assert task.status == TaskStatus.DONE
+    assert mock_table.get_item.call_count == 2
+    mock_table.update_item.assert_called_once()
+
+
+def test_update_should_raise_error_when_status_is_set_without_owner(
+    mock_table,
+    mock_wire,
+):
+    # Arrange
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="task list owner"):
+        repository.update(
+            TaskListId("list1"),
+            TaskId("task1"),
+            status=TaskStatus.DONE,
+        )
+    mock_table.get_item.assert_not_called()
+
+
+def test_update_should_return_none_when_status_of_missing_task_is_set(
+    mock_table,
+    mock_wire,
+):
+    # Arrange
+    mock_table.get_item.return_value = {}
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    task = repository.update(
+        TaskListId("list1"),
+        TaskId("task1"),
+        status=TaskStatus.DONE,
+        user_id=UserId("user1"),
+    )
+
+    # Assert
+    assert task is None
+    mock_table.update_item.assert_not_called()
+    mock_table.transact_write_items.assert_not_called()
+
+
+def test_update_should_return_none_when_task_is_missing(mock_table, mock_wire):
+    # Arrange
+    mock_table.update_item.side_effect = ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException"}},
+        "UpdateItem",
+    )
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    task = repository.update(
+        TaskListId("list1"),
+        TaskId("task1"),
+        title=TaskTitle("Title"),
+    )
+
+    # Assert
+    assert task is None
+
+
+def test_delete_should_delete_by_key_without_query(mock_table, mock_wire):
+    # Arrange
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    repository.delete(TaskId("task1"), task_list_id=TaskListId("list1"))
+
+    # Assert
+    mock_wire.query.assert_not_called()
+    mock_table.delete_item.assert_called_once_with(
+        Key={"PK": "TASK_LIST#list1", "SK": "TASK#task1"}
+    )
+
+
+def test_find_many_should_return_tasks_in_key_order(
+    mock_table, mock_wire, task_item_factory
+):
+    # Arrange
+    mock_table.name = "test-table"
+    mock_table.batch_get_item.return_value = {
+        "Responses": {
+            "test-table": [
+                task_item_factory("list2", "task2"),
+                task_item_factory("list1", "task1"),
+            ]
+        }
+    }
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+    keys = [
+        (TaskListId("list1"), TaskId("task1")),
+        (TaskListId("list1"), TaskId("missing")),
+        (TaskListId("list2"), TaskId("task2")),
+        (TaskListId("list1"), TaskId("task1")),
+    ]
+
+    # Act
+    tasks = repository.find_many(keys)
+
+    # Assert
+    assert [task.id if task else None for task in tasks] == [
+        TaskId("task1"),
+        None,
+        TaskId("task2"),
+        TaskId("task1"),
+    ]
+    request = mock_table.batch_get_item.call_args.kwargs["RequestItems"][
+        "test-table"
+    ]
+    assert len(request["Keys"]) == 3
+    assert request["ConsistentRead"] is True
+
+
+def test_list_all_should_query_index_of_sort_attribute(
+    mock_table, mock_wire, task_wire_item_factory
+):
+    # Arrange
+    mock_wire.query.return_value = {
+        "Items": [task_wire_item_factory("list1", "task1")],
+    }
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+    task_list_id = TaskListId("list1")
+
+    # Act
+    page = repository.list_all(
+        task_list_id,
+        limit=20,
+        sort_by=TaskSortBy.TITLE,
+        order=TaskSortOrder.DESCENDING,
+    )
+
+    # Assert
+    assert [task.id for task in page.items] == [TaskId("task1")]
+    assert page.items[0].task_list_id is task_list_id
+    query = mock_wire.query.call_args.kwargs
+    assert query["IndexName"] == "LSI2"
+    assert query["ScanIndexForward"] is False
+    assert query["Limit"] == 20
+
+
+def test_list_all_should_sort_by_creation_time_by_default(
+    mock_table, mock_wire
+):
+    # Arrange
+    mock_wire.query.return_value = {"Items": []}
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    repository.list_all(TaskListId("list1"))
+
+    # Assert
+    query = mock_wire.query.call_args.kwargs
+    assert query["IndexName"] == "LSI1"
+    assert query["ScanIndexForward"] is True
+
+
+def test_list_all_should_skip_task_list_heading_creation_time_index(
+    mock_table,
+    mock_wire,
+):
+    # Arrange
+    mock_wire.query.return_value = {"Items": []}
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    repository.list_all(TaskListId("list1"))
+
+    # Assert
+    query = mock_wire.query.call_args.kwargs
+    assert query["KeyConditionExpression"] == "#pk = :pk AND #sk > :sk"
+    assert query["ExpressionAttributeNames"]["#sk"] == "created_at"
+    assert query["ExpressionAttributeValues"][":sk"] == {"S": "#METADATA"}
+
+
+def test_list_all_should_read_key_range_of_status(mock_table, mock_wire):
+    # Arrange
+    mock_wire.query.return_value = {"Items": []}
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    repository.list_all(
+        TaskListId("list1"),
+        order=TaskSortOrder.DESCENDING,
+        status=TaskStatus.TODO,
+    )
+
+    # Assert
+    query = mock_wire.query.call_args.kwargs
+    assert query["IndexName"] == "LSI3"
+    assert query["ScanIndexForward"] is False
+    assert "FilterExpression" not in query
+    assert query["KeyConditionExpression"] == (
+        "#pk = :pk AND begins_with(#sk, :sk)"
+    )
+    assert query["ExpressionAttributeValues"][":sk"] == {"S": "todo#"}
+
+
+def test_list_all_should_raise_error_when_status_is_sorted_by_title(
+    mock_table,
+    mock_wire,
+):
+    # Arrange
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="only be sorted by creation time"):
+        repository.list_all(
+            TaskListId("list1"),
+            sort_by=TaskSortBy.TITLE,
+            status=TaskStatus.DONE,
+        )
+    mock_wire.query.assert_not_called()
+
+
+def test_list_user_tasks_should_query_user_task_index(
+    mock_table, mock_wire, task_wire_item_factory
+):
+    # Arrange
+    mock_wire.query.return_value = {
+        "Items": [task_wire_item_factory("list1", "task1")],
+        "LastEvaluatedKey": {"GSI2PK": "USER#user1"},
+    }
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+
+    # Act
+    page = repository.list_user_tasks(
+        UserId("user1"),
+        limit=1,
+        order=TaskSortOrder.DESCENDING,
+    )
+
+    # Assert
+    assert [task.id for task in page.items] == [TaskId("task1")]
+    assert page.next_token is not None
+    cursor = TaskFeedCursor.decode(page.next_token)
+    assert cursor.task_list_id == TaskListId("list1")
+    assert cursor.task_id == TaskId("task1")
+    query = mock_wire.query.call_args.kwargs
+    assert query["IndexName"] == "GSI2"
+    assert query["ScanIndexForward"] is False
+    assert query["Limit"] == 1
+    assert "ExclusiveStartKey" not in query
+
+
+def test_list_user_tasks_should_start_after_cursor_in_status_index(
+    mock_table,
+    mock_wire,
+):
+    # Arrange
+    mock_wire.query.return_value = {"Items": []}
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+    cursor = TaskFeedCursor(
+        created_at="2025-01-01T00:00:00",
+        task_list_id=TaskListId("list1"),
+        task_id=TaskId("task1"),
+    )
+
+    # Act
+    page = repository.list_user_tasks(
+        UserId("user1"),
+        next_token=cursor.encode(),
+        status=TaskStatus.DONE,
+    )
+
+    # Assert
+    assert page.next_token is None
+    query = mock_wire.query.call_args.kwargs
+    assert query["IndexName"] == "GSI3"
+    assert query["ExclusiveStartKey"] == {
+        "GSI2PK": "USER#user1",
+        "status_created_at": "done#2025-01-01T00:00:00",
+        "PK": "TASK_LIST#list1",
+        "SK": "TASK#task1",
+    }
+    assert query["KeyConditionExpression"] == (
+        "#pk = :pk AND begins_with(#sk, :sk)"
+    )
+    assert query["ExpressionAttributeValues"] == {
+        ":pk": {"S": "USER#user1"},
+        ":sk": {"S": "done#"},
+    }
+
+
+@pytest.mark.parametrize(
+    ("order", "status", "bounds"),
+    [
+        (TaskSortOrder.ASCENDING, None, ("2025-01-01T00:00:00", "~")),
+        (TaskSortOrder.DESCENDING, None, ("0", "2025-01-01T00:00:00")),
+        (
+            TaskSortOrder.DESCENDING,
+            TaskStatus.DONE,
+            ("done#0", "done#2025-01-01T00:00:00"),
+        ),
+    ],
+)
+def test_iter_all_should_start_at_creation_time_of_cursor(
+    mock_table,
+    mock_wire,
+    order,
+    status,
+    bounds,
+):
+    # Arrange
+    mock_wire.query.return_value = {"Items": []}
+    repository = DynamoDBTaskRepository(mock_table, mock_wire)
+    cursor = TaskFeedCursor(
+        created_at="2025-01-01T00:00:00",
+        task_list_id=TaskListId("list2"),
+        task_id=TaskId("task1"),
+    )
+
+    # Act
+    tasks = list(
+        repository.iter_all(
+            TaskListId("list1"),
+            sort_by=TaskSortBy.CREATED_AT,
+            order=order,
+            status=status,
+            start=cursor,
+            page_size=11,
+        )
+    )
+
+    # Assert
+    assert tasks == []
+    query = mock_wire.query.call_args.kwargs
+    assert query["IndexName"] == ("LSI1" if status is None else "LSI3")
+    assert query["Limit"] == 11
+    assert query["KeyConditionExpression"] == (
+        "#pk = :pk AND #sk BETWEEN :sk AND :sk_end"
+    )
+    assert query["ExpressionAttributeValues"] == {
+        ":pk": {"S": "TASK_LIST#list1"},
+        ":sk": {"S": bounds[0]},
+        ":sk_end": {"S": bounds[1]},
+    }
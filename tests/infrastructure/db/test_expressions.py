@@ -0,0 +1,49 @@
+import pytest
+
+from app.infrastructure.db.expressions import increment_version, set_expression
+
+
+def test_set_expression_should_alias_every_attribute():
+    # Act
+    expression = set_expression({"name": "List", "count": 1})
+
+    # Assert
+    assert expression == {
+        "UpdateExpression": "SET #name = :name, #count = :count",
+        "ExpressionAttributeNames": {"#name": "name", "#count": "count"},
+        "ExpressionAttributeValues": {":name": "List", ":count": 1},
+    }
+
+
+def test_set_expression_should_raise_error_without_values():
+    # Act & Assert
+    with pytest.raises(ValueError, match="At least one attribute"):
+        set_expression({})
+
+
+def test_increment_version_should_extend_set_and_add_expressions():
+    # Act
+    expressions = [
+        increment_version(set_expression({"name": "List"})),
+        increment_version(
+            {
+                "UpdateExpression": "ADD #count :one",
+                "ExpressionAttributeNames": {"#count": "count"},
+                "ExpressionAttributeValues": {":one": 1},
+            }
+        ),
+    ]
+
+    # Assert
+    assert [expression["UpdateExpression"] for expression in expressions] == [
+        "SET #name = :name ADD #version :version_step",
+        "ADD #count :one, #version :version_step",
+    ]
+    assert expressions[1]["ExpressionAttributeNames"] == {
+        "#count": "count",
+        "#version": "version",
+    }
+    assert expressions[1]["ExpressionAttributeValues"] == {
+        ":one": 1,
+        ":version_step": 1,
+    }
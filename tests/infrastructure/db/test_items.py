@@ -0,0 +1,216 @@
+from datetime import datetime
+
+from boto3.dynamodb.types import TypeSerializer
+
+from app.domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from app.domain.task_list import TaskCount, TaskList, TaskListId, TaskListName
+from app.domain.user import UserId
+from app.infrastructure.db.items import (
+    ITEM_FORMAT,
+    task_from_item,
+    task_from_wire,
+    task_list_from_item,
+    task_list_from_wire,
+    task_list_to_item,
+    task_to_item,
+)
+
+
+def to_wire(item: dict) -> dict:
+    serializer = TypeSerializer()
+    return {name: serializer.serialize(value) for name, value in item.items()}
+
+
+def create_task(description: str = "") -> Task:
+    return Task(
+        id=TaskId("task1"),
+        task_list_id=TaskListId("list1"),
+        title=TaskTitle("Task"),
+        description=TaskDescription(description),
+        status=TaskStatus.DONE,
+        created_at=datetime(2025, 1, 1, 12, 0),
+    )
+
+
+def test_task_to_item_should_derive_ids_from_keys():
+    # Act
+    item = task_to_item(create_task(), UserId("user1"))
+
+    # Assert
+    assert item == {
+        "PK": "TASK_LIST#list1",
+        "SK": "TASK#task1",
+        "GSI1PK": "TASK#task1",
+        "GSI1SK": "#",
+        "GSI2PK": "USER#user1",
+        "fmt": ITEM_FORMAT,
+        "title": "Task",
+        "status": "done",
+        "created_at": "2025-01-01T12:00:00",
+        "status_created_at": "done#2025-01-01T12:00:00",
+        "version": 0,
+    }
+
+
+def test_task_from_item_should_read_compact_item():
+    # Arrange
+    task = create_task("Details")
+
+    # Act
+    result = task_from_item(task_to_item(task))
+
+    # Assert
+    assert result == task
+
+
+def test_task_from_item_should_read_legacy_item():
+    # Arrange
+    item = {
+        "PK": "TASK_LIST#list1",
+        "SK": "TASK#task1",
+        "GSI1PK": "TASK#task1",
+        "GSI1SK": "TASK#task1",
+        "task_list_id": "list1",
+        "task_id": "task1",
+        "title": "Task",
+        "description": "",
+        "status": "done",
+        "created_at": "2025-01-01T12:00:00",
+        "status_created_at": "done#2025-01-01T12:00:00",
+    }
+
+    # Act
+    result = task_from_item(item)
+
+    # Assert
+    assert result == create_task()
+
+
+def test_task_list_from_item_should_read_compact_and_legacy_items():
+    # Arrange
+    task_list = TaskList(
+        id=TaskListId("list1"),
+        name=TaskListName("List"),
+        user_id=UserId("user1"),
+        count=TaskCount(2),
+        todo_count=TaskCount(1),
+        done_count=TaskCount(1),
+    )
+    item = task_list_to_item(task_list)
+    legacy_item = {
+        "PK": "USER#user1",
+        "SK": "TASK_LIST#list1",
+        "user_id": "user1",
+        "task_list_id": "list1",
+        "name": "List",
+        "count": 2,
+        "todo_count": 1,
+        "done_count": 1,
+    }
+
+    # Act
+    results = [task_list_from_item(item), task_list_from_item(legacy_item)]
+
+    # Assert
+    assert "task_list_id" not in item
+    assert results == [task_list, task_list]
+
+
+def test_task_from_wire_should_read_compact_and_legacy_items():
+    # Arrange
+    task = create_task("Details")
+    legacy_item = {
+        "PK": "TASK_LIST#list1",
+        "SK": "TASK#task1",
+        "task_list_id": "list1",
+        "task_id": "task1",
+        "title": "Task",
+        "description": "",
+        "status": "done",
+        "created_at": "2025-01-01T12:00:00",
+    }
+
+    # Act
+    results = [
+        task_from_wire(to_wire(task_to_item(task))),
+        task_from_wire(to_wire(task_to_item(create_task()))),
+        task_from_wire(to_wire(legacy_item)),
+    ]
+
+    # Assert
+    assert results == [task, create_task(), create_task()]
+
+
+def test_task_list_from_wire_should_match_task_list_from_item():
+    # Arrange
+    task_list = TaskList(
+        id=TaskListId("list1"),
+        name=TaskListName("List"),
+        user_id=UserId("user1"),
+        count=TaskCount(2),
+        todo_count=TaskCount(2),
+        done_count=TaskCount(0),
+    )
+    item = task_list_to_item(task_list)
+    legacy_item = {
+        "PK": "USER#user1",
+        "SK": "TASK_LIST#list1",
+        "user_id": "user1",
+        "task_list_id": "list1",
+        "name": "List",
+        "count": 2,
+        "todo_count": 2,
+    }
+
+    # Act
+    results = [
+        task_list_from_wire(to_wire(item)),
+        task_list_from_wire(to_wire(legacy_item)),
+    ]
+
+    # Assert
+    assert results == [task_list, task_list_from_item(legacy_item)]
+    assert results[1] == task_list
+
+
+def test_task_from_wire_should_share_task_list_id_within_one_result():
+    # Arrange
+    items = [
+        to_wire(task_to_item(create_task())),
+        to_wire(task_to_item(create_task("Details"))),
+    ]
+    task_list_ids: dict[str, TaskListId] = {}
+
+    # Act
+    tasks = [task_from_wire(item, task_list_ids) for item in items]
+
+    # Assert
+    assert tasks[0].task_list_id is tasks[1].task_list_id
+    assert task_list_ids == {"list1": TaskListId("list1")}
+
+
+def test_mappers_should_read_back_written_versions():
+    # Arrange
+    task = create_task()
+    task.version = 7
+    task_list = TaskList(
+        id=TaskListId("list1"),
+        name=TaskListName("List"),
+        user_id=UserId("user1"),
+        count=TaskCount(0),
+        version=4,
+    )
+
+    # Act
+    tasks = [
+        task_from_item(task_to_item(task)),
+        task_from_wire(to_wire(task_to_item(task))),
+    ]
+    task_lists = [
+        task_list_from_item(task_list_to_item(task_list)),
+        task_list_from_wire(to_wire(task_list_to_item(task_list))),
+    ]
+
+    # Assert
+    assert [result.version for result in tasks] == [7, 7]
+    assert [result.version for result in task_lists] == [4, 4]
@@ -0,0 +1,190 @@
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from app.domain.task_list import TaskListId
+from app.domain.user import UserId
+from app.infrastructure.db.items import task_list_from_item
+from app.infrastructure.db.migration import (
+    MIGRATION_PAGE_SIZE,
+    iter_with_moved_task_lists,
+    merge_moved_task_lists,
+    migrate_task_lists,
+    move_legacy_task_list,
+)
+
+
+def legacy_item(task_list_id: str):
+    return {
+        "PK": "USER#user1",
+        "SK": f"TASK_LIST#{task_list_id}",
+        "user_id": "user1",
+        "task_list_id": task_list_id,
+        "name": "List",
+        "count": 0,
+    }
+
+
+def legacy_task_lists(*task_list_ids: str):
+    return [task_list_from_item(legacy_item(i)) for i in task_list_ids]
+
+
+def test_migrate_task_lists_should_move_items_next_to_their_tasks():
+    # Arrange
+    table = MagicMock()
+    table.name = "table"
+    table.scan.return_value = {"Items": [legacy_item("list1")]}
+
+    # Act
+    result = migrate_task_lists(table)
+
+    # Assert
+    assert result.moved == 1
+    assert result.start_key is None
+    items = table.transact_write_items.call_args.kwargs["TransactItems"]
+    put = items[0]["Put"]["Item"]
+    assert (put["PK"], put["SK"]) == ("TASK_LIST#list1", "#METADATA")
+    assert (put["GSI1PK"], put["GSI1SK"]) == ("USER#user1", "TASK_LIST#list1")
+    assert items[1]["Delete"]["Key"] == {
+        "PK": "USER#user1",
+        "SK": "TASK_LIST#list1",
+    }
+
+
+def test_migrate_task_lists_should_skip_items_already_moved():
+    # Arrange
+    table = MagicMock()
+    table.scan.return_value = {"Items": [legacy_item("list1")]}
+    table.transact_write_items.side_effect = ClientError(
+        {
+            "Error": {"Code": "TransactionCanceledException"},
+            "CancellationReasons": [
+                {"Code": "ConditionalCheckFailed"},
+                {"Code": "None"},
+            ],
+        },
+        "TransactWriteItems",
+    )
+
+    # Act
+    result = migrate_task_lists(table)
+
+    # Assert
+    assert result.moved == 0
+
+
+def test_migrate_task_lists_should_resume_from_start_key():
+    # Arrange
+    table = MagicMock()
+    table.scan.side_effect = [
+        {"Items": [legacy_item("list1")], "LastEvaluatedKey": {"PK": "b"}},
+        {"Items": [legacy_item("list2")]},
+    ]
+
+    # Act
+    result = migrate_task_lists(table, start_key={"PK": "a"})
+
+    # Assert
+    assert result.moved == 2
+    assert result.start_key is None
+    scans = [call.kwargs for call in table.scan.call_args_list]
+    assert [scan["ExclusiveStartKey"] for scan in scans] == [
+        {"PK": "a"},
+        {"PK": "b"},
+    ]
+    assert all(scan["Limit"] == MIGRATION_PAGE_SIZE for scan in scans)
+
+
+def test_migrate_task_lists_should_return_key_to_resume_from_when_stopped():
+    # Arrange
+    table = MagicMock()
+    table.scan.return_value = {
+        "Items": [legacy_item("list1")],
+        "LastEvaluatedKey": {"PK": "b"},
+    }
+
+    # Act
+    result = migrate_task_lists(table, should_stop=lambda: True)
+
+    # Assert
+    assert result.moved == 1
+    assert result.start_key == {"PK": "b"}
+    table.scan.assert_called_once()
+
+
+def test_move_legacy_task_list_should_move_item_found_by_owner():
+    # Arrange
+    table = MagicMock()
+    table.get_item.return_value = {"Item": legacy_item("list1")}
+
+    # Act
+    found = move_legacy_task_list(table, TaskListId("list1"), UserId("user1"))
+
+    # Assert
+    assert found
+    assert table.get_item.call_args.kwargs["Key"] == {
+        "PK": "USER#user1",
+        "SK": "TASK_LIST#list1",
+    }
+    table.transact_write_items.assert_called_once()
+
+
+def test_move_legacy_task_list_should_find_item_by_id_without_owner():
+    # Arrange
+    table = MagicMock()
+    table.query.return_value = {"Items": []}
+
+    # Act
+    found = move_legacy_task_list(table, TaskListId("list1"))
+
+    # Assert
+    assert not found
+    assert table.query.call_args.kwargs["IndexName"] == "GSI1"
+    table.transact_write_items.assert_not_called()
+
+
+def test_merge_moved_task_lists_should_add_moved_lists_up_to_end_of_page():
+    # Arrange
+    task_lists = legacy_task_lists("b", "d")
+    moved = legacy_task_lists("a", "d", "e")
+
+    # Act
+    merged = merge_moved_task_lists(task_lists, moved, last_page=False)
+
+    # Assert
+    assert [task_list.id for task_list in merged] == [
+        TaskListId("a"),
+        TaskListId("b"),
+        TaskListId("d"),
+    ]
+
+
+def test_merge_moved_task_lists_should_add_every_moved_list_on_last_page():
+    # Arrange
+    moved = legacy_task_lists("a", "e")
+
+    # Act
+    merged = merge_moved_task_lists([], moved, last_page=True)
+
+    # Assert
+    assert [task_list.id for task_list in merged] == [
+        TaskListId("a"),
+        TaskListId("e"),
+    ]
+
+
+def test_iter_with_moved_task_lists_should_merge_in_index_order_once():
+    # Arrange
+    task_lists = legacy_task_lists("b", "c")
+    moved = legacy_task_lists("d", "a", "c")
+
+    # Act
+    merged = list(iter_with_moved_task_lists(iter(task_lists), moved))
+
+    # Assert
+    assert [task_list.id for task_list in merged] == [
+        TaskListId("a"),
+        TaskListId("b"),
+        TaskListId("c"),
+        TaskListId("d"),
+    ]
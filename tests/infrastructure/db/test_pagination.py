@@ -0,0 +1,103 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.infrastructure.db.pagination import (
+    decode_token,
+    encode_token,
+    iter_query,
+    query_page,
+)
+
+
+def test_decode_token_should_return_encoded_key():
+    # Arrange
+    key = {"PK": "TASK_LIST#list1", "SK": "TASK#task1"}
+
+    # Act
+    decoded = decode_token(encode_token(key), "PK", "TASK_LIST#list1")
+
+    # Assert
+    assert decoded == key
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not-base64!",
+        encode_token({"PK": "TASK_LIST#other", "SK": "TASK#task1"}),
+    ],
+)
+def test_decode_token_should_raise_error_with_foreign_token(token):
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid pagination token."):
+        decode_token(token, "PK", "TASK_LIST#list1")
+
+
+def test_decode_token_should_raise_error_with_token_of_other_index():
+    # Arrange
+    token = encode_token(
+        {"PK": "TASK_LIST#list1", "SK": "TASK#task1", "title": "Task"}
+    )
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid pagination token."):
+        decode_token(token, "PK", "TASK_LIST#list1", "created_at")
+
+
+def test_query_page_should_follow_last_evaluated_key_until_limit():
+    # Arrange
+    table = MagicMock()
+    table.query.side_effect = [
+        {"Items": [{"id": 1}], "LastEvaluatedKey": {"PK": "P", "SK": "1"}},
+        {"Items": [{"id": 2}], "LastEvaluatedKey": {"PK": "P", "SK": "2"}},
+    ]
+
+    # Act
+    items, next_token = query_page(table, "PK", "P", limit=2)
+
+    # Assert
+    assert items == [{"id": 1}, {"id": 2}]
+    assert decode_token(next_token, "PK", "P") == {"PK": "P", "SK": "2"}
+    assert table.query.call_args_list[1].kwargs == {
+        "Limit": 1,
+        "ExclusiveStartKey": {"PK": "P", "SK": "1"},
+    }
+
+
+def test_query_page_should_read_every_page_without_limit():
+    # Arrange
+    table = MagicMock()
+    table.query.side_effect = [
+        {"Items": [{"id": 1}], "LastEvaluatedKey": {"PK": "P", "SK": "1"}},
+        {"Items": [{"id": 2}]},
+    ]
+
+    # Act
+    items, next_token = query_page(table, "PK", "P")
+
+    # Assert
+    assert items == [{"id": 1}, {"id": 2}]
+    assert next_token is None
+
+
+def test_iter_query_should_fetch_next_page_only_when_consumed():
+    # Arrange
+    table = MagicMock()
+    table.query.side_effect = [
+        {"Items": [{"id": 1}], "LastEvaluatedKey": {"PK": "P", "SK": "1"}},
+        {"Items": [{"id": 2}]},
+    ]
+
+    # Act
+    items = iter_query(table, KeyConditionExpression="expr")
+    first = next(items)
+
+    # Assert
+    assert first == {"id": 1}
+    assert table.query.call_count == 1
+    assert list(items) == [{"id": 2}]
+    assert table.query.call_args.kwargs == {
+        "KeyConditionExpression": "expr",
+        "ExclusiveStartKey": {"PK": "P", "SK": "1"},
+    }
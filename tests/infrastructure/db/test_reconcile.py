@@ -0,0 +1,189 @@
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from app.domain.task import TaskStatus
+from app.infrastructure.cache.shared import user_task_lists
+from app.infrastructure.db.reconcile import (
+    RECONCILE_CHUNK_SIZE,
+    count_tasks,
+    reconcile_task_lists,
+    repair_request,
+)
+
+
+def task_list_item(task_list_id: str, **counts):
+    return {
+        "PK": f"TASK_LIST#{task_list_id}",
+        "SK": "#METADATA",
+        "user_id": "user1",
+        **counts,
+    }
+
+
+def test_count_tasks_should_sum_count_of_every_page():
+    # Arrange
+    table = MagicMock()
+    table.query.side_effect = [
+        {"Count": 2, "LastEvaluatedKey": {"PK": "TASK_LIST#l"}},
+        {"Count": 1},
+    ]
+
+    # Act
+    count = count_tasks(table, "l", TaskStatus.DONE)
+
+    # Assert
+    assert count == 3
+    query = table.query.call_args.kwargs
+    assert query["IndexName"] == "LSI3"
+    assert query["Select"] == "COUNT"
+    assert query["ConsistentRead"] is True
+    assert query["ExclusiveStartKey"] == {"PK": "TASK_LIST#l"}
+
+
+def test_repair_request_should_return_none_when_counts_match():
+    # Arrange
+    item = task_list_item("l", count=3, todo_count=1, done_count=2)
+
+    # Act
+    request = repair_request(item, {TaskStatus.TODO: 1, TaskStatus.DONE: 2})
+
+    # Assert
+    assert request is None
+
+
+def test_repair_request_should_set_counts_read_by_scan():
+    # Arrange
+    item = task_list_item("l", count=3)
+
+    # Act
+    request = repair_request(item, {TaskStatus.TODO: 1, TaskStatus.DONE: 2})
+
+    # Assert
+    assert request is not None
+    assert request["Key"] == {"PK": "TASK_LIST#l", "SK": "#METADATA"}
+    assert request["ExpressionAttributeValues"] == {
+        ":count": 3,
+        ":todo_count": 1,
+        ":done_count": 2,
+        ":version_step": 1,
+    }
+
+
+def test_reconcile_task_lists_should_repair_only_drifted_lists():
+    # Arrange
+    table = MagicMock()
+    table.scan.return_value = {
+        "Items": [
+            task_list_item("ok", count=0, todo_count=0, done_count=0),
+            task_list_item("drifted", count=1),
+        ]
+    }
+    table.query.return_value = {"Count": 0}
+
+    # Act
+    result = reconcile_task_lists(table)
+
+    # Assert
+    assert result.checked == 2
+    assert result.repaired == 1
+    table.update_item.assert_called_once()
+    assert table.update_item.call_args.kwargs["Key"]["PK"] == (
+        "TASK_LIST#drifted"
+    )
+
+
+def test_reconcile_task_lists_should_skip_lists_changed_while_counting():
+    # Arrange
+    table = MagicMock()
+    table.scan.return_value = {"Items": [task_list_item("l", count=5)]}
+    table.query.return_value = {"Count": 0}
+    table.update_item.side_effect = ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException"}},
+        "UpdateItem",
+    )
+
+    # Act
+    result = reconcile_task_lists(table)
+
+    # Assert
+    assert result.skipped == 1
+    assert result.repaired == 0
+
+
+def test_reconcile_task_lists_should_invalidate_task_lists_of_owner():
+    # Arrange
+    table = MagicMock()
+    table.scan.return_value = {
+        "Items": [
+            task_list_item("ok", count=0, todo_count=0, done_count=0),
+            task_list_item("drifted", count=1),
+        ]
+    }
+    table.query.return_value = {"Count": 0}
+    collections = MagicMock()
+
+    # Act
+    reconcile_task_lists(table, collections)
+
+    # Assert
+    collections.invalidate.assert_called_once_with(user_task_lists("user1"))
+
+
+def test_reconcile_task_lists_should_report_lists_at_legacy_key():
+    # Arrange
+    table = MagicMock()
+    table.scan.return_value = {
+        "Items": [
+            task_list_item("l", count=0, todo_count=0, done_count=0),
+            {"PK": "USER#user1", "SK": "TASK_LIST#old", "count": 1},
+        ]
+    }
+    table.query.return_value = {"Count": 0}
+
+    # Act
+    result = reconcile_task_lists(table)
+
+    # Assert
+    assert (result.checked, result.legacy) == (1, 1)
+    assert table.scan.call_args.kwargs["ConsistentRead"] is True
+    table.update_item.assert_not_called()
+
+
+def test_reconcile_task_lists_should_scan_next_page_after_counting_chunk():
+    # Arrange
+    calls = []
+    pages = iter(
+        [
+            {
+                "Items": [
+                    task_list_item(f"a{i}", count=0)
+                    for i in range(RECONCILE_CHUNK_SIZE)
+                ],
+                "LastEvaluatedKey": {"PK": "TASK_LIST#a"},
+            },
+            {"Items": [task_list_item("b", count=0)]},
+        ]
+    )
+
+    def scan(**kwargs):
+        calls.append("scan")
+        return next(pages)
+
+    def query(**kwargs):
+        calls.append("query")
+        return {"Count": 0}
+
+    table = MagicMock()
+    table.scan.side_effect = scan
+    table.query.side_effect = query
+
+    # Act
+    result = reconcile_task_lists(table)
+
+    # Assert
+    assert result.checked == RECONCILE_CHUNK_SIZE + 1
+    second_scan = calls.index("scan", 1)
+    assert calls[1:second_scan] == ["query"] * (
+        RECONCILE_CHUNK_SIZE * len(TaskStatus)
+    )
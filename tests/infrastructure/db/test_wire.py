@@ -0,0 +1,90 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infrastructure.db.wire import AsyncWireTable, KeyCondition, WireTable
+
+
+def test_key_condition_bind_should_return_typed_values():
+    # Arrange
+    condition = KeyCondition("GSI1PK", "GSI1SK", "begins_with")
+
+    # Act
+    params = condition.bind("USER#user1", "TASK_LIST#")
+
+    # Assert
+    assert params == {
+        "KeyConditionExpression": "#pk = :pk AND begins_with(#sk, :sk)",
+        "ExpressionAttributeNames": {"#pk": "GSI1PK", "#sk": "GSI1SK"},
+        "ExpressionAttributeValues": {
+            ":pk": {"S": "USER#user1"},
+            ":sk": {"S": "TASK_LIST#"},
+        },
+    }
+
+
+def test_key_condition_bind_should_match_partition_alone():
+    # Arrange
+    condition = KeyCondition("PK")
+
+    # Act
+    params = condition.bind("TASK_LIST#list1")
+
+    # Assert
+    assert params == {
+        "KeyConditionExpression": "#pk = :pk",
+        "ExpressionAttributeNames": {"#pk": "PK"},
+        "ExpressionAttributeValues": {":pk": {"S": "TASK_LIST#list1"}},
+    }
+
+
+def test_wire_table_query_should_convert_start_and_last_keys():
+    # Arrange
+    client = MagicMock()
+    client.query.return_value = {
+        "Items": [{"PK": {"S": "TASK_LIST#list1"}}],
+        "LastEvaluatedKey": {
+            "PK": {"S": "TASK_LIST#list1"},
+            "SK": {"S": "TASK#task2"},
+        },
+    }
+    table = WireTable(client, "test-table")
+
+    # Act
+    resp = table.query(
+        KeyConditionExpression="#pk = :pk",
+        ExclusiveStartKey={"PK": "TASK_LIST#list1", "SK": "TASK#task1"},
+    )
+
+    # Assert
+    client.query.assert_called_once_with(
+        TableName="test-table",
+        KeyConditionExpression="#pk = :pk",
+        ExclusiveStartKey={
+            "PK": {"S": "TASK_LIST#list1"},
+            "SK": {"S": "TASK#task1"},
+        },
+    )
+    assert resp["Items"] == [{"PK": {"S": "TASK_LIST#list1"}}]
+    assert resp["LastEvaluatedKey"] == {
+        "PK": "TASK_LIST#list1",
+        "SK": "TASK#task2",
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_wire_table_query_should_call_low_level_query():
+    # Arrange
+    client = MagicMock()
+    client.call = AsyncMock(return_value={"Items": []})
+    table = AsyncWireTable(client, "test-table")
+
+    # Act
+    resp = await table.query(KeyConditionExpression="#pk = :pk")
+
+    # Assert
+    assert resp == {"Items": []}
+    client.call.assert_awaited_once_with(
+        "Query",
+        {"TableName": "test-table", "KeyConditionExpression": "#pk = :pk"},
+    )
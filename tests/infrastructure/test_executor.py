@@ -0,0 +1,102 @@
+import threading
+
+import pytest
+
+from app.infrastructure.executor import InstrumentedThreadPoolExecutor
+
+
+def test_metrics_should_count_completed_calls():
+    # Arrange
+    executor = InstrumentedThreadPoolExecutor(max_workers=2)
+
+    # Act
+    results = [executor.submit(pow, 2, n).result() for n in range(3)]
+    metrics = executor.metrics()
+    executor.shutdown()
+
+    # Assert
+    assert results == [1, 2, 4]
+    assert metrics.max_workers == 2
+    assert metrics.completed == 3
+    assert metrics.queue_depth == 0
+    assert metrics.running == 0
+
+
+def test_metrics_should_report_calls_waiting_for_a_thread():
+    # Arrange
+    executor = InstrumentedThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait()
+
+    # Act
+    executor.submit(block)
+    started.wait()
+    queued = executor.submit(int)
+    metrics = executor.metrics()
+    release.set()
+    queued.result()
+    executor.shutdown()
+
+    # Assert
+    assert metrics.running == 1
+    assert metrics.queue_depth == 1
+    assert executor.metrics().wait_time_max_ms > 0
+
+
+def test_metrics_should_forget_cancelled_calls():
+    # Arrange
+    executor = InstrumentedThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait()
+
+    executor.submit(block)
+    started.wait()
+    queued = executor.submit(int)
+
+    # Act
+    queued.cancel()
+    release.set()
+    executor.shutdown()
+
+    # Assert
+    assert executor.metrics().queue_depth == 0
+    assert executor.metrics().completed == 1
+
+
+def test_map_should_run_calls_not_started_in_caller():
+    # Arrange
+    executor = InstrumentedThreadPoolExecutor(max_workers=1)
+
+    def fan_out(n: int) -> list[int]:
+        # The only thread of the pool is busy with this call.
+        return list(executor.map(pow, [2] * n, range(n)))
+
+    # Act
+    result = executor.submit(fan_out, 3).result(timeout=5)
+    executor.shutdown()
+
+    # Assert
+    assert result == [1, 2, 4]
+    assert executor.metrics().queue_depth == 0
+
+
+def test_map_should_re_raise_first_error():
+    # Arrange
+    executor = InstrumentedThreadPoolExecutor(max_workers=2)
+
+    # Act
+    results = executor.map(int, ["1", "x", "3"])
+
+    # Assert
+    assert next(results) == 1
+    with pytest.raises(ValueError, match="invalid literal"):
+        next(results)
+    executor.shutdown()
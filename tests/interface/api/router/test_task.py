@@ -1,30 +1,49 @@
+import json
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi import HTTPException
 
+from app.domain.page import Page
 from app.domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
-from app.domain.task_list import TaskListId
+from app.domain.task_list import TaskListId, TaskSortBy, TaskSortOrder
+from app.domain.user import UserId
+from app.infrastructure.cache.lru import CacheSettings, LRUCache
+from app.interface.api.rendering import FragmentRenderer
 from app.interface.api.router.task import (
+    batch_get_tasks,
+    bulk_create_tasks,
     create_task,
     delete_task,
     get_task,
     list_tasks,
+    list_user_tasks,
     update_task,
 )
 from app.interface.api.schema.task import (
+    BatchGetTasksParameters,
+    BatchGetTasksResponse,
+    BulkCreateTasksParameters,
     CreateTaskParameters,
     DeleteTaskParameters,
     GetTaskParameters,
     ListTasksParameters,
+    ListUserTasksParameters,
+    TaskPageResponse,
+    TaskResponse,
     UpdateTaskParameters,
 )
 
 
 @pytest.fixture
 def mock_todo_service():
-    return MagicMock()
+    return AsyncMock()
+
+
+@pytest.fixture
+def renderer():
+    return FragmentRenderer(LRUCache(CacheSettings()))
 
 
 @pytest.mark.asyncio
@@ -46,7 +65,7 @@ async def test_create_task_should_return_task_response(mock_todo_service):
     mock_todo_service.create_task.return_value = mock_task
 
     # Act
-    response = await create_task(params, mock_todo_service)
+    response = await create_task(params, mock_todo_service, UserId("user1"))
 
     # Assert
     assert response.id == "task1"
@@ -67,15 +86,21 @@ async def test_create_task_should_raise_http_exception_on_error(
 
     # Act & Assert
     with pytest.raises(HTTPException) as exc_info:
-        await create_task(params, mock_todo_service)
+        await create_task(params, mock_todo_service, UserId("user1"))
     assert exc_info.value.status_code == 404
     assert exc_info.value.detail == "Test Error"
 
 
 @pytest.mark.asyncio
-async def test_list_tasks_should_return_list_of_tasks(mock_todo_service):
+async def test_list_tasks_should_return_list_of_tasks(
+    mock_todo_service, renderer
+):
     # Arrange
-    params = ListTasksParameters(task_list_id="list1")
+    params = ListTasksParameters(
+        task_list_id="list1",
+        limit=10,
+        next_token="token1",
+    )
     mock_tasks = [
         Task(
             id=TaskId("task1"),
@@ -86,21 +111,189 @@ async def test_list_tasks_should_return_list_of_tasks(mock_todo_service):
             created_at=datetime.now(),
         )
     ]
-    mock_todo_service.list_tasks.return_value = mock_tasks
+    mock_todo_service.list_tasks.return_value = Page(
+        items=mock_tasks,
+        next_token="token2",
+    )
 
     # Act
-    response = await list_tasks(params, mock_todo_service)
+    response = await list_tasks(params, mock_todo_service, renderer)
+    body = TaskPageResponse.model_validate_json(response.body)
 
     # Assert
-    assert len(response) == 1
-    assert response[0].id == "task1"
+    assert len(body.items) == 1
+    assert body.items[0].id == "task1"
+    assert body.next_token == "token2"
     mock_todo_service.list_tasks.assert_called_once_with(
-        task_list_id=TaskListId("list1")
+        task_list_id=TaskListId("list1"),
+        limit=10,
+        next_token="token1",
+        sort_by=TaskSortBy.CREATED_AT,
+        order=TaskSortOrder.ASCENDING,
+        status=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_user_tasks_should_return_tasks_of_current_user(
+    mock_todo_service, renderer
+):
+    # Arrange
+    params = ListUserTasksParameters(
+        limit=10,
+        order=TaskSortOrder.DESCENDING,
+        status=TaskStatus.TODO,
+    )
+    mock_todo_service.list_user_tasks.return_value = Page(
+        items=[
+            Task(
+                id=TaskId("task1"),
+                task_list_id=TaskListId("list1"),
+                title=TaskTitle("Task 1"),
+                description=TaskDescription(""),
+                status=TaskStatus.TODO,
+                created_at=datetime.now(),
+            )
+        ],
+        next_token="token2",
+    )
+
+    # Act
+    response = await list_user_tasks(
+        params, mock_todo_service, UserId("user1"), renderer
+    )
+    body = TaskPageResponse.model_validate_json(response.body)
+
+    # Assert
+    assert [item.task_list_id for item in body.items] == ["list1"]
+    assert body.next_token == "token2"
+    mock_todo_service.list_user_tasks.assert_called_once_with(
+        user_id=UserId("user1"),
+        limit=10,
+        next_token=None,
+        order=TaskSortOrder.DESCENDING,
+        status=TaskStatus.TODO,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_user_tasks_should_raise_404_for_invalid_token(
+    mock_todo_service, renderer
+):
+    # Arrange
+    params = ListUserTasksParameters(next_token="invalid")
+    mock_todo_service.list_user_tasks.side_effect = ValueError(
+        "Invalid pagination token."
+    )
+
+    # Act / Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await list_user_tasks(
+            params, mock_todo_service, UserId("user1"), renderer
+        )
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_tasks_should_stream_ndjson_when_requested(
+    mock_todo_service, renderer
+):
+    # Arrange
+    params = ListTasksParameters(task_list_id="list1")
+    mock_todo_service.list_tasks.return_value = None
+    mock_todo_service.iter_tasks.return_value = iter(
+        [
+            Task(
+                id=TaskId(f"task{i}"),
+                task_list_id=TaskListId("list1"),
+                title=TaskTitle(f"Task {i}"),
+                description=TaskDescription(""),
+                status=TaskStatus.TODO,
+                created_at=datetime.now(),
+            )
+            for i in range(2)
+        ]
+    )
+
+    # Act
+    response = await list_tasks(
+        params, mock_todo_service, renderer, accept="application/x-ndjson"
+    )
+    lines = [line async for line in response.body_iterator]
+
+    # Assert
+    assert response.media_type == "application/x-ndjson"
+    assert [json.loads(line)["id"] for line in lines] == ["task0", "task1"]
+    mock_todo_service.list_tasks.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_tasks_should_report_result_of_each_task(
+    mock_todo_service,
+):
+    # Arrange
+    params = BulkCreateTasksParameters(
+        tasks=[
+            {"title": "First"},
+            {"title": ""},
+            {"title": "Third", "description": "Details"},
+        ]
+    )
+    mock_todo_service.create_tasks.side_effect = (
+        lambda task_list_id, drafts, user_id: [
+            Task.create(title, description, task_list_id)
+            for title, description in drafts
+        ]
+    )
+
+    # Act
+    response = await bulk_create_tasks(
+        "list1",
+        params,
+        mock_todo_service,
+        UserId("user1"),
+    )
+
+    # Assert
+    assert [result.index for result in response.results] == [0, 1, 2]
+    assert response.results[0].task.title == "First"
+    assert response.results[1].task is None
+    assert response.results[1].error == "Title cannot be empty."
+    assert response.results[2].task.description == "Details"
+    mock_todo_service.create_tasks.assert_called_once_with(
+        task_list_id=TaskListId("list1"),
+        drafts=[
+            (TaskTitle("First"), TaskDescription("")),
+            (TaskTitle("Third"), TaskDescription("Details")),
+        ],
+        user_id=UserId("user1"),
     )
 
 
 @pytest.mark.asyncio
-async def test_get_task_should_return_task(mock_todo_service):
+async def test_bulk_create_tasks_should_raise_404_when_tasks_do_not_fit(
+    mock_todo_service,
+):
+    # Arrange
+    params = BulkCreateTasksParameters(tasks=[{"title": "Task"}])
+    mock_todo_service.create_tasks.side_effect = ValueError(
+        "Task count cannot exceed 100."
+    )
+
+    # Act & Assert
+    with pytest.raises(HTTPException) as exc_info:
+        await bulk_create_tasks(
+            "list1",
+            params,
+            mock_todo_service,
+            UserId("user1"),
+        )
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_task_should_return_task(mock_todo_service, renderer):
     # Arrange
     params = GetTaskParameters(task_list_id="list1", task_id="task1")
     mock_task = Task(
@@ -114,11 +307,51 @@ async def test_get_task_should_return_task(mock_todo_service):
     mock_todo_service.get_task.return_value = mock_task
 
     # Act
-    response = await get_task(params, mock_todo_service)
+    response = await get_task(params, mock_todo_service, renderer)
+    body = TaskResponse.model_validate_json(response.body)
 
     # Assert
-    assert response.id == "task1"
-    mock_todo_service.get_task.assert_called_once_with(task_id=TaskId("task1"))
+    assert body.id == "task1"
+    mock_todo_service.get_task.assert_called_once_with(
+        task_id=TaskId("task1"),
+        task_list_id=TaskListId("list1"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_get_tasks_should_return_found_and_missing_tasks(
+    mock_todo_service, renderer
+):
+    # Arrange
+    params = BatchGetTasksParameters(
+        keys=[
+            {"task_list_id": "list1", "task_id": "task1"},
+            {"task_list_id": "list1", "task_id": "task2"},
+        ]
+    )
+    mock_task = Task(
+        id=TaskId("task1"),
+        task_list_id=TaskListId("list1"),
+        title=TaskTitle("Test Task"),
+        description=TaskDescription(""),
+        status=TaskStatus.TODO,
+        created_at=datetime.now(),
+    )
+    mock_todo_service.get_tasks.return_value = [mock_task, None]
+
+    # Act
+    response = await batch_get_tasks(params, mock_todo_service, renderer)
+    body = BatchGetTasksResponse.model_validate_json(response.body)
+
+    # Assert
+    assert [item.id for item in body.items] == ["task1"]
+    assert body.missing_ids == ["task2"]
+    mock_todo_service.get_tasks.assert_called_once_with(
+        keys=[
+            (TaskListId("list1"), TaskId("task1")),
+            (TaskListId("list1"), TaskId("task2")),
+        ]
+    )
 
 
 @pytest.mark.asyncio
@@ -137,16 +370,23 @@ async def test_update_task_should_return_updated_task(mock_todo_service):
         status=TaskStatus.DONE,
         created_at=datetime.now(),
     )
-    mock_todo_service.update_task_status.return_value = mock_task
+    mock_todo_service.update_task.return_value = mock_task
 
     # Act
-    response = await update_task(params, mock_todo_service)
+    response = await update_task(params, mock_todo_service, UserId("user1"))
 
     # Assert
     assert response.title == "Updated Title"
     assert response.description == "Updated Description"
     assert response.status == TaskStatus.DONE
-    mock_todo_service.update_task_status.assert_called_once()
+    mock_todo_service.update_task.assert_called_once_with(
+        task_id=TaskId("task1"),
+        title=None,
+        description=None,
+        status=TaskStatus.DONE,
+        task_list_id=TaskListId("list1"),
+        user_id=UserId("user1"),
+    )
 
 
 @pytest.mark.asyncio
@@ -155,10 +395,12 @@ async def test_delete_task_should_return_success_message(mock_todo_service):
     params = DeleteTaskParameters(task_list_id="list1", task_id="task1")
 
     # Act
-    response = await delete_task(params, mock_todo_service)
+    response = await delete_task(params, mock_todo_service, UserId("user1"))
 
     # Assert
     assert response is None
     mock_todo_service.remove_task.assert_called_once_with(
-        task_list_id=TaskListId("list1"), task_id=TaskId("task1")
+        task_list_id=TaskListId("list1"),
+        task_id=TaskId("task1"),
+        user_id=UserId("user1"),
     )
@@ -1,10 +1,13 @@
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 from fastapi import HTTPException
 
+from app.domain.page import Page
 from app.domain.task_list import TaskCount, TaskList, TaskListId, TaskListName
 from app.domain.user import UserId
+from app.infrastructure.cache.lru import CacheSettings, LRUCache
+from app.interface.api.rendering import FragmentRenderer
 from app.interface.api.router.task_list import (
     create_task_list,
     delete_task_list,
@@ -16,13 +19,22 @@ from app.interface.api.schema.task_list import (
     CreateTaskListParameters,
     DeleteTaskListParameters,
     GetTaskListParameters,
+    ListTaskListsParameters,
+    TaskListPageResponse,
+    TaskListResponse,
+    TaskListWithTasksResponse,
     UpdateTaskListParameters,
 )
 
 
 @pytest.fixture
 def mock_todo_service():
-    return MagicMock()
+    return AsyncMock()
+
+
+@pytest.fixture
+def renderer():
+    return FragmentRenderer(LRUCache(CacheSettings()))
 
 
 @pytest.mark.asyncio
@@ -40,7 +52,9 @@ async def test_create_task_list_should_return_task_list_response(
     mock_todo_service.create_task_list.return_value = mock_list
 
     # Act
-    response = await create_task_list(params, mock_todo_service)
+    response = await create_task_list(
+        params, mock_todo_service, UserId("user1")
+    )
 
     # Assert
     assert response.id == "list1"
@@ -58,14 +72,14 @@ async def test_create_task_list_should_raise_http_exception_on_error(
 
     # Act & Assert
     with pytest.raises(HTTPException) as exc_info:
-        await create_task_list(params, mock_todo_service)
+        await create_task_list(params, mock_todo_service, UserId("user1"))
     assert exc_info.value.status_code == 400
     assert exc_info.value.detail == "Test Error"
 
 
 @pytest.mark.asyncio
 async def test_list_all_task_lists_should_return_list_of_task_lists(
-    mock_todo_service,
+    mock_todo_service, renderer
 ):
     # Arrange
     mock_lists = [
@@ -76,19 +90,30 @@ async def test_list_all_task_lists_should_return_list_of_task_lists(
             count=TaskCount(0),
         )
     ]
-    mock_todo_service.list_all_task_lists.return_value = mock_lists
+    mock_todo_service.list_all_task_lists.return_value = Page(items=mock_lists)
+    params = ListTaskListsParameters(limit=10)
 
     # Act
-    response = await list_all_task_lists(mock_todo_service)
+    response = await list_all_task_lists(
+        params, mock_todo_service, UserId("user1"), renderer
+    )
+    body = TaskListPageResponse.model_validate_json(response.body)
 
     # Assert
-    assert len(response) == 1
-    assert response[0].id == "list1"
-    mock_todo_service.list_all_task_lists.assert_called_once()
+    assert len(body.items) == 1
+    assert body.items[0].id == "list1"
+    assert body.next_token is None
+    mock_todo_service.list_all_task_lists.assert_called_once_with(
+        user_id=UserId("user1"),
+        limit=10,
+        next_token=None,
+    )
 
 
 @pytest.mark.asyncio
-async def test_get_task_list_should_return_task_list(mock_todo_service):
+async def test_get_task_list_should_return_task_list(
+    mock_todo_service, renderer
+):
     # Arrange
     params = GetTaskListParameters(task_list_id="list1")
     mock_list = TaskList(
@@ -100,15 +125,57 @@ async def test_get_task_list_should_return_task_list(mock_todo_service):
     mock_todo_service.get_task_list.return_value = mock_list
 
     # Act
-    response = await get_task_list(params, mock_todo_service)
+    response = await get_task_list(
+        params, mock_todo_service, UserId("user1"), renderer
+    )
+    body = TaskListResponse.model_validate_json(response.body)
 
     # Assert
-    assert response.id == "list1"
+    assert body.id == "list1"
     mock_todo_service.get_task_list.assert_called_once_with(
-        task_list_id=TaskListId("list1")
+        task_list_id=TaskListId("list1"),
+        user_id=UserId("user1"),
     )
 
 
+@pytest.mark.asyncio
+async def test_get_task_list_should_include_first_page_of_tasks(
+    mock_todo_service, renderer
+):
+    # Arrange
+    params = GetTaskListParameters(
+        task_list_id="list1",
+        include="tasks",
+        limit=10,
+    )
+    mock_list = TaskList(
+        id=TaskListId("list1"),
+        name=TaskListName("Test List"),
+        user_id=UserId("user1"),
+        count=TaskCount(0),
+    )
+    mock_todo_service.get_task_list_with_tasks.return_value = (
+        mock_list,
+        Page(items=[], next_token="token"),
+    )
+
+    # Act
+    response = await get_task_list(
+        params, mock_todo_service, UserId("user1"), renderer
+    )
+    body = TaskListWithTasksResponse.model_validate_json(response.body)
+
+    # Assert
+    assert body.id == "list1"
+    assert body.tasks.next_token == "token"
+    mock_todo_service.get_task_list_with_tasks.assert_called_once_with(
+        task_list_id=TaskListId("list1"),
+        user_id=UserId("user1"),
+        limit=10,
+    )
+    mock_todo_service.get_task_list.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_update_task_list_should_return_updated_task_list(
     mock_todo_service,
@@ -124,7 +191,9 @@ async def test_update_task_list_should_return_updated_task_list(
     mock_todo_service.update_task_list_name.return_value = mock_list
 
     # Act
-    response = await update_task_list(params, mock_todo_service)
+    response = await update_task_list(
+        params, mock_todo_service, UserId("user1")
+    )
 
     # Assert
     assert response.name == "Updated Name"
@@ -139,10 +208,15 @@ async def test_delete_task_list_should_return_success_message(
     params = DeleteTaskListParameters(task_list_id="list1")
 
     # Act
-    response = await delete_task_list(params, mock_todo_service)
+    response = await delete_task_list(
+        params,
+        mock_todo_service,
+        UserId("user1"),
+    )
 
     # Assert
     assert response is None
     mock_todo_service.delete_task_list.assert_called_once_with(
-        task_list_id=TaskListId("list1")
+        task_list_id=TaskListId("list1"),
+        user_id=UserId("user1"),
     )
@@ -1,8 +1,15 @@
 from datetime import datetime
 
+from pydantic_core import to_json
+
+from app.domain.page import Page
 from app.domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
 from app.domain.task_list import TaskListId
-from app.interface.api.schema.task import TaskResponse
+from app.interface.api.schema.task import (
+    TaskPageResponse,
+    TaskResponse,
+    task_page_to_dict,
+)
 
 
 def test_task_response_from_domain_should_create_correct_response():
@@ -26,3 +33,25 @@ def test_task_response_from_domain_should_create_correct_response():
     assert response.description == "Test Description"
     assert response.status == "todo"
     assert response.created_at == now.isoformat()
+
+
+def test_task_page_to_dict_should_match_task_page_response():
+    # Arrange
+    task = Task(
+        id=TaskId("task1"),
+        task_list_id=TaskListId("list1"),
+        title=TaskTitle("Test Task"),
+        description=TaskDescription(""),
+        status=TaskStatus.DONE,
+        created_at=datetime(2025, 1, 1, 12, 0),
+    )
+    page = Page(items=[task], next_token="token")
+
+    # Act
+    data = task_page_to_dict(page)
+
+    # Assert
+    assert data == TaskPageResponse.from_domain(page).model_dump()
+    assert TaskPageResponse.model_validate_json(to_json(data)) == (
+        TaskPageResponse.from_domain(page)
+    )
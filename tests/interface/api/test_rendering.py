@@ -0,0 +1,105 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from app.domain.page import Page
+from app.domain.task import Task, TaskDescription, TaskId, TaskStatus, TaskTitle
+from app.domain.task_list import TaskCount, TaskList, TaskListId, TaskListName
+from app.domain.user import UserId
+from app.infrastructure.cache.lru import CacheSettings, LRUCache
+from app.interface.api.rendering import FragmentRenderer
+from app.interface.api.schema.task import (
+    batch_get_tasks_to_dict,
+    task_page_to_dict,
+)
+from app.interface.api.schema.task_list import (
+    task_list_page_to_dict,
+    task_list_with_tasks_to_dict,
+)
+
+
+def create_task(task_id: str, version: int = 1) -> Task:
+    return Task(
+        id=TaskId(task_id),
+        task_list_id=TaskListId("list1"),
+        title=TaskTitle(f"Task {task_id}"),
+        description=TaskDescription("Détails"),
+        status=TaskStatus.TODO,
+        created_at=datetime(2025, 1, 1, 12, 0),
+        version=version,
+    )
+
+
+def create_task_list(version: int = 1) -> TaskList:
+    return TaskList(
+        id=TaskListId("list1"),
+        user_id=UserId("user1"),
+        name=TaskListName("List"),
+        count=TaskCount(2),
+        todo_count=TaskCount(2),
+        version=version,
+    )
+
+
+@pytest.fixture
+def cache():
+    return LRUCache[tuple[str, str, int], bytes](CacheSettings())
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_renderer_should_match_plain_data_of_schemas(cache, cached):
+    # Arrange
+    renderer = FragmentRenderer(cache if cached else None)
+    tasks = Page(
+        items=[create_task("task1"), create_task("task2", version=0)],
+        next_token="token",
+    )
+    task_lists = Page(items=[create_task_list()], next_token=None)
+    task_ids = [TaskId("task1"), TaskId("task3")]
+
+    # Act
+    bodies = [
+        renderer.task_page(tasks),
+        renderer.task_list_page(task_lists),
+        renderer.task_list_with_tasks(create_task_list(), tasks),
+        renderer.batch_get_tasks(task_ids, [create_task("task1"), None]),
+    ]
+
+    # Assert
+    assert [json.loads(body) for body in bodies] == [
+        task_page_to_dict(tasks),
+        task_list_page_to_dict(task_lists),
+        task_list_with_tasks_to_dict(create_task_list(), tasks),
+        batch_get_tasks_to_dict(task_ids, [create_task("task1"), None]),
+    ]
+
+
+def test_renderer_should_reuse_fragments_of_the_same_version(cache):
+    # Arrange
+    renderer = FragmentRenderer(cache)
+    first = renderer.task(create_task("task1"))
+    stale = create_task("task1")
+    stale.update_title(TaskTitle("Stale"))
+    renamed = create_task("task1", version=2)
+    renamed.update_title(TaskTitle("Renamed"))
+
+    # Act
+    bodies = [renderer.task(stale), renderer.task(renamed)]
+
+    # Assert
+    assert bodies[0] is first
+    assert json.loads(bodies[1])["title"] == "Renamed"
+    assert cache.stats().hits == 1
+
+
+def test_renderer_should_not_cache_entities_without_version(cache):
+    # Arrange
+    renderer = FragmentRenderer(cache)
+
+    # Act
+    renderer.task(create_task("task1", version=0))
+    renderer.task_list(create_task_list(version=0))
+
+    # Assert
+    assert cache.stats().size == 0
@@ -0,0 +1,39 @@
+import pytest
+from pydantic import BaseModel
+
+from app.interface.api.streaming import accepts_ndjson, ndjson_response
+
+
+class Item(BaseModel):
+    name: str
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, False),
+        ("application/json", False),
+        ("application/x-ndjson", True),
+        ("application/json, application/x-ndjson;q=0.9", True),
+    ],
+)
+def test_accepts_ndjson(accept, expected):
+    # Act & Assert
+    assert accepts_ndjson(accept) is expected
+
+
+@pytest.mark.asyncio
+async def test_ndjson_response_should_stream_async_iterable():
+    # Arrange
+    async def items():
+        yield Item(name="a")
+        yield Item(name="b")
+
+    response = ndjson_response(items(), lambda item: item)
+
+    # Act
+    body = [chunk async for chunk in response.body_iterator]
+
+    # Assert
+    assert body == [b'{"name":"a"}\n', b'{"name":"b"}\n']
+    assert response.media_type == "application/x-ndjson"
@@ -0,0 +1,82 @@
+from app.application.async_todo import AsyncTodoService
+from app.application.awaitable_todo import AwaitableTodoService
+from app.container import Container, ExecutionMode, get_container
+from app.infrastructure.db.dynamodb import DynamoDBSettings
+
+
+def test_container_create_should_share_table_between_repositories():
+    # Arrange
+    settings = DynamoDBSettings(table_name="test-table")
+
+    # Act
+    container = Container.create(settings)
+
+    # Assert
+    assert (
+        container.task_list_repository._repository._table
+        is container.dynamodb.table
+    )
+    assert (
+        container.task_repository._repository._table is container.dynamodb.table
+    )
+    assert (
+        container.task_repository._repository._wire._client
+        is container.dynamodb.client
+    )
+    assert (
+        container.todo_service.task_list_repository
+        is container.task_list_repository
+    )
+    assert container.todo_service.task_repository is container.task_repository
+    assert container.todo_service.executor is container.executor
+    assert container.task_repository._repository._executor is (
+        container.executor
+    )
+
+
+def test_get_container_should_return_same_instance():
+    # Act
+    first = get_container()
+    second = get_container()
+
+    # Assert
+    assert first is second
+
+
+def test_todo_service_for_should_select_backend_by_mode():
+    # Arrange
+    container = Container.create(DynamoDBSettings(table_name="test-table"))
+
+    # Act
+    sync_service = container.todo_service_for(ExecutionMode.SYNC)
+    threadpool_service = container.todo_service_for(ExecutionMode.THREADPOOL)
+    async_service = container.todo_service_for(ExecutionMode.ASYNC)
+
+    # Assert
+    assert isinstance(sync_service, AwaitableTodoService)
+    assert sync_service.service is container.todo_service
+    assert sync_service.executor is None
+    assert isinstance(threadpool_service, AwaitableTodoService)
+    assert threadpool_service.executor is container.executor
+    assert (
+        container.executor.metrics().max_workers
+        == container.dynamodb.settings.max_pool_connections
+    )
+    assert isinstance(async_service, AsyncTodoService)
+    assert async_service is container.todo_service_for(ExecutionMode.ASYNC)
+
+
+def test_container_create_should_share_task_list_cache():
+    # Arrange
+    settings = DynamoDBSettings(table_name="test-table")
+
+    # Act
+    container = Container.create(settings)
+
+    # Assert
+    assert container.task_list_repository.cache is container.caches["task_list"]
+    assert (
+        container.task_repository._task_list_cache
+        is (container.caches["task_list"])
+    )
+    assert set(container.cache_stats()) == {"task_list", "task", "rendered"}
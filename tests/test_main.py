@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock
+
+from fastapi.testclient import TestClient
+
+from app.container import Container
+from app.domain.task_list import TaskCount, TaskList, TaskListId, TaskListName
+from app.domain.user import UserId
+from app.infrastructure.cache.lru import CacheSettings, LRUCache
+from app.main import create_app
+
+
+def test_create_app_should_share_todo_service_between_requests():
+    # Arrange
+    todo_service = MagicMock()
+    todo_service.get_task_list.return_value = TaskList(
+        id=TaskListId("list1"),
+        name=TaskListName("List"),
+        user_id=UserId("user1"),
+        count=TaskCount(0),
+    )
+    container = Container(
+        dynamodb=MagicMock(),
+        task_list_repository=MagicMock(),
+        task_repository=MagicMock(),
+        todo_service=todo_service,
+    )
+
+    # Act
+    with TestClient(create_app(container)) as client:
+        first = client.get("/api/v1/task_list/list1")
+        second = client.get("/api/v1/task_list/list1")
+
+    # Assert
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert todo_service.get_task_list.call_count == 2
+
+
+def test_create_app_should_reuse_rendered_task_list_until_its_next_write():
+    # Arrange
+    todo_service = MagicMock()
+    todo_service.get_task_list.side_effect = [
+        TaskList(
+            id=TaskListId("list1"),
+            name=TaskListName(name),
+            user_id=UserId("user1"),
+            count=TaskCount(0),
+            version=version,
+        )
+        for name, version in [("List", 1), ("Stale", 1), ("Renamed", 2)]
+    ]
+    rendered = LRUCache[tuple[str, str, int], bytes](CacheSettings())
+    container = Container(
+        dynamodb=MagicMock(),
+        task_list_repository=MagicMock(),
+        task_repository=MagicMock(),
+        todo_service=todo_service,
+        caches={"rendered": rendered},
+    )
+
+    # Act
+    with TestClient(create_app(container)) as client:
+        names = [
+            client.get("/api/v1/task_list/list1").json()["name"]
+            for _ in range(3)
+        ]
+
+    # Assert
+    assert names == ["List", "List", "Renamed"]
+    assert rendered.stats().hits == 1
+
+
+def test_openapi_should_describe_fast_json_routes_with_response_models():
+    # Arrange
+    app = create_app(
+        Container(
+            dynamodb=MagicMock(),
+            task_list_repository=MagicMock(),
+            task_repository=MagicMock(),
+            todo_service=MagicMock(),
+        )
+    )
+
+    # Act
+    paths = app.openapi()["paths"]
+
+    # Assert
+    for path, model in [
+        ("/api/v1/task", "TaskPageResponse"),
+        ("/api/v1/task_list", "TaskListPageResponse"),
+        ("/api/v1/task_list/{task_list_id}/task", "TaskPageResponse"),
+        ("/api/v1/task_list/{task_list_id}/task/{task_id}", "TaskResponse"),
+    ]:
+        schema = paths[path]["get"]["responses"]["200"]["content"][
+            "application/json"
+        ]["schema"]
+        assert schema == {"$ref": f"#/components/schemas/{model}"}